@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Benchmark micro-batching of the PyTorch backend at 1-16 concurrent streams.
+
+Each stream sends the corpus utterances one after another, as a room would.
+For every stream count the corpus is replayed with batches of one and with
+the micro-batcher, and throughput (utterances per second), p50/p95 latency
+and mean batch size are reported: the throughput and latency curves used
+to choose `[batching]` settings.
+
+Usage:
+    python3 scripts/benchmark_batching.py --corpus ./samples --model whisper-base \\
+        --streams 1 2 4 8 16 --max-wait-ms 5
+"""
+
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.orac_stt.config.settings import BatchingConfig, ModelConfig  # noqa: E402
+from src.orac_stt.models.audio_ctx import load_corpus  # noqa: E402
+from src.orac_stt.models.backends import PyTorchBackend  # noqa: E402
+from src.orac_stt.models.batching import BatchingModel  # noqa: E402
+from src.orac_stt.models.hedging import percentile  # noqa: E402
+
+
+def run(model, corpus, streams: int, language: str):
+    """Run ``streams`` concurrent streams over the corpus; return (latencies, utt/s)."""
+    latencies = []
+    lock = threading.Lock()
+
+    def stream(offset: int):
+        for i in range(len(corpus)):
+            item = corpus[(i + offset) % len(corpus)]
+            start = time.perf_counter()
+            model.transcribe(item.audio, language=language, beam_size=1)
+            with lock:
+                latencies.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=stream, args=(n,)) for n in range(streams)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, len(latencies) / (time.perf_counter() - start)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", type=Path, required=True, help="Directory of WAV/TXT pairs (up to 30 s each)")
+    parser.add_argument("--model", default="whisper-base", help="Model name")
+    parser.add_argument("--device", default="cpu", help="Device (cpu or cuda)")
+    parser.add_argument("--streams", type=int, nargs="+", default=[1, 2, 4, 8, 16], help="Concurrent streams")
+    parser.add_argument("--max-batch", type=int, default=8, help="Utterances decoded together")
+    parser.add_argument("--max-wait-ms", type=float, default=5.0, help="Batching wait window")
+    parser.add_argument("--language", default="en", help="Language code")
+    parser.add_argument("--cache-dir", type=Path, default=ModelConfig().cache_dir,
+                        help="Model download directory")
+    args = parser.parse_args()
+
+    corpus = [item for item in load_corpus(args.corpus) if item.duration <= 30.0]
+    config = ModelConfig(cache_dir=args.cache_dir, device=args.device)
+    model = PyTorchBackend().create(config, args.model, args.device)
+    model.transcribe(corpus[0].audio, language=args.language)  # warm-up
+    print(f"{args.model} on {args.device}, {len(corpus)} utterances per stream, "
+          f"max_batch {args.max_batch}, max_wait_ms {args.max_wait_ms}")
+    print(f"{'streams':>7} {'mode':>9} {'utt/s':>7} {'p50 ms':>8} {'p95 ms':>8} {'batch':>6}")
+
+    for streams in args.streams:
+        # Batches of one use the same greedy decoder, so only batching differs
+        for mode, max_batch, max_wait_ms in (("unbatched", 1, 0.0), ("batched", args.max_batch, args.max_wait_ms)):
+            batching = BatchingModel(model, BatchingConfig(enabled=True, max_batch=max_batch, max_wait_ms=max_wait_ms))
+            latencies, throughput = run(batching, corpus, streams, args.language)
+            batching.stop()
+            print(f"{streams:>7} {mode:>9} {throughput:>7.2f} {percentile(latencies, 50) * 1000:>8.1f} "
+                  f"{percentile(latencies, 95) * 1000:>8.1f} {batching.get_stats()['mean_batch_size']:>6}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
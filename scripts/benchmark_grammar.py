@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Benchmark grammar-constrained decoding on a synthetic command corpus.
+
+Builds home-automation commands from templates, synthesizes them with
+espeak-ng (or uses an existing WAV/TXT corpus), and transcribes each
+utterance through the configured backend without and with the phrase-list
+grammar. Reports p50/p95 latency and WER for both.
+
+whisper.cpp CLI decodes with the grammar itself; whisper-server and PyTorch
+only receive the phrase list as a prompt.
+
+Usage:
+    python3 scripts/benchmark_grammar.py --backend whisper.cpp --model whisper-tiny
+    python3 scripts/benchmark_grammar.py --corpus ./commands --runs 3
+"""
+
+import argparse
+import itertools
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.orac_stt.config.loader import load_config  # noqa: E402
+from src.orac_stt.models.audio_ctx import load_corpus  # noqa: E402
+from src.orac_stt.models.grammar import GrammarCompiler  # noqa: E402
+from src.orac_stt.models.topic import TopicGrammar  # noqa: E402
+from src.orac_stt.models.unified_loader import UnifiedWhisperLoader  # noqa: E402
+from src.orac_stt.utils.wer import word_error_rate  # noqa: E402
+
+ACTIONS = ["turn on", "turn off", "dim"]
+DEVICES = ["the lights", "the lamp", "the fan"]
+ROOMS = ["in the kitchen", "in the bedroom", "in the living room"]
+EXTRA = ["set a timer for five minutes", "stop the timer", "what time is it"]
+
+
+def command_phrases():
+    """Synthetic command vocabulary."""
+    phrases = [f"{a} {d} {r}" for a, d, r in itertools.product(ACTIONS, DEVICES, ROOMS)]
+    return phrases + EXTRA
+
+
+def synthesize(phrases, out_dir: Path) -> None:
+    """Write <n>.wav / <n>.txt pairs with espeak-ng."""
+    espeak = shutil.which("espeak-ng") or shutil.which("espeak")
+    if espeak is None:
+        sys.exit("espeak-ng not found; pass --corpus with recorded WAV/TXT pairs instead")
+    for i, phrase in enumerate(phrases):
+        wav = out_dir / f"{i:03d}.wav"
+        subprocess.run([espeak, "-w", str(wav), phrase], check=True, capture_output=True)
+        (out_dir / f"{i:03d}.txt").write_text(phrase)
+
+
+def percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def run(loader, corpus, options, runs: int):
+    latencies, errors = [], []
+    for item in corpus:
+        for _ in range(runs):
+            start = time.perf_counter()
+            result = loader.transcribe(item.audio, **options)
+            latencies.append(time.perf_counter() - start)
+        errors.append(word_error_rate(item.reference, result.get("text", "")))
+    return latencies, statistics.mean(errors)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", type=Path, default=None, help="Existing WAV/TXT corpus (default: synthesize)")
+    parser.add_argument("--backend", default=None, help="Backend (default: configured)")
+    parser.add_argument("--model", default=None, help="Model (default: configured)")
+    parser.add_argument("--runs", type=int, default=1, help="Runs per utterance")
+    args = parser.parse_args()
+
+    settings = load_config()
+    model_config = settings.model.model_copy()
+    if args.backend:
+        model_config.backend = args.backend
+    if args.model:
+        model_config.name = args.model
+    loader = UnifiedWhisperLoader(model_config, settings.decode)
+
+    phrases = command_phrases()
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus_dir = args.corpus
+        if corpus_dir is None:
+            corpus_dir = Path(tmp) / "corpus"
+            corpus_dir.mkdir()
+            synthesize(phrases, corpus_dir)
+        corpus = load_corpus(corpus_dir)
+        if args.corpus is not None:
+            phrases = [item.reference for item in corpus]
+
+        compiler = GrammarCompiler(settings.grammar.model_copy(update={"cache_dir": Path(tmp) / "grammars"}))
+        grammar = compiler.compile("benchmark", TopicGrammar(phrases=phrases))
+
+        loader.transcribe(corpus[0].audio)  # warm-up
+        print(f"{len(corpus)} utterances, backend={loader.backend_name}, model={model_config.name}")
+        for label, options in (("unconstrained", {}), ("grammar", grammar.options())):
+            latencies, wer = run(loader, corpus, options, args.runs)
+            print(f"{label:>14}: p50 {percentile(latencies, 50) * 1000:7.1f} ms  "
+                  f"p95 {percentile(latencies, 95) * 1000:7.1f} ms  WER {wer:.3f}")
+
+    loader.cleanup()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Benchmark request hedging across two whisper-server workers.
+
+Replays a WAV/TXT corpus against the primary whisper-server, first without
+hedging and then with hedging to the second worker, and reports p50/p95/p99
+latency and the hedge rate. Both servers must run the same model.
+
+Usage:
+    python3 scripts/benchmark_hedging.py --primary http://localhost:8080 \\
+        --worker http://localhost:8081 --corpus ./samples --rounds 20
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.orac_stt.config.settings import HedgingConfig  # noqa: E402
+from src.orac_stt.models.audio_ctx import load_corpus  # noqa: E402
+from src.orac_stt.models.hedging import HedgePolicy, percentile  # noqa: E402
+from src.orac_stt.models.whisper_server import WhisperServerModel  # noqa: E402
+
+
+def run(client, corpus, rounds: int):
+    latencies = []
+    for _ in range(rounds):
+        for item in corpus:
+            start = time.perf_counter()
+            client.transcribe(item.audio)
+            latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def report(label: str, latencies) -> None:
+    print(f"{label:>10}: p50 {percentile(latencies, 50) * 1000:7.1f} ms  "
+          f"p95 {percentile(latencies, 95) * 1000:7.1f} ms  "
+          f"p99 {percentile(latencies, 99) * 1000:7.1f} ms")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--primary", default="http://localhost:8080", help="Primary whisper-server")
+    parser.add_argument("--worker", required=True, help="Second whisper-server to hedge to")
+    parser.add_argument("--corpus", type=Path, required=True, help="Directory of WAV/TXT pairs")
+    parser.add_argument("--rounds", type=int, default=20, help="Passes over the corpus per mode")
+    parser.add_argument("--budget", type=float, default=0.05, help="Max fraction of requests hedged")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus)
+    plain = WhisperServerModel(server_url=args.primary)
+    plain.transcribe(corpus[0].audio)  # warm-up
+
+    baseline = run(plain, corpus, args.rounds)
+    policy = HedgePolicy(HedgingConfig(enabled=True, budget=args.budget))
+    hedged = WhisperServerModel(server_url=args.primary, hedge_urls=[args.worker], hedge_policy=policy)
+    # Learn per-bucket latencies before measuring
+    run(hedged, corpus, 1)
+    with_hedging = run(hedged, corpus, args.rounds)
+
+    print(f"{len(corpus)} utterances x {args.rounds} rounds")
+    report("baseline", baseline)
+    report("hedged", with_hedging)
+    stats = policy.get_stats()
+    print(f"hedge rate {stats['hedge_rate']:.3f}  (hedge wins {stats['hedge_wins']}, "
+          f"primary wins {stats['primary_wins']}, budget exhausted {stats['budget_exhausted']})")
+    print(f"p99 improvement {(percentile(baseline, 99) - percentile(with_hedging, 99)) * 1000:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
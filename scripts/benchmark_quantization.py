@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Benchmark dynamic int8 quantization against fp32 for the PyTorch backend on CPU.
+
+Transcribes a WAV/TXT corpus with each model size in fp32 and int8 and
+reports load time, model size, real-time factor and word error rate, so
+the accuracy cost of `model.quantization = "int8"` can be weighed against
+its speedup on a given CPU.
+
+Usage:
+    python3 scripts/benchmark_quantization.py --corpus ./samples \\
+        --models whisper-tiny whisper-base whisper-small --threads 4
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.orac_stt.config.settings import ModelConfig  # noqa: E402
+from src.orac_stt.models.audio_ctx import load_corpus  # noqa: E402
+from src.orac_stt.models.backends import PyTorchBackend  # noqa: E402
+from src.orac_stt.utils.wer import word_error_rate  # noqa: E402
+
+
+def evaluate(model, corpus, language: str):
+    """Return (RTF, mean WER) over the corpus."""
+    model.transcribe(corpus[0].audio, language=language)  # warm-up
+    elapsed = 0.0
+    errors = []
+    for item in corpus:
+        start = time.perf_counter()
+        result = model.transcribe(item.audio, language=language)
+        elapsed += time.perf_counter() - start
+        errors.append(word_error_rate(item.reference, result["text"]))
+    return elapsed / sum(item.duration for item in corpus), sum(errors) / len(errors)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", type=Path, required=True, help="Directory of WAV/TXT pairs")
+    parser.add_argument("--models", nargs="+", default=["whisper-tiny", "whisper-base", "whisper-small"],
+                        help="Model sizes to compare")
+    parser.add_argument("--threads", type=int, default=0, help="torch threads (0: torch default)")
+    parser.add_argument("--language", default="en", help="Language code")
+    parser.add_argument("--cache-dir", type=Path, default=ModelConfig().cache_dir,
+                        help="Model download directory")
+    parser.add_argument("--no-cache", action="store_true", help="Quantize at every load instead of caching")
+    args = parser.parse_args()
+
+    import torch
+
+    if args.threads:
+        torch.set_num_threads(args.threads)
+    corpus = load_corpus(args.corpus)
+    config = ModelConfig(cache_dir=args.cache_dir, device="cpu", quantized_cache=not args.no_cache)
+    plugin = PyTorchBackend()
+    print(f"{len(corpus)} utterances, {sum(i.duration for i in corpus):.1f}s of audio, "
+          f"{torch.get_num_threads()} torch threads")
+    print(f"{'model':<16} {'mode':<5} {'load s':>7} {'MB':>7} {'RTF':>7} {'WER':>7} {'speedup':>8} {'dWER':>7}")
+
+    for name in args.models:
+        baseline = None
+        for mode, model_name in (("fp32", name), ("int8", f"{name}-int8")):
+            start = time.perf_counter()
+            model = plugin.create(config, model_name, "cpu")
+            load_time = time.perf_counter() - start
+            info = model.quantization or {}
+            rtf, wer = evaluate(model, corpus, args.language)
+            model.close()
+
+            if baseline is None:
+                baseline = (rtf, wer)
+                relative = ""
+            else:
+                relative = f"{baseline[0] / rtf:>7.2f}x {wer - baseline[1]:>+7.3f}"
+            size = info.get("size_mb", "")
+            print(f"{name:<16} {mode:<5} {load_time:>7.2f} {size:>7} {rtf:>7.3f} {wer:>7.3f} {relative}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Benchmark speculative greedy decoding against plain greedy decoding on CPU.
+
+Decodes each WAV file with the target model alone and with a draft model
+proposing k tokens per round, checks that the text is identical and
+reports decode latency, speedup and draft acceptance rate.
+
+Usage:
+    python3 scripts/benchmark_speculative.py --target whisper-small --draft whisper-tiny \\
+        --k 2 4 6 --runs 3 samples/*.wav
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.orac_stt.audio.processor import AudioProcessor  # noqa: E402
+from src.orac_stt.config.settings import ModelConfig  # noqa: E402
+from src.orac_stt.models.backends import PyTorchBackend  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("audio", type=Path, nargs="+", help="WAV files (up to 30 s each)")
+    parser.add_argument("--target", default="whisper-small", help="Target model")
+    parser.add_argument("--draft", default="whisper-tiny", help="Draft model")
+    parser.add_argument("--k", type=int, nargs="+", default=[2, 4, 6], help="Draft tokens per round")
+    parser.add_argument("--runs", type=int, default=3, help="Timed runs per file and setting")
+    parser.add_argument("--device", default="cpu", help="Device (cpu or cuda)")
+    parser.add_argument("--language", default="en", help="Language code")
+    parser.add_argument("--cache-dir", type=Path, default=ModelConfig().cache_dir,
+                        help="Model download directory")
+    return parser.parse_args()
+
+
+def timed(fn, runs: int):
+    """Run fn once to warm up, then return (median seconds, last result)."""
+    result = fn()
+    latencies = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = fn()
+        latencies.append(time.perf_counter() - start)
+    return statistics.median(latencies), result
+
+
+def main() -> int:
+    args = parse_args()
+    config = ModelConfig(cache_dir=args.cache_dir, device=args.device)
+    plugin = PyTorchBackend()
+    print(f"Loading {args.target} and {args.draft} on {args.device}")
+    target = plugin.create(config, args.target, args.device)
+    draft = plugin.create(config, args.draft, args.device)
+
+    totals = {"greedy": 0.0, **{k: 0.0 for k in args.k}}
+    mismatches = 0
+    for path in args.audio:
+        audio, _ = AudioProcessor.load_audio(path.read_bytes(), validate=False)
+        audio = AudioProcessor.prepare_for_whisper(audio)
+        duration = len(audio) / 16000
+
+        base_time, base = timed(lambda: target.decode_greedy(audio, language=args.language), args.runs)
+        totals["greedy"] += base_time
+        print(f"\n{path.name} ({duration:.1f}s): greedy {base_time * 1000:.0f} ms "
+              f"(RTF {base_time / duration:.3f}) \"{base['text']}\"")
+
+        for k in args.k:
+            spec_time, spec = timed(
+                lambda: target.decode_greedy(audio, language=args.language, draft=draft, k=k), args.runs
+            )
+            totals[k] += spec_time
+            identical = spec["text"] == base["text"]
+            mismatches += not identical
+            stats = spec["speculative"]
+            acceptance = stats["acceptance_rate"]
+            print(f"  k={k}: {spec_time * 1000:.0f} ms  speedup {base_time / spec_time:.2f}x  "
+                  f"acceptance {acceptance if acceptance is None else f'{acceptance:.2f}'}  "
+                  f"target passes {stats['target_passes']}  identical={identical}")
+
+    print("\nOverall:")
+    for k in args.k:
+        print(f"  k={k}: speedup {totals['greedy'] / totals[k]:.2f}x")
+    if mismatches:
+        print(f"{mismatches} outputs differed from greedy decoding", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
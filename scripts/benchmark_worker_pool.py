@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Benchmark the inference worker pool over worker count x threads per worker.
+
+For every combination, starts a pool of pinned workers running the given
+backend, replays a WAV/TXT corpus with concurrent requests and reports
+throughput (utterances per second) and p50/p95 latency. Compare against a
+single worker using all cores to choose `[worker_pool]` settings for a node.
+
+Usage:
+    python3 scripts/benchmark_worker_pool.py --corpus ./samples \\
+        --backend pytorch --model whisper-base --workers 1 2 4 --threads 1 2 4
+"""
+
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.orac_stt.config.settings import ModelConfig, WorkerPoolConfig  # noqa: E402
+from src.orac_stt.models.audio_ctx import load_corpus  # noqa: E402
+from src.orac_stt.models.hedging import percentile  # noqa: E402
+from src.orac_stt.models.worker_pool import WorkerPoolModel, available_cores  # noqa: E402
+
+
+def run(pool: WorkerPoolModel, corpus, rounds: int, concurrency: int):
+    def timed(item):
+        start = time.perf_counter()
+        pool.transcribe(item.audio, language="en")
+        return time.perf_counter() - start
+
+    items = [item for _ in range(rounds) for item in corpus]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = list(executor.map(timed, items))
+    return latencies, len(items) / (time.perf_counter() - start)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", type=Path, required=True, help="Directory of WAV/TXT pairs")
+    parser.add_argument("--backend", default="pytorch", help="Backend run inside each worker")
+    parser.add_argument("--model", default="whisper-base", help="Model name")
+    parser.add_argument("--cache-dir", type=Path, default=Path("./models"), help="Model cache directory")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Worker counts to try")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4], help="Threads per worker to try")
+    parser.add_argument("--reserved-cores", type=int, default=1, help="Cores left to the API process")
+    parser.add_argument("--rounds", type=int, default=3, help="Passes over the corpus per combination")
+    parser.add_argument("--concurrency", type=int, default=0, help="Concurrent requests (0: 2 x workers)")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus)
+    model_config = ModelConfig(name=args.model, device="cpu", cache_dir=args.cache_dir, backend="worker-pool")
+    print(f"{len(available_cores())} cores, {len(corpus)} utterances x {args.rounds} rounds, "
+          f"{args.backend}/{args.model}")
+    print(f"{'workers':>7} {'threads':>7} {'utt/s':>8} {'p50 ms':>8} {'p95 ms':>8}")
+
+    for workers in args.workers:
+        for threads in args.threads:
+            config = WorkerPoolConfig(
+                backend=args.backend,
+                workers=workers,
+                threads_per_worker=threads,
+                reserved_cores=args.reserved_cores,
+            )
+            pool = WorkerPoolModel(config, model_config, args.model)
+            try:
+                pool.transcribe(corpus[0].audio, language="en")  # warm-up
+                latencies, throughput = run(pool, corpus, args.rounds, args.concurrency or 2 * workers)
+            finally:
+                pool.close()
+            print(f"{workers:>7} {threads:>7} {throughput:>8.2f} "
+                  f"{percentile(latencies, 50) * 1000:>8.1f} {percentile(latencies, 95) * 1000:>8.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
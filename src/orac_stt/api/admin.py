@@ -153,16 +153,14 @@ async def select_model(request: ModelSelectRequest) -> Dict[str, str]:
                 "instruction": "Update MODEL_NAME in docker-compose.yml and restart container"
             }
 
-        # For non-server backends, hot-reload is possible
-        # Update configuration
-        model_loader.config.name = model_name
-
-        # Clear current model to force reload
-        model_loader._model = None
-
-        # Preload new model
+        # For non-server backends, hot-reload is possible.
+        # Load the new model first so requests keep using the old one meanwhile.
         logger.info(f"Switching to model: {model_name}")
-        model_loader.load_model()
+        await asyncio.get_running_loop().run_in_executor(
+            None, lambda: model_loader.get_backend(model_name=model_name)
+        )
+        model_loader.config.name = model_name
+        model_loader.unload(model_name=current_model)
 
         # Notify connected clients
         await notify_model_change(model_name)
@@ -174,6 +172,61 @@ async def select_model(request: ModelSelectRequest) -> Dict[str, str]:
         raise HTTPException(status_code=500, detail=f"Failed to switch model: {str(e)}")
 
 
+class BackendSelectRequest(BaseModel):
+    """Inference backend selection request."""
+    backend: str
+    device: Optional[str] = None
+
+
+@router.get("/backends")
+async def list_backends() -> Dict[str, Any]:
+    """List registered inference backends and constructed instances."""
+    from ..models.backends import list_backends as list_backend_plugins
+
+    model_loader = get_model_loader()
+    return {
+        "active": model_loader.backend_name,
+        "device": model_loader.device,
+        "backends": [plugin.describe() for plugin in list_backend_plugins()],
+        "loaded": model_loader.loaded_backends(),
+    }
+
+
+@router.post("/backends/select")
+async def select_backend(request: BackendSelectRequest) -> Dict[str, Any]:
+    """Switch the active inference backend at runtime.
+
+    The new backend is constructed in the background thread pool before it
+    becomes active, so transcriptions keep using the previous backend until
+    the switch completes. No restart is required.
+    """
+    model_loader = get_model_loader()
+    previous = model_loader.backend_name
+
+    try:
+        await asyncio.get_running_loop().run_in_executor(
+            None, model_loader.set_backend, request.backend, request.device
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Failed to switch backend: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to switch backend: {str(e)}")
+
+    await broadcast({
+        "type": "backend_changed",
+        "backend": model_loader.backend_name,
+        "device": model_loader.device,
+    })
+
+    return {
+        "status": "success",
+        "previous_backend": previous,
+        "backend": model_loader.backend_name,
+        "device": model_loader.device,
+    }
+
+
 class ModelRestartRequest(BaseModel):
     """Model restart request."""
     model_name: str
@@ -210,30 +263,26 @@ async def get_running_model() -> Dict[str, str]:
 
 @router.post("/models/restart")
 async def restart_with_model(request: ModelRestartRequest) -> Dict[str, Any]:
-    """Restart whisper-server with a new model.
+    """Switch whisper-server to a new model without downtime.
 
-    This kills the current whisper-server process and starts a new one
-    with the specified model. Takes ~10-15 seconds.
+    The new model is started on the alternate port and warmed up while the
+    current server keeps serving; traffic is then moved over and the old
+    server drained and stopped. The switch runs as a background job; progress
+    is broadcast over /admin/ws as ``model_switch`` messages and can be polled
+    at /admin/models/switch.
     """
-    import subprocess
     import os
-    import time
+    from ..core.model_switcher import STATE_COMPLETED, follow_switch, get_model_switcher
+    from ..core.whisper_manager import get_whisper_manager
+    from ..models.backends import WhisperServerBackend
 
     model_name = request.model_name
 
     if model_name not in MODEL_INFO:
         raise HTTPException(status_code=400, detail=f"Invalid model: {model_name}")
 
-    # Map model name to ggml file
-    model_files = {
-        "whisper-tiny": "ggml-tiny.bin",
-        "whisper-base": "ggml-base.bin",
-        "whisper-small": "ggml-small.bin",
-        "whisper-medium": "ggml-medium.bin",
-    }
-
-    ggml_file = model_files.get(model_name, "ggml-tiny.bin")
-    model_path = f"/app/models/whisper_cpp/whisper/{ggml_file}"
+    manager = get_whisper_manager()
+    model_path = manager.model_path_for(model_name)
 
     # Check if model file exists
     if not os.path.exists(model_path):
@@ -242,76 +291,198 @@ async def restart_with_model(request: ModelRestartRequest) -> Dict[str, Any]:
             detail=f"Model file not found: {model_path}"
         )
 
-    logger.info(f"Restarting whisper-server with model: {model_name}")
+    model_loader = get_model_loader()
+
+    async def on_progress(job):
+        await broadcast({"type": "model_switch", "job": job.to_dict()})
+        follow_switch(model_loader, job)
+        if job.state == STATE_COMPLETED:
+            _set_running_model(job.model_name)
+            await notify_model_change(job.model_name)
+
+    logger.info(f"Switching whisper-server to model: {model_name}")
 
     try:
-        # Kill existing whisper-server
-        logger.info("Stopping existing whisper-server...")
-        subprocess.run(["pkill", "-f", "whisper-server"], timeout=5)
-        time.sleep(1)  # Give it time to die
-
-        # Start new whisper-server
-        whisper_prompt = os.environ.get(
-            "WHISPER_PROMPT",
-            "lounge cabinet lights kitchen bedroom bathroom office"
+        job = get_model_switcher().start_switch(
+            model_name,
+            clients=lambda: model_loader.get_instances(WhisperServerBackend.name),
+            on_progress=on_progress,
         )
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
 
-        cmd = [
-            "/app/third_party/whisper_cpp/bin/whisper-server",
-            "--model", model_path,
-            "--host", "127.0.0.1",
-            "--port", "8080",
-            "--no-timestamps",
-            "--language", "en",
-            "--prompt", whisper_prompt
-        ]
-
-        logger.info(f"Starting whisper-server: {' '.join(cmd)}")
-
-        # Start in background
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            start_new_session=True
-        )
+    return {
+        "status": "started",
+        "message": f"Switching to {model_name} in the background",
+        "job_id": job.id,
+        "running_model": _get_running_model(),
+    }
 
-        # Wait for server to be ready (poll health endpoint)
-        logger.info("Waiting for whisper-server to be ready...")
-        for _ in range(60):  # Wait up to 60 seconds
-            time.sleep(1)
-            try:
-                import urllib.request
-                urllib.request.urlopen("http://127.0.0.1:8080/", timeout=2)
-                logger.info("whisper-server is ready!")
-                break
-            except Exception:
-                continue
-        else:
-            raise RuntimeError("whisper-server failed to start within 60 seconds")
 
-        # Update running model tracker
-        _set_running_model(model_name)
+@router.get("/whisper-server/output")
+async def get_whisper_server_output(limit: int = 100) -> Dict[str, Any]:
+    """Get recent whisper-server output lines and the last timing report."""
+    from ..core.whisper_manager import get_whisper_manager
 
-        # Update config
-        model_loader = get_model_loader()
-        model_loader.config.name = model_name
+    output = get_whisper_manager().output
+    return {
+        **output.get_stats(),
+        "lines": output.tail(limit),
+    }
 
-        # Notify clients
-        await notify_model_change(model_name)
 
-        return {
-            "status": "success",
-            "message": f"Restarted with {model_name}",
-            "running_model": model_name
-        }
+@router.get("/model-store")
+async def get_model_store_stats() -> Dict[str, Any]:
+    """Get model file prewarm/checksum reports and the last whisper-server start breakdown."""
+    from ..core.model_store import get_model_store
+    from ..core.whisper_manager import get_whisper_manager
+
+    return {
+        **get_model_store().get_stats(),
+        "last_start": get_whisper_manager().last_start,
+    }
+
+
+@router.get("/whisper-server/restarts")
+async def get_whisper_server_restarts(limit: int = 50) -> Dict[str, Any]:
+    """Get the persistent whisper-server restart history and crash-loop state."""
+    from ..core.restart_policy import get_restart_policy
+    from ..core.whisper_manager import get_whisper_manager
+
+    policy = get_restart_policy()
+    return {
+        **policy.get_status(),
+        "fallback_from": get_whisper_manager().original_model,
+        "history": policy.history(limit),
+    }
+
+
+@router.get("/core-forwards")
+async def get_core_forward_stats() -> Dict[str, Any]:
+    """Get the ORAC Core forward queue depth, retries, outcomes and pooled clients."""
+    from ..integrations.core_dispatcher import get_core_dispatcher
+    from ..integrations.core_pool import get_core_pool
+
+    return {**get_core_dispatcher().get_stats(), "pool": get_core_pool().get_stats()}
+
+
+@router.get("/standby")
+async def get_standby_status() -> Dict[str, Any]:
+    """Get hot-standby whisper-server state, failovers and memory overhead."""
+    from ..core.whisper_manager import get_whisper_manager
+
+    standby = get_whisper_manager().standby
+    if standby is None:
+        return {"enabled": False}
+    return standby.get_status()
+
+
+@router.get("/models/switch")
+async def get_model_switch_status() -> Dict[str, Any]:
+    """Get the most recent model switch job."""
+    from ..core.model_switcher import get_model_switcher
+
+    job = get_model_switcher().current_job
+    return {"job": job.to_dict() if job else None}
+
+
+@router.get("/models/switch/{job_id}")
+async def get_model_switch_job(job_id: str) -> Dict[str, Any]:
+    """Get a model switch job by ID."""
+    from ..core.model_switcher import get_model_switcher
+
+    job = get_model_switcher().get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Switch job not found")
+    return job.to_dict()
 
-    except subprocess.TimeoutExpired:
-        logger.error("Timeout killing whisper-server")
-        raise HTTPException(status_code=500, detail="Timeout stopping whisper-server")
-    except Exception as e:
-        logger.error(f"Failed to restart whisper-server: {e}")
-        raise HTTPException(status_code=500, detail=f"Restart failed: {str(e)}")
+
+@router.get("/cascade")
+async def get_cascade_stats() -> Dict[str, Any]:
+    """Get model cascade settings and per-topic escalation statistics."""
+    from ..core.cascade import get_model_cascade
+
+    cascade = get_model_cascade()
+    return {
+        "config": cascade.config.model_dump(),
+        "topics": cascade.get_stats(),
+    }
+
+
+@router.get("/degradation")
+async def get_degradation_status() -> Dict[str, Any]:
+    """Get the load-adaptive degradation level and recent transitions."""
+    from ..core.degradation import get_degradation_controller
+
+    controller = get_degradation_controller()
+    return {
+        "config": controller.config.model_dump(),
+        **controller.get_status(),
+    }
+
+
+@router.get("/residency")
+async def get_residency_status() -> Dict[str, Any]:
+    """Get resident models, memory budget and per-model hit rates."""
+    from ..core.residency import get_residency_manager
+
+    return get_residency_manager().get_stats(get_model_loader())
+
+
+@router.get("/hedging")
+async def get_hedging_stats() -> Dict[str, Any]:
+    """Get hedge rate, per-bucket hedge thresholds and p99 with and without hedging."""
+    from ..models.hedging import get_hedge_policy
+
+    policy = get_hedge_policy()
+    return {
+        "config": policy.config.model_dump(),
+        **policy.get_stats(),
+    }
+
+
+@router.get("/result-cache")
+async def get_result_cache_stats() -> Dict[str, Any]:
+    """Get transcription result cache size and hit/miss/coalesced counts."""
+    from ..core.result_cache import get_result_cache
+
+    cache = get_result_cache()
+    return {
+        "config": cache.config.model_dump(),
+        **cache.get_stats(),
+    }
+
+
+@router.delete("/result-cache")
+async def clear_result_cache() -> Dict[str, Any]:
+    """Drop all cached transcription results."""
+    from ..core.result_cache import get_result_cache
+
+    removed = get_result_cache().clear()
+    logger.info(f"Cleared {removed} cached transcription results")
+    return {"status": "success", "removed": removed}
+
+
+@router.get("/templates")
+async def get_template_stats() -> Dict[str, Any]:
+    """Get template fast-path hit rate, latency savings and false-accept audits."""
+    from ..core.templates import get_template_matcher
+
+    matcher = get_template_matcher()
+    return {
+        "config": matcher.config.model_dump(),
+        **matcher.get_stats(),
+    }
+
+
+@router.delete("/templates")
+async def clear_templates(topic: Optional[str] = None) -> Dict[str, Any]:
+    """Forget learned command templates (one topic, or all)."""
+    from ..core.templates import get_template_matcher
+
+    removed = get_template_matcher().clear(topic)
+    logger.info(f"Cleared {removed} command templates" + (f" for topic '{topic}'" if topic else ""))
+    return {"status": "success", "removed": removed}
 
 
 @router.get("/commands")
@@ -471,16 +642,11 @@ async def websocket_endpoint(websocket: WebSocket):
         logger.info(f"WebSocket disconnected. Remaining connections: {len(active_connections)}")
 
 
-async def notify_new_command(command_dict: Dict[str, Any]):
-    """Notify all connected WebSocket clients of a new command."""
+async def broadcast(message: Dict[str, Any]):
+    """Send a message to all connected admin WebSocket clients."""
     if not active_connections:
         return
-        
-    message = {
-        "type": "new_command",
-        "command": command_dict
-    }
-    
+
     # Send to all connected clients
     disconnected = []
     for connection in active_connections:
@@ -496,29 +662,20 @@ async def notify_new_command(command_dict: Dict[str, Any]):
             active_connections.remove(conn)
 
 
+async def notify_new_command(command_dict: Dict[str, Any]):
+    """Notify all connected WebSocket clients of a new command."""
+    await broadcast({
+        "type": "new_command",
+        "command": command_dict
+    })
+
+
 async def notify_model_change(model_name: str):
     """Notify all connected WebSocket clients of model change."""
-    if not active_connections:
-        return
-        
-    message = {
+    await broadcast({
         "type": "model_changed",
         "model": model_name
-    }
-    
-    # Send to all connected clients
-    disconnected = []
-    for connection in active_connections:
-        try:
-            await connection.send_json(message)
-        except Exception as e:
-            logger.error(f"Error sending to WebSocket: {e}")
-            disconnected.append(connection)
-    
-    # Remove disconnected clients
-    for conn in disconnected:
-        if conn in active_connections:
-            active_connections.remove(conn)
+    })
 
 
 # Set up command buffer observer when module loads
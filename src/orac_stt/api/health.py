@@ -3,11 +3,12 @@
 from datetime import datetime
 from typing import Dict, Any
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Response, status
 from pydantic import BaseModel
 
 from ..utils.logging import get_logger
 from ..core.whisper_manager import get_whisper_manager
+from ..core.warmup import get_readiness_gate
 
 logger = get_logger(__name__)
 router = APIRouter()
@@ -41,11 +42,12 @@ async def health_check() -> HealthStatus:
         "whisper_restart_count": whisper_status["restart_count"],
         "whisper_consecutive_failures": whisper_status["consecutive_failures"],
         "watchdog": "running" if whisper_status["watchdog_running"] else "stopped",
+        "circuit_breaker": whisper_status["circuit_breaker"],
     }
 
     # Determine overall status
     overall_status = "healthy"
-    if not whisper_healthy:
+    if not whisper_healthy or whisper_status["circuit_breaker"]["state"] != "closed":
         overall_status = "degraded"
     if whisper_status["consecutive_failures"] >= whisper_manager.max_consecutive_failures:
         overall_status = "unhealthy"
@@ -75,7 +77,14 @@ async def liveness():
     summary="Readiness probe",
     description="Check if service is ready to accept traffic"
 )
-async def readiness():
-    """Readiness probe for Kubernetes."""
-    # TODO: Check if model is loaded and ready
-    return {"status": "ready"}
\ No newline at end of file
+async def readiness(response: Response):
+    """Readiness probe for Kubernetes.
+
+    Reports not ready (503) until the model is loaded and warmed up, and
+    while whisper-server is being restarted.
+    """
+    readiness_status = get_readiness_gate().get_status()
+    if not readiness_status["ready"]:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"status": "not_ready", **readiness_status}
+    return {"status": "ready", **readiness_status}
@@ -4,79 +4,15 @@ from typing import Dict, Any
 import time
 
 from fastapi import APIRouter, Response
-from prometheus_client import (
-    Counter, Histogram, Gauge, 
-    generate_latest, CONTENT_TYPE_LATEST,
-    CollectorRegistry
-)
+from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
 
 from ..utils.logging import get_logger
-
-logger = get_logger(__name__)
-
-# Create a custom registry to avoid conflicts
-registry = CollectorRegistry()
-
-# Define metrics
-request_count = Counter(
-    'orac_stt_requests_total',
-    'Total number of STT requests',
-    ['method', 'endpoint', 'status'],
-    registry=registry
-)
-
-request_duration = Histogram(
-    'orac_stt_request_duration_seconds',
-    'Request duration in seconds',
-    ['method', 'endpoint'],
-    registry=registry
-)
-
-active_requests = Gauge(
-    'orac_stt_active_requests',
-    'Number of active requests',
-    registry=registry
-)
-
-stt_processing_duration = Histogram(
-    'orac_stt_processing_duration_seconds',
-    'STT processing duration in seconds',
-    ['model'],
-    registry=registry
+from ..utils.metrics import (
+    registry, request_count, request_duration, active_requests, error_count,
+    gpu_utilization, gpu_memory_used,
 )
 
-model_load_time = Gauge(
-    'orac_stt_model_load_time_seconds',
-    'Time taken to load the model',
-    ['model'],
-    registry=registry
-)
-
-audio_duration = Histogram(
-    'orac_stt_audio_duration_seconds',
-    'Duration of processed audio in seconds',
-    registry=registry
-)
-
-error_count = Counter(
-    'orac_stt_errors_total',
-    'Total number of errors',
-    ['error_type'],
-    registry=registry
-)
-
-# GPU metrics placeholders
-gpu_utilization = Gauge(
-    'orac_stt_gpu_utilization_percent',
-    'GPU utilization percentage',
-    registry=registry
-)
-
-gpu_memory_used = Gauge(
-    'orac_stt_gpu_memory_used_bytes',
-    'GPU memory used in bytes',
-    registry=registry
-)
+logger = get_logger(__name__)
 
 # Create router
 router = APIRouter()
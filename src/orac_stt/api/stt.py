@@ -2,8 +2,9 @@
 
 import json
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, AsyncIterator, Optional, Set, Tuple
 import asyncio
+import uuid
 from pathlib import Path
 import shutil
 from datetime import datetime
@@ -18,17 +19,31 @@ import numpy as np
 from ..config.settings import Settings, get_settings
 from ..audio.processor import AudioProcessor, AudioStreamBuffer
 from ..audio.validator import AudioValidationError
+from ..models.backends import get_backend_plugin
 from ..models.unified_loader import UnifiedWhisperLoader
 from ..utils.logging import get_logger
+from ..utils.metrics import core_relay_first_token, stt_processing_duration
 from ..history.command_buffer import CommandBuffer
-from ..integrations.orac_core_client import ORACCoreClient
+from ..integrations.orac_core_client import CoreForwardError, ORACCoreClient
+from ..integrations.core_dispatcher import get_core_dispatcher
+from ..integrations.core_pool import get_core_pool
 from ..models.heartbeat import HeartbeatRequest, HeartbeatResponse
 from ..core.heartbeat_manager import get_heartbeat_manager
+from ..core.cascade import SINGLE_MODEL_BACKENDS, get_model_cascade
+from ..core.degradation import get_degradation_controller
+from ..core.residency import get_residency_manager
+from ..core.result_cache import cache_key, get_result_cache
+from ..core.templates import TemplateMatch, get_template_matcher
+from ..models.grammar import get_grammar_compiler, record_grammar_outcome
+from ..models.topic import TopicConfig
 from ..dependencies import get_model_loader, get_command_buffer, get_core_client
 
 router = APIRouter()
 logger = get_logger(__name__)
 
+# Background template verifications (kept referenced until they finish)
+_background_tasks: set = set()
+
 # Debug recording settings
 DEBUG_RECORDINGS_DIR = Path("/app/debug_recordings")
 MAX_DEBUG_RECORDINGS = 5
@@ -86,6 +101,8 @@ class TranscriptionResponse(BaseModel):
     language: Optional[str] = Field(None, description="Detected language code")
     duration: float = Field(..., description="Audio duration in seconds")
     processing_time: float = Field(..., description="Processing time in seconds")
+    degradation_level: int = Field(0, description="Load-adaptive decoding level used (0 = full quality)")
+    template_match: bool = Field(False, description="Answered from an acoustic command template")
 
 
 class TranscriptionRequest(BaseModel):
@@ -102,6 +119,8 @@ class TranscriptionResult:
     language: str
     has_error: bool = False
     error_message: Optional[str] = None
+    degradation_level: int = 0
+    template_match: bool = False
 
     @property
     def should_forward(self) -> bool:
@@ -118,7 +137,9 @@ class TranscriptionResult:
             "confidence": self.confidence,
             "language": self.language,
             "duration": duration,
-            "processing_time": processing_time
+            "processing_time": processing_time,
+            "degradation_level": self.degradation_level,
+            "template_match": self.template_match
         }
 
 
@@ -169,38 +190,233 @@ def save_debug_recording(audio_data: np.ndarray, sample_rate: int, transcription
         return None
 
 
+def get_topic_config(topic: Optional[str]) -> Optional[TopicConfig]:
+    """Look up a topic's configuration.
+
+    Args:
+        topic: Topic name
+
+    Returns:
+        TopicConfig or None if unknown or the registry is unavailable
+    """
+    if not topic:
+        return None
+    try:
+        manager = get_heartbeat_manager()
+        return manager.get_topic_registry().get_topic(topic)
+    except Exception as e:
+        logger.warning(f"Could not get config for topic {topic}: {e}")
+        return None
+
+
 async def transcribe_audio(
     audio_data: np.ndarray,
     sample_rate: int,
     model_loader: UnifiedWhisperLoader,
     language: Optional[str] = None,
-    task: str = "transcribe"
+    task: str = "transcribe",
+    topic: Optional[str] = None
 ) -> Dict[str, Any]:
     """Transcribe audio data using the model.
 
+    Results are cached under a hash of the audio and the decode
+    parameters, so retried uploads are answered from the cache and
+    concurrent identical requests share one inference.
+
     Args:
         audio_data: Audio samples as numpy array
         sample_rate: Sample rate (must be 16000)
         model_loader: Model loader instance (injected)
         language: Language code
         task: Task type (transcribe or translate)
+        topic: Topic the audio belongs to
 
     Returns:
-        Transcription results
+        Transcription results, including the ``degradation_level`` used
     """
-    # Run transcription in thread pool to avoid blocking
-    loop = asyncio.get_event_loop()
+    cache = get_result_cache()
+    if not cache.config.enabled:
+        return await _transcribe_uncached(audio_data, sample_rate, model_loader, language, task, topic)
+
+    topic_config = get_topic_config(topic)
+    key = cache_key(audio_data, sample_rate, {
+        "backend": model_loader.backend_name,
+        "model": model_loader.config.name,
+        "device": model_loader.device,
+        "adaptive_audio_ctx": model_loader.config.adaptive_audio_ctx,
+        "decode": model_loader.decode_guard.config.model_dump(),
+        "language": language,
+        "task": task,
+        "topic": topic or "general",
+        "topic_config": (
+            topic_config.model_dump(mode="json", include={"preferred_model", "cascade", "grammar"})
+            if topic_config else None
+        ),
+    })
+    result, outcome = await cache.get_or_compute(
+        key,
+        lambda: _transcribe_uncached(audio_data, sample_rate, model_loader, language, task, topic)
+    )
+    if outcome != "miss":
+        logger.info(f"Transcription served from result cache ({outcome})")
+    return result
 
-    def transcribe_sync():
-        return model_loader.transcribe(
-            audio_data,
-            sample_rate=sample_rate,
-            language=language,
-            task=task
-        )
 
-    result = await loop.run_in_executor(None, transcribe_sync)
+async def _transcribe_uncached(
+    audio_data: np.ndarray,
+    sample_rate: int,
+    model_loader: UnifiedWhisperLoader,
+    language: Optional[str] = None,
+    task: str = "transcribe",
+    topic: Optional[str] = None
+) -> Dict[str, Any]:
+    """Transcribe audio data, trying command templates before Whisper.
 
+    Short utterances are first matched against acoustic templates of
+    frequent commands; a hit returns the learned text without running
+    Whisper (a sample of hits is re-transcribed in the background to audit
+    false accepts). Everything else goes through ``_transcribe_full``, and
+    confident results of short commands become new templates.
+    """
+    matcher = get_template_matcher()
+    if not matcher.accepts(audio_data, sample_rate, task):
+        return await _transcribe_full(audio_data, sample_rate, model_loader, language, task, topic)
+
+    topic_name = topic or "general"
+    utterance = await asyncio.to_thread(matcher.extract, audio_data, sample_rate)
+    match = await asyncio.to_thread(matcher.match, topic_name, utterance)
+    if match is not None:
+        logger.info(f"Template hit on topic '{topic_name}': '{match.template.text}' ({match.similarity:.3f})")
+        # Verification is skipped while the service is shedding load
+        if matcher.should_verify() and get_degradation_controller().level == 0:
+            verification = asyncio.create_task(
+                _verify_template_match(match, audio_data, sample_rate, model_loader, language, topic)
+            )
+            _background_tasks.add(verification)
+            verification.add_done_callback(_background_tasks.discard)
+        return {**match.result(), "degradation_level": 0}
+
+    start = time.time()
+    result = await _transcribe_full(audio_data, sample_rate, model_loader, language, task, topic)
+    matcher.record_whisper_latency(time.time() - start)
+    matcher.learn(topic_name, utterance, result)
+    return result
+
+
+async def _verify_template_match(
+    match: TemplateMatch,
+    audio_data: np.ndarray,
+    sample_rate: int,
+    model_loader: UnifiedWhisperLoader,
+    language: Optional[str],
+    topic: Optional[str]
+) -> None:
+    """Re-transcribe a template hit with Whisper and audit the outcome."""
+    try:
+        result = await _transcribe_full(audio_data, sample_rate, model_loader, language, "transcribe", topic)
+    except Exception as e:
+        logger.warning(f"Template verification failed: {e}")
+        return
+    get_template_matcher().verify(match, result)
+
+
+async def _transcribe_full(
+    audio_data: np.ndarray,
+    sample_rate: int,
+    model_loader: UnifiedWhisperLoader,
+    language: Optional[str] = None,
+    task: str = "transcribe",
+    topic: Optional[str] = None
+) -> Dict[str, Any]:
+    """Transcribe audio data with Whisper.
+
+    Runs through the model cascade, which falls straight through to the
+    active model (or the topic's preferred model, made resident by the
+    residency manager) unless the cascade is enabled for the topic. Topics
+    with a grammar the backend can apply are decoded constrained first and
+    retried unconstrained when the constrained result scores poorly (not
+    when it was aborted). Decode quality is chosen by
+    the load-adaptive degradation controller; at its last level the request
+    goes straight to the smaller fallback model.
+
+    Args:
+        audio_data: Audio samples as numpy array
+        sample_rate: Sample rate (must be 16000)
+        model_loader: Model loader instance (injected)
+        language: Language code
+        task: Task type (transcribe or translate)
+        topic: Topic the audio belongs to
+
+    Returns:
+        Transcription results, including the ``degradation_level`` used
+    """
+    controller = get_degradation_controller()
+    fallback_model = controller.config.fallback_model
+    small_model_available = (
+        model_loader.backend_name not in SINGLE_MODEL_BACKENDS
+        and fallback_model != model_loader.config.name
+        and model_loader.is_resident(model_name=fallback_model)
+    )
+    duration = len(audio_data) / sample_rate
+    topic_config = get_topic_config(topic)
+    grammar = get_grammar_compiler().for_topic(topic or "general", topic_config)
+    # Only what the backend applies: a GBNF-only grammar is a no-op without
+    # grammar support, and retrying it would just repeat the same decode
+    grammar_options = (
+        grammar.options(get_backend_plugin(model_loader.backend_name).grammar) if grammar else {}
+    )
+    residency = get_residency_manager()
+    preferred_model = await residency.acquire(model_loader, topic_config)
+
+    # The preferred model stays pinned (not evictable) until decoding is done
+    with residency.releasing(preferred_model), controller.track(duration, small_model_available) as level:
+        start = time.time()
+        decode_options = controller.decode_options(level) if controller.config.enabled else {}
+        model_name = decode_options.pop("model_name", None) or preferred_model
+
+        async def run(options: Dict[str, Any]) -> Dict[str, Any]:
+            if model_name and model_name != preferred_model:
+                # Degraded to the small fallback model: no cascade
+                return await model_loader.transcribe_async(
+                    audio_data,
+                    sample_rate=sample_rate,
+                    language=language,
+                    task=task,
+                    model_name=model_name,
+                    **options
+                )
+            return await get_model_cascade().transcribe(
+                model_loader,
+                audio_data,
+                sample_rate=sample_rate,
+                language=language,
+                task=task,
+                topic=topic or "general",
+                topic_config=topic_config,
+                model_name=preferred_model,
+                **options
+            )
+
+        if not grammar_options:
+            result = await run(decode_options)
+        else:
+            result = await run({**decode_options, **grammar_options})
+            if grammar.should_fallback(result):
+                logger.info(
+                    f"Grammar result for topic '{grammar.topic}' scored poorly "
+                    f"(avg_logprob {result.get('avg_logprob')}), retrying unconstrained"
+                )
+                record_grammar_outcome(grammar.topic, "fallback")
+                result = await run(decode_options)
+                result["grammar"] = "fallback"
+            else:
+                record_grammar_outcome(grammar.topic, "constrained")
+                result["grammar"] = "constrained"
+
+    stt_processing_duration.labels(
+        model=model_name or model_loader.config.name, degradation_level=str(level)
+    ).observe(time.time() - start)
+    result["degradation_level"] = level
     return result
 
 
@@ -268,7 +484,8 @@ async def transcribe_with_error_handling(
     model_loader: UnifiedWhisperLoader,
     language: Optional[str],
     task: str,
-    start_time: float
+    start_time: float,
+    topic: Optional[str] = None
 ) -> TranscriptionResult:
     """Transcribe audio with comprehensive error handling.
 
@@ -279,6 +496,7 @@ async def transcribe_with_error_handling(
         language: Optional language code
         task: Task type (transcribe/translate)
         start_time: Start timestamp for logging
+        topic: Topic the audio belongs to
 
     Returns:
         TranscriptionResult with text and metadata
@@ -289,7 +507,8 @@ async def transcribe_with_error_handling(
             sample_rate,
             model_loader,
             language=language,
-            task=task
+            task=task,
+            topic=topic
         )
 
         text = result.get("text", "").strip()
@@ -310,7 +529,9 @@ async def transcribe_with_error_handling(
             text=text,
             confidence=confidence,
             language=detected_language,
-            has_error=False
+            has_error=False,
+            degradation_level=result.get("degradation_level", 0),
+            template_match="template_match" in result
         )
 
     except Exception as e:
@@ -370,29 +591,140 @@ async def forward_to_core_async(
     topic: str,
     metadata: dict
 ) -> None:
-    """Forward transcription to ORAC Core asynchronously.
+    """Queue a transcription for delivery to ORAC Core.
+
+    Delivery (with retries) happens in the background dispatcher, so this
+    does not wait for Core.
 
     Args:
-        core_client: ORAC Core client instance
+        core_client: Default ORAC Core client (used unless the topic has its
+            own ``orac_core_url``)
         text: Transcribed text
         topic: Topic for routing
         metadata: Additional metadata
     """
     try:
-        # Forward asynchronously (don't wait for response)
-        asyncio.create_task(
-            core_client.forward_transcription(
-                text=text,
-                topic=topic,
-                metadata=metadata
-            )
-        )
-
-        logger.info(f"Forwarded transcription to ORAC Core with topic '{topic}'")
+        core_url = get_heartbeat_manager().get_topic_registry().get_core_url(topic) or core_client.base_url
+        if get_core_dispatcher().submit(core_url, text, topic, metadata):
+            logger.info(f"Queued transcription for ORAC Core with topic '{topic}'")
     except Exception as e:
         logger.error(f"Failed to forward to ORAC Core: {e}")
 
 
+class CoreRelay:
+    """A transcription sent to ORAC Core, with Core's answer relayed as it streams.
+
+    Used when the satellite asked for Core's response on its own connection
+    instead of a separate round-trip. The Core request runs in its own task,
+    started before the transcription is sent to the satellite, and the
+    connection only consumes its events: a satellite that disconnects does
+    not stop the command from reaching Core. If it disconnects before Core
+    answered, the stream is dropped and the transcription queued for normal
+    (retried) delivery instead; the same ``forward_id`` is sent both times,
+    so Core can tell a duplicate.
+    """
+
+    def __init__(self, core_client: ORACCoreClient, text: str, topic: str, metadata: dict):
+        """Start the Core request (needs a running loop).
+
+        Args:
+            core_client: Default ORAC Core client (used unless the topic has
+                its own ``orac_core_url``)
+            text: Transcribed text
+            topic: Topic for routing
+            metadata: Additional metadata
+        """
+        self.core_url = get_heartbeat_manager().get_topic_registry().get_core_url(topic) or core_client.base_url
+        self.text = text
+        self.topic = topic
+        self.metadata = {**metadata, "forward_id": uuid.uuid4().hex}
+        self.answered = False
+        self._events: asyncio.Queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+        _relay_tasks.add(self._task)
+        self._task.add_done_callback(_relay_tasks.discard)
+
+    async def _run(self) -> None:
+        started = time.time()
+        try:
+            async for event in get_core_pool().get(self.core_url).stream_transcription(
+                self.text, self.topic, self.metadata, read_timeout=get_settings().streaming.relay_read_timeout
+            ):
+                if not self.answered:
+                    self.answered = True
+                    core_relay_first_token.observe(time.time() - started)
+                self._events.put_nowait(event)
+        except CoreForwardError as e:
+            logger.warning(f"Relaying ORAC Core response failed: {e}")
+            queued = False
+            if e.retryable and not self.answered:
+                queued = self._queue_forward()
+            self._events.put_nowait({"type": "core_error", "error": str(e), "queued": queued})
+        finally:
+            self._events.put_nowait(None)
+
+    def _queue_forward(self) -> bool:
+        return get_core_dispatcher().submit(self.core_url, self.text, self.topic, self.metadata)
+
+    async def events(self) -> AsyncIterator[Dict[str, Any]]:
+        """Yield ``core_token`` events, then ``core_response`` (or ``core_error``)."""
+        while True:
+            event = await self._events.get()
+            if event is None:
+                return
+            yield event
+
+    def abandon(self) -> None:
+        """The satellite went away before all events were sent.
+
+        Once Core has started answering it has the command, and the request
+        is left to finish. Before that, the stream is cancelled and the
+        transcription queued for retried delivery.
+        """
+        if self._task.done() or self.answered:
+            return
+        self._task.cancel()
+        if self._queue_forward():
+            logger.info(f"Satellite disconnected before ORAC Core answered, queued '{self.topic}' transcription")
+
+
+# Core relays still running after their connection closed
+_relay_tasks: Set[asyncio.Task] = set()
+
+
+def relay_stream_response(
+    response: TranscriptionResponse,
+    core_relay: Optional[CoreRelay]
+) -> StreamingResponse:
+    """Stream the transcription and then Core's answer as server-sent events.
+
+    Args:
+        response: Transcription response (sent first)
+        core_relay: Core relay, or None if nothing was forwarded
+
+    Returns:
+        ``text/event-stream`` response ending with a ``done`` event
+    """
+    def sse(event: Dict[str, Any]) -> str:
+        return f"event: {event['type']}\ndata: {json.dumps(event, default=str)}\n\n"
+
+    async def body():
+        finished = False
+        try:
+            yield sse({"type": "transcription", **response.model_dump(mode="json")})
+            if core_relay is not None:
+                async for event in core_relay.events():
+                    yield sse(event)
+            finished = True
+            yield sse({"type": "done"})
+        finally:
+            # Closed or cancelled: the client disconnected
+            if core_relay is not None and not finished:
+                core_relay.abandon()
+
+    return StreamingResponse(body(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
 def build_transcription_response(
     result: TranscriptionResult,
     duration: float,
@@ -422,7 +754,9 @@ def build_transcription_response(
             confidence=result.confidence,
             language=result.language,
             duration=duration,
-            processing_time=processing_time
+            processing_time=processing_time,
+            degradation_level=result.degradation_level,
+            template_match=result.template_match
         )
 
 
@@ -516,6 +850,7 @@ async def transcribe_stream_with_topic(
     language: Optional[str] = None,
     task: str = "transcribe",
     forward_to_core: bool = True,
+    relay: bool = False,
     model_loader: UnifiedWhisperLoader = Depends(get_model_loader),
     command_buffer: CommandBuffer = Depends(get_command_buffer),
     core_client: ORACCoreClient = Depends(get_core_client)
@@ -524,6 +859,8 @@ async def transcribe_stream_with_topic(
 
     This endpoint accepts audio files, transcribes them, and optionally
     forwards the transcription to ORAC Core with the specified topic.
+    With ``relay=true`` the response is a server-sent event stream: the
+    transcription first, then Core's answer as Core generates it.
 
     Args:
         topic: Topic ID for ORAC Core routing
@@ -532,6 +869,7 @@ async def transcribe_stream_with_topic(
         language: Optional language code
         task: Task type (transcribe or translate)
         forward_to_core: Whether to forward transcription to ORAC Core
+        relay: Stream ORAC Core's response back on this request (SSE)
         model_loader: Model loader instance (injected)
         command_buffer: Command buffer instance (injected)
         core_client: ORAC Core client instance (injected)
@@ -558,7 +896,8 @@ async def transcribe_stream_with_topic(
         command_buffer=command_buffer,
         core_client=core_client,
         wake_word_time=wake_word_time,
-        recording_end_time=recording_end_time
+        recording_end_time=recording_end_time,
+        relay=relay
     )
 
 
@@ -568,6 +907,7 @@ async def transcribe_stream(
     language: Optional[str] = None,
     task: str = "transcribe",
     forward_to_core: bool = True,
+    relay: bool = False,
     model_loader: UnifiedWhisperLoader = Depends(get_model_loader),
     command_buffer: CommandBuffer = Depends(get_command_buffer),
     core_client: ORACCoreClient = Depends(get_core_client)
@@ -584,7 +924,8 @@ async def transcribe_stream(
         forward_to_core=forward_to_core,
         model_loader=model_loader,
         command_buffer=command_buffer,
-        core_client=core_client
+        core_client=core_client,
+        relay=relay
     )
 
 
@@ -598,7 +939,8 @@ async def _transcribe_impl(
     topic: str = "general",
     forward_to_core: bool = True,
     wake_word_time: Optional[str] = None,
-    recording_end_time: Optional[str] = None
+    recording_end_time: Optional[str] = None,
+    relay: bool = False
 ) -> TranscriptionResponse:
     """Main transcription orchestrator.
 
@@ -616,9 +958,11 @@ async def _transcribe_impl(
         forward_to_core: Whether to forward to Core
         wake_word_time: ISO timestamp when wake word was detected (from Hey ORAC)
         recording_end_time: ISO timestamp when recording ended (from Hey ORAC)
+        relay: Stream the response and ORAC Core's answer as server-sent events
 
     Returns:
-        TranscriptionResponse with results or error info
+        TranscriptionResponse with results or error info (a server-sent
+        event stream when relaying)
     """
     start_time = time.time()
 
@@ -633,7 +977,8 @@ async def _transcribe_impl(
 
         # 3. Transcribe with error handling
         result = await transcribe_with_error_handling(
-            audio_data, sample_rate, model_loader, language, task, start_time
+            audio_data, sample_rate, model_loader, language, task, start_time,
+            topic=topic
         )
 
         # 4. Add to command history
@@ -650,6 +995,7 @@ async def _transcribe_impl(
         )
 
         # 5. Forward to ORAC Core if successful
+        core_relay = None
         if result.should_forward and forward_to_core:
             # Build metadata with timing information
             metadata = result.get_metadata(duration, time.time() - start_time)
@@ -663,27 +1009,26 @@ async def _transcribe_impl(
                 metadata['recording_end_time'] = recording_end_time
 
             # Strip wake word from transcription before forwarding
-            wake_words_to_strip = None
-            try:
-                manager = get_heartbeat_manager()
-                topic_registry = manager.get_topic_registry()
-                topic_config = topic_registry.get_topic(topic)
-                if topic_config:
-                    wake_words_to_strip = topic_config.wake_words_to_strip
-            except Exception as e:
-                logger.warning(f"Could not get wake words for topic {topic}: {e}")
+            topic_config = get_topic_config(topic)
+            wake_words_to_strip = topic_config.wake_words_to_strip if topic_config else None
 
             text_to_forward = strip_wake_word(result.text, wake_words_to_strip)
 
-            await forward_to_core_async(
-                core_client=core_client,
-                text=text_to_forward,
-                topic=topic,
-                metadata=metadata
-            )
+            if relay:
+                core_relay = CoreRelay(core_client, text_to_forward, topic, metadata)
+            else:
+                await forward_to_core_async(
+                    core_client=core_client,
+                    text=text_to_forward,
+                    topic=topic,
+                    metadata=metadata
+                )
 
         # 6. Build and return response
-        return build_transcription_response(result, duration, time.time() - start_time)
+        response = build_transcription_response(result, duration, time.time() - start_time)
+        if relay:
+            return relay_stream_response(response, core_relay)
+        return response
 
     except AudioValidationError as e:
         return handle_validation_error(e, command_buffer, time.time() - start_time)
@@ -704,13 +1049,16 @@ class StreamingTranscriptionResult(BaseModel):
     language: Optional[str] = None
     duration: float
     processing_time: float
+    degradation_level: int = 0
+    template_match: bool = False
     is_final: bool = True
 
 
 @router.websocket("/ws/stream/{topic}")
 async def websocket_stream_transcription(
     websocket: WebSocket,
-    topic: str
+    topic: str,
+    relay: bool = False
 ):
     """Stream audio via WebSocket for real-time transcription.
 
@@ -718,11 +1066,16 @@ async def websocket_stream_transcription(
     - Client sends binary frames: raw int16 audio chunks (16kHz mono)
     - Client sends text frame: {"type": "end"} to signal end of speech
     - Client can send text frame: {"type": "config", ...} to configure
+      (``"relay": true`` is the same as the ``relay`` query parameter)
     - Server sends text frame: JSON transcription result when done
+    - With relay, the server then sends ORAC Core's answer as
+      ``core_token`` frames and a final ``core_response`` (or
+      ``core_error``) frame before closing
 
     Args:
         websocket: WebSocket connection
         topic: Topic ID for ORAC Core routing
+        relay: Relay ORAC Core's response over this connection
     """
     settings = get_settings()
 
@@ -789,19 +1142,31 @@ async def websocket_stream_transcription(
                         )
 
                         # Perform transcription
-                        result = await _transcribe_stream_buffer(
+                        result, core_relay = await _transcribe_stream_buffer(
                             stream_buffer=stream_buffer,
                             model_loader=model_loader,
                             command_buffer=command_buffer,
                             core_client=core_client,
                             topic=topic,
                             start_time=start_time,
-                            wake_word_time=wake_word_time
+                            wake_word_time=wake_word_time,
+                            relay=relay
                         )
 
-                        # Send result to client
-                        await websocket.send_text(result.model_dump_json())
-                        logger.info(f"Sent transcription result: {result.text[:50]}...")
+                        relayed = False
+                        try:
+                            # Send result to client
+                            await websocket.send_text(result.model_dump_json())
+                            logger.info(f"Sent transcription result: {result.text[:50]}...")
+
+                            # Relay Core's answer on the same connection
+                            if core_relay is not None:
+                                async for event in core_relay.events():
+                                    await websocket.send_text(json.dumps(event, default=str))
+                            relayed = True
+                        finally:
+                            if core_relay is not None and not relayed:
+                                core_relay.abandon()
 
                         # Close connection after final result
                         connection_open = False
@@ -811,6 +1176,8 @@ async def websocket_stream_transcription(
                         wake_word_time = control.get("wake_word_time")
                         if wake_word_time:
                             logger.info(f"⏱️ Received wake word time: {wake_word_time}")
+                        if "relay" in control:
+                            relay = bool(control["relay"])
 
                     elif msg_type == "ping":
                         # Keep-alive ping
@@ -848,8 +1215,9 @@ async def _transcribe_stream_buffer(
     core_client: ORACCoreClient,
     topic: str,
     start_time: float,
-    wake_word_time: Optional[str] = None
-) -> StreamingTranscriptionResult:
+    wake_word_time: Optional[str] = None,
+    relay: bool = False
+) -> Tuple[StreamingTranscriptionResult, Optional[CoreRelay]]:
     """Transcribe accumulated audio from stream buffer.
 
     Args:
@@ -860,9 +1228,11 @@ async def _transcribe_stream_buffer(
         topic: Topic for routing
         start_time: Connection start time
         wake_word_time: Wake word detection timestamp
+        relay: Send to ORAC Core for relaying instead of queuing the forward
 
     Returns:
-        StreamingTranscriptionResult with transcription
+        StreamingTranscriptionResult with transcription, and the running
+        CoreRelay when relaying (None otherwise)
     """
     transcribe_start = time.time()
 
@@ -878,7 +1248,7 @@ async def _transcribe_stream_buffer(
             duration=0.0,
             processing_time=0.0,
             is_final=True
-        )
+        ), None
 
     # Save debug recording
     audio_path = await save_debug_recording_if_enabled(
@@ -892,7 +1262,8 @@ async def _transcribe_stream_buffer(
         model_loader=model_loader,
         language=None,
         task="transcribe",
-        start_time=transcribe_start
+        start_time=transcribe_start,
+        topic=topic
     )
 
     processing_time = time.time() - transcribe_start
@@ -911,6 +1282,7 @@ async def _transcribe_stream_buffer(
     )
 
     # Forward to ORAC Core if successful
+    core_relay = None
     if result.should_forward:
         metadata = result.get_metadata(duration, processing_time)
         metadata['stt_start_time'] = datetime.fromtimestamp(transcribe_start).isoformat()
@@ -920,24 +1292,20 @@ async def _transcribe_stream_buffer(
             metadata['wake_word_time'] = wake_word_time
 
         # Strip wake word from transcription before forwarding
-        wake_words_to_strip = None
-        try:
-            manager = get_heartbeat_manager()
-            topic_registry = manager.get_topic_registry()
-            topic_config = topic_registry.get_topic(topic)
-            if topic_config:
-                wake_words_to_strip = topic_config.wake_words_to_strip
-        except Exception as e:
-            logger.warning(f"Could not get wake words for topic {topic}: {e}")
+        topic_config = get_topic_config(topic)
+        wake_words_to_strip = topic_config.wake_words_to_strip if topic_config else None
 
         text_to_forward = strip_wake_word(result.text, wake_words_to_strip)
 
-        await forward_to_core_async(
-            core_client=core_client,
-            text=text_to_forward,
-            topic=topic,
-            metadata=metadata
-        )
+        if relay:
+            core_relay = CoreRelay(core_client, text_to_forward, topic, metadata)
+        else:
+            await forward_to_core_async(
+                core_client=core_client,
+                text=text_to_forward,
+                topic=topic,
+                metadata=metadata
+            )
 
     return StreamingTranscriptionResult(
         text=result.text,
@@ -945,8 +1313,10 @@ async def _transcribe_stream_buffer(
         language=result.language,
         duration=duration,
         processing_time=processing_time,
+        degradation_level=result.degradation_level,
+        template_match=result.template_match,
         is_final=True
-    )
+    ), core_relay
 
 
 @router.get("/health")
@@ -958,14 +1328,20 @@ async def stt_health(
         settings = get_settings()
 
         # Check if model is loaded
-        model_loaded = model_loader._model is not None
+        model_loaded = model_loader.is_loaded
 
         return {
             "status": "healthy" if model_loaded else "initializing",
             "model_loaded": model_loaded,
             "model_name": model_loader.config.name,
-            "backend": "whisper-server" if model_loader.use_whisper_server else ("whisper.cpp" if model_loader.use_whisper_cpp else "pytorch"),
-            "device": model_loader.config.device,
+            "backend": model_loader.backend_name,
+            "device": model_loader.device,
+            "loaded_backends": model_loader.loaded_backends(),
+            "quantization": model_loader.quantization(),
+            "audio_ctx_buckets": (
+                model_loader.audio_ctx_policy.to_list()
+                if model_loader.audio_ctx_policy else None
+            ),
             "streaming": {
                 "enabled": settings.streaming.enabled,
                 "buffer_threshold_ms": settings.streaming.buffer_threshold_ms,
@@ -993,7 +1369,7 @@ async def preload_model(
         start_time = time.time()
         
         # Load model if not already loaded
-        if model_loader._model is None:
+        if not model_loader.is_loaded:
             await asyncio.get_event_loop().run_in_executor(
                 None,
                 model_loader.load_model
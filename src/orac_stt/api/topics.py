@@ -4,8 +4,11 @@ from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel, Field
 
 from ..core.heartbeat_manager import get_heartbeat_manager
-from ..models.topic import TopicConfig
+from ..models.grammar import GrammarError, get_grammar_compiler
+from ..models.quantization import split_model_name
+from ..models.topic import TopicCascadeConfig, TopicConfig, TopicGrammar
 from ..utils.logging import get_logger
+from .admin import MODEL_INFO
 
 logger = get_logger(__name__)
 router = APIRouter(prefix="/admin/topics", tags=["topics"])
@@ -17,6 +20,11 @@ class TopicConfigUpdate(BaseModel):
     wake_words_to_strip: Optional[str] = Field(None, description="Comma-separated wake words to strip from transcriptions")
 
 
+class TopicModelUpdate(BaseModel):
+    """Request model for setting a topic's preferred model."""
+    preferred_model: Optional[str] = Field(None, description="Model name (None uses the configured model)")
+
+
 class TopicResponse(BaseModel):
     """Response model for topic information."""
     name: str
@@ -25,6 +33,9 @@ class TopicResponse(BaseModel):
     last_seen: Optional[str]
     metadata: dict
     wake_words_to_strip: Optional[str] = None
+    cascade: Optional[TopicCascadeConfig] = None
+    preferred_model: Optional[str] = None
+    grammar: Optional[TopicGrammar] = None
 
     @classmethod
     def from_config(cls, config: TopicConfig) -> "TopicResponse":
@@ -35,7 +46,10 @@ class TopicResponse(BaseModel):
             orac_core_url=config.orac_core_url,
             last_seen=config.last_seen.isoformat() if config.last_seen else None,
             metadata=config.metadata,
-            wake_words_to_strip=config.wake_words_to_strip
+            wake_words_to_strip=config.wake_words_to_strip,
+            cascade=config.cascade,
+            preferred_model=config.preferred_model,
+            grammar=config.grammar
         )
 
 
@@ -124,6 +138,151 @@ async def update_topic_config(topic_name: str, config: TopicConfigUpdate):
         )
 
 
+@router.post("/{topic_name}/cascade")
+async def update_topic_cascade(topic_name: str, cascade: TopicCascadeConfig):
+    """Set model cascade overrides for a topic.
+
+    Fields left unset use the global [cascade] settings.
+
+    Args:
+        topic_name: Name of the topic
+        cascade: Cascade overrides
+
+    Returns:
+        Success status
+    """
+    try:
+        manager = get_heartbeat_manager()
+        registry = manager.get_topic_registry()
+        registry.set_cascade(topic_name, cascade)
+
+        logger.info(f"Updated cascade for topic '{topic_name}': {cascade.model_dump(exclude_none=True)}")
+
+        return {"status": "ok", "message": f"Topic '{topic_name}' cascade updated"}
+    except Exception as e:
+        logger.error(f"Failed to update topic cascade: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+
+@router.delete("/{topic_name}/cascade")
+async def remove_topic_cascade(topic_name: str):
+    """Remove cascade overrides for a topic (use global settings).
+
+    Args:
+        topic_name: Name of the topic
+
+    Returns:
+        Success status
+    """
+    try:
+        manager = get_heartbeat_manager()
+        registry = manager.get_topic_registry()
+        registry.set_cascade(topic_name, None)
+
+        return {"status": "ok", "message": f"Topic '{topic_name}' cascade reset to defaults"}
+    except Exception as e:
+        logger.error(f"Failed to remove topic cascade: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+
+@router.post("/{topic_name}/model")
+async def update_topic_model(topic_name: str, update: TopicModelUpdate):
+    """Set the preferred model for a topic.
+
+    Takes effect when model residency is enabled and the backend can hold
+    more than one model.
+
+    Args:
+        topic_name: Name of the topic
+        update: Preferred model (a known model, optionally with ``-int8``)
+
+    Returns:
+        Success status
+    """
+    model_name = update.preferred_model
+    if model_name is not None and split_model_name(model_name)[0] not in MODEL_INFO:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid model: {model_name}")
+
+    try:
+        manager = get_heartbeat_manager()
+        registry = manager.get_topic_registry()
+        registry.set_preferred_model(topic_name, update.preferred_model)
+
+        logger.info(f"Updated preferred model for topic '{topic_name}': {update.preferred_model}")
+
+        return {"status": "ok", "message": f"Topic '{topic_name}' preferred model updated"}
+    except Exception as e:
+        logger.error(f"Failed to update topic model: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+
+@router.post("/{topic_name}/grammar")
+async def update_topic_grammar(topic_name: str, grammar: TopicGrammar):
+    """Constrain decoding for a topic with a GBNF grammar or phrase list.
+
+    Args:
+        topic_name: Name of the topic
+        grammar: Grammar settings
+
+    Returns:
+        Success status with the compiled grammar
+    """
+    compiler = get_grammar_compiler()
+    try:
+        compiled = compiler.compile(topic_name, grammar)
+    except GrammarError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    try:
+        manager = get_heartbeat_manager()
+        registry = manager.get_topic_registry()
+        registry.set_grammar(topic_name, grammar)
+
+        logger.info(f"Updated grammar for topic '{topic_name}' ({compiled.digest})")
+
+        return {"status": "ok", "message": f"Topic '{topic_name}' grammar updated", "gbnf": compiled.gbnf}
+    except Exception as e:
+        logger.error(f"Failed to update topic grammar: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+
+@router.delete("/{topic_name}/grammar")
+async def remove_topic_grammar(topic_name: str):
+    """Remove the grammar for a topic (unconstrained decoding).
+
+    Args:
+        topic_name: Name of the topic
+
+    Returns:
+        Success status
+    """
+    try:
+        manager = get_heartbeat_manager()
+        registry = manager.get_topic_registry()
+        registry.set_grammar(topic_name, None)
+        get_grammar_compiler().invalidate(topic_name)
+
+        return {"status": "ok", "message": f"Topic '{topic_name}' grammar removed"}
+    except Exception as e:
+        logger.error(f"Failed to remove topic grammar: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+
 @router.delete("/{topic_name}/config")
 async def remove_topic_config(topic_name: str):
     """Remove Core URL override for a topic (use default).
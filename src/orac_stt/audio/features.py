@@ -0,0 +1,164 @@
+"""Compact acoustic features for template matching.
+
+MFCCs with per-utterance mean/variance normalization, compared with
+dynamic time warping. Cheap enough to run on every request on CPU.
+"""
+
+from functools import lru_cache
+from typing import List, Optional
+
+import numpy as np
+from scipy.fft import dct
+
+FRAME_LENGTH = 0.025  # seconds
+FRAME_HOP = 0.010  # seconds
+N_FFT = 512
+N_MELS = 26
+N_MFCC = 13
+
+
+@lru_cache(maxsize=4)
+def _mel_filterbank(sample_rate: int, n_fft: int = N_FFT, n_mels: int = N_MELS) -> np.ndarray:
+    """Triangular mel filterbank of shape (n_mels, n_fft // 2 + 1)."""
+    def hz_to_mel(hz):
+        return 2595.0 * np.log10(1.0 + hz / 700.0)
+
+    def mel_to_hz(mel):
+        return 700.0 * (10 ** (mel / 2595.0) - 1.0)
+
+    mel_points = np.linspace(hz_to_mel(0.0), hz_to_mel(sample_rate / 2), n_mels + 2)
+    bins = np.floor((n_fft + 1) * mel_to_hz(mel_points) / sample_rate).astype(int)
+
+    filters = np.zeros((n_mels, n_fft // 2 + 1))
+    for m in range(1, n_mels + 1):
+        left, center, right = bins[m - 1], bins[m], bins[m + 1]
+        if center > left:
+            filters[m - 1, left:center] = (np.arange(left, center) - left) / (center - left)
+        if right > center:
+            filters[m - 1, center:right] = (right - np.arange(center, right)) / (right - center)
+    return filters
+
+
+def trim_silence(audio: np.ndarray, sample_rate: int = 16000, threshold_db: float = -35.0) -> np.ndarray:
+    """Trim leading and trailing frames quieter than the peak by ``threshold_db``.
+
+    Args:
+        audio: Audio samples
+        sample_rate: Sample rate in Hz
+        threshold_db: Frame energy threshold relative to the loudest frame
+
+    Returns:
+        Trimmed audio (unchanged if it is silent throughout)
+    """
+    hop = int(FRAME_HOP * sample_rate)
+    if len(audio) < hop:
+        return audio
+    frames = len(audio) // hop
+    energy = np.sqrt(np.mean(audio[:frames * hop].reshape(frames, hop) ** 2, axis=1)) + 1e-10
+    level = 20 * np.log10(energy / energy.max())
+    voiced = np.flatnonzero(level > threshold_db)
+    if len(voiced) == 0:
+        return audio
+    return audio[voiced[0] * hop:(voiced[-1] + 1) * hop]
+
+
+def mfcc(audio: np.ndarray, sample_rate: int = 16000, n_mfcc: int = N_MFCC) -> np.ndarray:
+    """Compute normalized MFCC frames.
+
+    Args:
+        audio: Audio samples (float, mono)
+        sample_rate: Sample rate in Hz
+        n_mfcc: Number of cepstral coefficients
+
+    Returns:
+        Array of shape (frames, n_mfcc), zero mean and unit variance per
+        coefficient
+    """
+    audio = np.asarray(audio, dtype=np.float32)
+    frame_len = int(FRAME_LENGTH * sample_rate)
+    hop = int(FRAME_HOP * sample_rate)
+    if len(audio) < frame_len:
+        audio = np.pad(audio, (0, frame_len - len(audio)))
+
+    emphasized = np.append(audio[0], audio[1:] - 0.97 * audio[:-1])
+    n_frames = 1 + (len(emphasized) - frame_len) // hop
+    index = np.arange(frame_len)[None, :] + hop * np.arange(n_frames)[:, None]
+    frames = emphasized[index] * np.hamming(frame_len)
+
+    power = np.abs(np.fft.rfft(frames, N_FFT)) ** 2 / N_FFT
+    mel_energy = power @ _mel_filterbank(sample_rate).T
+    coefficients = dct(np.log(mel_energy + 1e-10), type=2, axis=1, norm="ortho")[:, :n_mfcc]
+
+    std = coefficients.std(axis=0)
+    return (coefficients - coefficients.mean(axis=0)) / np.where(std > 1e-8, std, 1.0)
+
+
+def pool_frames(features: np.ndarray, factor: int = 2) -> np.ndarray:
+    """Average groups of ``factor`` consecutive frames (cheaper DTW)."""
+    if factor <= 1 or len(features) < factor:
+        return features
+    usable = len(features) // factor * factor
+    return features[:usable].reshape(-1, factor, features.shape[1]).mean(axis=1)
+
+
+def dtw_distances(query: np.ndarray, templates: List[np.ndarray], band: Optional[float] = 0.3) -> np.ndarray:
+    """Length-normalized DTW distances from a query to several templates.
+
+    All templates are aligned at once: cells are filled one anti-diagonal
+    at a time across a padded (templates, n, m) cost tensor, so the cost
+    of a lookup grows with sequence length rather than template count.
+
+    Args:
+        query: Features of shape (n, dim)
+        templates: Feature arrays of shape (m_t, dim)
+        band: Sakoe-Chiba band as a fraction of the longer sequence (None: unconstrained)
+
+    Returns:
+        Per template, the mean per-step Euclidean distance divided by
+        sqrt(dim) along the best path (inf if the band admits no path)
+    """
+    n = len(query)
+    if n == 0 or not templates:
+        return np.full(len(templates), np.inf)
+    lengths = np.array([len(t) for t in templates])
+    m_max = int(lengths.max())
+    scale = np.sqrt(query.shape[1])
+
+    cost = np.full((len(templates), n, m_max), np.inf)
+    rows = np.arange(n)[:, None]
+    for t, template in enumerate(templates):
+        m = len(template)
+        if m == 0:
+            continue
+        block = np.sqrt(((query[:, None, :] - template[None, :, :]) ** 2).sum(axis=2)) / scale
+        if band is not None:
+            width = max(int(band * max(n, m)), abs(n - m) + 1)
+            block = np.where(np.abs(rows * m / n - np.arange(m)[None, :]) <= width, block, np.inf)
+        cost[t, :, :m] = block
+
+    acc = np.full((len(templates), n + 1, m_max + 1), np.inf)
+    acc[:, 0, 0] = 0.0
+    for k in range(2, n + m_max + 1):
+        i = np.arange(max(1, k - m_max), min(n, k - 1) + 1)
+        j = k - i
+        acc[:, i, j] = cost[:, i - 1, j - 1] + np.minimum(
+            np.minimum(acc[:, i - 1, j - 1], acc[:, i - 1, j]), acc[:, i, j - 1]
+        )
+    with np.errstate(invalid="ignore"):
+        return acc[np.arange(len(templates)), n, lengths] / (n + lengths)
+
+
+def dtw_distance(a: np.ndarray, b: np.ndarray, band: Optional[float] = 0.3) -> float:
+    """Length-normalized DTW distance between two feature sequences.
+
+    Args:
+        a: Features of shape (n, dim)
+        b: Features of shape (m, dim)
+        band: Sakoe-Chiba band (see dtw_distances)
+
+    Returns:
+        Distance (inf if either sequence is empty)
+    """
+    if len(b) == 0:
+        return float("inf")
+    return float(dtw_distances(a, [b], band)[0])
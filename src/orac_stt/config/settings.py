@@ -2,7 +2,7 @@
 
 import os
 from pathlib import Path
-from typing import Optional
+from typing import List, Literal, Optional
 from pydantic import Field, field_validator, ConfigDict
 from pydantic_settings import BaseSettings
 
@@ -13,8 +13,18 @@ class ModelConfig(BaseSettings):
     name: str = Field(default="whisper-tiny", env="MODEL_NAME")
     cache_dir: Path = Field(default=Path("/app/models/whisper_cpp/whisper"), env="MODEL_CACHE_DIR")
     device: str = Field(default="cuda", env="MODEL_DEVICE")
+    backend: Optional[str] = Field(default=None, env="MODEL_BACKEND")  # None: derive from USE_WHISPER_* env
+    warmup_durations: List[float] = Field(default=[1.0, 3.0, 8.0], env="MODEL_WARMUP_DURATIONS")  # Empty: no warm-up
+    adaptive_audio_ctx: bool = Field(default=False, env="MODEL_ADAPTIVE_AUDIO_CTX")  # Shrink encoder window for short audio
+    audio_ctx_calibration: Path = Field(
+        default=Path("/app/data/audio_ctx_calibration.json"), env="MODEL_AUDIO_CTX_CALIBRATION"
+    )
+    speculative_draft_model: Optional[str] = Field(default=None, env="MODEL_SPECULATIVE_DRAFT_MODEL")  # In-process backends only
+    speculative_k: int = Field(default=4, env="MODEL_SPECULATIVE_K")  # Draft tokens verified per target pass
+    quantization: Optional[str] = Field(default=None, env="MODEL_QUANTIZATION")  # "int8": PyTorch backend on CPU
+    quantized_cache: bool = Field(default=True, env="MODEL_QUANTIZED_CACHE")  # Keep quantized models in cache_dir/quantized
     
-    @field_validator("cache_dir", mode="before")
+    @field_validator("cache_dir", "audio_ctx_calibration", mode="before")
     @classmethod
     def validate_cache_dir(cls, v):
         if isinstance(v, str):
@@ -42,6 +52,7 @@ class StreamingConfig(BaseSettings):
     buffer_threshold_ms: int = Field(default=500, env="STREAMING_BUFFER_THRESHOLD_MS")
     partial_results: bool = Field(default=False, env="STREAMING_PARTIAL_RESULTS")
     audio_format: str = Field(default="int16", env="STREAMING_AUDIO_FORMAT")
+    relay_read_timeout: float = Field(default=30.0, env="STREAMING_RELAY_READ_TIMEOUT")  # Longest gap between relayed Core chunks
 
     model_config = ConfigDict(env_prefix="ORAC_")
 
@@ -52,11 +63,224 @@ class CommandAPIConfig(BaseSettings):
     url: str = Field(default="http://localhost:8001/command", env="COMMAND_API_URL")
     timeout: int = Field(default=30, env="COMMAND_API_TIMEOUT")
     max_retries: int = Field(default=3, env="COMMAND_API_MAX_RETRIES")
-    retry_delay: float = Field(default=1.0, env="COMMAND_API_RETRY_DELAY")
+    retry_delay: float = Field(default=1.0, env="COMMAND_API_RETRY_DELAY")  # Doubled after every failed attempt
+    max_retry_delay: float = Field(default=60.0, env="COMMAND_API_MAX_RETRY_DELAY")
+    max_age: float = Field(default=300.0, env="COMMAND_API_MAX_AGE")  # Drop forwards older than this (stale commands)
+    queue_size: int = Field(default=256, env="COMMAND_API_QUEUE_SIZE")  # Forwards beyond this are rejected
+    per_core_concurrency: int = Field(default=2, env="COMMAND_API_PER_CORE_CONCURRENCY")  # Workers (in-flight requests) per Core URL
+    spill_path: Optional[Path] = Field(default=None, env="COMMAND_API_SPILL_PATH")  # Append-only log of pending forwards
     
     model_config = ConfigDict(env_prefix="ORAC_")
 
 
+class CorePoolConfig(BaseSettings):
+    """Pooled HTTP connections to ORAC Core instances."""
+
+    limit: int = Field(default=32, env="CORE_POOL_LIMIT")  # Open connections across all Core URLs
+    limit_per_host: int = Field(default=4, env="CORE_POOL_LIMIT_PER_HOST")
+    keepalive_timeout: float = Field(default=60.0, env="CORE_POOL_KEEPALIVE_TIMEOUT")  # Idle connection reuse window
+    idle_timeout: float = Field(default=600.0, env="CORE_POOL_IDLE_TIMEOUT")  # Close clients of Core URLs unused this long
+    dns_cache_ttl: int = Field(default=300, env="CORE_POOL_DNS_CACHE_TTL")
+
+    model_config = ConfigDict(env_prefix="ORAC_CORE_POOL_")
+
+
+class DecodeConfig(BaseSettings):
+    """Duration-aware decode budget and repetition guard settings."""
+
+    enabled: bool = Field(default=True, env="DECODE_GUARD_ENABLED")
+    tokens_per_second: float = Field(default=6.0, env="DECODE_TOKENS_PER_SECOND")  # Fast speech is ~4 tokens/s
+    min_tokens: int = Field(default=16, env="DECODE_MIN_TOKENS")  # Added to every budget
+    max_tokens: int = Field(default=224, env="DECODE_MAX_TOKENS")
+    timeout_factor: float = Field(default=3.0, env="DECODE_TIMEOUT_FACTOR")  # Seconds of decode per second of audio
+    min_timeout: float = Field(default=5.0, env="DECODE_MIN_TIMEOUT")
+    compression_ratio_threshold: float = Field(default=2.4, env="DECODE_COMPRESSION_RATIO_THRESHOLD")
+
+    model_config = ConfigDict(env_prefix="ORAC_DECODE_")
+
+
+class DegradationConfig(BaseSettings):
+    """Load-adaptive quality degradation settings."""
+
+    enabled: bool = Field(default=False, env="DEGRADATION_ENABLED")
+    # Full-quality decoding (level 0)
+    beam_size: int = Field(default=5, env="DEGRADATION_BEAM_SIZE")
+    best_of: int = Field(default=5, env="DEGRADATION_BEST_OF")
+    temperature_inc: float = Field(default=0.2, env="DEGRADATION_TEMPERATURE_INC")
+    # Degraded decoding
+    degraded_temperature_inc: float = Field(default=0.5, env="DEGRADATION_DEGRADED_TEMPERATURE_INC")
+    fallback_model: str = Field(default="whisper-tiny", env="DEGRADATION_FALLBACK_MODEL")
+    # Load thresholds (step up above *_high, step down below *_low)
+    queue_depth_high: int = Field(default=3, env="DEGRADATION_QUEUE_DEPTH_HIGH")
+    queue_depth_low: int = Field(default=1, env="DEGRADATION_QUEUE_DEPTH_LOW")
+    rtf_high: float = Field(default=0.5, env="DEGRADATION_RTF_HIGH")
+    rtf_low: float = Field(default=0.25, env="DEGRADATION_RTF_LOW")
+    rtf_window: float = Field(default=30.0, env="DEGRADATION_RTF_WINDOW")  # Seconds of history
+    step_up_interval: float = Field(default=5.0, env="DEGRADATION_STEP_UP_INTERVAL")  # Min seconds between steps up
+    step_down_interval: float = Field(default=30.0, env="DEGRADATION_STEP_DOWN_INTERVAL")  # Min seconds before restoring
+
+    model_config = ConfigDict(env_prefix="ORAC_DEGRADATION_")
+
+
+class ResidencyConfig(BaseSettings):
+    """Multi-model residency settings (per-topic preferred models)."""
+
+    enabled: bool = Field(default=False, env="RESIDENCY_ENABLED")
+    memory_budget_mb: int = Field(default=4096, env="RESIDENCY_MEMORY_BUDGET_MB")  # RAM/VRAM for resident models
+    prefetch: bool = Field(default=True, env="RESIDENCY_PREFETCH")
+    prefetch_interval: float = Field(default=30.0, env="RESIDENCY_PREFETCH_INTERVAL")  # Seconds between prefetch passes
+    prefetch_window: float = Field(default=600.0, env="RESIDENCY_PREFETCH_WINDOW")  # Topics seen this recently are prefetched
+
+    model_config = ConfigDict(env_prefix="ORAC_RESIDENCY_")
+
+
+class GrammarConfig(BaseSettings):
+    """Per-topic grammar-constrained decoding settings."""
+
+    enabled: bool = Field(default=True, env="GRAMMAR_ENABLED")
+    cache_dir: Path = Field(default=Path("/tmp/orac_stt_grammars"), env="GRAMMAR_CACHE_DIR")  # Compiled GBNF files
+    penalty: float = Field(default=100.0, env="GRAMMAR_PENALTY")  # whisper.cpp --grammar-penalty
+    min_avg_logprob: float = Field(default=-1.0, env="GRAMMAR_MIN_AVG_LOGPROB")  # Retry unconstrained below this
+
+    model_config = ConfigDict(env_prefix="ORAC_GRAMMAR_")
+
+
+class TemplateConfig(BaseSettings):
+    """Acoustic template fast path for frequent commands."""
+
+    enabled: bool = Field(default=False, env="TEMPLATES_ENABLED")
+    min_similarity: float = Field(default=0.7, env="TEMPLATES_MIN_SIMILARITY")  # exp(-DTW distance) needed for a hit
+    margin: float = Field(default=0.05, env="TEMPLATES_MARGIN")  # Lead over the best template of another text
+    max_duration: float = Field(default=3.0, env="TEMPLATES_MAX_DURATION")  # Longer audio always goes to Whisper
+    learn_min_confidence: float = Field(default=0.8, env="TEMPLATES_LEARN_MIN_CONFIDENCE")  # Only learn confident results
+    max_words: int = Field(default=6, env="TEMPLATES_MAX_WORDS")  # Only learn short commands
+    templates_per_text: int = Field(default=3, env="TEMPLATES_PER_TEXT")  # Utterances kept per command
+    max_templates: int = Field(default=60, env="TEMPLATES_MAX_TEMPLATES")  # Per topic (bounds matching cost)
+    verify_rate: float = Field(default=0.1, env="TEMPLATES_VERIFY_RATE")  # Fraction of hits re-checked by Whisper
+    band: float = Field(default=0.3, env="TEMPLATES_BAND")  # DTW Sakoe-Chiba band (fraction of length)
+
+    model_config = ConfigDict(env_prefix="ORAC_TEMPLATES_")
+
+
+class ResultCacheConfig(BaseSettings):
+    """Content-addressed transcription result cache."""
+
+    enabled: bool = Field(default=True, env="RESULT_CACHE_ENABLED")
+    ttl: float = Field(default=300.0, env="RESULT_CACHE_TTL")  # Seconds a result stays valid
+    max_entries: int = Field(default=1024, env="RESULT_CACHE_MAX_ENTRIES")
+    max_memory_mb: float = Field(default=16.0, env="RESULT_CACHE_MAX_MEMORY_MB")  # Estimated size of cached results
+
+    model_config = ConfigDict(env_prefix="ORAC_RESULT_CACHE_")
+
+
+class HedgingConfig(BaseSettings):
+    """Request hedging across whisper-server workers."""
+
+    enabled: bool = Field(default=False, env="HEDGING_ENABLED")
+    worker_urls: List[str] = Field(default=[], env="HEDGING_WORKER_URLS")  # Extra whisper-servers serving the same model
+    budget: float = Field(default=0.05, env="HEDGING_BUDGET")  # Max fraction of requests hedged
+    budget_window: int = Field(default=200, env="HEDGING_BUDGET_WINDOW")  # Requests the budget is measured over
+    percentile: float = Field(default=95.0, env="HEDGING_PERCENTILE")  # Hedge after this latency percentile
+    min_delay: float = Field(default=0.2, env="HEDGING_MIN_DELAY")  # Never hedge sooner (seconds)
+    min_samples: int = Field(default=20, env="HEDGING_MIN_SAMPLES")  # Latencies needed before a bucket hedges
+    window: int = Field(default=500, env="HEDGING_WINDOW")  # Latencies kept per duration bucket
+    bucket_edges: List[float] = Field(default=[2.0, 5.0, 10.0], env="HEDGING_BUCKET_EDGES")  # Seconds of audio
+
+    model_config = ConfigDict(env_prefix="ORAC_HEDGING_")
+
+
+class CircuitBreakerConfig(BaseSettings):
+    """Circuit breaker around the whisper-server backend."""
+
+    enabled: bool = Field(default=True, env="CIRCUIT_BREAKER_ENABLED")
+    failure_threshold: int = Field(default=3, env="CIRCUIT_BREAKER_FAILURE_THRESHOLD")  # Consecutive failures to open
+    open_duration: float = Field(default=5.0, env="CIRCUIT_BREAKER_OPEN_DURATION")  # Seconds open before probing
+    probe_interval: float = Field(default=1.0, env="CIRCUIT_BREAKER_PROBE_INTERVAL")  # Seconds between probe checks
+    probe_timeout: float = Field(default=10.0, env="CIRCUIT_BREAKER_PROBE_TIMEOUT")
+    fallback_backend: Optional[str] = Field(default=None, env="CIRCUIT_BREAKER_FALLBACK_BACKEND")  # None: fail fast
+    fallback_device: str = Field(default="cpu", env="CIRCUIT_BREAKER_FALLBACK_DEVICE")
+
+    model_config = ConfigDict(env_prefix="ORAC_CIRCUIT_BREAKER_")
+
+
+class WorkerPoolConfig(BaseSettings):
+    """CPU-affinity-aware inference worker pool (backend "worker-pool")."""
+
+    backend: str = Field(default="pytorch", env="WORKER_POOL_BACKEND")  # Backend run inside each worker
+    workers: int = Field(default=0, env="WORKER_POOL_WORKERS")  # 0: as many as fit the cores
+    threads_per_worker: int = Field(default=0, env="WORKER_POOL_THREADS_PER_WORKER")  # 0: up to 4 cores per worker
+    reserved_cores: int = Field(default=1, env="WORKER_POOL_RESERVED_CORES")  # Left to the API process
+
+    model_config = ConfigDict(env_prefix="ORAC_WORKER_POOL_")
+
+
+class BatchingConfig(BaseSettings):
+    """Micro-batching of concurrent requests for in-process backends."""
+
+    enabled: bool = Field(default=False, env="BATCHING_ENABLED")
+    max_batch: int = Field(default=8, env="BATCHING_MAX_BATCH")  # Utterances decoded together
+    max_wait_ms: float = Field(default=5.0, env="BATCHING_MAX_WAIT_MS")  # Wait for more requests at an idle model
+
+    model_config = ConfigDict(env_prefix="ORAC_BATCHING_")
+
+
+class StandbyConfig(BaseSettings):
+    """Hot-standby whisper-server for instant failover."""
+
+    enabled: bool = Field(default=False, env="STANDBY_ENABLED")
+    port: int = Field(default=8082, env="STANDBY_PORT")
+    min_available_mb: int = Field(default=512, env="STANDBY_MIN_AVAILABLE_MB")  # No standby below this much free RAM
+    check_interval: float = Field(default=10.0, env="STANDBY_CHECK_INTERVAL")  # Seconds between standby health checks
+    warm_interval: float = Field(default=300.0, env="STANDBY_WARM_INTERVAL")  # Seconds between keep-warm utterances
+    ready_timeout: float = Field(default=120.0, env="STANDBY_READY_TIMEOUT")  # Seconds to load the standby model
+
+    model_config = ConfigDict(env_prefix="ORAC_STANDBY_")
+
+
+class ModelStoreConfig(BaseSettings):
+    """Page-cache prewarming and checksum verification of whisper.cpp model files."""
+
+    prewarm: bool = Field(default=True, env="MODEL_STORE_PREWARM")  # Read model files into the page cache before loading
+    verify_checksums: bool = Field(default=True, env="MODEL_STORE_VERIFY_CHECKSUMS")
+    checksum_cache: Path = Field(
+        default=Path("/app/data/model_checksums.json"), env="MODEL_STORE_CHECKSUM_CACHE"
+    )
+    chunk_mb: int = Field(default=8, env="MODEL_STORE_CHUNK_MB")  # Read size while prewarming
+
+    model_config = ConfigDict(env_prefix="ORAC_MODEL_STORE_")
+
+
+class RestartPolicyConfig(BaseSettings):
+    """whisper-server restart backoff, crash-loop fallback and restart history."""
+
+    initial_backoff: float = Field(default=2.0, env="RESTART_POLICY_INITIAL_BACKOFF")  # Seconds before the 2nd restart in a window
+    max_backoff: float = Field(default=120.0, env="RESTART_POLICY_MAX_BACKOFF")
+    multiplier: float = Field(default=2.0, env="RESTART_POLICY_MULTIPLIER")
+    jitter: float = Field(default=0.2, env="RESTART_POLICY_JITTER")  # +/- fraction of each delay
+    window: float = Field(default=600.0, env="RESTART_POLICY_WINDOW")  # Seconds restarts count as recent
+    crash_loop_restarts: int = Field(default=3, env="RESTART_POLICY_CRASH_LOOP_RESTARTS")  # Recent restarts = crash loop
+    fallback_model: Optional[str] = Field(default="whisper-tiny", env="RESTART_POLICY_FALLBACK_MODEL")  # None: no fallback
+    exit_after: int = Field(default=0, env="RESTART_POLICY_EXIT_AFTER")  # Failed restarts before exiting (0: never)
+    history_file: Path = Field(default=Path("/app/data/whisper_restarts.json"), env="RESTART_POLICY_HISTORY_FILE")
+    history_size: int = Field(default=200, env="RESTART_POLICY_HISTORY_SIZE")
+
+    model_config = ConfigDict(env_prefix="ORAC_RESTART_POLICY_")
+
+
+class CascadeConfig(BaseSettings):
+    """Confidence-driven model cascade settings (defaults, overridable per topic)."""
+
+    enabled: bool = Field(default=False, env="CASCADE_ENABLED")
+    draft_model: str = Field(default="whisper-tiny", env="CASCADE_DRAFT_MODEL")
+    draft_backend: Optional[str] = Field(default=None, env="CASCADE_DRAFT_BACKEND")  # None: active backend
+    mode: Literal["sequential", "concurrent"] = Field(default="sequential", env="CASCADE_MODE")
+    log_prob_threshold: float = Field(default=-0.5, env="CASCADE_LOG_PROB_THRESHOLD")  # Escalate below
+    no_speech_threshold: float = Field(default=0.6, env="CASCADE_NO_SPEECH_THRESHOLD")  # Escalate above
+    compression_ratio_threshold: float = Field(default=2.4, env="CASCADE_COMPRESSION_RATIO_THRESHOLD")  # Escalate above
+
+    model_config = ConfigDict(env_prefix="ORAC_CASCADE_")
+
+
 class SecurityConfig(BaseSettings):
     """Security configuration settings."""
     
@@ -88,8 +312,23 @@ class Settings(BaseSettings):
     model: ModelConfig = Field(default_factory=ModelConfig)
     api: APIConfig = Field(default_factory=APIConfig)
     command_api: CommandAPIConfig = Field(default_factory=CommandAPIConfig)
+    core_pool: CorePoolConfig = Field(default_factory=CorePoolConfig)
     security: SecurityConfig = Field(default_factory=SecurityConfig)
     streaming: StreamingConfig = Field(default_factory=StreamingConfig)
+    cascade: CascadeConfig = Field(default_factory=CascadeConfig)
+    decode: DecodeConfig = Field(default_factory=DecodeConfig)
+    degradation: DegradationConfig = Field(default_factory=DegradationConfig)
+    residency: ResidencyConfig = Field(default_factory=ResidencyConfig)
+    grammar: GrammarConfig = Field(default_factory=GrammarConfig)
+    templates: TemplateConfig = Field(default_factory=TemplateConfig)
+    result_cache: ResultCacheConfig = Field(default_factory=ResultCacheConfig)
+    hedging: HedgingConfig = Field(default_factory=HedgingConfig)
+    circuit_breaker: CircuitBreakerConfig = Field(default_factory=CircuitBreakerConfig)
+    worker_pool: WorkerPoolConfig = Field(default_factory=WorkerPoolConfig)
+    batching: BatchingConfig = Field(default_factory=BatchingConfig)
+    standby: StandbyConfig = Field(default_factory=StandbyConfig)
+    model_store: ModelStoreConfig = Field(default_factory=ModelStoreConfig)
+    restart_policy: RestartPolicyConfig = Field(default_factory=RestartPolicyConfig)
     
     model_config = ConfigDict(
         env_prefix="ORAC_",
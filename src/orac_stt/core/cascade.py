@@ -0,0 +1,327 @@
+"""Confidence-driven model cascade.
+
+Transcribes with a small draft model first and only pays for the configured
+(larger) model when the draft's decoder scores look doubtful.
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Literal, Optional
+
+import numpy as np
+
+from ..config.settings import CascadeConfig
+from ..models.topic import TopicConfig
+from ..utils.logging import get_logger
+from ..utils.metrics import cascade_latency_overhead, cascade_latency_saved, cascade_requests
+
+logger = get_logger(__name__)
+
+# Weight of the newest sample in the full-model latency moving average
+LATENCY_EWMA_ALPHA = 0.2
+
+# Backends that serve a single fixed model, so a different draft model
+# cannot be selected per request
+SINGLE_MODEL_BACKENDS = ("whisper-server",)
+
+
+@dataclass
+class CascadePolicy:
+    """Effective cascade settings for one request."""
+    enabled: bool
+    draft_model: str
+    draft_backend: Optional[str]
+    mode: Literal["sequential", "concurrent"]
+    log_prob_threshold: float
+    no_speech_threshold: float
+    compression_ratio_threshold: float
+
+    @classmethod
+    def resolve(
+        cls,
+        config: CascadeConfig,
+        topic_config: Optional[TopicConfig] = None,
+    ) -> "CascadePolicy":
+        """Merge global cascade settings with a topic's overrides.
+
+        Args:
+            config: Global cascade configuration
+            topic_config: Topic configuration (may be None)
+
+        Returns:
+            Effective policy
+        """
+        values = {
+            "enabled": config.enabled,
+            "draft_model": config.draft_model,
+            "draft_backend": config.draft_backend,
+            "mode": config.mode,
+            "log_prob_threshold": config.log_prob_threshold,
+            "no_speech_threshold": config.no_speech_threshold,
+            "compression_ratio_threshold": config.compression_ratio_threshold,
+        }
+        if topic_config is not None and topic_config.cascade is not None:
+            overrides = topic_config.cascade.model_dump(exclude_none=True)
+            values.update(overrides)
+        return cls(**values)
+
+    def escalation_reasons(self, result: Dict[str, Any]) -> List[str]:
+        """Check a draft result against the thresholds.
+
+        Args:
+            result: Backend transcription result with score fields
+
+        Returns:
+            Reasons to escalate (empty if the draft is accepted)
+        """
+        reasons = []
+
+        avg_logprob = result.get("avg_logprob")
+        if avg_logprob is None:
+            # Backend gave no scores; never trust the draft blindly
+            reasons.append("no_scores")
+        elif avg_logprob < self.log_prob_threshold:
+            reasons.append("avg_logprob")
+
+        no_speech_prob = result.get("no_speech_prob")
+        if no_speech_prob is not None and no_speech_prob > self.no_speech_threshold:
+            reasons.append("no_speech_prob")
+
+        ratio = result.get("compression_ratio")
+        if ratio is not None and ratio > self.compression_ratio_threshold:
+            reasons.append("compression_ratio")
+
+        return reasons
+
+
+@dataclass
+class TopicCascadeStats:
+    """Cascade outcomes for one topic."""
+    requests: int = 0
+    escalations: int = 0
+    reasons: Dict[str, int] = field(default_factory=dict)
+    draft_time: float = 0.0
+    full_latency_ewma: Optional[float] = None
+    latency_saved: float = 0.0
+    latency_overhead: float = 0.0
+
+    def record_full_latency(self, latency: float) -> None:
+        """Update the moving average of the full model's latency."""
+        if self.full_latency_ewma is None:
+            self.full_latency_ewma = latency
+        else:
+            self.full_latency_ewma += LATENCY_EWMA_ALPHA * (latency - self.full_latency_ewma)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "requests": self.requests,
+            "escalations": self.escalations,
+            "escalation_rate": self.escalations / self.requests if self.requests else 0.0,
+            "reasons": dict(self.reasons),
+            "avg_draft_latency": self.draft_time / self.requests if self.requests else None,
+            "avg_full_latency": self.full_latency_ewma,
+            "latency_saved": round(self.latency_saved, 4),
+            "latency_overhead": round(self.latency_overhead, 4),
+            "net_latency_saved": round(self.latency_saved - self.latency_overhead, 4),
+        }
+
+
+class ModelCascade:
+    """Runs the tiny-first cascade and keeps per-topic statistics."""
+
+    def __init__(self, config: Optional[CascadeConfig] = None):
+        """Initialize model cascade.
+
+        Args:
+            config: Global cascade configuration
+        """
+        self.config = config or CascadeConfig()
+        self._stats: Dict[str, TopicCascadeStats] = {}
+        self._lock = threading.Lock()
+
+    def _topic_stats(self, topic: str) -> TopicCascadeStats:
+        with self._lock:
+            if topic not in self._stats:
+                self._stats[topic] = TopicCascadeStats()
+            return self._stats[topic]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-topic escalation rates and latency savings."""
+        with self._lock:
+            return {topic: stats.to_dict() for topic, stats in self._stats.items()}
+
+    def reset_stats(self) -> None:
+        """Clear all statistics."""
+        with self._lock:
+            self._stats.clear()
+
+    @staticmethod
+    def is_applicable(
+        model_loader, policy: CascadePolicy, full_model: Optional[str] = None
+    ) -> bool:
+        """Whether the draft model can actually differ from the full model."""
+        draft_backend = policy.draft_backend or model_loader.backend_name
+        if draft_backend != model_loader.backend_name:
+            return True
+        if draft_backend in SINGLE_MODEL_BACKENDS:
+            return False
+        return policy.draft_model != (full_model or model_loader.config.name)
+
+    async def transcribe(
+        self,
+        model_loader,
+        audio_data: np.ndarray,
+        sample_rate: int = 16000,
+        language: Optional[str] = None,
+        task: str = "transcribe",
+        topic: str = "general",
+        topic_config: Optional[TopicConfig] = None,
+        model_name: Optional[str] = None,
+        **decode_options,
+    ) -> Dict[str, Any]:
+        """Transcribe, escalating from the draft model when it is in doubt.
+
+        Args:
+            model_loader: UnifiedWhisperLoader instance
+            audio_data: Audio samples
+            sample_rate: Sample rate
+            language: Language code
+            task: Task type (transcribe or translate)
+            topic: Topic name (for statistics)
+            topic_config: Topic configuration with cascade overrides
+            model_name: Full model override (default: configured model)
+            **decode_options: Decode options passed to both models
+
+        Returns:
+            Transcription result; includes a ``cascade`` entry when the
+            cascade ran
+        """
+        policy = CascadePolicy.resolve(self.config, topic_config)
+        if not policy.enabled or not self.is_applicable(model_loader, policy, model_name):
+            return await model_loader.transcribe_async(
+                audio_data, sample_rate=sample_rate, language=language, task=task,
+                model_name=model_name, **decode_options
+            )
+
+        draft_kwargs = {
+            "sample_rate": sample_rate,
+            "language": language,
+            "task": task,
+            "backend": policy.draft_backend,
+            "model_name": policy.draft_model,
+            **decode_options,
+        }
+        full_kwargs = {
+            "sample_rate": sample_rate, "language": language, "task": task,
+            "model_name": model_name, **decode_options
+        }
+
+        async def run_full() -> Dict[str, Any]:
+            full_start = time.time()
+            full_result = await model_loader.transcribe_async(audio_data, **full_kwargs)
+            return {"result": full_result, "latency": time.time() - full_start}
+
+        full_task = None
+        if policy.mode == "concurrent":
+            full_task = asyncio.create_task(run_full())
+
+        start = time.time()
+        try:
+            draft = await model_loader.transcribe_async(audio_data, **draft_kwargs)
+            reasons = policy.escalation_reasons(draft)
+        except Exception as e:
+            logger.warning(f"Cascade draft model failed, escalating: {e}")
+            draft = None
+            reasons = ["draft_error"]
+        draft_latency = time.time() - start
+
+        stats = self._topic_stats(topic)
+
+        if not reasons:
+            if full_task is not None:
+                # The executor thread finishes in the background; its result is dropped
+                full_task.cancel()
+            self._record(topic, stats, draft_latency, escalated=False, reasons=reasons)
+            draft["cascade"] = {
+                "escalated": False,
+                "model": policy.draft_model,
+                "draft_latency": draft_latency,
+            }
+            return draft
+
+        if full_task is None:
+            full_task = asyncio.create_task(run_full())
+        full = await full_task
+        full_latency = full["latency"]
+        self._record(
+            topic, stats, draft_latency, escalated=True, reasons=reasons,
+            full_latency=full_latency, concurrent=policy.mode == "concurrent",
+        )
+
+        logger.info(
+            f"Cascade escalated for topic '{topic}' ({', '.join(reasons)}): "
+            f"draft {draft_latency:.3f}s, full {full_latency:.3f}s"
+        )
+        result = full["result"]
+        result["cascade"] = {
+            "escalated": True,
+            "reasons": reasons,
+            "model": model_name or model_loader.config.name,
+            "draft_model": policy.draft_model,
+            "draft_text": draft.get("text") if draft else None,
+            "draft_latency": draft_latency,
+        }
+        return result
+
+    def _record(
+        self,
+        topic: str,
+        stats: TopicCascadeStats,
+        draft_latency: float,
+        escalated: bool,
+        reasons: List[str],
+        full_latency: Optional[float] = None,
+        concurrent: bool = False,
+    ) -> None:
+        """Update topic statistics and Prometheus metrics."""
+        saved = 0.0
+        overhead = 0.0
+        with self._lock:
+            stats.requests += 1
+            stats.draft_time += draft_latency
+            if escalated:
+                stats.escalations += 1
+                for reason in reasons:
+                    stats.reasons[reason] = stats.reasons.get(reason, 0) + 1
+                stats.record_full_latency(full_latency)
+                # Sequential escalation pays for the draft on top of the full model
+                if not concurrent:
+                    overhead = draft_latency
+            elif stats.full_latency_ewma is not None:
+                saved = max(0.0, stats.full_latency_ewma - draft_latency)
+            stats.latency_saved += saved
+            stats.latency_overhead += overhead
+
+        cascade_requests.labels(
+            topic=topic, outcome="escalated" if escalated else "accepted"
+        ).inc()
+        if saved:
+            cascade_latency_saved.labels(topic=topic).inc(saved)
+        if overhead:
+            cascade_latency_overhead.labels(topic=topic).inc(overhead)
+
+
+# Global cascade instance
+_model_cascade: Optional[ModelCascade] = None
+
+
+def get_model_cascade() -> ModelCascade:
+    """Get or create the global ModelCascade instance."""
+    global _model_cascade
+    if _model_cascade is None:
+        from ..config.loader import load_config
+        _model_cascade = ModelCascade(load_config().cascade)
+    return _model_cascade
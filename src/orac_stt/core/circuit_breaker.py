@@ -0,0 +1,191 @@
+"""Circuit breaker around the whisper-server backend.
+
+While whisper-server is down or restarting, every request would otherwise
+wait for the client's 30 s timeout, and satellites pile up doomed work.
+The breaker is shared by the whisper-server client (which reports request
+outcomes) and ``WhisperServerManager`` (which reports health checks and
+restarts):
+
+- closed: requests go through; consecutive failures open the breaker
+- open: requests fail immediately with ``CircuitOpenError`` (or are
+  diverted to the configured fallback backend by the model loader)
+- half-open: after ``open_duration`` a probe with synthetic audio is sent;
+  success closes the breaker, failure opens it again
+
+Ordinary requests are not used as trial requests in the half-open state;
+only the synthetic probe is, so no satellite waits on a server that may
+still be down.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+from ..config.settings import CircuitBreakerConfig
+from ..utils.logging import get_logger
+from ..utils.metrics import (
+    circuit_breaker_rejections, circuit_breaker_state, circuit_breaker_transitions,
+)
+
+logger = get_logger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Gauge values for orac_stt_circuit_breaker_state
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+# Synthetic utterance used to probe a half-open breaker
+PROBE_DURATION = 1.0
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of sending a request while the breaker is open."""
+
+
+class CircuitBreaker:
+    """Thread-safe closed/open/half-open breaker."""
+
+    def __init__(self, name: str, config: Optional[CircuitBreakerConfig] = None):
+        """Initialize circuit breaker.
+
+        Args:
+            name: Breaker name (metric label)
+            config: Circuit breaker configuration
+        """
+        self.name = name
+        self.config = config or CircuitBreakerConfig()
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._reason: Optional[str] = None
+        self._rejected = 0
+        self._history: deque = deque(maxlen=50)
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def _transition(self, state: str, reason: str) -> None:
+        """Change state (lock held)."""
+        if state == self._state:
+            return
+        logger.warning(f"Circuit breaker '{self.name}': {self._state} -> {state} ({reason})")
+        self._history.append({"from": self._state, "to": state, "reason": reason, "timestamp": time.time()})
+        self._state = state
+        self._reason = reason
+        if state == OPEN:
+            self._opened_at = time.monotonic()
+        if state == CLOSED:
+            self._failures = 0
+        circuit_breaker_state.labels(breaker=self.name).set(STATE_VALUES[state])
+        circuit_breaker_transitions.labels(breaker=self.name, state=state).inc()
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now (counts rejections)."""
+        if not self.config.enabled or self._state == CLOSED:
+            return True
+        with self._lock:
+            self._rejected += 1
+        circuit_breaker_rejections.labels(breaker=self.name).inc()
+        return False
+
+    def record_success(self) -> None:
+        """Report a successful request."""
+        with self._lock:
+            self._failures = 0
+
+    def record_failure(self, reason: str = "request failed") -> None:
+        """Report a failed request; opens the breaker past the threshold."""
+        with self._lock:
+            self._failures += 1
+            if self._state == CLOSED and self._failures >= self.config.failure_threshold:
+                self._transition(OPEN, f"{self._failures} consecutive failures: {reason}")
+
+    def trip(self, reason: str) -> None:
+        """Open the breaker immediately (health check failed, restart begun)."""
+        if not self.config.enabled:
+            return
+        with self._lock:
+            if self._state == OPEN:
+                # Keep failing fast for a full period after the latest trip
+                self._opened_at = time.monotonic()
+                self._reason = reason
+            else:
+                self._transition(OPEN, reason)
+
+    def probe_due(self) -> bool:
+        """Move an open breaker to half-open once ``open_duration`` has passed.
+
+        Returns:
+            True if the caller should now send a probe
+        """
+        with self._lock:
+            if self._state == HALF_OPEN:
+                return True
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self.config.open_duration:
+                self._transition(HALF_OPEN, "probing")
+                return True
+            return False
+
+    def record_probe(self, success: bool, reason: str = "") -> None:
+        """Report a half-open probe: close on success, reopen on failure."""
+        with self._lock:
+            if success:
+                self._transition(CLOSED, reason or "probe succeeded")
+            else:
+                self._transition(OPEN, reason or "probe failed")
+
+    def probe(self, transcribe: Callable[[np.ndarray], Any]) -> bool:
+        """Probe the backend with a short synthetic utterance if one is due.
+
+        Blocking; call from a worker thread.
+
+        Args:
+            transcribe: Callable transcribing a float32 16 kHz array, which
+                must bypass this breaker
+
+        Returns:
+            True if a probe was sent and succeeded
+        """
+        if not self.probe_due():
+            return False
+        from ..audio.synthetic import synthetic_utterance
+
+        try:
+            transcribe(synthetic_utterance(PROBE_DURATION))
+        except Exception as e:
+            self.record_probe(False, f"probe failed: {e}")
+            return False
+        self.record_probe(True)
+        return True
+
+    def get_status(self) -> Dict[str, Any]:
+        """State, reason and recent transitions for /health and the admin API."""
+        with self._lock:
+            return {
+                "state": self._state,
+                "reason": self._reason,
+                "consecutive_failures": self._failures,
+                "open_for": round(time.monotonic() - self._opened_at, 3) if self._state != CLOSED else None,
+                "rejected": self._rejected,
+                "transitions": list(self._history)[-10:],
+            }
+
+
+# Global breaker for whisper-server, shared by the manager and the clients
+_whisper_breaker: Optional[CircuitBreaker] = None
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """Get or create the global whisper-server CircuitBreaker instance."""
+    global _whisper_breaker
+    if _whisper_breaker is None:
+        from ..config.loader import load_config
+        _whisper_breaker = CircuitBreaker("whisper-server", load_config().circuit_breaker)
+    return _whisper_breaker
@@ -0,0 +1,210 @@
+"""Load-adaptive quality degradation.
+
+Under sustained load latency grows without bound if every request keeps
+paying for full-quality decoding. The controller watches the number of
+transcriptions in flight and the recent real-time factor (RTF) and steps
+decoding down one level at a time, restoring it once load subsides:
+
+- Level 0: configured beam search and full temperature fallback
+- Level 1: greedy decoding
+- Level 2: greedy decoding with a shorter temperature fallback
+- Level 3: level 2 on a smaller, already loaded model
+
+Separate high/low thresholds and minimum dwell times give hysteresis, so
+the level does not flap around a single threshold.
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from ..config.settings import DegradationConfig
+from ..utils.logging import get_logger
+from ..utils.metrics import degradation_level, degradation_transitions
+
+logger = get_logger(__name__)
+
+LEVEL_NORMAL = 0
+LEVEL_GREEDY = 1
+LEVEL_SHORT_FALLBACK = 2
+LEVEL_SMALL_MODEL = 3
+
+LEVEL_NAMES = {
+    LEVEL_NORMAL: "normal",
+    LEVEL_GREEDY: "greedy",
+    LEVEL_SHORT_FALLBACK: "short_fallback",
+    LEVEL_SMALL_MODEL: "small_model",
+}
+
+
+class DegradationController:
+    """Chooses decode parameters from current load."""
+
+    def __init__(self, config: Optional[DegradationConfig] = None):
+        """Initialize degradation controller.
+
+        Args:
+            config: Degradation configuration
+        """
+        self.config = config or DegradationConfig()
+        self._lock = threading.Lock()
+        self._level = LEVEL_NORMAL
+        self._inflight = 0
+        # (timestamp, rtf) of recently finished transcriptions
+        self._rtf: deque = deque(maxlen=1000)
+        self._last_change = 0.0
+        self._history: deque = deque(maxlen=50)
+
+    @property
+    def level(self) -> int:
+        """Degradation level currently in effect."""
+        return self._level
+
+    @property
+    def queue_depth(self) -> int:
+        """Transcriptions currently in flight."""
+        return self._inflight
+
+    def _recent_rtf(self, now: float) -> Optional[float]:
+        """Mean RTF over the recent window (caller holds the lock)."""
+        while self._rtf and now - self._rtf[0][0] > self.config.rtf_window:
+            self._rtf.popleft()
+        if not self._rtf:
+            return None
+        return sum(rtf for _, rtf in self._rtf) / len(self._rtf)
+
+    def recent_rtf(self) -> Optional[float]:
+        """Mean RTF over the recent window."""
+        with self._lock:
+            return self._recent_rtf(time.time())
+
+    def max_level(self, small_model_available: bool) -> int:
+        """Highest level reachable with the current backend."""
+        if not self.config.enabled:
+            return LEVEL_NORMAL
+        return LEVEL_SMALL_MODEL if small_model_available else LEVEL_SHORT_FALLBACK
+
+    def decode_options(self, level: int) -> Dict[str, Any]:
+        """Decode options for a degradation level.
+
+        Args:
+            level: Degradation level
+
+        Returns:
+            Options passed to the backends (beam_size, best_of,
+            temperature_inc and, at the last level, model_name)
+        """
+        config = self.config
+        if level <= LEVEL_NORMAL:
+            return {
+                "beam_size": config.beam_size,
+                "best_of": config.best_of,
+                "temperature_inc": config.temperature_inc,
+            }
+
+        options = {"beam_size": 1, "best_of": 1, "temperature_inc": config.temperature_inc}
+        if level >= LEVEL_SHORT_FALLBACK:
+            options["temperature_inc"] = config.degraded_temperature_inc
+        if level >= LEVEL_SMALL_MODEL:
+            options["model_name"] = config.fallback_model
+        return options
+
+    @contextmanager
+    def track(self, duration: float, small_model_available: bool = False) -> Iterator[int]:
+        """Track one transcription and yield the level it should use.
+
+        Args:
+            duration: Audio duration in seconds
+            small_model_available: Whether the fallback model is loaded
+
+        Yields:
+            Degradation level for this request
+        """
+        with self._lock:
+            self._inflight += 1
+        self._evaluate(small_model_available)
+        start = time.time()
+        level = min(self._level, self.max_level(small_model_available))
+        try:
+            yield level
+        finally:
+            elapsed = time.time() - start
+            with self._lock:
+                self._inflight -= 1
+                if duration > 0:
+                    self._rtf.append((time.time(), elapsed / duration))
+            self._evaluate(small_model_available)
+
+    def _evaluate(self, small_model_available: bool) -> None:
+        """Step the level up or down if thresholds have been crossed long enough."""
+        config = self.config
+        if not config.enabled:
+            return
+
+        now = time.time()
+        with self._lock:
+            rtf = self._recent_rtf(now) or 0.0
+            depth = self._inflight
+            since_change = now - self._last_change
+            overloaded = depth >= config.queue_depth_high or rtf >= config.rtf_high
+            relaxed = depth <= config.queue_depth_low and rtf <= config.rtf_low
+
+            new_level = self._level
+            if overloaded and since_change >= config.step_up_interval:
+                new_level = min(self._level + 1, self.max_level(small_model_available))
+            elif relaxed and since_change >= config.step_down_interval:
+                new_level = max(self._level - 1, LEVEL_NORMAL)
+
+            if new_level == self._level:
+                return
+            old_level = self._level
+            self._level = new_level
+            self._last_change = now
+            self._history.append({
+                "from": old_level,
+                "to": new_level,
+                "queue_depth": depth,
+                "rtf": round(rtf, 4),
+                "at": now,
+            })
+
+        direction = "up" if new_level > old_level else "down"
+        logger.warning(
+            f"Degradation level {direction}: {LEVEL_NAMES[old_level]} -> {LEVEL_NAMES[new_level]} "
+            f"(queue depth {depth}, RTF {rtf:.2f})"
+        )
+        self._record_transition(new_level, direction)
+
+    @staticmethod
+    def _record_transition(level: int, direction: str) -> None:
+        degradation_level.set(level)
+        degradation_transitions.labels(direction=direction).inc()
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get controller state for admin endpoints."""
+        rtf = self.recent_rtf()
+        with self._lock:
+            history: List[Dict[str, Any]] = list(self._history)
+        return {
+            "enabled": self.config.enabled,
+            "level": self._level,
+            "level_name": LEVEL_NAMES[self._level],
+            "queue_depth": self._inflight,
+            "recent_rtf": round(rtf, 4) if rtf is not None else None,
+            "transitions": history,
+        }
+
+
+# Global controller instance
+_degradation_controller: Optional[DegradationController] = None
+
+
+def get_degradation_controller() -> DegradationController:
+    """Get or create the global DegradationController instance."""
+    global _degradation_controller
+    if _degradation_controller is None:
+        from ..config.loader import load_config
+        _degradation_controller = DegradationController(load_config().degradation)
+    return _degradation_controller
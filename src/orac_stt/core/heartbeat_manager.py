@@ -13,6 +13,7 @@ from ..models.heartbeat import (
     HeartbeatResponse
 )
 from ..utils.logging import get_logger
+from ..integrations.core_pool import get_core_pool
 from ..integrations.orac_core_client import ORACCoreClient
 from ..config.loader import load_config
 from .topic_registry import TopicRegistry
@@ -32,7 +33,7 @@ class HeartbeatManager:
         """
         self.ttl_seconds = ttl_seconds
         self._heartbeats: Dict[str, Dict] = {}  # instance_id -> heartbeat data
-        self._core_client: Optional[ORACCoreClient] = None
+        self._core_url: Optional[str] = None
         self._instance_id = "orac_stt_001"  # TODO: Make configurable
         self._forward_lock = asyncio.Lock()
         self._last_forward_time = datetime.min
@@ -40,8 +41,8 @@ class HeartbeatManager:
         self._topic_registry = TopicRegistry(data_dir=data_dir)
         
     def _get_core_client(self) -> Optional[ORACCoreClient]:
-        """Get or create ORAC Core client."""
-        if self._core_client is None:
+        """Get the pooled ORAC Core client for the default Core URL."""
+        if self._core_url is None:
             try:
                 # First try to get from settings manager (runtime config)
                 from ..core.settings_manager import get_settings_manager
@@ -54,11 +55,11 @@ class HeartbeatManager:
                     core_url = getattr(settings, 'orac_core_url', None)
                 
                 if core_url:
-                    self._core_client = ORACCoreClient(base_url=core_url)
-                    logger.info(f"Initialized ORAC Core client for heartbeat: {core_url}")
+                    self._core_url = core_url
+                    logger.info(f"Using ORAC Core for heartbeat: {core_url}")
             except Exception as e:
                 logger.error(f"Failed to initialize ORAC Core client: {e}")
-        return self._core_client
+        return get_core_pool().get(self._core_url) if self._core_url else None
     
     async def process_heartbeat(self, request: HeartbeatRequest) -> HeartbeatResponse:
         """Process incoming heartbeat from Hey ORAC.
@@ -173,8 +174,8 @@ class HeartbeatManager:
                             logger.debug("Default ORAC Core not configured, skipping these topics")
                             continue
                     else:
-                        # Create client for override URL
-                        core_client = ORACCoreClient(base_url=core_url)
+                        # Pooled client for the override URL
+                        core_client = get_core_pool().get(core_url)
                     
                     # Create batched request
                     core_request = CoreHeartbeatRequest(
@@ -0,0 +1,262 @@
+"""Page-cache prewarming and checksum verification of whisper.cpp model files.
+
+Starting whisper-server is dominated by reading a multi-hundred-MB GGML
+file from eMMC/SD storage. ``ModelStore.prepare`` reads the file into the
+page cache first (``posix_fadvise(WILLNEED)`` to start kernel readahead,
+then a sequential read), so whisper-server's own read of the model comes
+from RAM. The same pass verifies the file's SHA-256 against a
+``<model>.sha256`` file next to it, or against the checksum recorded the
+first time the file was seen. Checksums are cached by path, size and
+mtime, so an unchanged file is not hashed again.
+
+Whether the file was already cached is measured before reading it (with
+mincore), so start timings can be split into cold and warm.
+"""
+
+import ctypes
+import ctypes.util
+import hashlib
+import json
+import mmap
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from ..config.settings import ModelStoreConfig
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Files at least this resident count as warm
+WARM_FRACTION = 0.9
+
+
+class ModelIntegrityError(RuntimeError):
+    """A model file does not match its expected checksum."""
+
+
+def _libc():
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    except OSError:
+        return None
+    if not hasattr(libc, "mincore"):
+        return None
+    libc.mmap.restype = ctypes.c_void_p
+    libc.mmap.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_long]
+    libc.munmap.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+    libc.mincore.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_void_p]
+    return libc
+
+
+def resident_fraction(path: Path) -> Optional[float]:
+    """Fraction of a file's pages that are in the page cache.
+
+    Uses mincore(2) on a read-only mapping, which (unlike a read) does not
+    pull pages in.
+
+    Args:
+        path: File to check
+
+    Returns:
+        Resident fraction, or None if this platform cannot tell
+    """
+    size = path.stat().st_size
+    if size == 0:
+        return 1.0
+    libc = _libc()
+    if libc is None:
+        return None
+    page = mmap.PAGESIZE
+    pages = (size + page - 1) // page
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        addr = libc.mmap(None, size, mmap.PROT_READ, mmap.MAP_SHARED, fd, 0)
+        if addr in (None, ctypes.c_void_p(-1).value):
+            return None
+        try:
+            vec = (ctypes.c_ubyte * pages)()
+            if libc.mincore(addr, size, vec) != 0:
+                return None
+            return sum(b & 1 for b in vec) / pages
+        finally:
+            libc.munmap(addr, size)
+    finally:
+        os.close(fd)
+
+
+class ModelStore:
+    """Prewarms and verifies model files; reports how long that took."""
+
+    def __init__(self, config: Optional[ModelStoreConfig] = None):
+        """Initialize the store.
+
+        Args:
+            config: Model store configuration
+        """
+        self.config = config or ModelStoreConfig()
+        self._lock = threading.Lock()
+        self._checksums: Dict[str, Dict[str, Any]] = self._load_checksums()
+        self._reports: Dict[str, Dict[str, Any]] = {}
+
+    def _load_checksums(self) -> Dict[str, Dict[str, Any]]:
+        path = self.config.checksum_cache
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable model checksum cache {path}: {e}")
+            return {}
+
+    def _save_checksums(self) -> None:
+        path = self.config.checksum_cache
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(path.suffix + ".tmp")
+            tmp.write_text(json.dumps(self._checksums, indent=2, sort_keys=True))
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"Could not save model checksum cache {path}: {e}")
+
+    @staticmethod
+    def _expected_checksum(path: Path) -> Optional[str]:
+        """SHA-256 from a ``<model>.sha256`` file (sha256sum format), if any."""
+        sidecar = path.with_name(path.name + ".sha256")
+        try:
+            return sidecar.read_text().split()[0].lower()
+        except (OSError, IndexError):
+            return None
+
+    def _read(self, path: Path, hash_it: bool) -> Optional[str]:
+        """Read a file sequentially into the page cache, hashing it if asked."""
+        chunk = bytearray(self.config.chunk_mb * 1024 * 1024)
+        view = memoryview(chunk)
+        digest = hashlib.sha256() if hash_it else None
+        with open(path, "rb", buffering=0) as f:
+            if hasattr(os, "posix_fadvise"):
+                # Start kernel readahead of the whole file before reading it
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+            while True:
+                n = f.readinto(chunk)
+                if not n:
+                    break
+                if digest is not None:
+                    digest.update(view[:n])
+        return digest.hexdigest() if digest is not None else None
+
+    def prepare(self, model_name: str, path: Path) -> Dict[str, Any]:
+        """Prewarm and verify a model file before whisper-server loads it.
+
+        Blocking; call from a worker thread.
+
+        Args:
+            model_name: Model name (for reporting)
+            path: Model file
+
+        Returns:
+            Report with the file size, read time, page-cache state before
+            the read and checksum result
+
+        Raises:
+            ModelIntegrityError: If the file does not match its checksum
+            OSError: If the file cannot be read
+        """
+        path = Path(path)
+        stat = path.stat()
+        key = str(path.resolve())
+        fraction = resident_fraction(path)
+
+        cached = self._checksums.get(key)
+        known = cached is not None and cached["size"] == stat.st_size and cached["mtime_ns"] == stat.st_mtime_ns
+        hash_it = self.config.verify_checksums and not known
+        read_seconds = 0.0
+        sha256 = None
+        if self.config.prewarm or hash_it:
+            start = time.perf_counter()
+            sha256 = self._read(path, hash_it)
+            read_seconds = time.perf_counter() - start
+
+        checksum: Dict[str, Any] = {"verified": False, "source": None}
+        if self.config.verify_checksums:
+            if sha256 is None:
+                sha256 = cached["sha256"]
+                checksum["source"] = "cache"
+            else:
+                checksum["source"] = "computed"
+            expected = self._expected_checksum(path)
+            if expected is None and cached is not None and not known:
+                logger.warning(f"Model file {path} changed since its checksum was recorded")
+            if expected is not None and sha256 != expected:
+                raise ModelIntegrityError(
+                    f"Model file {path} has SHA-256 {sha256}, expected {expected} ({path.name}.sha256)"
+                )
+            checksum.update(sha256=sha256, verified=True, reference="sha256 file" if expected else "recorded")
+            if not known:
+                with self._lock:
+                    self._checksums[key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": sha256}
+                    self._save_checksums()
+
+        size_mb = stat.st_size / (1024 * 1024)
+        report = {
+            "model": model_name,
+            "path": str(path),
+            "size_mb": round(size_mb, 1),
+            "resident_before": round(fraction, 3) if fraction is not None else None,
+            "page_cache": self.cache_state(fraction, size_mb, read_seconds),
+            "read_seconds": round(read_seconds, 3),
+            "throughput_mbps": round(size_mb / read_seconds, 1) if read_seconds > 0 else None,
+            "checksum": checksum,
+            "prepared_at": time.time(),
+        }
+        self._reports[model_name] = report
+        logger.info(
+            f"Prepared model {model_name}: {report['size_mb']} MB read in {report['read_seconds']}s "
+            f"(page cache {report['page_cache']}, checksum {checksum['source'] or 'off'})"
+        )
+        return report
+
+    @staticmethod
+    def cache_state(fraction: Optional[float], size_mb: float, read_seconds: float) -> str:
+        """Classify the page-cache state of a file before it was read ("warm" or "cold")."""
+        if fraction is not None:
+            return "warm" if fraction >= WARM_FRACTION else "cold"
+        # No residency probe: even fast eMMC does not read 1 GB/s
+        if read_seconds > 0 and size_mb / read_seconds >= 1000:
+            return "warm"
+        return "cold" if read_seconds > 0 else "unknown"
+
+    def prefetch(self, models: Iterable[tuple]) -> None:
+        """Prewarm several (model_name, path) pairs, logging failures.
+
+        Blocking; call from a worker thread.
+        """
+        for model_name, path in models:
+            try:
+                self.prepare(model_name, path)
+            except Exception as e:
+                logger.warning(f"Prefetching model {model_name} failed: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Last preparation report per model, for the admin API."""
+        return {
+            "config": self.config.model_dump(mode="json"),
+            "models": dict(self._reports),
+        }
+
+
+# Global model store instance
+_model_store: Optional[ModelStore] = None
+
+
+def get_model_store() -> ModelStore:
+    """Get or create the global ModelStore instance."""
+    global _model_store
+    if _model_store is None:
+        from ..config.loader import load_config
+        _model_store = ModelStore(load_config().model_store)
+    return _model_store
@@ -0,0 +1,262 @@
+"""Zero-downtime blue/green model switching for whisper-server."""
+
+import asyncio
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from ..models.backends import WhisperServerBackend
+from ..models.whisper_server import WhisperServerModel
+from ..utils.logging import get_logger
+from .warmup import run_warmup
+from .whisper_manager import WhisperServerManager, get_whisper_manager
+
+logger = get_logger(__name__)
+
+# Job states, in the order a successful switch goes through them
+STATE_PENDING = "pending"
+STATE_STARTING = "starting"
+STATE_WARMING = "warming"
+STATE_SWITCHING = "switching"
+STATE_DRAINING = "draining"
+STATE_STOPPING = "stopping"
+STATE_COMPLETED = "completed"
+STATE_FAILED = "failed"
+
+ProgressCallback = Callable[["ModelSwitchJob"], Awaitable[None]]
+
+
+@dataclass
+class ModelSwitchJob:
+    """Progress of a single background model switch."""
+    model_name: str
+    from_model: str
+    id: str = field(default_factory=lambda: uuid.uuid4().hex[:12])
+    state: str = STATE_PENDING
+    message: str = "Queued"
+    started_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+    steps: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def done(self) -> bool:
+        """Whether the job has finished (successfully or not)."""
+        return self.state in (STATE_COMPLETED, STATE_FAILED)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "id": self.id,
+            "model_name": self.model_name,
+            "from_model": self.from_model,
+            "state": self.state,
+            "message": self.message,
+            "started_at": self.started_at.isoformat(),
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "error": self.error,
+            "steps": self.steps,
+        }
+
+
+class ModelSwitcher:
+    """Switch whisper-server models without dropping transcriptions.
+
+    The new model is started on the alternate port while the current server
+    keeps serving. Once the new server answers and has been warmed up with
+    synthetic audio, all whisper-server clients are repointed at it, the old
+    server is drained of in-flight requests and then stopped.
+    """
+
+    def __init__(
+        self,
+        manager: Optional[WhisperServerManager] = None,
+        ready_timeout: float = 120.0,
+        drain_timeout: float = 30.0,
+        warmup_durations: tuple = (1.0, 3.0),
+    ):
+        """Initialize model switcher.
+
+        Args:
+            manager: whisper-server process manager
+            ready_timeout: Seconds to wait for the new server to load its model
+            drain_timeout: Seconds to wait for in-flight requests on the old server
+            warmup_durations: Synthetic utterance lengths sent before switching
+        """
+        self.manager = manager or get_whisper_manager()
+        self.ready_timeout = ready_timeout
+        self.drain_timeout = drain_timeout
+        self.warmup_durations = warmup_durations
+        self._jobs: Dict[str, ModelSwitchJob] = {}
+        self._current: Optional[ModelSwitchJob] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def current_job(self) -> Optional[ModelSwitchJob]:
+        """Most recent job (running or finished)."""
+        return self._current
+
+    def get_job(self, job_id: str) -> Optional[ModelSwitchJob]:
+        """Get a job by ID."""
+        return self._jobs.get(job_id)
+
+    def start_switch(
+        self,
+        model_name: str,
+        clients: Callable[[], List[WhisperServerModel]],
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> ModelSwitchJob:
+        """Start a model switch as a background task.
+
+        Args:
+            model_name: Model to switch to
+            clients: Returns the whisper-server clients to repoint
+            on_progress: Awaited after every state change
+
+        Returns:
+            The started job
+
+        Raises:
+            RuntimeError: If a switch is already running
+        """
+        if self._current is not None and not self._current.done:
+            raise RuntimeError(
+                f"Model switch to {self._current.model_name} already in progress"
+            )
+
+        job = ModelSwitchJob(model_name=model_name, from_model=self.manager.model_name)
+        self._jobs[job.id] = job
+        self._current = job
+        self._task = asyncio.create_task(self._run(job, clients, on_progress))
+        return job
+
+    async def _update(
+        self,
+        job: ModelSwitchJob,
+        state: str,
+        message: str,
+        on_progress: Optional[ProgressCallback],
+    ) -> None:
+        job.state = state
+        job.message = message
+        job.steps.append({
+            "state": state,
+            "message": message,
+            "at": datetime.utcnow().isoformat(),
+        })
+        if job.done:
+            job.finished_at = datetime.utcnow()
+        logger.info(f"Model switch {job.id}: {state} - {message}")
+
+        if on_progress is not None:
+            try:
+                await on_progress(job)
+            except Exception as e:
+                logger.error(f"Model switch progress callback failed: {e}")
+
+    def _warm_up(self, url: str, model_name: str) -> Dict[str, Any]:
+        """Send synthetic utterances to a server before it takes traffic."""
+        client = WhisperServerModel(server_url=url, timeout=self.ready_timeout, prompt=self.manager.prompt)
+        return run_warmup(
+            client.transcribe, self.warmup_durations,
+            model=model_name, backend=WhisperServerBackend.name,
+        )
+
+    async def _run(
+        self,
+        job: ModelSwitchJob,
+        clients: Callable[[], List[WhisperServerModel]],
+        on_progress: Optional[ProgressCallback],
+    ) -> None:
+        manager = self.manager
+        loop = asyncio.get_running_loop()
+        old_process = manager._process
+        old_port = manager.port
+        old_url = manager.server_url
+        new_port = manager.alternate_port
+        new_url = manager.url_for_port(new_port)
+        new_process = None
+        switched = False
+
+        manager.switch_in_progress = True
+        try:
+            await self._update(
+                job, STATE_STARTING,
+                f"Starting {job.model_name} on port {new_port}", on_progress
+            )
+            # Clear out anything left on the alternate port by a failed switch
+            await manager._kill_existing(new_port)
+            # Prewarms and verifies the new model file while the old server serves
+            new_process, ready = await manager.launch(job.model_name, new_port, self.ready_timeout)
+            if not ready:
+                raise RuntimeError(f"New whisper-server on port {new_port} did not become ready")
+
+            await self._update(job, STATE_WARMING, "Warming up with synthetic audio", on_progress)
+            await loop.run_in_executor(None, self._warm_up, new_url, job.model_name)
+
+            await self._update(job, STATE_SWITCHING, f"Routing traffic to {new_url}", on_progress)
+            WhisperServerBackend.set_server_url(new_url)
+            # Remember each client's previous URL so it can be drained
+            targets = [(client, client.server_url) for client in clients()]
+            for client, _ in targets:
+                client.repoint(new_url)
+            manager.adopt(new_process, job.model_name, new_port)
+            switched = True
+
+            await self._update(job, STATE_DRAINING, f"Draining requests on {old_url}", on_progress)
+            for client, previous_url in targets:
+                drained = await loop.run_in_executor(
+                    None, client.wait_for_drain, previous_url, self.drain_timeout
+                )
+                if not drained:
+                    logger.warning(
+                        f"Old whisper-server still had {client.inflight(previous_url)} "
+                        f"request(s) after {self.drain_timeout}s, stopping anyway"
+                    )
+
+            await self._update(job, STATE_STOPPING, f"Stopping old server on port {old_port}", on_progress)
+            await manager.stop_instance(old_process, port=old_port)
+
+            await self._update(
+                job, STATE_COMPLETED, f"Switched to {job.model_name}", on_progress
+            )
+
+        except Exception as e:
+            job.error = str(e)
+            if not switched and new_process is not None:
+                # Old server never stopped serving; just discard the new one
+                await manager.stop_instance(new_process)
+            await self._update(job, STATE_FAILED, f"Switch failed: {e}", on_progress)
+
+        finally:
+            manager.switch_in_progress = False
+
+
+def follow_switch(model_loader, job: ModelSwitchJob) -> None:
+    """Keep a model loader in step with a switch (call from ``on_progress``).
+
+    The loader's model name labels results (metrics, result cache, health),
+    so it changes as soon as traffic moves to the new server. The client
+    registered under the old model name is unloaded once it is drained.
+
+    Args:
+        model_loader: UnifiedWhisperLoader serving the whisper-server clients
+        job: Switch job that just changed state
+    """
+    if job.state == STATE_DRAINING:
+        model_loader.config.name = job.model_name
+    elif job.state == STATE_STOPPING and job.from_model != job.model_name:
+        model_loader.unload(backend=WhisperServerBackend.name, model_name=job.from_model)
+
+
+# Global switcher instance
+_model_switcher: Optional[ModelSwitcher] = None
+
+
+def get_model_switcher() -> ModelSwitcher:
+    """Get or create the global ModelSwitcher instance."""
+    global _model_switcher
+    if _model_switcher is None:
+        _model_switcher = ModelSwitcher()
+    return _model_switcher
@@ -0,0 +1,314 @@
+"""Memory-budgeted multi-model residency.
+
+Topics can name a preferred model (a kitchen timer is fine on tiny while
+dictation needs small or medium). The residency manager keeps several
+models constructed in the loader within a RAM/VRAM budget: a request for a
+model that is not resident loads it, evicting the least recently used
+models first, and a background pass prefetches the preferred models of
+topics that were active recently. A model handed out by ``acquire`` is in
+use until the caller ``release``s it, and models in use are never evicted.
+
+Only models that live in this process count against the budget (see
+``BackendPlugin.memory_mb``). whisper-server serves a single model, so
+preferred models are ignored with that backend.
+"""
+
+import asyncio
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from ..config.settings import ResidencyConfig
+from ..models.backends import get_backend_plugin
+from ..models.topic import TopicConfig
+from ..utils.logging import get_logger
+from ..utils.metrics import model_residency_events, model_residency_memory, model_residency_requests
+from .cascade import SINGLE_MODEL_BACKENDS
+
+logger = get_logger(__name__)
+
+
+class ModelStats:
+    """Per-model residency counters."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.evictions = 0
+        self.prefetches = 0
+
+    @property
+    def hit_rate(self) -> Optional[float]:
+        total = self.hits + self.misses
+        return self.hits / total if total else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 4) if self.hit_rate is not None else None,
+            "loads": self.loads,
+            "evictions": self.evictions,
+            "prefetches": self.prefetches,
+        }
+
+
+class ModelResidencyManager:
+    """Keeps preferred models loaded within a memory budget, evicting LRU."""
+
+    def __init__(self, config: Optional[ResidencyConfig] = None):
+        """Initialize residency manager.
+
+        Args:
+            config: Residency configuration
+        """
+        self.config = config or ResidencyConfig()
+        self._last_used: Dict[str, float] = {}
+        self._in_use: Dict[str, int] = {}
+        self._stats: Dict[str, ModelStats] = {}
+        self._load_lock: Optional[asyncio.Lock] = None
+
+    def _model_stats(self, model_name: str) -> ModelStats:
+        if model_name not in self._stats:
+            self._stats[model_name] = ModelStats()
+        return self._stats[model_name]
+
+    def _lock(self) -> asyncio.Lock:
+        # Created lazily so the lock binds to the running event loop
+        if self._load_lock is None:
+            self._load_lock = asyncio.Lock()
+        return self._load_lock
+
+    @staticmethod
+    def is_applicable(model_loader) -> bool:
+        """Whether the active backend can hold more than one model."""
+        return model_loader.backend_name not in SINGLE_MODEL_BACKENDS
+
+    def used_mb(self, model_loader) -> int:
+        """Estimated memory held by resident models of the active backend."""
+        plugin = get_backend_plugin(model_loader.backend_name)
+        return sum(
+            plugin.memory_mb(entry["model"])
+            for entry in model_loader.loaded_backends()
+            if entry["backend"] == model_loader.backend_name
+        )
+
+    def resolve_model(self, model_loader, topic_config: Optional[TopicConfig]) -> Optional[str]:
+        """Preferred model for a topic, if one applies.
+
+        Returns:
+            Model name, or None to use the configured model
+        """
+        if not self.config.enabled or topic_config is None or not topic_config.preferred_model:
+            return None
+        if not self.is_applicable(model_loader):
+            return None
+        if topic_config.preferred_model == model_loader.config.name:
+            return None
+        return topic_config.preferred_model
+
+    def _make_room(self, model_loader, needed_mb: int, protected: Set[str]) -> bool:
+        """Evict least recently used models until ``needed_mb`` fits.
+
+        The configured model, ``protected`` models and models in use are
+        never evicted.
+
+        Returns:
+            True if the model now fits within the budget
+        """
+        budget = self.config.memory_budget_mb
+        plugin = get_backend_plugin(model_loader.backend_name)
+        protected = protected | {model_loader.config.name} | {
+            name for name, count in self._in_use.items() if count > 0
+        }
+
+        while self.used_mb(model_loader) + needed_mb > budget:
+            candidates = [
+                entry["model"] for entry in model_loader.loaded_backends()
+                if entry["backend"] == model_loader.backend_name
+                and entry["model"] not in protected
+                and plugin.memory_mb(entry["model"]) > 0
+            ]
+            if not candidates:
+                return False
+            victim = min(candidates, key=lambda name: self._last_used.get(name, 0.0))
+            model_loader.unload(model_name=victim)
+            self._last_used.pop(victim, None)
+            self._model_stats(victim).evictions += 1
+            self._record_event(victim, "evict")
+            logger.info(f"Evicted model {victim} to stay within {budget} MB")
+        return True
+
+    async def _load(self, model_loader, model_name: str, protected: Set[str], event: str) -> bool:
+        """Load a model in the executor after making room for it."""
+        needed = get_backend_plugin(model_loader.backend_name).memory_mb(model_name)
+        async with self._lock():
+            if model_loader.is_resident(model_name=model_name):
+                return True
+            if not self._make_room(model_loader, needed, protected | {model_name}):
+                logger.warning(
+                    f"Model {model_name} ({needed} MB) does not fit in the "
+                    f"{self.config.memory_budget_mb} MB residency budget"
+                )
+                return False
+
+            start = time.time()
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(
+                None, lambda: model_loader.get_backend(model_name=model_name)
+            )
+            stats = self._model_stats(model_name)
+            stats.loads += 1
+            if event == "prefetch":
+                stats.prefetches += 1
+            self._last_used.setdefault(model_name, time.time())
+            self._record_event(model_name, event)
+            self._record_memory(model_loader)
+            logger.info(f"Model {model_name} resident ({event}) in {time.time() - start:.2f}s")
+            return True
+
+    async def acquire(self, model_loader, topic_config: Optional[TopicConfig]) -> Optional[str]:
+        """Make a topic's preferred model resident and mark it in use.
+
+        A returned model stays pinned (not evictable) until ``release``
+        is called for it.
+
+        Args:
+            model_loader: UnifiedWhisperLoader instance
+            topic_config: Topic configuration
+
+        Returns:
+            Model to transcribe with, or None for the configured model
+            (also when the preferred model cannot be loaded)
+        """
+        model_name = self.resolve_model(model_loader, topic_config)
+        if model_name is None:
+            return None
+
+        stats = self._model_stats(model_name)
+        if model_loader.is_resident(model_name=model_name):
+            stats.hits += 1
+            self._record_request(model_name, "hit")
+        else:
+            stats.misses += 1
+            self._record_request(model_name, "miss")
+            try:
+                loaded = await self._load(model_loader, model_name, set(), "load")
+            except Exception as e:
+                logger.error(f"Failed to load preferred model {model_name}: {e}")
+                loaded = False
+            if not loaded:
+                return None
+
+        self._last_used[model_name] = time.time()
+        self._in_use[model_name] = self._in_use.get(model_name, 0) + 1
+        return model_name
+
+    def release(self, model_name: Optional[str]) -> None:
+        """Unpin a model returned by ``acquire`` once decoding is done.
+
+        Args:
+            model_name: Model returned by ``acquire`` (None is ignored)
+        """
+        if model_name is None:
+            return
+        count = self._in_use.get(model_name, 0) - 1
+        if count > 0:
+            self._in_use[model_name] = count
+        else:
+            self._in_use.pop(model_name, None)
+
+    @contextmanager
+    def releasing(self, model_name: Optional[str]) -> Iterator[None]:
+        """Release a model returned by ``acquire`` when the block exits."""
+        try:
+            yield
+        finally:
+            self.release(model_name)
+
+    async def prefetch(self, model_loader, topics: List[TopicConfig]) -> List[str]:
+        """Load preferred models of recently active topics.
+
+        Models wanted by the given topics are protected from eviction, so
+        prefetching only displaces models no recent topic uses.
+
+        Args:
+            model_loader: UnifiedWhisperLoader instance
+            topics: Recently active topics, most recent first
+
+        Returns:
+            Models loaded by this pass
+        """
+        wanted: List[str] = []
+        for topic in topics:
+            model_name = self.resolve_model(model_loader, topic)
+            if model_name and model_name not in wanted:
+                wanted.append(model_name)
+
+        loaded = []
+        for model_name in wanted:
+            if model_loader.is_resident(model_name=model_name):
+                continue
+            try:
+                if await self._load(model_loader, model_name, set(wanted), "prefetch"):
+                    loaded.append(model_name)
+            except Exception as e:
+                logger.warning(f"Prefetch of {model_name} failed: {e}")
+        return loaded
+
+    async def run_prefetch_loop(self, model_loader, topic_registry) -> None:
+        """Prefetch preferred models periodically until cancelled."""
+        while True:
+            try:
+                await self.prefetch(
+                    model_loader, topic_registry.get_recent_topics(self.config.prefetch_window)
+                )
+                self._record_memory(model_loader)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Residency prefetch pass failed: {e}")
+            await asyncio.sleep(self.config.prefetch_interval)
+
+    def _record_memory(self, model_loader) -> None:
+        model_residency_memory.set(self.used_mb(model_loader))
+
+    @staticmethod
+    def _record_event(model_name: str, event: str) -> None:
+        model_residency_events.labels(model=model_name, event=event).inc()
+
+    @staticmethod
+    def _record_request(model_name: str, result: str) -> None:
+        model_residency_requests.labels(model=model_name, result=result).inc()
+
+    def get_stats(self, model_loader) -> Dict[str, Any]:
+        """Get residency state for admin endpoints."""
+        return {
+            "enabled": self.config.enabled,
+            "applicable": self.is_applicable(model_loader),
+            "memory_budget_mb": self.config.memory_budget_mb,
+            "memory_used_mb": self.used_mb(model_loader),
+            "resident": [
+                {
+                    **entry,
+                    "last_used": self._last_used.get(entry["model"]),
+                    "in_use": self._in_use.get(entry["model"], 0),
+                }
+                for entry in model_loader.loaded_backends()
+            ],
+            "models": {name: stats.to_dict() for name, stats in self._stats.items()},
+        }
+
+
+# Global residency manager instance
+_residency_manager: Optional[ModelResidencyManager] = None
+
+
+def get_residency_manager() -> ModelResidencyManager:
+    """Get or create the global ModelResidencyManager instance."""
+    global _residency_manager
+    if _residency_manager is None:
+        from ..config.loader import load_config
+        _residency_manager = ModelResidencyManager(load_config().residency)
+    return _residency_manager
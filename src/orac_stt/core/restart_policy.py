@@ -0,0 +1,151 @@
+"""Restart backoff, crash-loop detection and restart history for whisper-server.
+
+Without a policy, a whisper-server that fails right after every restart
+(e.g. a corrupt model file) is restarted in a tight loop, or the whole
+container is. ``RestartPolicy`` spaces restarts out: the first restart
+after a quiet period is immediate, and each further restart within
+``window`` seconds waits exponentially longer (with jitter, up to
+``max_backoff``). When ``crash_loop_restarts`` restarts happen within the
+window, the manager switches to the fallback model.
+
+Every restart is appended to a JSON history file, so a crash loop that
+spans container restarts is still recognized.
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+from ..config.settings import RestartPolicyConfig
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class RestartPolicy:
+    """Decides how long to wait before a restart and when to fall back."""
+
+    def __init__(self, config: Optional[RestartPolicyConfig] = None):
+        """Initialize the policy and load the restart history.
+
+        Args:
+            config: Restart policy configuration
+        """
+        self.config = config or RestartPolicyConfig()
+        self._lock = threading.Lock()
+        self._history: deque = deque(self._load_history(), maxlen=self.config.history_size)
+        self.consecutive_failures = 0
+
+    def _load_history(self) -> List[Dict[str, Any]]:
+        path = self.config.history_file
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return []
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable restart history {path}: {e}")
+            return []
+
+    def _save_history(self) -> None:
+        path = self.config.history_file
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(path.suffix + ".tmp")
+            tmp.write_text(json.dumps(list(self._history), indent=2))
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"Could not save restart history {path}: {e}")
+
+    def recent_restarts(self, now: Optional[float] = None) -> int:
+        """Restarts (successful or not) within the crash-loop window."""
+        now = time.time() if now is None else now
+        return sum(1 for event in self._history if now - event["at"] <= self.config.window)
+
+    def in_crash_loop(self, now: Optional[float] = None) -> bool:
+        """Whether restarts are happening too often to be transient."""
+        return self.recent_restarts(now) >= self.config.crash_loop_restarts
+
+    def next_delay(self, now: Optional[float] = None) -> float:
+        """Seconds to wait before the next restart.
+
+        No wait after a quiet period; otherwise ``initial_backoff`` doubled
+        (by ``multiplier``) for every recent restart, capped and jittered.
+        """
+        recent = self.recent_restarts(now)
+        if recent == 0:
+            return 0.0
+        delay = min(self.config.max_backoff, self.config.initial_backoff * self.config.multiplier ** (recent - 1))
+        return delay * random.uniform(1 - self.config.jitter, 1 + self.config.jitter)
+
+    def should_exit(self) -> bool:
+        """Whether to give up and exit so the container is restarted."""
+        return 0 < self.config.exit_after <= self.consecutive_failures
+
+    def record(
+        self,
+        reason: str,
+        model: str,
+        success: bool,
+        duration: float,
+        delay: float = 0.0,
+        fallback: bool = False,
+    ) -> Dict[str, Any]:
+        """Append a restart to the persistent history.
+
+        Args:
+            reason: What triggered the restart
+            model: Model the server was restarted with
+            success: Whether the server came back
+            duration: Seconds the restart took
+            delay: Backoff waited before it
+            fallback: Whether the fallback model was in use
+
+        Returns:
+            The recorded event
+        """
+        event = {
+            "at": time.time(),
+            "reason": reason,
+            "model": model,
+            "success": success,
+            "duration_s": round(duration, 3),
+            "delay_s": round(delay, 3),
+            "fallback": fallback,
+        }
+        self.consecutive_failures = 0 if success else self.consecutive_failures + 1
+        with self._lock:
+            self._history.append(event)
+            self._save_history()
+        return event
+
+    def history(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Most recent restarts, newest last."""
+        return list(self._history)[-limit:] if limit > 0 else []
+
+    def get_status(self) -> Dict[str, Any]:
+        """Policy state for the manager status and admin API."""
+        return {
+            "recent_restarts": self.recent_restarts(),
+            "crash_loop": self.in_crash_loop(),
+            "consecutive_failures": self.consecutive_failures,
+            "next_delay_s": round(self.next_delay(), 2),
+            "history": self.history(10),
+        }
+
+
+# Global restart policy instance
+_restart_policy: Optional[RestartPolicy] = None
+
+
+def get_restart_policy() -> RestartPolicy:
+    """Get or create the global RestartPolicy instance."""
+    global _restart_policy
+    if _restart_policy is None:
+        from ..config.loader import load_config
+        _restart_policy = RestartPolicy(load_config().restart_policy)
+    return _restart_policy
@@ -0,0 +1,203 @@
+"""Content-addressed transcription result cache.
+
+Satellites retry an upload when the response is slow, so the same audio is
+often transcribed two or three times, sometimes concurrently. Results are
+cached under a hash of the PCM samples and every parameter that affects
+decoding (backend, model, language, task, decode budget and the topic's
+model, cascade and grammar settings):
+
+- a repeated request is answered from the cache (LRU, TTL and a bound on
+  the estimated memory held)
+- a request identical to one still being transcribed waits for that
+  inference instead of starting its own (single flight)
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from ..config.settings import ResultCacheConfig
+from ..utils.logging import get_logger
+from ..utils.metrics import result_cache_entries, result_cache_requests
+
+logger = get_logger(__name__)
+
+# Per-entry overhead (key, dict and bookkeeping) added to the JSON size
+ENTRY_OVERHEAD = 512
+
+
+def cache_key(audio: np.ndarray, sample_rate: int, params: Dict[str, Any]) -> str:
+    """Hash audio samples together with the decode parameters.
+
+    Args:
+        audio: Audio samples
+        sample_rate: Sample rate in Hz
+        params: Parameters that affect the transcription (JSON-serializable)
+
+    Returns:
+        Hex digest identifying the request
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.ascontiguousarray(audio, dtype=np.float32).tobytes())
+    digest.update(str(sample_rate).encode())
+    digest.update(json.dumps(params, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+@dataclass
+class _Entry:
+    result: Dict[str, Any]
+    size: int
+    expires: float
+
+
+class TranscriptionCache:
+    """LRU/TTL result cache with single-flight coalescing.
+
+    Only used from the event loop, so no locking is needed.
+    """
+
+    def __init__(self, config: Optional[ResultCacheConfig] = None):
+        """Initialize result cache.
+
+        Args:
+            config: Result cache configuration
+        """
+        self.config = config or ResultCacheConfig()
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._bytes = 0
+        self._stats = {"hit": 0, "miss": 0, "coalesced": 0, "evicted": 0, "expired": 0}
+
+    @property
+    def max_bytes(self) -> int:
+        return int(self.config.max_memory_mb * 1024 * 1024)
+
+    @staticmethod
+    def cacheable(result: Dict[str, Any]) -> bool:
+        """Whether a result may be reused.
+
+        Aborted decodes are not, and neither are results decoded at a
+        degraded quality level: the load that caused them is usually gone
+        long before the TTL expires.
+        """
+        return not result.get("decode_aborted") and not result.get("degradation_level")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached result (a copy), dropping it if expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires <= time.monotonic():
+            self._remove(key)
+            self._stats["expired"] += 1
+            return None
+        self._entries.move_to_end(key)
+        return dict(entry.result)
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a result, evicting least recently used entries past the bounds."""
+        size = len(json.dumps(result, default=str)) + ENTRY_OVERHEAD
+        if not self.cacheable(result) or size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = _Entry(dict(result), size, time.monotonic() + self.config.ttl)
+        self._bytes += size
+        while self._entries and (len(self._entries) > self.config.max_entries or self._bytes > self.max_bytes):
+            self._remove(next(iter(self._entries)))
+            self._stats["evicted"] += 1
+        self._update_gauge()
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+        self._update_gauge()
+
+    def _update_gauge(self) -> None:
+        result_cache_entries.set(len(self._entries))
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Tuple[Dict[str, Any], str]:
+        """Return the cached result for a key, or compute it once.
+
+        Concurrent callers with the same key share one computation; if it
+        fails, all of them see the error and nothing is cached.
+
+        Args:
+            key: Request key from ``cache_key``
+            compute: Coroutine factory producing the transcription
+
+        Returns:
+            Tuple of (result, outcome) where outcome is "hit", "coalesced"
+            or "miss"
+        """
+        cached = self.get(key)
+        task = self._inflight.get(key)
+        if cached is not None:
+            outcome = "hit"
+        elif task is not None:
+            outcome = "coalesced"
+        else:
+            outcome = "miss"
+            # The inference runs as its own task so that a caller going away
+            # does not cancel it for the others waiting on it
+            task = asyncio.ensure_future(compute())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        self._stats[outcome] += 1
+        result_cache_requests.labels(result=outcome).inc()
+        if cached is not None:
+            return cached, outcome
+        return dict(await asyncio.shield(task)), outcome
+
+    def _finish(self, key: str, task: asyncio.Future) -> None:
+        """Cache a finished inference and release its waiters' key."""
+        self._inflight.pop(key, None)
+        if not task.cancelled() and task.exception() is None:
+            self.put(key, task.result())
+
+    def clear(self) -> int:
+        """Drop all cached results.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = len(self._entries)
+        self._entries.clear()
+        self._bytes = 0
+        self._update_gauge()
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Entry count, memory use and lookup outcomes."""
+        lookups = self._stats["hit"] + self._stats["miss"] + self._stats["coalesced"]
+        return {
+            "entries": len(self._entries),
+            "memory_bytes": self._bytes,
+            "inflight": len(self._inflight),
+            **self._stats,
+            "hit_rate": (self._stats["hit"] + self._stats["coalesced"]) / lookups if lookups else None,
+        }
+
+
+# Global cache instance
+_result_cache: Optional[TranscriptionCache] = None
+
+
+def get_result_cache() -> TranscriptionCache:
+    """Get or create the global TranscriptionCache instance."""
+    global _result_cache
+    if _result_cache is None:
+        from ..config.loader import load_config
+        _result_cache = TranscriptionCache(load_config().result_cache)
+    return _result_cache
@@ -0,0 +1,115 @@
+"""Drain whisper-server output into a bounded ring and timing metrics.
+
+whisper-server is started with its stdout (and stderr) on a pipe. Unless
+something reads that pipe, a chatty server eventually fills it, blocks on
+its next write and stalls inference. ``ServerOutputLog.drain`` reads every
+line as it is written, keeps the most recent ones for the admin API and
+turns whisper.cpp's timing report::
+
+    whisper_print_timings:     load time =   101.23 ms
+    whisper_print_timings:      mel time =    10.45 ms
+    whisper_print_timings:   encode time =   350.12 ms /     1 runs (  350.12 ms per run)
+    whisper_print_timings:   decode time =    20.33 ms /     5 runs (    4.07 ms per run)
+    whisper_print_timings:    total time =   498.87 ms
+
+into per-stage histograms.
+"""
+
+import asyncio
+import re
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..utils.logging import get_logger
+from ..utils.metrics import whisper_server_stage
+
+logger = get_logger(__name__)
+
+# Stages exported as orac_stt_whisper_server_stage_seconds{stage=...}
+STAGES = ("load", "mel", "sample", "encode", "decode", "batchd", "prompt", "total")
+
+TIMING_RE = re.compile(r"whisper_print_timings:\s+(\w+) time\s*=\s*([0-9.]+)\s*ms")
+
+
+def parse_timing(line: str) -> Optional[Tuple[str, float]]:
+    """Parse a whisper.cpp timing line.
+
+    Args:
+        line: One line of whisper-server output
+
+    Returns:
+        (stage, seconds), or None if the line is not a known timing line
+    """
+    match = TIMING_RE.search(line)
+    if not match or match.group(1) not in STAGES:
+        return None
+    return match.group(1), float(match.group(2)) / 1000
+
+
+class ServerOutputLog:
+    """Most recent whisper-server output lines and parsed timings."""
+
+    def __init__(self, max_lines: int = 500):
+        """Initialize the ring.
+
+        Args:
+            max_lines: Lines kept; older lines are dropped
+        """
+        self.max_lines = max_lines
+        self._lines: deque = deque(maxlen=max_lines)
+        self._total_lines = 0
+        self._timed_requests = 0
+        self._pending: Dict[str, float] = {}
+        self.last_timings: Optional[Dict[str, float]] = None
+
+    def append(self, line: str, port: Optional[int] = None) -> None:
+        """Record one output line and observe it if it is a timing line."""
+        self._lines.append({"time": time.time(), "port": port, "line": line})
+        self._total_lines += 1
+
+        timing = parse_timing(line)
+        if timing is None:
+            return
+        stage, seconds = timing
+        whisper_server_stage.labels(stage=stage).observe(seconds)
+        self._pending[stage] = round(seconds * 1000, 2)
+        if stage == "total":
+            # The total line closes one request's report
+            self.last_timings = self._pending
+            self._pending = {}
+            self._timed_requests += 1
+
+    async def drain(self, stream: asyncio.StreamReader, port: Optional[int] = None) -> None:
+        """Read a process's output until EOF.
+
+        Args:
+            stream: The process's stdout
+            port: Port of the instance, recorded with each line
+        """
+        while True:
+            try:
+                raw = await stream.readline()
+            except ValueError:
+                # Line longer than the stream limit: the reader discards it
+                self.append("[line too long, dropped]", port)
+                continue
+            if not raw:
+                return
+            self.append(raw.decode("utf-8", errors="replace").rstrip(), port)
+
+    def tail(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """Get the most recent lines, oldest first."""
+        if limit <= 0:
+            return []
+        return list(self._lines)[-limit:]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Line counts and the last timing report."""
+        return {
+            "max_lines": self.max_lines,
+            "buffered_lines": len(self._lines),
+            "total_lines": self._total_lines,
+            "timed_requests": self._timed_requests,
+            "last_timings_ms": self.last_timings,
+        }
@@ -0,0 +1,290 @@
+"""Hot-standby whisper-server for instant failover.
+
+Restarting a failed whisper-server means loading its model again, which
+takes 10-15 s during which every command fails. ``WhisperStandby`` keeps a
+second instance of the same model loaded, warmed up and health-checked on
+its own port. When the manager decides to restart the active server, the
+standby takes over instead: clients are repointed at it in one step, and
+the failed server is stopped and started again in the background as the
+new standby, so the active and standby ports swap.
+
+The standby costs a second copy of the model in RAM. Its resident memory
+is reported, and it is not started (or is stopped) when less than
+``min_available_mb`` would remain available.
+"""
+
+import asyncio
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from ..config.settings import StandbyConfig
+from ..models.backends import WhisperServerBackend
+from ..models.whisper_server import WhisperServerModel
+from ..utils.logging import get_logger
+from ..utils.metrics import standby_failovers, standby_memory
+from .warmup import run_warmup
+
+logger = get_logger(__name__)
+
+# Synthetic utterance lengths sent to keep the standby warm
+WARM_DURATIONS = (1.0,)
+
+
+def available_mb() -> Optional[float]:
+    """Memory available to new processes (MemAvailable), or None if unknown."""
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def process_rss_mb(pid: int) -> Optional[float]:
+    """Resident memory of a process, or None if unknown."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+class WhisperStandby:
+    """Keeps a warm second whisper-server ready to take over."""
+
+    def __init__(
+        self,
+        manager,
+        config: Optional[StandbyConfig] = None,
+        clients: Optional[Callable[[], List[WhisperServerModel]]] = None,
+    ):
+        """Initialize the standby.
+
+        Args:
+            manager: whisper-server process manager
+            config: Standby configuration
+            clients: Returns the whisper-server clients to repoint on failover
+        """
+        self.manager = manager
+        self.config = config or StandbyConfig()
+        self.clients = clients or (lambda: [])
+        self.port = self.config.port
+        self.model_name: Optional[str] = None
+        self.ready = False
+        self.disabled_reason: Optional[str] = None
+        self.failovers = 0
+        self.last_failover: Optional[float] = None
+        self._process = None
+        self._last_warm = 0.0
+        self._rebuild_task: Optional[asyncio.Task] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the standby instance."""
+        return self.manager.url_for_port(self.port)
+
+    @property
+    def pid(self) -> Optional[int]:
+        """PID of the standby process, if one is running."""
+        return self._process.pid if self._process is not None else None
+
+    @property
+    def rebuilding(self) -> bool:
+        """Whether a failed server is being rebuilt as the new standby."""
+        return self._rebuild_task is not None and not self._rebuild_task.done()
+
+    def memory_mb(self) -> Optional[float]:
+        """Resident memory of the standby process (the failover overhead)."""
+        return process_rss_mb(self.pid) if self.pid is not None else None
+
+    def estimate_mb(self, model_name: str) -> int:
+        """Expected standby memory: the active server's, or the model file size."""
+        manager = self.manager
+        rss = None
+        if manager.active_pid is not None and model_name == manager.model_name:
+            rss = process_rss_mb(manager.active_pid)
+        try:
+            file_mb = os.path.getsize(manager.model_path_for(model_name)) / (1024 * 1024)
+        except OSError:
+            file_mb = 0
+        return round(max(rss or 0, file_mb))
+
+    def _memory_blocked(self, model_name: str) -> Optional[str]:
+        """Reason the standby may not start, or None if memory allows it."""
+        available = available_mb()
+        if available is None:
+            return None
+        needed = self.estimate_mb(model_name)
+        if available - needed < self.config.min_available_mb:
+            return (
+                f"{available:.0f} MB available, {model_name} needs ~{needed} MB "
+                f"and {self.config.min_available_mb} MB must stay free"
+            )
+        return None
+
+    def _warm_up(self) -> Dict[str, Any]:
+        client = WhisperServerModel(
+            server_url=self.url, timeout=self.config.ready_timeout, prompt=self.manager.prompt
+        )
+        return run_warmup(
+            client.transcribe, WARM_DURATIONS,
+            model=self.model_name, backend=WhisperServerBackend.name,
+        )
+
+    async def _start(self, model_name: str) -> bool:
+        """Start, wait for and warm up a standby instance."""
+        manager = self.manager
+        logger.info(f"Starting hot-standby whisper-server ({model_name}) on port {self.port}")
+        await manager._kill_existing(self.port)
+        self.model_name = model_name
+        self._process, ready = await manager.launch(model_name, self.port, self.config.ready_timeout)
+        if ready:
+            try:
+                await asyncio.to_thread(self._warm_up)
+            except Exception as e:
+                logger.warning(f"Hot-standby warm-up failed: {e}")
+                ready = False
+        if not ready:
+            logger.error(f"Hot-standby whisper-server on port {self.port} did not become ready")
+            await self._stop_process()
+            return False
+        self._last_warm = time.monotonic()
+        self.ready = True
+        self._record_memory()
+        logger.info(f"Hot-standby whisper-server ready on port {self.port} ({self.memory_mb() or 0:.0f} MB)")
+        return True
+
+    async def _stop_process(self) -> None:
+        process, self._process = self._process, None
+        self.ready = False
+        if process is not None:
+            await self.manager.stop_instance(process)
+        self._record_memory()
+
+    async def maintain(self) -> None:
+        """One pass of the keeper loop: start, check, keep warm or stop the standby."""
+        manager = self.manager
+        if manager.switch_in_progress or self.rebuilding:
+            return
+
+        if self._process is not None and self._process.returncode is not None:
+            logger.warning(f"Hot-standby whisper-server exited (code {self._process.returncode})")
+            self._process = None
+            self.ready = False
+        if self._process is not None and self.model_name != manager.model_name:
+            logger.info(f"Active model is now {manager.model_name}, replacing the standby")
+            await self._stop_process()
+
+        if self._process is None:
+            self.disabled_reason = self._memory_blocked(manager.model_name)
+            if self.disabled_reason:
+                logger.debug(f"Hot standby not started: {self.disabled_reason}")
+                return
+            await self._start(manager.model_name)
+            return
+
+        available = available_mb()
+        if available is not None and available < self.config.min_available_mb:
+            self.disabled_reason = f"only {available:.0f} MB available, stopped to free memory"
+            logger.warning(f"Stopping hot-standby whisper-server: {self.disabled_reason}")
+            await self._stop_process()
+            return
+
+        self.ready = await manager.check_health(self.url)
+        if self.ready and time.monotonic() - self._last_warm >= self.config.warm_interval:
+            try:
+                await asyncio.to_thread(self._warm_up)
+                self._last_warm = time.monotonic()
+            except Exception as e:
+                logger.warning(f"Hot-standby keep-warm failed: {e}")
+                self.ready = False
+        self._record_memory()
+
+    async def run(self) -> None:
+        """Keep the standby running until cancelled."""
+        while True:
+            try:
+                await self.maintain()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Hot-standby check failed: {e}")
+            await asyncio.sleep(self.config.check_interval)
+
+    async def take_over(self) -> bool:
+        """Make the standby the active server and rebuild the old one in the background.
+
+        Returns:
+            True if traffic moved to the standby, False if none was ready
+        """
+        manager = self.manager
+        process = self._process
+        if (
+            not self.ready or process is None or process.returncode is not None
+            or self.model_name != manager.model_name
+        ):
+            return False
+        if not await manager.check_health(self.url):
+            self.ready = False
+            return False
+
+        old_process, old_port = manager._process, manager.port
+        new_url = self.url
+        WhisperServerBackend.set_server_url(new_url)
+        for client in self.clients():
+            client.repoint(new_url)
+        manager.adopt(process, self.model_name, self.port)
+        await manager.check_health()
+
+        self._process = None
+        self.ready = False
+        self.port = old_port
+        self.failovers += 1
+        self.last_failover = time.time()
+        standby_failovers.inc()
+        logger.warning(f"Failed over to hot-standby whisper-server at {new_url}")
+
+        self._rebuild_task = asyncio.create_task(self._rebuild(old_process, old_port))
+        return True
+
+    async def _rebuild(self, old_process, old_port: int) -> None:
+        """Replace the failed server with a new standby on its port."""
+        try:
+            await self.manager.stop_instance(old_process, port=old_port)
+            await self._start(self.manager.model_name)
+        except Exception as e:
+            logger.error(f"Rebuilding the hot standby failed: {e}")
+
+    async def stop(self) -> None:
+        """Stop the standby (and any rebuild in progress)."""
+        if self.rebuilding:
+            self._rebuild_task.cancel()
+        await self._stop_process()
+
+    def _record_memory(self) -> None:
+        standby_memory.set((self.memory_mb() or 0) * 1024 * 1024)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Standby state and memory overhead for the admin API."""
+        memory = self.memory_mb()
+        return {
+            "enabled": self.config.enabled,
+            "ready": self.ready,
+            "port": self.port,
+            "url": self.url,
+            "pid": self.pid,
+            "model_name": self.model_name,
+            "rebuilding": self.rebuilding,
+            "memory_overhead_mb": round(memory, 1) if memory is not None else None,
+            "available_mb": round(available_mb() or 0, 1) or None,
+            "min_available_mb": self.config.min_available_mb,
+            "disabled_reason": self.disabled_reason,
+            "failovers": self.failovers,
+            "last_failover": self.last_failover,
+        }
@@ -0,0 +1,339 @@
+"""Acoustic template fast path for frequent commands.
+
+A handful of short commands ("lights on", "lights off") make up most of
+the traffic. Confident Whisper transcriptions of short utterances are kept
+as templates (MFCC frames of the trimmed audio), per topic and per
+normalized text. A new short utterance is aligned against the topic's
+templates with DTW; when the closest template is similar enough, and
+clearly closer than any template of a different text, its text is returned
+without running Whisper.
+
+A sample of hits is re-transcribed in the background. A hit whose text
+Whisper disagrees with is recorded as a false accept (kept for audit on the
+admin API) and the template that produced it is dropped.
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from ..audio.features import dtw_distances, mfcc, pool_frames, trim_silence
+from ..config.settings import TemplateConfig
+from ..utils.logging import get_logger
+from ..utils.metrics import template_latency_saved, template_requests, template_verifications
+from ..utils.wer import normalize_words
+
+logger = get_logger(__name__)
+
+# Frames are averaged in pairs (20 ms hop) to keep DTW cheap
+POOL_FACTOR = 2
+# Templates further than this duration ratio from the query are not aligned
+MAX_DURATION_RATIO = 1.4
+# Smoothing factor for the running Whisper latency estimate
+LATENCY_ALPHA = 0.1
+
+
+@dataclass
+class Utterance:
+    """Acoustic features of one request's audio."""
+
+    features: np.ndarray
+    duration: float  # Seconds of speech after trimming silence
+
+
+@dataclass
+class Template:
+    """A learned utterance of a command."""
+
+    key: str  # Normalized text
+    text: str  # Text as Whisper returned it
+    confidence: float
+    language: Optional[str]
+    features: np.ndarray
+    duration: float
+    created: float = field(default_factory=time.time)
+    last_used: float = field(default_factory=time.time)
+    hits: int = 0
+
+
+@dataclass
+class TemplateMatch:
+    """A fast-path hit."""
+
+    topic: str
+    template: Template
+    similarity: float
+    runner_up: Optional[float]  # Best similarity of a different text
+    match_time: float  # Seconds spent matching
+
+    def result(self) -> Dict[str, Any]:
+        """Transcription result returned in place of Whisper's."""
+        return {
+            "text": self.template.text,
+            "confidence": self.template.confidence,
+            "language": self.template.language,
+            "template_match": {
+                "similarity": round(self.similarity, 4),
+                "runner_up": None if self.runner_up is None else round(self.runner_up, 4),
+                "match_ms": round(self.match_time * 1000, 2),
+            },
+        }
+
+
+class TemplateMatcher:
+    """Learns command templates and matches requests against them."""
+
+    def __init__(self, config: Optional[TemplateConfig] = None):
+        """Initialize template matcher.
+
+        Args:
+            config: Template fast-path configuration
+        """
+        self.config = config or TemplateConfig()
+        self._lock = threading.Lock()
+        self._templates: Dict[str, List[Template]] = {}
+        self._audits: deque = deque(maxlen=50)
+        self._whisper_latency: Optional[float] = None
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "learned": 0,
+            "verifications": 0,
+            "false_accepts": 0,
+            "match_time": 0.0,
+            "latency_saved": 0.0,
+        }
+
+    def accepts(self, audio: np.ndarray, sample_rate: int, task: str = "transcribe") -> bool:
+        """Whether a request is eligible for the fast path."""
+        return (
+            self.config.enabled
+            and task == "transcribe"
+            and len(audio) <= self.config.max_duration * sample_rate
+        )
+
+    @staticmethod
+    def extract(audio: np.ndarray, sample_rate: int) -> Utterance:
+        """Compute the features used for matching and learning.
+
+        Args:
+            audio: Audio samples
+            sample_rate: Sample rate in Hz
+
+        Returns:
+            Utterance features
+        """
+        speech = trim_silence(np.asarray(audio, dtype=np.float32), sample_rate)
+        features = pool_frames(mfcc(speech, sample_rate), POOL_FACTOR)
+        return Utterance(features=features, duration=len(speech) / sample_rate)
+
+    def match(self, topic: str, utterance: Utterance) -> Optional[TemplateMatch]:
+        """Match an utterance against a topic's templates.
+
+        Args:
+            topic: Topic name
+            utterance: Features of the request's audio
+
+        Returns:
+            The match, or None if no template is close enough
+        """
+        start = time.perf_counter()
+        with self._lock:
+            candidates = [
+                t for t in self._templates.get(topic, [])
+                if 1 / MAX_DURATION_RATIO <= t.duration / max(utterance.duration, 1e-3) <= MAX_DURATION_RATIO
+            ]
+
+        match = None
+        if candidates:
+            distances = dtw_distances(utterance.features, [t.features for t in candidates], self.config.band)
+            similarities = np.exp(-distances)
+            best = int(np.argmax(similarities))
+            others = [s for t, s in zip(candidates, similarities) if t.key != candidates[best].key]
+            runner_up = float(max(others)) if others else None
+            similarity = float(similarities[best])
+            if similarity >= self.config.min_similarity and (
+                runner_up is None or similarity - runner_up >= self.config.margin
+            ):
+                match = TemplateMatch(
+                    topic=topic,
+                    template=candidates[best],
+                    similarity=similarity,
+                    runner_up=runner_up,
+                    match_time=time.perf_counter() - start,
+                )
+
+        elapsed = time.perf_counter() - start
+        saved = 0.0
+        with self._lock:
+            self._stats["match_time"] += elapsed
+            if match is None:
+                self._stats["misses"] += 1
+            else:
+                self._stats["hits"] += 1
+                match.template.hits += 1
+                match.template.last_used = time.time()
+                if self._whisper_latency is not None:
+                    saved = max(0.0, self._whisper_latency - elapsed)
+                    self._stats["latency_saved"] += saved
+        template_requests.labels(result="miss" if match is None else "hit").inc()
+        template_latency_saved.inc(saved)
+        return match
+
+    def record_whisper_latency(self, seconds: float) -> None:
+        """Update the running Whisper latency used to estimate savings."""
+        with self._lock:
+            if self._whisper_latency is None:
+                self._whisper_latency = seconds
+            else:
+                self._whisper_latency += LATENCY_ALPHA * (seconds - self._whisper_latency)
+
+    def learn(self, topic: str, utterance: Utterance, result: Dict[str, Any]) -> bool:
+        """Keep a confident transcription of a short command as a template.
+
+        Args:
+            topic: Topic name
+            utterance: Features of the transcribed audio
+            result: Whisper transcription result
+
+        Returns:
+            True if a template was added
+        """
+        text = result.get("text", "").strip()
+        words = normalize_words(text)
+        if (
+            not self.config.enabled
+            or not words
+            or len(words) > self.config.max_words
+            or result.get("confidence", 0.0) < self.config.learn_min_confidence
+            or result.get("decode_aborted")
+            or utterance.duration > self.config.max_duration
+            or len(utterance.features) < 2
+        ):
+            return False
+
+        template = Template(
+            key=" ".join(words),
+            text=text,
+            confidence=result.get("confidence", 0.0),
+            language=result.get("language"),
+            features=utterance.features,
+            duration=utterance.duration,
+        )
+        with self._lock:
+            templates = self._templates.setdefault(topic, [])
+            templates.append(template)
+            same = [t for t in templates if t.key == template.key]
+            if len(same) > self.config.templates_per_text:
+                templates.remove(same[0])  # Oldest utterance of this text
+            while len(templates) > self.config.max_templates:
+                templates.remove(min(templates, key=lambda t: t.last_used))
+            self._stats["learned"] += 1
+        return True
+
+    def should_verify(self) -> bool:
+        """Whether a hit should be re-transcribed for auditing."""
+        return random.random() < self.config.verify_rate
+
+    def verify(self, match: TemplateMatch, result: Dict[str, Any]) -> bool:
+        """Compare a hit with Whisper's transcription of the same audio.
+
+        A disagreement is audited and the template that produced it dropped.
+
+        Args:
+            match: The fast-path hit
+            result: Whisper transcription result
+
+        Returns:
+            True if Whisper agrees with the template
+        """
+        whisper_text = result.get("text", "").strip()
+        agrees = " ".join(normalize_words(whisper_text)) == match.template.key
+        with self._lock:
+            self._stats["verifications"] += 1
+            if not agrees:
+                self._stats["false_accepts"] += 1
+                self._audits.append({
+                    "timestamp": time.time(),
+                    "topic": match.topic,
+                    "template_text": match.template.text,
+                    "whisper_text": whisper_text,
+                    "similarity": round(match.similarity, 4),
+                    "runner_up": None if match.runner_up is None else round(match.runner_up, 4),
+                })
+                templates = self._templates.get(match.topic, [])
+                if match.template in templates:
+                    templates.remove(match.template)
+        template_verifications.labels(outcome="confirmed" if agrees else "false_accept").inc()
+        if not agrees:
+            logger.warning(
+                f"Template false accept on topic '{match.topic}': "
+                f"'{match.template.text}' but Whisper heard '{whisper_text}'"
+            )
+        return agrees
+
+    def clear(self, topic: Optional[str] = None) -> int:
+        """Forget templates (one topic or all).
+
+        Returns:
+            Number of templates removed
+        """
+        with self._lock:
+            if topic is None:
+                removed = sum(len(t) for t in self._templates.values())
+                self._templates.clear()
+            else:
+                removed = len(self._templates.pop(topic, []))
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit rate, false-accept audits, latency savings and templates per topic."""
+        with self._lock:
+            stats = dict(self._stats)
+            lookups = stats["hits"] + stats["misses"]
+            topics = {}
+            for topic, templates in self._templates.items():
+                texts: Dict[str, Dict[str, Any]] = {}
+                for t in templates:
+                    entry = texts.setdefault(t.key, {"text": t.text, "templates": 0, "hits": 0})
+                    entry["templates"] += 1
+                    entry["hits"] += t.hits
+                topics[topic] = {"templates": len(templates), "texts": texts}
+            audits = list(self._audits)
+            whisper_latency = self._whisper_latency
+
+        return {
+            "lookups": lookups,
+            "hits": stats["hits"],
+            "misses": stats["misses"],
+            "hit_rate": stats["hits"] / lookups if lookups else None,
+            "learned": stats["learned"],
+            "verifications": stats["verifications"],
+            "false_accepts": stats["false_accepts"],
+            "false_accept_rate": (
+                stats["false_accepts"] / stats["verifications"] if stats["verifications"] else None
+            ),
+            "avg_match_ms": stats["match_time"] / lookups * 1000 if lookups else None,
+            "avg_whisper_ms": None if whisper_latency is None else whisper_latency * 1000,
+            "latency_saved_seconds": round(stats["latency_saved"], 3),
+            "topics": topics,
+            "audits": audits,
+        }
+
+
+# Global matcher instance
+_template_matcher: Optional[TemplateMatcher] = None
+
+
+def get_template_matcher() -> TemplateMatcher:
+    """Get or create the global TemplateMatcher instance."""
+    global _template_matcher
+    if _template_matcher is None:
+        from ..config.loader import load_config
+        _template_matcher = TemplateMatcher(load_config().templates)
+    return _template_matcher
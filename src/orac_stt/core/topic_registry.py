@@ -7,7 +7,7 @@ from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any
 from threading import RLock
 
-from ..models.topic import TopicConfig
+from ..models.topic import TopicCascadeConfig, TopicConfig, TopicGrammar
 
 logger = logging.getLogger(__name__)
 
@@ -111,6 +111,71 @@ class TopicRegistry:
             self.topics[topic_name].wake_words_to_strip = wake_words
             self.save()
     
+    def set_cascade(self, topic_name: str, cascade: Optional[TopicCascadeConfig]) -> None:
+        """Set model cascade overrides for a topic.
+
+        Args:
+            topic_name: Name of the topic
+            cascade: Cascade overrides, or None to use the global settings
+        """
+        with self._lock:
+            if topic_name not in self.topics:
+                # Auto-register if not exists
+                self.auto_register(topic_name)
+
+            self.topics[topic_name].cascade = cascade
+            self.save()
+
+    def set_preferred_model(self, topic_name: str, model_name: Optional[str]) -> None:
+        """Set the preferred model for a topic.
+
+        Args:
+            topic_name: Name of the topic
+            model_name: Model name, or None to use the configured model
+        """
+        with self._lock:
+            if topic_name not in self.topics:
+                # Auto-register if not exists
+                self.auto_register(topic_name)
+
+            self.topics[topic_name].preferred_model = model_name
+            self.save()
+
+    def set_grammar(self, topic_name: str, grammar: Optional[TopicGrammar]) -> None:
+        """Set the decoding grammar for a topic.
+
+        Args:
+            topic_name: Name of the topic
+            grammar: Grammar or phrase list, or None for unconstrained decoding
+        """
+        with self._lock:
+            if topic_name not in self.topics:
+                # Auto-register if not exists
+                self.auto_register(topic_name)
+
+            self.topics[topic_name].grammar = grammar
+            self.save()
+
+    def get_recent_topics(self, window: float) -> List[TopicConfig]:
+        """Get topics seen within a time window, most recent first.
+
+        Args:
+            window: Window in seconds
+
+        Returns:
+            List of recently seen topics
+        """
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            recent = []
+            for topic in self.topics.values():
+                if not topic.last_seen:
+                    continue
+                last_seen = topic.last_seen if topic.last_seen.tzinfo else topic.last_seen.replace(tzinfo=timezone.utc)
+                if (now - last_seen).total_seconds() < window:
+                    recent.append((last_seen, topic))
+        return [topic for _, topic in sorted(recent, key=lambda item: item[0], reverse=True)]
+
     def get_active_topics(self) -> List[TopicConfig]:
         """Get list of active topics (recent heartbeats).
         
@@ -0,0 +1,173 @@
+"""Model warm-up and readiness gating."""
+
+import asyncio
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import numpy as np
+
+from ..audio.synthetic import synthetic_utterance
+from ..utils.logging import get_logger
+from ..utils.metrics import model_load_time, warmup_latency
+
+logger = get_logger(__name__)
+
+# Representative command lengths: short command, typical command, long dictation
+DEFAULT_WARMUP_DURATIONS = (1.0, 3.0, 8.0)
+
+
+class ReadinessGate:
+    """Tracks whether the service is warm enough to receive traffic."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ready = False
+        self._reason = "starting"
+        self._since = datetime.utcnow()
+        self.last_warmup: Optional[Dict[str, Any]] = None
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether the service should receive traffic."""
+        return self._ready
+
+    def set_not_ready(self, reason: str) -> None:
+        """Stop advertising readiness (e.g. while loading or restarting)."""
+        with self._lock:
+            if self._ready or self._reason != reason:
+                logger.info(f"Service not ready: {reason}")
+            self._ready = False
+            self._reason = reason
+            self._since = datetime.utcnow()
+
+    def set_ready(self, warmup: Optional[Dict[str, Any]] = None) -> None:
+        """Advertise readiness, optionally recording the warm-up that preceded it."""
+        with self._lock:
+            self._ready = True
+            self._reason = "warm"
+            self._since = datetime.utcnow()
+            if warmup is not None:
+                self.last_warmup = warmup
+        logger.info("Service ready")
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get readiness status for the health endpoints."""
+        with self._lock:
+            return {
+                "ready": self._ready,
+                "reason": self._reason,
+                "since": self._since.isoformat(),
+                "last_warmup": self.last_warmup,
+            }
+
+
+def run_warmup(
+    transcribe: Callable[[np.ndarray], Any],
+    durations: Iterable[float] = DEFAULT_WARMUP_DURATIONS,
+    model: str = "unknown",
+    backend: str = "unknown",
+) -> Dict[str, Any]:
+    """Run synthetic utterances through a backend and time them.
+
+    Blocking; call from a worker thread.
+
+    Args:
+        transcribe: Callable that transcribes a float32 16kHz array
+        durations: Utterance lengths in seconds
+        model: Model name (for reporting)
+        backend: Backend name (for reporting)
+
+    Returns:
+        Warm-up report with per-utterance latencies
+    """
+    latencies = {}
+    start = time.time()
+
+    for seed, duration in enumerate(durations):
+        audio = synthetic_utterance(duration, seed=seed)
+        t0 = time.time()
+        transcribe(audio)
+        latencies[f"{duration:g}s"] = round(time.time() - t0, 4)
+
+    report = {
+        "model": model,
+        "backend": backend,
+        "latencies": latencies,
+        "total_time": round(time.time() - start, 4),
+        "finished_at": datetime.utcnow().isoformat(),
+    }
+    _record_metrics(report)
+    logger.info(f"Warm-up complete for {backend}/{model}: {latencies}")
+    return report
+
+
+def _record_metrics(report: Dict[str, Any]) -> None:
+    for utterance, latency in report["latencies"].items():
+        warmup_latency.labels(
+            model=report["model"],
+            backend=report["backend"],
+            utterance=utterance,
+        ).set(latency)
+
+
+async def warm_up_loader(
+    model_loader,
+    gate: ReadinessGate,
+    durations: Iterable[float] = DEFAULT_WARMUP_DURATIONS,
+    retry_interval: float = 5.0,
+) -> None:
+    """Load the active model, warm it up, then mark the service ready.
+
+    Retries until it succeeds or the task is cancelled, so a backend that is
+    still starting (e.g. whisper-server loading its model) does not leave the
+    service permanently not-ready.
+
+    Args:
+        model_loader: UnifiedWhisperLoader instance
+        gate: Readiness gate to open when warm
+        durations: Utterance lengths in seconds
+        retry_interval: Seconds between attempts after a failure
+    """
+    loop = asyncio.get_running_loop()
+    durations = tuple(durations)
+
+    while True:
+        try:
+            gate.set_not_ready("loading model")
+            load_start = time.time()
+            await loop.run_in_executor(None, model_loader.load_model)
+            model_load_time.labels(model=model_loader.config.name).set(time.time() - load_start)
+
+            gate.set_not_ready("warming up")
+            report = await loop.run_in_executor(
+                None,
+                lambda: run_warmup(
+                    model_loader.transcribe,
+                    durations,
+                    model=model_loader.config.name,
+                    backend=model_loader.backend_name,
+                ),
+            )
+            gate.set_ready(report)
+            return
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Warm-up failed, retrying in {retry_interval}s: {e}")
+            gate.set_not_ready(f"warm-up failed: {e}")
+            await asyncio.sleep(retry_interval)
+
+
+# Global readiness gate
+_readiness_gate: Optional[ReadinessGate] = None
+
+
+def get_readiness_gate() -> ReadinessGate:
+    """Get or create the global ReadinessGate instance."""
+    global _readiness_gate
+    if _readiness_gate is None:
+        _readiness_gate = ReadinessGate()
+    return _readiness_gate
@@ -1,16 +1,30 @@
-"""Whisper-server process manager with health monitoring and auto-restart."""
+"""Whisper-server process manager with health monitoring and auto-restart.
+
+Everything runs on the event loop: health probes are async HTTP requests,
+and ``/health`` reads a cached snapshot that a background task refreshes,
+so a hung whisper-server never blocks request handling. Processes are
+started with ``asyncio.create_subprocess_exec`` and supervised by a task
+awaiting their exit, so a crash is detected (and the server restarted) at
+once rather than at the next watchdog poll.
+"""
 
 import asyncio
 import os
 import signal
-import subprocess
 import time
 from datetime import datetime
-from typing import Optional
+from pathlib import Path
+from typing import Any, Awaitable, Dict, Optional, Set, Tuple
 
-import requests
+import aiohttp
 
+from ..models.whisper_server import default_prompt
 from ..utils.logging import get_logger
+from ..utils.metrics import whisper_server_recovery, whisper_server_start
+from .circuit_breaker import get_circuit_breaker
+from .model_store import ModelIntegrityError, get_model_store
+from .restart_policy import get_restart_policy
+from .server_output import ServerOutputLog
 
 logger = get_logger(__name__)
 
@@ -42,6 +56,8 @@ class WhisperServerManager:
         health_check_interval: float = 60.0,
         health_check_timeout: float = 5.0,
         max_consecutive_failures: int = 2,
+        health_refresh_interval: float = 5.0,
+        output_lines: int = None,
     ):
         """Initialize whisper-server manager.
 
@@ -50,32 +66,56 @@ class WhisperServerManager:
             port: Server port (default from env or 8080)
             model_name: Model name (default from env or whisper-base)
             prompt: Whisper prompt for biasing (default from env)
-            health_check_interval: Seconds between health checks
+            health_check_interval: Seconds between watchdog health checks
             health_check_timeout: Timeout for health check requests
             max_consecutive_failures: Failures before restart
+            health_refresh_interval: Seconds between refreshes of the
+                cached health snapshot served by /health
+            output_lines: whisper-server output lines kept for the admin API
+                (default from env or 500)
         """
         self.host = host or os.environ.get("WHISPER_SERVER_HOST", self.DEFAULT_HOST)
         self.port = port or int(os.environ.get("WHISPER_SERVER_PORT", self.DEFAULT_PORT))
         self.model_name = model_name or os.environ.get("MODEL_NAME", "whisper-base")
-        self.prompt = prompt or os.environ.get(
-            "WHISPER_PROMPT",
-            "lounge cabinet lights kitchen bedroom bathroom office"
-        )
+        self.prompt = prompt or default_prompt()
 
         self.server_url = f"http://{self.host}:{self.port}"
         self.health_check_interval = health_check_interval
         self.health_check_timeout = health_check_timeout
         self.max_consecutive_failures = max_consecutive_failures
+        self.health_refresh_interval = health_refresh_interval
 
         # State tracking
-        self._process: Optional[subprocess.Popen] = None
+        self._process: Optional[asyncio.subprocess.Process] = None
+        # Server started outside this process (entrypoint.sh), if found
+        self._external_pid: Optional[int] = None
         self._restart_count = 0
         self._consecutive_failures = 0
         self._last_health_check: Optional[datetime] = None
         self._last_healthy: Optional[datetime] = None
+        self._health: Dict[str, Any] = {"healthy": False, "checked_at": None, "latency_ms": None, "error": None}
         self._running = False
         self._watchdog_task: Optional[asyncio.Task] = None
-        self._session = requests.Session()
+        self._probe_task: Optional[asyncio.Task] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._standby_task: Optional[asyncio.Task] = None
+        # Hot standby (core.standby.WhisperStandby) that takes over on restart
+        self.standby = None
+        self._supervisor_tasks: Set[asyncio.Task] = set()
+        # Readers draining each instance's stdout, so a full pipe never blocks it
+        self._drain_tasks: Set[asyncio.Task] = set()
+        self.output = ServerOutputLog(
+            output_lines or int(os.environ.get("WHISPER_SERVER_OUTPUT_LINES", 500))
+        )
+        # Timing breakdown of the most recent successful start
+        self.last_start: Optional[Dict[str, Any]] = None
+        # PIDs stopped on purpose, whose exit is not a crash
+        self._expected_exits: Set[int] = set()
+        self._restart_lock = asyncio.Lock()
+        self._recovery_lock = asyncio.Lock()
+        # Model configured before a crash loop switched to the fallback model
+        self.original_model: Optional[str] = None
+        self.switch_in_progress = False
 
         logger.info(
             f"WhisperServerManager initialized: {self.server_url}, "
@@ -85,73 +125,121 @@ class WhisperServerManager:
     @property
     def model_path(self) -> str:
         """Get full path to the whisper model file."""
-        model_file = self.MODEL_MAP.get(self.model_name, "ggml-base.bin")
+        return self.model_path_for(self.model_name)
+
+    def model_path_for(self, model_name: str) -> str:
+        """Get full path to the model file for a model name."""
+        model_file = self.MODEL_MAP.get(model_name, "ggml-base.bin")
         return os.path.join(self.WHISPER_MODELS_DIR, model_file)
 
+    @property
+    def alternate_port(self) -> int:
+        """Port for the second instance started during a blue/green switch."""
+        alt_port = int(os.environ.get("WHISPER_SERVER_ALT_PORT", self.DEFAULT_PORT + 1))
+        taken = {self.port, self.standby.port if self.standby is not None else None}
+        for port in (alt_port, self.DEFAULT_PORT, self.DEFAULT_PORT + 1, self.DEFAULT_PORT + 2):
+            if port not in taken:
+                return port
+
+    def url_for_port(self, port: int) -> str:
+        """Get whisper-server base URL for a port on the configured host."""
+        return f"http://{self.host}:{port}"
+
     def is_healthy(self) -> bool:
-        """Check if whisper-server is responding to requests.
+        """Whether the last health check succeeded (cached, no I/O)."""
+        return self._health["healthy"]
+
+    async def check_health(self, url: Optional[str] = None) -> bool:
+        """Probe whisper-server over HTTP.
+
+        Probes of the active server update the cached health snapshot.
+
+        Args:
+            url: Server URL to probe (default: the active server)
 
         Returns:
             True if server responds, False otherwise
         """
+        probe_url = url or self.server_url
+        start = time.perf_counter()
+        error = None
         try:
-            response = self._session.get(
-                self.server_url,
-                timeout=self.health_check_timeout
-            )
-            healthy = response.status_code == 200
-
-            if healthy:
-                self._last_healthy = datetime.utcnow()
-                self._consecutive_failures = 0
-
-            return healthy
-
-        except requests.exceptions.Timeout:
+            timeout = aiohttp.ClientTimeout(total=self.health_check_timeout)
+            async with aiohttp.ClientSession(timeout=timeout) as session:
+                async with session.get(probe_url) as response:
+                    healthy = response.status == 200
+                    if not healthy:
+                        error = f"HTTP {response.status}"
+        except asyncio.TimeoutError:
+            healthy = False
+            error = f"timed out after {self.health_check_timeout}s"
             logger.warning(f"Whisper-server health check timed out after {self.health_check_timeout}s")
-            return False
-        except requests.exceptions.ConnectionError:
-            logger.warning(f"Whisper-server not reachable at {self.server_url}")
-            return False
+        except aiohttp.ClientConnectionError:
+            healthy = False
+            error = "not reachable"
+            logger.warning(f"Whisper-server not reachable at {probe_url}")
         except Exception as e:
+            healthy = False
+            error = str(e)
             logger.warning(f"Whisper-server health check failed: {e}")
-            return False
 
-    def _find_existing_process(self) -> Optional[int]:
+        if probe_url == self.server_url:
+            now = datetime.utcnow()
+            self._health = {
+                "healthy": healthy,
+                "checked_at": now.isoformat(),
+                "latency_ms": round((time.perf_counter() - start) * 1000, 1),
+                "error": error,
+            }
+            if healthy:
+                self._last_healthy = now
+                self._consecutive_failures = 0
+        return healthy
+
+    async def _find_existing_process(self, port: Optional[int] = None) -> Optional[int]:
         """Find PID of existing whisper-server process.
 
+        Args:
+            port: Only match a server listening on this port (default: any)
+
         Returns:
             PID if found, None otherwise
         """
+        pattern = f"whisper-server.*--port {port}( |$)" if port else "whisper-server.*--port"
         try:
-            result = subprocess.run(
-                ["pgrep", "-f", "whisper-server.*--port"],
-                capture_output=True,
-                text=True
+            process = await asyncio.create_subprocess_exec(
+                "pgrep", "-f", pattern,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
             )
-            if result.returncode == 0:
-                pids = result.stdout.strip().split('\n')
+            stdout, _ = await process.communicate()
+            if process.returncode == 0:
+                pids = stdout.decode().strip().split('\n')
                 if pids and pids[0]:
                     return int(pids[0])
         except Exception as e:
             logger.warning(f"Failed to find whisper-server process: {e}")
         return None
 
-    def _kill_existing(self) -> bool:
-        """Kill any existing whisper-server process.
+    async def _kill_existing(self, port: Optional[int] = None) -> bool:
+        """Kill an existing whisper-server process.
+
+        Args:
+            port: Only kill the server listening on this port (default: any)
 
         Returns:
             True if a process was killed, False otherwise
         """
-        pid = self._find_existing_process()
+        pid = await self._find_existing_process(port)
         if pid:
+            self._expected_exits.add(pid)
             try:
                 os.kill(pid, signal.SIGTERM)
                 logger.info(f"Sent SIGTERM to whisper-server (PID {pid})")
 
                 # Wait for process to terminate
                 for _ in range(10):
-                    time.sleep(0.5)
+                    await asyncio.sleep(0.5)
                     try:
                         os.kill(pid, 0)  # Check if still running
                     except OSError:
@@ -161,7 +249,7 @@ class WhisperServerManager:
                 # Force kill if still running
                 logger.warning(f"whisper-server (PID {pid}) didn't terminate, sending SIGKILL")
                 os.kill(pid, signal.SIGKILL)
-                time.sleep(0.5)
+                await asyncio.sleep(0.5)
                 return True
 
             except ProcessLookupError:
@@ -171,7 +259,7 @@ class WhisperServerManager:
                 logger.error(f"Failed to kill whisper-server (PID {pid}): {e}")
         return False
 
-    def start(self) -> bool:
+    async def start(self) -> bool:
         """Start the whisper-server subprocess.
 
         Returns:
@@ -185,43 +273,143 @@ class WhisperServerManager:
             logger.error(f"Whisper model not found: {self.model_path}")
             return False
 
-        # Kill any existing process first
-        self._kill_existing()
+        # Kill any existing process on our port first
+        await self._kill_existing(self.port)
 
         try:
-            cmd = [
-                self.WHISPER_SERVER_BIN,
-                "--model", self.model_path,
-                "--host", self.host,
-                "--port", str(self.port),
-                "--no-timestamps",
-                "--language", "en",
-                "--prompt", self.prompt,
-            ]
-
-            logger.info(f"Starting whisper-server: {' '.join(cmd)}")
-
-            self._process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-            )
-
-            logger.info(f"whisper-server started with PID {self._process.pid}")
-
-            # Wait for server to be ready
-            return self._wait_for_ready()
+            self._process, ready = await self.launch(self.model_name, self.port)
+            self._external_pid = None
+            if ready:
+                self._supervise(self._process)
+            return ready
 
         except Exception as e:
             logger.error(f"Failed to start whisper-server: {e}")
             return False
 
-    def _wait_for_ready(self, timeout: float = 60.0) -> bool:
+    async def prepare_model(self, model_name: str) -> Optional[Dict[str, Any]]:
+        """Prewarm the page cache with a model file and verify its checksum.
+
+        Args:
+            model_name: Model about to be loaded
+
+        Returns:
+            Model store report, or None if the file could not be read
+
+        Raises:
+            ModelIntegrityError: If the file does not match its checksum
+        """
+        try:
+            return await asyncio.to_thread(
+                get_model_store().prepare, model_name, Path(self.model_path_for(model_name))
+            )
+        except ModelIntegrityError:
+            raise
+        except OSError as e:
+            logger.warning(f"Could not prewarm model {model_name}: {e}")
+            return None
+
+    async def launch(
+        self, model_name: str, port: int, timeout: float = 60.0
+    ) -> Tuple[asyncio.subprocess.Process, bool]:
+        """Prewarm the model, start an instance and wait until it answers.
+
+        Args:
+            model_name: Model to load
+            port: Port to listen on
+            timeout: Seconds to wait for the model to load
+
+        Returns:
+            (process, ready)
+
+        Raises:
+            ModelIntegrityError: If the model file does not match its checksum
+        """
+        start = time.perf_counter()
+        report = await self.prepare_model(model_name)
+        prepared = time.perf_counter()
+        process = await self.spawn(model_name, port)
+        ready = await self._wait_for_ready(timeout, url=self.url_for_port(port), process=process)
+        if ready:
+            self._record_start(model_name, report, prepared - start, time.perf_counter() - prepared)
+        return process, ready
+
+    def _record_start(
+        self, model_name: str, report: Optional[Dict[str, Any]], prepare_seconds: float, load_seconds: float
+    ) -> None:
+        """Export a start's timing breakdown, split by page-cache state."""
+        page_cache = report["page_cache"] if report else "unknown"
+        total = prepare_seconds + load_seconds
+        for phase, seconds in (("prepare", prepare_seconds), ("load", load_seconds), ("total", total)):
+            whisper_server_start.labels(phase=phase, page_cache=page_cache).observe(seconds)
+        self.last_start = {
+            "model": model_name,
+            "page_cache": page_cache,
+            "prepare_seconds": round(prepare_seconds, 3),
+            "load_seconds": round(load_seconds, 3),
+            "total_seconds": round(total, 3),
+            "at": datetime.utcnow().isoformat(),
+        }
+        logger.info(
+            f"whisper-server ({model_name}) started in {total:.1f}s: prepare {prepare_seconds:.1f}s, "
+            f"load {load_seconds:.1f}s (page cache {page_cache})"
+        )
+
+    async def prefetch(self, model_names) -> None:
+        """Prewarm and verify model files in the background, logging failures."""
+        for model_name in dict.fromkeys(model_names):
+            try:
+                await self.prepare_model(model_name)
+            except Exception as e:
+                logger.warning(f"Prefetching model {model_name} failed: {e}")
+
+    async def spawn(self, model_name: str, port: int) -> asyncio.subprocess.Process:
+        """Start a whisper-server process without stopping any other instance.
+
+        Args:
+            model_name: Model to load
+            port: Port to listen on
+
+        Returns:
+            The started process (may still be loading the model)
+        """
+        cmd = [
+            self.WHISPER_SERVER_BIN,
+            "--model", self.model_path_for(model_name),
+            "--host", self.host,
+            "--port", str(port),
+            "--no-timestamps",
+            "--language", "en",
+            "--prompt", self.prompt,
+        ]
+
+        logger.info(f"Starting whisper-server: {' '.join(cmd)}")
+
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+
+        task = asyncio.get_running_loop().create_task(self.output.drain(process.stdout, port))
+        self._drain_tasks.add(task)
+        task.add_done_callback(self._drain_tasks.discard)
+
+        logger.info(f"whisper-server started with PID {process.pid} on port {port}")
+        return process
+
+    async def _wait_for_ready(
+        self,
+        timeout: float = 60.0,
+        url: Optional[str] = None,
+        process: Optional[asyncio.subprocess.Process] = None,
+    ) -> bool:
         """Wait for whisper-server to become ready.
 
         Args:
             timeout: Maximum seconds to wait
+            url: Server URL to probe (default: the active server)
+            process: Process to watch; waiting stops early if it exits
 
         Returns:
             True if server became ready, False if timeout
@@ -232,16 +420,243 @@ class WhisperServerManager:
         logger.info(f"Waiting for whisper-server to be ready (timeout={timeout}s)...")
 
         while time.time() - start < timeout:
-            if self.is_healthy():
+            if await self.check_health(url):
                 elapsed = time.time() - start
                 logger.info(f"whisper-server ready after {elapsed:.1f}s")
                 return True
-            time.sleep(check_interval)
+            if process is not None and process.returncode is not None:
+                logger.error(f"whisper-server exited with code {process.returncode} while starting")
+                return False
+            await asyncio.sleep(check_interval)
 
         logger.error(f"whisper-server not ready after {timeout}s")
         return False
 
-    def stop(self) -> bool:
+    async def stop_instance(
+        self,
+        process: Optional[asyncio.subprocess.Process] = None,
+        port: Optional[int] = None,
+        timeout: float = 5.0,
+    ) -> bool:
+        """Stop a single whisper-server instance.
+
+        Args:
+            process: Process handle, if we started it
+            port: Port of the instance (used when the process was started
+                elsewhere, e.g. by entrypoint.sh)
+            timeout: Seconds to wait after SIGTERM before SIGKILL
+
+        Returns:
+            True if an instance was stopped
+        """
+        if process is None:
+            return await self._kill_existing(port) if port else False
+
+        if process.returncode is not None:
+            return True
+
+        self._expected_exits.add(process.pid)
+        process.terminate()
+        try:
+            await asyncio.wait_for(process.wait(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"whisper-server (PID {process.pid}) didn't terminate, sending SIGKILL")
+            process.kill()
+            await asyncio.wait_for(process.wait(), timeout)
+
+        logger.info(f"whisper-server (PID {process.pid}) stopped")
+        return True
+
+    def adopt(self, process: asyncio.subprocess.Process, model_name: str, port: int) -> None:
+        """Make another instance the active, supervised whisper-server.
+
+        Args:
+            process: Process of the new instance
+            model_name: Model the instance was started with
+            port: Port the instance listens on
+        """
+        if model_name != self.model_name:
+            # Switching to another model (by an operator, or back from the
+            # fallback) ends a crash-loop fallback; a standby takeover does not
+            self.original_model = None
+        self._process = process
+        self._external_pid = None
+        self.model_name = model_name
+        self.port = port
+        self.server_url = self.url_for_port(port)
+        self._consecutive_failures = 0
+        self._supervise(process)
+        logger.info(f"Active whisper-server is now {self.server_url} (model={model_name})")
+
+    @property
+    def active_pid(self) -> Optional[int]:
+        """PID of the active whisper-server, if known."""
+        return self._process.pid if self._process is not None else self._external_pid
+
+    def _supervise(self, process: asyncio.subprocess.Process) -> None:
+        """Watch a process we started for exits (while the watchdog runs)."""
+        if self._running:
+            self._start_supervisor(process.pid, process.wait())
+
+    def _start_supervisor(self, pid: int, exited: Awaitable) -> None:
+        task = asyncio.get_running_loop().create_task(self._supervisor(pid, exited))
+        self._supervisor_tasks.add(task)
+        task.add_done_callback(self._supervisor_tasks.discard)
+
+    async def _wait_for_pid(self, pid: int) -> None:
+        """Wait for a process we did not start to exit (Linux pidfd)."""
+        loop = asyncio.get_running_loop()
+        fd = os.pidfd_open(pid)
+        exited = loop.create_future()
+        # The pidfd becomes readable when the process exits
+        loop.add_reader(fd, lambda: exited.done() or exited.set_result(None))
+        try:
+            await exited
+        finally:
+            loop.remove_reader(fd)
+            os.close(fd)
+
+    async def _supervisor(self, pid: int, exited: Awaitable) -> None:
+        """Restart whisper-server as soon as the active process exits unexpectedly."""
+        try:
+            code = await exited
+        except asyncio.CancelledError:
+            return
+        except Exception as e:
+            # Supervision is best-effort: the watchdog still polls health
+            logger.warning(f"Cannot supervise whisper-server (PID {pid}): {e}")
+            return
+        if pid in self._expected_exits:
+            self._expected_exits.discard(pid)
+            return
+        if not self._running or self.switch_in_progress or pid != self.active_pid:
+            return
+
+        logger.error(f"whisper-server (PID {pid}) exited unexpectedly (code {code}), restarting...")
+        self._health = {**self._health, "healthy": False, "checked_at": datetime.utcnow().isoformat(),
+                        "error": f"process exited (code {code})"}
+        get_circuit_breaker().trip(f"whisper-server exited (code {code})")
+        await self.recover(f"exited (code {code})")
+
+    async def recover(self, reason: str) -> bool:
+        """Restart after a failure until the server is back, per the restart policy.
+
+        Restarts back off exponentially while they keep happening; in a crash
+        loop the fallback model is used. Only exits the process (for a
+        container restart) after ``exit_after`` failed restarts in a row.
+
+        Args:
+            reason: What failed (recorded in the restart history)
+
+        Returns:
+            True once recovered, False if recovery was abandoned (stopped,
+            or another recovery is already running)
+        """
+        if self._recovery_lock.locked():
+            return False
+        async with self._recovery_lock:
+            policy = get_restart_policy()
+            failed_at = time.perf_counter()
+            while True:
+                delay = policy.next_delay()
+                if delay:
+                    logger.warning(
+                        f"whisper-server restarted {policy.recent_restarts()} time(s) recently, "
+                        f"waiting {delay:.1f}s before restarting"
+                    )
+                    await asyncio.sleep(delay)
+                if not self._running:
+                    return False
+                if policy.in_crash_loop():
+                    self._use_fallback_model(policy.config.fallback_model)
+
+                start = time.perf_counter()
+                success = await self.restart()
+                policy.record(
+                    reason, self.model_name, success, time.perf_counter() - start,
+                    delay=delay, fallback=self.original_model is not None,
+                )
+                if success:
+                    whisper_server_recovery.labels(fallback=str(self.original_model is not None).lower()).observe(
+                        time.perf_counter() - failed_at
+                    )
+                    return True
+                if policy.should_exit():
+                    logger.error(
+                        f"whisper-server failed to restart {policy.consecutive_failures} times in a row, "
+                        "exiting to trigger container restart"
+                    )
+                    os._exit(1)
+                reason = "restart failed"
+
+    def _use_fallback_model(self, fallback_model: Optional[str]) -> None:
+        """Switch to the fallback model until the crash loop is over.
+
+        The watchdog switches back to ``original_model`` once no restarts
+        are left in the crash-loop window (see ``restore_model``). The model
+        loader is relabeled too, so metrics, cached results and health report
+        the model the server actually runs.
+        """
+        from ..dependencies import get_model_loader
+
+        if self.original_model is not None:
+            return
+        if not fallback_model or fallback_model == self.model_name:
+            logger.error("whisper-server is crash-looping and no other fallback model is configured")
+            return
+        logger.error(f"whisper-server is crash-looping with {self.model_name}, falling back to {fallback_model}")
+        self.original_model = self.model_name
+        self.model_name = fallback_model
+        get_model_loader().config.name = fallback_model
+
+    def fallback_expired(self) -> bool:
+        """Whether a crash-loop fallback can end (no recent restarts left)."""
+        return (
+            self.original_model is not None
+            and not self.switch_in_progress
+            and not self._recovery_lock.locked()
+            and get_restart_policy().recent_restarts() == 0
+        )
+
+    async def restore_model(self) -> bool:
+        """Switch back from the fallback model to the configured model.
+
+        Runs as a blue/green model switch, so the fallback keeps serving
+        until the configured model is up and warmed up. A failed switch is
+        recorded as a restart, which keeps the fallback for another
+        crash-loop window before the next attempt.
+
+        Returns:
+            True if the switch was started
+        """
+        from ..dependencies import get_model_loader
+        from ..models.backends import WhisperServerBackend
+        from .model_switcher import STATE_FAILED, follow_switch, get_model_switcher
+
+        model_name = self.original_model
+        started = time.perf_counter()
+
+        async def on_progress(job):
+            follow_switch(get_model_loader(), job)
+            if job.state == STATE_FAILED:
+                get_restart_policy().record(
+                    f"restoring {model_name} failed: {job.error}", model_name, False,
+                    time.perf_counter() - started, fallback=True,
+                )
+
+        logger.info(f"No whisper-server restarts recently, switching back from {self.model_name} to {model_name}")
+        try:
+            get_model_switcher().start_switch(
+                model_name,
+                clients=lambda: get_model_loader().get_instances(WhisperServerBackend.name),
+                on_progress=on_progress,
+            )
+        except RuntimeError as e:
+            logger.info(f"Not restoring {model_name} yet: {e}")
+            return False
+        return True
+
+    async def stop(self) -> bool:
         """Stop the whisper-server subprocess.
 
         Returns:
@@ -249,44 +664,161 @@ class WhisperServerManager:
         """
         self._running = False
 
-        # Cancel watchdog task
-        if self._watchdog_task and not self._watchdog_task.done():
-            self._watchdog_task.cancel()
+        # Cancel watchdog, snapshot refresh, breaker probe, standby and supervisor tasks
+        for task in (
+            self._watchdog_task, self._probe_task, self._refresh_task, self._standby_task,
+            *self._supervisor_tasks,
+        ):
+            if task and not task.done():
+                task.cancel()
+        if self.standby is not None:
+            await self.standby.stop()
 
         # Kill the process
-        return self._kill_existing()
+        if self._process is not None:
+            return await self.stop_instance(self._process)
+        return await self._kill_existing(self.port)
 
-    def restart(self) -> bool:
+    async def restart(self) -> bool:
         """Restart the whisper-server subprocess.
 
+        With a hot standby ready, traffic moves to it instead and the failed
+        server is rebuilt in the background. Concurrent calls (watchdog and
+        exit supervisor) are serialized.
+
         Returns:
             True if restarted successfully
         """
-        self._restart_count += 1
-        logger.info(f"Restarting whisper-server (restart #{self._restart_count})...")
+        from .warmup import get_readiness_gate
+
+        async with self._restart_lock:
+            breaker = get_circuit_breaker()
+            if self.standby is not None and await self.standby.take_over():
+                # The standby was health-checked and warmed up: as good as a probe
+                breaker.record_probe(True, "failed over to hot standby")
+                self._consecutive_failures = 0
+                return True
 
-        self.stop()
-        time.sleep(0.5)  # Brief pause
+            self._restart_count += 1
+            logger.info(f"Restarting whisper-server (restart #{self._restart_count})...")
+
+            gate = get_readiness_gate()
+            gate.set_not_ready("restarting whisper-server")
+            breaker.trip("restarting whisper-server")
+
+            # Stop only the process: stop() would also cancel the watchdog and
+            # probe tasks, one of which may be the caller
+            if self._process is not None:
+                await self.stop_instance(self._process)
+            else:
+                await self._kill_existing(self.port)
+            await asyncio.sleep(0.5)  # Brief pause
+
+            success = await self.start()
+
+            if success:
+                logger.info(f"whisper-server restarted successfully (restart #{self._restart_count})")
+                gate.set_not_ready("warming up")
+                try:
+                    gate.set_ready(await asyncio.to_thread(self.warm_up))
+                    # The warm-up transcribed synthetic audio: as good as a probe
+                    breaker.record_probe(True, "restarted and warmed up")
+                except Exception as e:
+                    # Server answers health checks; serve cold rather than not at all
+                    # (the breaker stays open until a probe succeeds)
+                    logger.warning(f"whisper-server warm-up failed after restart: {e}")
+                    gate.set_ready()
+            else:
+                logger.error(f"Failed to restart whisper-server (attempt #{self._restart_count})")
+                gate.set_not_ready("whisper-server restart failed")
+
+            return success
+
+    def warm_up(self, durations=None) -> dict:
+        """Send synthetic utterances to the running server.
+
+        Blocking; call from a worker thread.
 
-        success = self.start()
+        Args:
+            durations: Utterance lengths in seconds (default: model config)
 
-        if success:
-            logger.info(f"whisper-server restarted successfully (restart #{self._restart_count})")
-        else:
-            logger.error(f"Failed to restart whisper-server (attempt #{self._restart_count})")
+        Returns:
+            Warm-up report with per-utterance latencies
+        """
+        from ..config.loader import load_config
+        from ..models.whisper_server import WhisperServerModel
+        from .warmup import run_warmup
 
-        return success
+        if durations is None:
+            durations = load_config().model.warmup_durations
+        client = WhisperServerModel(server_url=self.server_url, prompt=self.prompt)
+        return run_warmup(client.transcribe, durations, model=self.model_name, backend="whisper-server")
 
     async def start_watchdog(self):
-        """Start the background health monitoring task."""
+        """Start health monitoring, snapshot refresh and exit supervision."""
         if self._running:
             logger.warning("Watchdog already running")
             return
 
         self._running = True
         self._watchdog_task = asyncio.create_task(self._watchdog_loop())
+        self._probe_task = asyncio.create_task(self._breaker_probe_loop())
+        self._refresh_task = asyncio.create_task(self._refresh_loop())
+        if self.standby is not None:
+            self._standby_task = asyncio.create_task(self.standby.run())
+
+        if self._process is not None:
+            self._supervise(self._process)
+        elif hasattr(os, "pidfd_open"):
+            # Server started by entrypoint.sh: watch its PID
+            pid = await self._find_existing_process(self.port)
+            if pid:
+                self._external_pid = pid
+                self._start_supervisor(pid, self._wait_for_pid(pid))
         logger.info(f"Whisper watchdog started (interval={self.health_check_interval}s)")
 
+    def probe(self) -> bool:
+        """Send a half-open probe to the active server if the breaker is due one.
+
+        Blocking; call from a worker thread.
+
+        Returns:
+            True if a probe was sent and succeeded
+        """
+        from ..models.whisper_server import WhisperServerModel
+
+        breaker = get_circuit_breaker()
+        # No breaker on this client: the probe must reach the server
+        client = WhisperServerModel(
+            server_url=self.server_url, timeout=breaker.config.probe_timeout, prompt=self.prompt
+        )
+        return breaker.probe(client.transcribe)
+
+    async def _breaker_probe_loop(self):
+        """Background loop that probes whisper-server while the breaker is not closed."""
+        breaker = get_circuit_breaker()
+        while self._running:
+            try:
+                await asyncio.sleep(breaker.config.probe_interval)
+                if breaker.state == "closed" or self.switch_in_progress:
+                    continue
+                await asyncio.to_thread(self.probe)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Circuit breaker probe error: {e}")
+
+    async def _refresh_loop(self):
+        """Background loop that keeps the cached health snapshot fresh."""
+        while self._running:
+            try:
+                await self.check_health()
+                await asyncio.sleep(self.health_refresh_interval)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Whisper health refresh error: {e}")
+
     async def _watchdog_loop(self):
         """Background loop that monitors whisper-server health."""
         while self._running:
@@ -296,10 +828,15 @@ class WhisperServerManager:
                 if not self._running:
                     break
 
+                if self.switch_in_progress:
+                    # The switcher owns both instances until it finishes
+                    continue
+
                 self._last_health_check = datetime.utcnow()
-                healthy = self.is_healthy()
+                healthy = await self.check_health()
 
                 if not healthy:
+                    get_circuit_breaker().trip("health check failed")
                     self._consecutive_failures += 1
                     logger.warning(
                         f"Whisper-server unhealthy "
@@ -312,22 +849,14 @@ class WhisperServerManager:
                             f"{self._consecutive_failures} consecutive checks, restarting..."
                         )
 
-                        # Run restart in executor to avoid blocking
-                        loop = asyncio.get_event_loop()
-                        success = await loop.run_in_executor(None, self.restart)
-
-                        if not success:
-                            logger.error(
-                                "Failed to restart whisper-server, "
-                                "exiting to trigger container restart"
-                            )
-                            os._exit(1)
-
+                        await self.recover("unresponsive")
                         self._consecutive_failures = 0
                 else:
                     if self._consecutive_failures > 0:
                         logger.info("Whisper-server recovered")
                     self._consecutive_failures = 0
+                    if self.fallback_expired():
+                        await self.restore_model()
 
             except asyncio.CancelledError:
                 logger.info("Whisper watchdog cancelled")
@@ -336,7 +865,7 @@ class WhisperServerManager:
                 logger.error(f"Whisper watchdog error: {e}")
 
     def get_status(self) -> dict:
-        """Get current whisper-server status.
+        """Get current whisper-server status from cached state (no I/O).
 
         Returns:
             Status dictionary
@@ -344,12 +873,21 @@ class WhisperServerManager:
         return {
             "server_url": self.server_url,
             "model_name": self.model_name,
+            "pid": self.active_pid,
+            "switch_in_progress": self.switch_in_progress,
             "is_healthy": self.is_healthy(),
+            "health": dict(self._health),
             "restart_count": self._restart_count,
             "consecutive_failures": self._consecutive_failures,
             "last_health_check": self._last_health_check.isoformat() if self._last_health_check else None,
             "last_healthy": self._last_healthy.isoformat() if self._last_healthy else None,
             "watchdog_running": self._running,
+            "circuit_breaker": get_circuit_breaker().get_status(),
+            "output": self.output.get_stats(),
+            "last_start": self.last_start,
+            "fallback_from": self.original_model,
+            "restart_policy": get_restart_policy().get_status(),
+            "standby": self.standby.get_status() if self.standby is not None else None,
         }
 
 
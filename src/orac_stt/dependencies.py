@@ -43,7 +43,13 @@ def get_model_loader() -> UnifiedWhisperLoader:
     if _model_loader is None:
         settings = load_config()
         logger.info("Initializing model loader")
-        _model_loader = UnifiedWhisperLoader(settings.model)
+        _model_loader = UnifiedWhisperLoader(
+            settings.model,
+            settings.decode,
+            fallback_backend=settings.circuit_breaker.fallback_backend,
+            fallback_device=settings.circuit_breaker.fallback_device,
+            batching_config=settings.batching,
+        )
     return _model_loader
 
 
@@ -0,0 +1,285 @@
+"""Bounded, retrying dispatcher for forwarding transcriptions to ORAC Core.
+
+Forwarding used to be a fire-and-forget task per transcription: a Core
+restart or a network blip silently lost the command. ``CoreForwardDispatcher``
+queues forwards and delivers them from worker tasks, retrying retryable
+failures (timeouts, connection errors, 5xx, 429) with exponential backoff.
+Each Core URL gets its own queue and ``per_core_concurrency`` workers, so a
+slow or unreachable Core only delays its own forwards. Every forward carries
+a ``forward_id`` in its metadata that stays the same across retries (one
+set by the caller is kept), so Core can drop duplicates of a forward whose
+response was lost. Forwards older
+than ``max_age`` are dropped rather than delivered late, and the number of
+pending forwards is bounded: when it is full, new forwards are rejected
+instead of growing memory without limit.
+
+With ``spill_path`` set, every pending forward is also appended to a JSONL
+log (``add`` and ``done`` records) that is replayed on startup, so forwards
+survive a restart of the STT service as well.
+"""
+
+import asyncio
+import json
+import os
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from ..config.settings import CommandAPIConfig
+from ..utils.logging import get_logger
+from ..utils import metrics
+from .core_pool import get_core_pool
+from .orac_core_client import CoreForwardError, ORACCoreClient
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class ForwardJob:
+    """A transcription waiting to be forwarded to ORAC Core."""
+
+    base_url: str
+    text: str
+    topic: str
+    metadata: Dict[str, Any]
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    attempts: int = 0
+    enqueued_at: float = field(default_factory=time.time)
+
+
+class CoreForwardDispatcher:
+    """Delivers queued forwards to ORAC Core with retries and backpressure."""
+
+    def __init__(
+        self,
+        config: Optional[CommandAPIConfig] = None,
+        client_for: Optional[Callable[[str], ORACCoreClient]] = None,
+    ):
+        """Initialize the dispatcher.
+
+        Args:
+            config: Command API configuration (retries, limits, spill log)
+            client_for: Returns the client for a Core base URL; defaults to
+                the shared Core client pool
+        """
+        self.config = config or CommandAPIConfig()
+        self._client_for = client_for
+        self._pending: Dict[str, ForwardJob] = {}
+        # One queue per Core URL, each drained by its own workers
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._workers: List[asyncio.Task] = []
+        self._started = False
+        self._retry_timers: Set[asyncio.TimerHandle] = set()
+        self._spill = None
+        self._spill_records = 0
+        self._counts = {"delivered": 0, "failed": 0, "expired": 0, "rejected": 0, "retries": 0}
+
+    @property
+    def running(self) -> bool:
+        return self._started
+
+    def start(self) -> None:
+        """Replay the spill log and start delivering (needs a running loop)."""
+        if self.running:
+            return
+        self._started = True
+        for job in self._replay_spill():
+            self._pending[job.id] = job
+            self._enqueue(job)
+        if self._pending:
+            logger.info(f"Replaying {len(self._pending)} pending ORAC Core forwards from {self.config.spill_path}")
+        self._update_depth()
+
+    async def stop(self) -> None:
+        """Stop the workers; undelivered forwards stay in the spill log."""
+        for timer in self._retry_timers:
+            timer.cancel()
+        self._retry_timers.clear()
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queues.clear()
+        self._pending.clear()
+        self._started = False
+        self._update_depth()
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+
+    def submit(self, base_url: str, text: str, topic: str, metadata: Optional[Dict[str, Any]] = None) -> bool:
+        """Queue a transcription for forwarding.
+
+        Args:
+            base_url: ORAC Core base URL
+            text: Transcribed text
+            topic: Topic for routing
+            metadata: Additional metadata
+
+        Returns:
+            False if the queue is full and the forward was rejected
+        """
+        self.start()
+        if len(self._pending) >= self.config.queue_size:
+            logger.error(f"ORAC Core forward queue full ({self.config.queue_size}), dropping transcription for '{topic}'")
+            self._count("rejected")
+            return False
+        metadata = dict(metadata or {})
+        # Core should see when the command was spoken, not when a retry got through
+        metadata.setdefault("timestamp", datetime.now().isoformat())
+        job = ForwardJob(base_url=base_url.rstrip("/"), text=text, topic=topic, metadata=metadata)
+        self._pending[job.id] = job
+        self._spill_write({"op": "add", "job": asdict(job)})
+        self._enqueue(job)
+        self._update_depth()
+        return True
+
+    def _enqueue(self, job: ForwardJob) -> None:
+        """Queue a job for its Core URL, starting that URL's workers on first use."""
+        queue = self._queues.get(job.base_url)
+        if queue is None:
+            queue = self._queues[job.base_url] = asyncio.Queue()
+            self._workers.extend(
+                asyncio.create_task(self._worker(queue), name=f"core-forward-{job.base_url}-{i}")
+                for i in range(max(1, self.config.per_core_concurrency))
+            )
+        queue.put_nowait(job)
+
+    async def _worker(self, queue: asyncio.Queue) -> None:
+        while True:
+            job = await queue.get()
+            if time.time() - job.enqueued_at > self.config.max_age:
+                logger.warning(f"Dropping ORAC Core forward for '{job.topic}' after {job.attempts} attempts: too old")
+                self._finish(job, "expired")
+                continue
+            job.attempts += 1
+            # The same key on every attempt lets Core drop duplicate deliveries
+            metadata = {"forward_id": job.id, **job.metadata}
+            try:
+                client_for = self._client_for or get_core_pool().get
+                await client_for(job.base_url).send_transcription(job.text, job.topic, metadata)
+            except CoreForwardError as e:
+                self._failed(job, e)
+                continue
+            except Exception as e:
+                logger.error(f"Unexpected error forwarding to ORAC Core: {e}", exc_info=True)
+                self._finish(job, "failed")
+                continue
+            metrics.core_forward_latency.observe(time.time() - job.enqueued_at)
+            self._finish(job, "delivered")
+
+    def _failed(self, job: ForwardJob, error: CoreForwardError) -> None:
+        if not error.retryable or job.attempts > self.config.max_retries:
+            logger.error(f"Giving up forwarding to ORAC Core after {job.attempts} attempts: {error}")
+            self._finish(job, "failed")
+            return
+        delay = min(self.config.max_retry_delay, self.config.retry_delay * 2 ** (job.attempts - 1))
+        logger.warning(f"{error}; retry {job.attempts}/{self.config.max_retries} in {delay:.1f}s")
+        self._count("retries")
+
+        def requeue():
+            self._retry_timers.discard(timer)
+            self._enqueue(job)
+
+        timer = asyncio.get_running_loop().call_later(delay, requeue)
+        self._retry_timers.add(timer)
+
+    def _finish(self, job: ForwardJob, result: str) -> None:
+        self._pending.pop(job.id, None)
+        self._spill_write({"op": "done", "id": job.id})
+        self._count(result)
+        self._update_depth()
+
+    def _count(self, result: str) -> None:
+        self._counts[result] += 1
+        if result == "retries":
+            metrics.core_forward_retries.inc()
+        else:
+            metrics.core_forwards.labels(result=result).inc()
+
+    def _update_depth(self) -> None:
+        metrics.core_forward_queue_depth.set(len(self._pending))
+
+    def _replay_spill(self) -> List[ForwardJob]:
+        """Read pending forwards from the spill log and compact it."""
+        path = self.config.spill_path
+        if path is None:
+            return []
+        jobs: Dict[str, ForwardJob] = {}
+        try:
+            with open(path) as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        if record["op"] == "add":
+                            job = ForwardJob(**record["job"])
+                            jobs[job.id] = job
+                        else:
+                            jobs.pop(record["id"], None)
+                    except (ValueError, KeyError, TypeError):
+                        # A line cut short by a crash mid-write
+                        continue
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Ignoring unreadable ORAC Core spill log {path}: {e}")
+        self._compact(list(jobs.values()))
+        return list(jobs.values())
+
+    def _compact(self, jobs: List[ForwardJob]) -> None:
+        """Rewrite the spill log with only the given pending forwards."""
+        path = self.config.spill_path
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(path.suffix + ".tmp")
+            with open(tmp, "w") as f:
+                for job in jobs:
+                    f.write(json.dumps({"op": "add", "job": asdict(job)}, default=str) + "\n")
+            os.replace(tmp, path)
+            self._spill = open(path, "a", buffering=1)
+            self._spill_records = len(jobs)
+        except OSError as e:
+            logger.warning(f"Could not write ORAC Core spill log {path}: {e}")
+
+    def _spill_write(self, record: Dict[str, Any]) -> None:
+        if self._spill is None:
+            return
+        try:
+            self._spill.write(json.dumps(record, default=str) + "\n")
+            self._spill_records += 1
+        except OSError as e:
+            logger.warning(f"Could not append to ORAC Core spill log: {e}")
+            return
+        # Keep the log from growing with delivered forwards
+        if record["op"] == "done" and self._spill_records > 2 * self.config.queue_size + len(self._pending):
+            self._compact(list(self._pending.values()))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth and outcome counts for the admin API."""
+        return {
+            "running": self.running,
+            "pending": len(self._pending),
+            "waiting_retry": len(self._retry_timers),
+            "queued": {url: queue.qsize() for url, queue in self._queues.items()},
+            "queue_size": self.config.queue_size,
+            "spill_path": str(self.config.spill_path) if self.config.spill_path else None,
+            **self._counts,
+        }
+
+
+# Global dispatcher instance
+_core_dispatcher: Optional[CoreForwardDispatcher] = None
+
+
+def get_core_dispatcher() -> CoreForwardDispatcher:
+    """Get or create the global CoreForwardDispatcher instance."""
+    global _core_dispatcher
+    if _core_dispatcher is None:
+        from ..config.loader import load_config
+        _core_dispatcher = CoreForwardDispatcher(load_config().command_api)
+    return _core_dispatcher
@@ -0,0 +1,145 @@
+"""Pool of ORAC Core clients, one per Core URL, sharing keep-alive connections.
+
+Topics can route to their own Core (``orac_core_url``). Creating an
+``ORACCoreClient`` per forward opened a new session and TCP connection
+every time and never closed them. ``CoreClientPool`` hands out one client
+per Core URL; all of them use a single ``TCPConnector`` whose connections
+are kept alive between requests and capped overall and per host. Clients
+of Core URLs that have not been used for ``idle_timeout`` seconds are
+closed, and everything is closed at shutdown.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+from ..config.settings import CorePoolConfig
+from ..utils.logging import get_logger
+from .orac_core_client import ORACCoreClient
+
+logger = get_logger(__name__)
+
+
+class CoreClientPool:
+    """ORAC Core clients keyed by base URL, on a shared connector."""
+
+    def __init__(self, config: Optional[CorePoolConfig] = None, timeout: int = 30):
+        """Initialize the pool.
+
+        Args:
+            config: Connection pool configuration
+            timeout: Request timeout in seconds for the clients
+        """
+        self.config = config or CorePoolConfig()
+        self.timeout = timeout
+        self._clients: Dict[str, ORACCoreClient] = {}
+        self._last_used: Dict[str, float] = {}
+        self._connector: Optional[aiohttp.TCPConnector] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._evict_task: Optional[asyncio.Task] = None
+        self._created = 0
+        self._evicted = 0
+
+    def get(self, base_url: str) -> ORACCoreClient:
+        """Get the client for a Core URL, creating it if needed.
+
+        Must be called from the event loop.
+
+        Args:
+            base_url: ORAC Core base URL
+
+        Returns:
+            Client sharing the pool's connections
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Connections belong to one event loop; a new loop (tests, a
+            # restarted app) starts a fresh pool
+            self._clients.clear()
+            self._last_used.clear()
+            self._connector = None
+            self._evict_task = None
+            self._loop = loop
+        if self._connector is None or self._connector.closed:
+            self._connector = aiohttp.TCPConnector(
+                limit=self.config.limit,
+                limit_per_host=self.config.limit_per_host,
+                keepalive_timeout=self.config.keepalive_timeout,
+                ttl_dns_cache=self.config.dns_cache_ttl,
+            )
+        if self._evict_task is None and self.config.idle_timeout > 0:
+            self._evict_task = asyncio.create_task(self._evict_loop())
+
+        base_url = base_url.rstrip("/")
+        client = self._clients.get(base_url)
+        if client is None:
+            client = ORACCoreClient(base_url=base_url, timeout=self.timeout, connector=self._connector)
+            self._clients[base_url] = client
+            self._created += 1
+            logger.info(f"Added ORAC Core client for {base_url} to the pool")
+        self._last_used[base_url] = time.monotonic()
+        return client
+
+    async def evict_idle(self, now: Optional[float] = None) -> int:
+        """Close clients of Core URLs unused for ``idle_timeout`` seconds.
+
+        Returns:
+            Number of clients closed
+        """
+        now = time.monotonic() if now is None else now
+        idle = [url for url, used in self._last_used.items() if now - used > self.config.idle_timeout]
+        for url in idle:
+            client = self._clients.pop(url)
+            del self._last_used[url]
+            await client.close()
+            self._evicted += 1
+            logger.info(f"Closed idle ORAC Core client for {url}")
+        return len(idle)
+
+    async def _evict_loop(self) -> None:
+        while True:
+            await asyncio.sleep(max(1.0, self.config.idle_timeout / 4))
+            try:
+                await self.evict_idle()
+            except Exception as e:
+                logger.warning(f"Evicting idle ORAC Core clients failed: {e}")
+
+    async def close(self) -> None:
+        """Close all clients and the shared connector."""
+        if self._evict_task is not None:
+            self._evict_task.cancel()
+            await asyncio.gather(self._evict_task, return_exceptions=True)
+            self._evict_task = None
+        for client in self._clients.values():
+            await client.close()
+        self._clients.clear()
+        self._last_used.clear()
+        if self._connector is not None:
+            await self._connector.close()
+            self._connector = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pooled clients and connection limits, for the admin API."""
+        now = time.monotonic()
+        return {
+            "config": self.config.model_dump(mode="json"),
+            "clients": {url: {"idle_s": round(now - used, 1)} for url, used in self._last_used.items()},
+            "created": self._created,
+            "evicted": self._evicted,
+        }
+
+
+# Global client pool instance
+_core_pool: Optional[CoreClientPool] = None
+
+
+def get_core_pool() -> CoreClientPool:
+    """Get or create the global CoreClientPool instance."""
+    global _core_pool
+    if _core_pool is None:
+        from ..config.loader import load_config
+        settings = load_config()
+        _core_pool = CoreClientPool(settings.core_pool, timeout=settings.command_api.timeout)
+    return _core_pool
@@ -1,53 +1,69 @@
 """ORAC Core integration client for forwarding transcriptions with topic support."""
 
 import asyncio
+import json
 import aiohttp
-from typing import Optional, Dict, Any
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
 import logging
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Chunk fields that carry generated text, in order of preference
+STREAM_TEXT_FIELDS = ("response", "token", "text", "content")
+
 # Global client instance
 _orac_core_client: Optional['ORACCoreClient'] = None
 
 
+class CoreForwardError(Exception):
+    """Forwarding to ORAC Core failed."""
+
+    def __init__(self, message: str, retryable: bool = True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
 class ORACCoreClient:
     """Client for forwarding transcriptions to ORAC Core with topic support."""
     
-    def __init__(self, base_url: str = "http://192.168.8.192:8000", timeout: int = 30):
+    def __init__(
+        self,
+        base_url: str = "http://192.168.8.192:8000",
+        timeout: int = 30,
+        connector: Optional[aiohttp.BaseConnector] = None
+    ):
         """Initialize ORAC Core client.
         
         Args:
             base_url: Base URL for ORAC Core API
             timeout: Request timeout in seconds
+            connector: Shared connection pool (not closed with the client);
+                by default the session owns its own connector
         """
         self.base_url = base_url.rstrip('/')
         self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self._connector = connector
         self._session: Optional[aiohttp.ClientSession] = None
     
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session."""
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(timeout=self.timeout)
+            self._session = aiohttp.ClientSession(
+                timeout=self.timeout,
+                connector=self._connector,
+                connector_owner=self._connector is None
+            )
         return self._session
     
-    async def forward_transcription(
-        self, 
-        text: str, 
-        topic: str = "general",
-        metadata: Optional[Dict[str, Any]] = None
-    ) -> Optional[Dict[str, Any]]:
-        """Forward transcription to ORAC Core with topic.
-        
-        Args:
-            text: Transcribed text to forward
-            topic: Topic ID for routing (default: "general")
-            metadata: Optional metadata (confidence, language, duration, etc.)
-            
-        Returns:
-            Response from ORAC Core or None if failed
-        """
+    def _build_request(
+        self,
+        text: str,
+        topic: str,
+        metadata: Optional[Dict[str, Any]],
+        stream: bool
+    ) -> Tuple[str, str, Dict[str, Any]]:
+        """Build the topic, URL and payload for a generate request."""
         # Validate topic name (alphanumeric + underscore)
         if not topic or not topic.replace('_', '').isalnum():
             logger.warning(f"Invalid topic name '{topic}', using 'general'")
@@ -58,7 +74,7 @@ class ORACCoreClient:
         # Build payload
         payload = {
             "prompt": text,
-            "stream": False
+            "stream": stream
         }
         
         # Add metadata to payload if provided
@@ -66,8 +82,33 @@ class ORACCoreClient:
             payload["metadata"] = {
                 **metadata,
                 "source": "orac_stt",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": metadata.get("timestamp") or datetime.now().isoformat()
             }
+        return topic, url, payload
+
+    async def send_transcription(
+        self,
+        text: str,
+        topic: str = "general",
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Send a transcription to ORAC Core, raising on failure.
+
+        Args:
+            text: Transcribed text to forward
+            topic: Topic ID for routing (default: "general")
+            metadata: Optional metadata (confidence, language, duration, etc.);
+                a ``timestamp`` already in it is kept, so retries report when
+                the command was spoken
+
+        Returns:
+            Response from ORAC Core
+
+        Raises:
+            CoreForwardError: If Core could not be reached or rejected the
+                request (``retryable`` tells whether trying again may help)
+        """
+        topic, url, payload = self._build_request(text, topic, metadata, stream=False)
         
         logger.info(f"Forwarding transcription to ORAC Core: topic='{topic}', text_length={len(text)}")
         
@@ -79,19 +120,121 @@ class ORACCoreClient:
                     logger.info(f"Successfully forwarded to ORAC Core with topic '{topic}'")
                     return result
                 elif response.status == 404:
-                    logger.warning(f"Topic '{topic}' not found on ORAC Core")
                     # Auto-discovery should handle this on Core side
-                    return None
+                    raise CoreForwardError(f"Topic '{topic}' not found on ORAC Core", retryable=False)
                 else:
                     error_text = await response.text()
-                    logger.error(f"ORAC Core returned {response.status}: {error_text}")
-                    return None
+                    raise CoreForwardError(
+                        f"ORAC Core returned {response.status}: {error_text}",
+                        retryable=response.status >= 500 or response.status in (408, 429),
+                    )
                     
         except asyncio.TimeoutError:
-            logger.error(f"Timeout forwarding to ORAC Core (topic: {topic})")
-            return None
+            raise CoreForwardError(f"Timeout forwarding to ORAC Core (topic: {topic})")
         except aiohttp.ClientError as e:
-            logger.error(f"Connection error forwarding to ORAC Core: {e}")
+            raise CoreForwardError(f"Connection error forwarding to ORAC Core: {e}")
+
+    async def stream_transcription(
+        self,
+        text: str,
+        topic: str = "general",
+        metadata: Optional[Dict[str, Any]] = None,
+        read_timeout: Optional[float] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Send a transcription to ORAC Core and yield its response as it streams.
+
+        Core may answer with server-sent events (``data: {...}``), JSON lines
+        or a single JSON body; token text is taken from the ``response``,
+        ``token``, ``text`` or ``content`` field of each chunk.
+
+        Args:
+            text: Transcribed text to forward
+            topic: Topic ID for routing (default: "general")
+            metadata: Optional metadata (confidence, language, duration, etc.)
+            read_timeout: Longest wait for the next chunk, in seconds (the
+                client's total timeout does not apply to streams)
+
+        Yields:
+            ``{"type": "core_token", "text": ...}`` per chunk, then
+            ``{"type": "core_response", "text": <full text>, "response": <last chunk>}``
+
+        Raises:
+            CoreForwardError: If Core could not be reached, rejected the
+                request or the stream broke off
+        """
+        topic, url, payload = self._build_request(text, topic, metadata, stream=True)
+        timeout = aiohttp.ClientTimeout(total=None, sock_read=read_timeout or self.timeout.total)
+        logger.info(f"Streaming transcription to ORAC Core: topic='{topic}', text_length={len(text)}")
+        
+        try:
+            session = await self._get_session()
+            async with session.post(url, json=payload, timeout=timeout) as response:
+                if response.status == 404:
+                    raise CoreForwardError(f"Topic '{topic}' not found on ORAC Core", retryable=False)
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise CoreForwardError(
+                        f"ORAC Core returned {response.status}: {error_text}",
+                        retryable=response.status >= 500 or response.status in (408, 429),
+                    )
+                
+                if response.content_type == "application/json":
+                    # Core answered without streaming
+                    result = await response.json()
+                    full = next((result[k] for k in STREAM_TEXT_FIELDS if isinstance(result.get(k), str)), "")
+                    yield {"type": "core_response", "text": full, "response": result}
+                    return
+                
+                parts = []
+                last: Dict[str, Any] = {}
+                async for raw in response.content:
+                    line = raw.decode("utf-8", errors="replace").strip()
+                    if line.startswith("data:"):
+                        line = line[5:].strip()
+                    if not line or line.startswith(("event:", "id:", ":")) or line == "[DONE]":
+                        continue
+                    try:
+                        chunk = json.loads(line)
+                    except ValueError:
+                        chunk = {"response": line}
+                    if not isinstance(chunk, dict):
+                        chunk = {"response": str(chunk)}
+                    last = chunk
+                    token = next((chunk[k] for k in STREAM_TEXT_FIELDS if isinstance(chunk.get(k), str)), "")
+                    if token:
+                        parts.append(token)
+                        yield {"type": "core_token", "text": token}
+                
+                yield {"type": "core_response", "text": "".join(parts), "response": last}
+                
+        except asyncio.TimeoutError:
+            raise CoreForwardError(f"Timeout streaming from ORAC Core (topic: {topic})")
+        except aiohttp.ClientError as e:
+            raise CoreForwardError(f"Connection error streaming from ORAC Core: {e}")
+
+    async def forward_transcription(
+        self, 
+        text: str, 
+        topic: str = "general",
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Forward transcription to ORAC Core with topic.
+        
+        Args:
+            text: Transcribed text to forward
+            topic: Topic ID for routing (default: "general")
+            metadata: Optional metadata (confidence, language, duration, etc.)
+            
+        Returns:
+            Response from ORAC Core or None if failed
+        """
+        try:
+            return await self.send_transcription(text, topic, metadata)
+        except CoreForwardError as e:
+            if e.retryable:
+                logger.error(str(e))
+            else:
+                logger.warning(str(e))
             return None
         except Exception as e:
             logger.error(f"Unexpected error forwarding to ORAC Core: {e}", exc_info=True)
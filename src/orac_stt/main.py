@@ -39,7 +39,44 @@ async def lifespan(app: FastAPI):
     # Start whisper-server watchdog (monitors health, auto-restarts on failure)
     from .core.whisper_manager import get_whisper_manager
     whisper_manager = get_whisper_manager()
+    if settings.standby.enabled:
+        # Loaded, warm second instance that takes over instead of a restart
+        from .core.standby import WhisperStandby
+        from .dependencies import get_model_loader
+        from .models.backends import WhisperServerBackend
+        whisper_manager.standby = WhisperStandby(
+            whisper_manager, settings.standby,
+            clients=lambda: get_model_loader().get_instances(WhisperServerBackend.name),
+        )
     await whisper_manager.start_watchdog()
+    # Page-cache prewarm and checksum of the model file, so a restart or the
+    # standby reads it from RAM
+    prewarm_task = asyncio.create_task(whisper_manager.prefetch([whisper_manager.model_name]))
+
+    # Load and warm up the model in the background; /health/ready reports
+    # not ready until the first real request would not pay cold-start costs
+    from .core.warmup import get_readiness_gate, warm_up_loader
+    from .dependencies import get_model_loader
+    model_loader = get_model_loader()
+    warmup_task = asyncio.create_task(
+        warm_up_loader(model_loader, get_readiness_gate(), settings.model.warmup_durations)
+    )
+
+    # Prefetch preferred models of recently active topics
+    prefetch_task = None
+    if settings.residency.enabled and settings.residency.prefetch:
+        from .core.heartbeat_manager import get_heartbeat_manager
+        from .core.residency import get_residency_manager
+        prefetch_task = asyncio.create_task(
+            get_residency_manager().run_prefetch_loop(
+                model_loader, get_heartbeat_manager().get_topic_registry()
+            )
+        )
+
+    # Deliver transcriptions to ORAC Core (replays forwards spilled before a restart)
+    from .integrations.core_dispatcher import get_core_dispatcher
+    core_dispatcher = get_core_dispatcher()
+    core_dispatcher.start()
 
     logger.info("Application startup complete")
 
@@ -47,8 +84,15 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down ORAC STT Service")
+    warmup_task.cancel()
+    prewarm_task.cancel()
+    if prefetch_task is not None:
+        prefetch_task.cancel()
+    await core_dispatcher.stop()
+    from .integrations.core_pool import get_core_pool
+    await get_core_pool().close()
     # Stop whisper watchdog
-    whisper_manager.stop()
+    await whisper_manager.stop()
     
 
 def create_app(config_path: Optional[Path] = None) -> FastAPI:
@@ -0,0 +1,241 @@
+"""Adaptive encoder window (``audio_ctx``) for short utterances.
+
+Whisper pads every input to 30 s, so the encoder does the same work for a
+1.5 s command as for a 30 s one. whisper.cpp can shrink the encoder window
+with ``audio_ctx`` (encoder positions, 50 per second of audio). This module
+picks a reduced window from the utterance duration using duration buckets,
+and calibrates those buckets against a local corpus so that the accuracy
+cost of each bucket is measured rather than guessed.
+"""
+
+import json
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from ..utils.logging import get_logger
+from ..utils.wer import word_error_rate
+
+logger = get_logger(__name__)
+
+# Encoder positions per second of audio, and the full 30 s window
+FRAMES_PER_SECOND = 50
+FULL_AUDIO_CTX = 1500
+
+
+@dataclass(frozen=True)
+class AudioCtxBucket:
+    """Utterances up to ``max_duration`` seconds use ``audio_ctx`` positions."""
+    max_duration: float
+    audio_ctx: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {"max_duration": self.max_duration, "audio_ctx": self.audio_ctx}
+
+
+# Conservative uncalibrated buckets: each window covers the bucket's longest
+# utterance plus about 2 s of headroom
+DEFAULT_BUCKETS = (
+    AudioCtxBucket(2.0, 256),
+    AudioCtxBucket(4.0, 320),
+    AudioCtxBucket(8.0, 512),
+    AudioCtxBucket(15.0, 896),
+)
+
+DEFAULT_BUCKET_EDGES = tuple(bucket.max_duration for bucket in DEFAULT_BUCKETS)
+DEFAULT_CANDIDATES = (128, 192, 256, 320, 384, 512, 640, 768, 896, 1024, 1280)
+
+
+class AudioCtxPolicy:
+    """Maps utterance duration to an encoder window."""
+
+    def __init__(self, buckets: Iterable[AudioCtxBucket] = DEFAULT_BUCKETS):
+        """Initialize policy.
+
+        Args:
+            buckets: Duration buckets (any order)
+        """
+        self.buckets = sorted(buckets, key=lambda b: b.max_duration)
+
+    @classmethod
+    def from_file(cls, path: Path) -> "AudioCtxPolicy":
+        """Load buckets from a calibration report.
+
+        Args:
+            path: Report written by the calibration command
+
+        Returns:
+            Policy using the calibrated buckets
+        """
+        with open(path) as f:
+            data = json.load(f)
+        return cls(AudioCtxBucket(**bucket) for bucket in data["buckets"])
+
+    @classmethod
+    def load(cls, path: Optional[Path]) -> "AudioCtxPolicy":
+        """Load calibrated buckets if available, else the defaults."""
+        if path is not None and Path(path).exists():
+            try:
+                policy = cls.from_file(path)
+                logger.info(f"Loaded calibrated audio_ctx buckets from {path}")
+                return policy
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                logger.error(f"Invalid audio_ctx calibration file {path}: {e}")
+        logger.warning("Using uncalibrated default audio_ctx buckets")
+        return cls()
+
+    def select(self, duration: float) -> int:
+        """Pick the encoder window for an utterance.
+
+        Args:
+            duration: Utterance duration in seconds
+
+        Returns:
+            audio_ctx value (0 means the full 30 s window)
+        """
+        for bucket in self.buckets:
+            if duration <= bucket.max_duration:
+                return bucket.audio_ctx
+        return 0
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Describe buckets for status endpoints."""
+        return [bucket.to_dict() for bucket in self.buckets]
+
+
+@dataclass
+class CorpusItem:
+    """One calibration utterance."""
+    name: str
+    audio: np.ndarray
+    duration: float
+    reference: str
+
+
+def load_corpus(directory: Path) -> List[CorpusItem]:
+    """Load ``*.wav`` files with ``<name>.txt`` reference transcripts.
+
+    Audio is resampled to 16kHz mono.
+
+    Args:
+        directory: Corpus directory
+
+    Returns:
+        Corpus items sorted by duration
+    """
+    from ..audio.processor import AudioProcessor
+
+    items = []
+    for wav_path in sorted(Path(directory).glob("*.wav")):
+        ref_path = wav_path.with_suffix(".txt")
+        if not ref_path.exists():
+            logger.warning(f"Skipping {wav_path.name}: no reference transcript")
+            continue
+        audio, sr = AudioProcessor.load_audio(wav_path.read_bytes(), validate=False)
+        audio = AudioProcessor.prepare_for_whisper(audio)
+        items.append(CorpusItem(
+            name=wav_path.stem,
+            audio=audio,
+            duration=len(audio) / sr,
+            reference=ref_path.read_text().strip(),
+        ))
+    return sorted(items, key=lambda item: item.duration)
+
+
+def calibrate(
+    transcribe: Callable[..., Dict[str, Any]],
+    corpus: Sequence[CorpusItem],
+    bucket_edges: Sequence[float] = DEFAULT_BUCKET_EDGES,
+    candidates: Sequence[int] = DEFAULT_CANDIDATES,
+    max_wer_delta: float = 0.01,
+) -> Dict[str, Any]:
+    """Measure RTF and WER per duration bucket and encoder window.
+
+    Every utterance is transcribed with the full window and with each
+    candidate window that covers its whole bucket. For each bucket the
+    smallest window whose mean WER is within ``max_wer_delta`` of the full
+    window is chosen.
+
+    Args:
+        transcribe: Called as ``transcribe(audio, audio_ctx=n)``
+        corpus: Calibration utterances
+        bucket_edges: Upper duration bound of each bucket in seconds
+        candidates: audio_ctx values to evaluate
+        max_wer_delta: Largest acceptable absolute WER increase
+
+    Returns:
+        Report with chosen buckets and per-bucket RTF/WER deltas
+    """
+    edges = sorted(bucket_edges)
+    measurements: Dict[float, Dict[int, Dict[str, List[float]]]] = {
+        edge: {} for edge in edges
+    }
+
+    if corpus:
+        # Untimed pass so the first measurement does not include cold start
+        transcribe(corpus[0].audio, audio_ctx=0)
+
+    for item in corpus:
+        edge = next((e for e in edges if item.duration <= e), None)
+        if edge is None:
+            logger.info(f"{item.name}: {item.duration:.1f}s is longer than all buckets, skipped")
+            continue
+
+        windows = [0] + [c for c in candidates if c / FRAMES_PER_SECOND >= edge and c < FULL_AUDIO_CTX]
+        for audio_ctx in windows:
+            start = time.time()
+            result = transcribe(item.audio, audio_ctx=audio_ctx)
+            elapsed = time.time() - start
+
+            entry = measurements[edge].setdefault(audio_ctx, {"rtf": [], "wer": []})
+            entry["rtf"].append(elapsed / item.duration)
+            entry["wer"].append(word_error_rate(item.reference, result.get("text", "")))
+
+    buckets = []
+    details = []
+    for edge in edges:
+        runs = measurements[edge]
+        if 0 not in runs:
+            logger.warning(f"No corpus utterances up to {edge}s, bucket uses the full window")
+            continue
+
+        base_rtf = float(np.mean(runs[0]["rtf"]))
+        base_wer = float(np.mean(runs[0]["wer"]))
+        rows = []
+        for audio_ctx in sorted(c for c in runs if c):
+            rtf = float(np.mean(runs[audio_ctx]["rtf"]))
+            wer = float(np.mean(runs[audio_ctx]["wer"]))
+            rows.append({
+                "audio_ctx": audio_ctx,
+                "rtf": round(rtf, 4),
+                "wer": round(wer, 4),
+                "rtf_delta": round(rtf - base_rtf, 4),
+                "wer_delta": round(wer - base_wer, 4),
+                "speedup": round(base_rtf / rtf, 3) if rtf else None,
+            })
+
+        chosen = next(
+            (row["audio_ctx"] for row in rows if row["wer_delta"] <= max_wer_delta), 0
+        )
+        if chosen:
+            buckets.append(AudioCtxBucket(edge, chosen))
+        details.append({
+            "max_duration": edge,
+            "utterances": len(runs[0]["rtf"]),
+            "full_window": {"rtf": round(base_rtf, 4), "wer": round(base_wer, 4)},
+            "candidates": rows,
+            "chosen_audio_ctx": chosen,
+        })
+
+    return {
+        "generated_at": datetime.utcnow().isoformat(),
+        "utterances": len(corpus),
+        "max_wer_delta": max_wer_delta,
+        "buckets": [bucket.to_dict() for bucket in buckets],
+        "details": details,
+    }
@@ -0,0 +1,350 @@
+"""Inference backend plugin registry.
+
+Each backend plugin knows how to construct a model object for a given model
+name and device. Heavy dependencies (torch, openai-whisper) are only imported
+inside ``create()``, so selecting a backend never imports another backend's
+dependencies.
+
+Every model object returned by a plugin implements the same interface:
+
+- ``transcribe(audio_data, sample_rate=16000, language=None, **kwargs) -> dict``
+- ``detect_language(audio_data, sample_rate=16000) -> (language, confidence)``
+- ``is_multilingual`` property
+- optionally ``transcribe_async(...)`` (native async) and ``close()``
+"""
+
+import asyncio
+import importlib.util
+import os
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from ..config.settings import ModelConfig
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class BackendPlugin:
+    """Base class for inference backend plugins."""
+
+    #: Registry key (also reported by health endpoints)
+    name: str = ""
+    #: Human readable description for the admin UI
+    description: str = ""
+    #: Whether inference runs inside this Python process
+    in_process: bool = False
+    #: Whether decoding stops at the ``max_tokens`` budget (whisper.cpp has
+    #: no option for it and relies on ``decode_timeout`` instead)
+    token_budget: bool = False
+    #: Whether decoding applies a GBNF grammar (``grammar_path``); other
+    #: backends only get a grammar's phrase list as the prompt
+    grammar: bool = False
+    #: Approximate resident memory per model in MB (models kept in this process)
+    MODEL_MEMORY_MB: Dict[str, int] = {}
+
+    def is_available(self) -> bool:
+        """Check whether the backend can be constructed on this host.
+
+        Must not import heavy dependencies.
+        """
+        return True
+
+    def create(self, config: ModelConfig, model_name: str, device: str) -> Any:
+        """Construct a model object for this backend.
+
+        Args:
+            config: Model configuration
+            model_name: Model name (e.g. whisper-base)
+            device: Device to use (cuda or cpu)
+
+        Returns:
+            Model object implementing the backend interface
+        """
+        raise NotImplementedError
+
+    def memory_mb(self, model_name: str) -> int:
+        """Estimate the memory a constructed instance keeps resident.
+
+        Args:
+            model_name: Model name (e.g. whisper-base)
+
+        Returns:
+            Approximate RAM/VRAM in MB (0 if the model lives outside this process)
+        """
+        return self.MODEL_MEMORY_MB.get(model_name, 0)
+
+    def describe(self) -> Dict[str, Any]:
+        """Get plugin description for the admin API."""
+        return {
+            "name": self.name,
+            "description": self.description,
+            "in_process": self.in_process,
+            "available": self.is_available(),
+        }
+
+
+class WhisperServerBackend(BackendPlugin):
+    """HTTP client for a persistent whisper-server process."""
+
+    name = "whisper-server"
+    description = "whisper.cpp HTTP server (model stays loaded)"
+
+    # Set when a model switch moves the active server to another port
+    _url_override: Optional[str] = None
+
+    @classmethod
+    def server_url(cls) -> str:
+        """Get the active whisper-server URL."""
+        if cls._url_override:
+            return cls._url_override
+        return os.environ.get("WHISPER_SERVER_URL", "http://localhost:8080")
+
+    @classmethod
+    def set_server_url(cls, url: str) -> None:
+        """Point newly constructed clients at a different whisper-server."""
+        cls._url_override = url.rstrip("/")
+
+    def create(self, config: ModelConfig, model_name: str, device: str) -> Any:
+        from ..config.loader import load_config
+        from ..core.circuit_breaker import get_circuit_breaker
+        from ..core.whisper_manager import get_whisper_manager
+        from .hedging import get_hedge_policy
+        from .whisper_server import WhisperServerModel
+
+        server_url = self.server_url()
+        logger.info(f"Connecting to whisper-server at {server_url}")
+
+        hedging = load_config().hedging
+        model = WhisperServerModel(
+            server_url=server_url,
+            timeout=30.0,
+            language="en",
+            hedge_urls=hedging.worker_urls if hedging.enabled else None,
+            hedge_policy=get_hedge_policy() if hedging.enabled else None,
+            breaker=get_circuit_breaker(),
+            prompt=get_whisper_manager().prompt,
+        )
+
+        # Wait for server to be ready (model may still be loading)
+        if not model.wait_for_ready(timeout=60.0):
+            raise RuntimeError(f"Whisper-server at {server_url} not ready")
+
+        return model
+
+
+class WhisperCppBackend(BackendPlugin):
+    """whisper.cpp CLI invoked per request."""
+
+    name = "whisper.cpp"
+    description = "whisper.cpp CLI subprocess per request"
+    grammar = True
+
+    # Model size mapping for whisper.cpp
+    MODELS = {
+        "whisper-tiny": "ggml-tiny.bin",
+        "whisper-base": "ggml-base.bin",
+        "whisper-small": "ggml-small.bin",
+        "whisper-medium": "ggml-medium.bin",
+        "whisper-large": "ggml-large-v3.bin",
+        "whisper-large-v3": "ggml-large-v3.bin",
+    }
+
+    DEFAULT_BIN = Path("/app/third_party/whisper_cpp/bin/whisper-cli")
+
+    def whisper_bin(self, config: ModelConfig) -> Path:
+        """Resolve the whisper-cli binary path."""
+        if self.DEFAULT_BIN.exists():
+            return self.DEFAULT_BIN
+        return Path(config.cache_dir).parent / "whisper_cpp" / "bin" / "whisper-cli"
+
+    def create(self, config: ModelConfig, model_name: str, device: str) -> Any:
+        from .whisper_cpp import WhisperCppModel
+
+        ggml_name = self.MODELS.get(model_name, "ggml-base.bin")
+        model_path = Path(config.cache_dir) / ggml_name
+        whisper_bin = self.whisper_bin(config)
+
+        logger.info(f"Loading whisper.cpp model: {model_path}")
+        logger.info(f"Using whisper binary: {whisper_bin}")
+
+        return WhisperCppModel(
+            model_path=str(model_path),
+            whisper_bin=str(whisper_bin),
+            device="cuda" if device != "cpu" else "cpu",
+        )
+
+
+class PyTorchBackend(BackendPlugin):
+    """openai-whisper running in-process on PyTorch."""
+
+    name = "pytorch"
+    description = "openai-whisper on PyTorch (in-process)"
+    in_process = True
+    token_budget = True
+
+    # Model size mapping for PyTorch
+    MODELS = {
+        "whisper-tiny": "tiny",
+        "whisper-base": "base",
+        "whisper-small": "small",
+        "whisper-medium": "medium",
+        "whisper-large": "large",
+        "whisper-large-v3": "large-v3",
+    }
+
+    # Approximate memory required per model (openai-whisper model card)
+    MODEL_MEMORY_MB = {
+        "whisper-tiny": 1000,
+        "whisper-base": 1000,
+        "whisper-small": 2000,
+        "whisper-medium": 5000,
+        "whisper-large": 10000,
+        "whisper-large-v3": 10000,
+    }
+
+    def is_available(self) -> bool:
+        return (
+            importlib.util.find_spec("torch") is not None
+            and importlib.util.find_spec("whisper") is not None
+        )
+
+    def memory_mb(self, model_name: str) -> int:
+        from .quantization import split_model_name
+
+        base_name, quantization = split_model_name(model_name)
+        estimate = self.MODEL_MEMORY_MB.get(base_name, 0)
+        # int8 Linear weights take a quarter of fp32; activations do not shrink
+        return estimate // 2 if quantization else estimate
+
+    def create(self, config: ModelConfig, model_name: str, device: str) -> Any:
+        from .quantization import split_model_name
+        from .whisper_pytorch import PyTorchWhisperModel
+
+        base_name, quantization = split_model_name(model_name, config.quantization)
+        model_size = self.MODELS.get(base_name, "base")
+
+        # Set cache directory
+        os.environ['WHISPER_CACHE_DIR'] = str(config.cache_dir)
+        config.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        return PyTorchWhisperModel(
+            model_size=model_size,
+            device=device,
+            download_root=str(config.cache_dir),
+            quantization=quantization,
+            quantized_cache_dir=config.cache_dir if config.quantized_cache else None,
+        )
+
+
+class WorkerPoolBackend(BackendPlugin):
+    """Another backend run in CPU-pinned worker processes."""
+
+    name = "worker-pool"
+    description = "Inference in worker processes pinned to core sets (CPU)"
+
+    def is_available(self) -> bool:
+        from ..config.loader import load_config
+
+        inner = _BACKENDS.get(load_config().worker_pool.backend)
+        return inner is not None and inner is not self and inner.is_available()
+
+    @property
+    def token_budget(self) -> bool:
+        from ..config.loader import load_config
+
+        inner = _BACKENDS.get(load_config().worker_pool.backend)
+        return inner is not None and inner is not self and inner.token_budget
+
+    @property
+    def grammar(self) -> bool:
+        from ..config.loader import load_config
+
+        inner = _BACKENDS.get(load_config().worker_pool.backend)
+        return inner is not None and inner is not self and inner.grammar
+
+    def create(self, config: ModelConfig, model_name: str, device: str) -> Any:
+        from ..config.loader import load_config
+        from .worker_pool import WorkerPoolModel
+
+        return WorkerPoolModel(load_config().worker_pool, config, model_name, device)
+
+
+# Registered backend plugins by name
+_BACKENDS: Dict[str, BackendPlugin] = {}
+
+
+def register_backend(plugin: BackendPlugin) -> None:
+    """Register a backend plugin (replaces any plugin with the same name)."""
+    _BACKENDS[plugin.name] = plugin
+    logger.debug(f"Registered inference backend: {plugin.name}")
+
+
+def get_backend_plugin(name: str) -> BackendPlugin:
+    """Get a registered backend plugin.
+
+    Raises:
+        ValueError: If no plugin is registered under that name
+    """
+    plugin = _BACKENDS.get(name)
+    if plugin is None:
+        raise ValueError(
+            f"Unknown backend '{name}'. Available: {', '.join(sorted(_BACKENDS))}"
+        )
+    return plugin
+
+
+def list_backends() -> List[BackendPlugin]:
+    """List registered backend plugins."""
+    return list(_BACKENDS.values())
+
+
+def default_backend_name() -> str:
+    """Determine default backend from the environment.
+
+    Priority: whisper-server > whisper.cpp > PyTorch
+    """
+    if os.environ.get("USE_WHISPER_SERVER", "false").lower() == "true":
+        return WhisperServerBackend.name
+    if os.environ.get("USE_WHISPER_CPP", "true").lower() == "true":
+        return WhisperCppBackend.name
+    return PyTorchBackend.name
+
+
+async def transcribe_async(
+    model: Any,
+    audio_data: np.ndarray,
+    sample_rate: int = 16000,
+    language: Optional[str] = None,
+    **kwargs,
+) -> Dict[str, Any]:
+    """Transcribe with any backend model without blocking the event loop.
+
+    Uses the model's native ``transcribe_async`` when available, otherwise
+    runs the synchronous ``transcribe`` in the default executor.
+    """
+    if hasattr(model, "transcribe_async"):
+        return await model.transcribe_async(
+            audio_data, sample_rate=sample_rate, language=language, **kwargs
+        )
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None,
+        partial(
+            model.transcribe,
+            audio_data,
+            sample_rate=sample_rate,
+            language=language,
+            **kwargs,
+        ),
+    )
+
+
+register_backend(WhisperServerBackend())
+register_backend(WhisperCppBackend())
+register_backend(PyTorchBackend())
+register_backend(WorkerPoolBackend())
@@ -0,0 +1,188 @@
+"""Micro-batching of concurrent requests for in-process backends.
+
+When several rooms speak at once, an in-process model otherwise decodes
+their utterances one after another. ``BatchingModel`` sits in front of a
+model that implements ``batch_key``/``transcribe_batch``: requests with the
+same key are collected for up to ``max_wait_ms`` after the first one
+arrives, or until ``max_batch`` are waiting, and decoded together. Requests
+that queue up while a batch is running are taken immediately when it
+finishes, so the wait window only applies to a request arriving at an idle
+model. Requests the model cannot batch go straight to ``transcribe``.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Dict, Hashable, List, Optional
+
+import numpy as np
+
+from ..config.settings import BatchingConfig
+from ..utils.logging import get_logger
+from ..utils.metrics import batch_size, batch_wait
+
+logger = get_logger(__name__)
+
+
+@dataclass(eq=False)
+class _Pending:
+    key: Hashable
+    audio: np.ndarray
+    language: Optional[str]
+    options: Dict[str, Any]
+    future: Future = field(default_factory=Future)
+    enqueued: float = field(default_factory=time.monotonic)
+
+
+class BatchingModel:
+    """Batches concurrent requests to a model; other attributes pass through."""
+
+    def __init__(self, inner: Any, config: Optional[BatchingConfig] = None, label: str = ""):
+        """Start the batching thread.
+
+        Args:
+            inner: Model implementing ``batch_key`` and ``transcribe_batch``
+            config: Batching configuration
+            label: Name used in logs
+        """
+        self.inner = inner
+        self.config = config or BatchingConfig()
+        self.label = label
+        self._queue: List[_Pending] = []
+        self._condition = threading.Condition()
+        self._closed = False
+        self._batches = 0
+        self._batched_requests = 0
+        self._unbatched_requests = 0
+        self._thread = threading.Thread(target=self._run, name=f"batcher-{label}", daemon=True)
+        self._thread.start()
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not set on the wrapper
+        if name == "inner":
+            raise AttributeError(name)
+        return getattr(self.inner, name)
+
+    def _submit(
+        self,
+        audio_data: np.ndarray,
+        sample_rate: int,
+        language: Optional[str],
+        options: Dict[str, Any],
+    ) -> Optional[Future]:
+        """Queue a request, or return None if it cannot be batched."""
+        key = self.inner.batch_key(audio_data, sample_rate, language, options)
+        if key is None or self._closed:
+            self._unbatched_requests += 1
+            return None
+        pending = _Pending(key=key, audio=audio_data, language=language, options=options)
+        with self._condition:
+            self._queue.append(pending)
+            self._condition.notify()
+        return pending.future
+
+    def transcribe(
+        self,
+        audio_data: np.ndarray,
+        sample_rate: int = 16000,
+        language: Optional[str] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Transcribe, batched with concurrent requests when possible (blocking)."""
+        future = self._submit(audio_data, sample_rate, language, kwargs)
+        if future is None:
+            return self.inner.transcribe(audio_data, sample_rate=sample_rate, language=language, **kwargs)
+        return future.result()
+
+    async def transcribe_async(
+        self,
+        audio_data: np.ndarray,
+        sample_rate: int = 16000,
+        language: Optional[str] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Transcribe without blocking the event loop."""
+        future = self._submit(audio_data, sample_rate, language, kwargs)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None,
+                partial(self.inner.transcribe, audio_data, sample_rate=sample_rate, language=language, **kwargs),
+            )
+        return await asyncio.wrap_future(future)
+
+    def _next_batch(self) -> List[_Pending]:
+        """Wait for a batch of requests sharing the oldest request's key."""
+        max_wait = self.config.max_wait_ms / 1000
+        with self._condition:
+            while not self._queue and not self._closed:
+                self._condition.wait()
+            if not self._queue:
+                return []
+            first = self._queue[0]
+            while not self._closed:
+                same_key = sum(1 for p in self._queue if p.key == first.key)
+                remaining = first.enqueued + max_wait - time.monotonic()
+                if same_key >= self.config.max_batch or remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            batch = [p for p in self._queue if p.key == first.key][:self.config.max_batch]
+            self._queue = [p for p in self._queue if p not in batch]
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if not batch:
+                return
+            self._execute(batch)
+
+    def _execute(self, batch: List[_Pending]) -> None:
+        start = time.monotonic()
+        for pending in batch:
+            batch_wait.observe(start - pending.enqueued)
+        batch_size.observe(len(batch))
+        self._batches += 1
+        self._batched_requests += len(batch)
+
+        try:
+            results = self.inner.transcribe_batch(
+                [p.audio for p in batch],
+                language=batch[0].language,
+                options=[p.options for p in batch],
+            )
+        except Exception as e:
+            logger.error(f"Batched transcription of {len(batch)} requests failed: {e}")
+            for pending in batch:
+                pending.future.set_exception(e)
+            return
+
+        for pending, result in zip(batch, results):
+            result["batch_size"] = len(batch)
+            pending.future.set_result(result)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Batch counts reported with the loaded backends."""
+        return {
+            "batches": self._batches,
+            "batched_requests": self._batched_requests,
+            "unbatched_requests": self._unbatched_requests,
+            "mean_batch_size": round(self._batched_requests / self._batches, 2) if self._batches else None,
+            "queued": len(self._queue),
+        }
+
+    def stop(self) -> None:
+        """Finish queued batches and stop the thread; later requests run unbatched."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout=30)
+
+    def close(self) -> None:
+        """Stop the thread and close the model."""
+        self.stop()
+        if hasattr(self.inner, "close"):
+            self.inner.close()
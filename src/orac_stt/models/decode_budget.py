@@ -0,0 +1,189 @@
+"""Duration-aware decode budget and repetition guard.
+
+Whisper can hallucinate repeating text on noise, and a runaway decode keeps
+the backend busy for seconds. The guard bounds each decode by the audio
+duration (a token budget and a wall-clock timeout, which the backends map to
+their own options) and truncates output that is still repetitive.
+
+Only the PyTorch backend enforces the token budget. whisper.cpp has no
+option that caps generated tokens (``max_context`` / ``-mc`` limits the
+prompt carried over from earlier segments), so whisper.cpp decodes are
+bounded by the timeout (the process is killed, ``decode_aborted="timeout"``)
+and the repetition guard alone.
+
+whisper-server decodes are not bounded at all. When the timeout expires the
+client stops waiting and returns an empty transcript with
+``decode_aborted="abandoned"``, but the server keeps decoding the runaway
+request and requests queued behind it still wait for it. Abandoned decodes
+count as circuit breaker failures, so a server that keeps timing out stops
+receiving requests until a probe gets through.
+"""
+
+import re
+from typing import Any, Dict, Optional
+
+from ..config.settings import DecodeConfig
+from ..utils.logging import get_logger
+from ..utils.metrics import decode_aborts, decode_time_saved
+from .scoring import compression_ratio
+
+logger = get_logger(__name__)
+
+# Whisper's decoder never generates more than half its 448-token text context
+WHISPER_MAX_TOKENS = 224
+
+# A loop is a phrase repeated at least MIN_LOOP_REPEATS times back to back,
+# spanning at least MIN_LOOP_WORDS words (so "no no no" is still speech)
+MIN_LOOP_REPEATS = 3
+MIN_LOOP_WORDS = 6
+
+
+def find_repetition_loop(text: str) -> Optional[int]:
+    """Find where a phrase starts repeating itself.
+
+    Args:
+        text: Transcribed text
+
+    Returns:
+        Number of words to keep (up to and including the first occurrence
+        of the looping phrase), or None if there is no loop
+    """
+    normalized = [re.sub(r"[^\w']", "", w.lower()) for w in text.split()]
+    n = len(normalized)
+
+    for start in range(n):
+        for period in range(1, (n - start) // MIN_LOOP_REPEATS + 1):
+            repeats = max(MIN_LOOP_REPEATS, -(-MIN_LOOP_WORDS // period))
+            if start + repeats * period > n:
+                continue
+            phrase = normalized[start:start + period]
+            if all(
+                normalized[start + k * period:start + (k + 1) * period] == phrase
+                for k in range(1, repeats)
+            ):
+                return start + period
+    return None
+
+
+class DecodeGuard:
+    """Computes per-request decode limits and checks results against them."""
+
+    def __init__(self, config: Optional[DecodeConfig] = None):
+        """Initialize decode guard.
+
+        Args:
+            config: Decode budget configuration
+        """
+        self.config = config or DecodeConfig()
+
+    def max_tokens(self, duration: float) -> int:
+        """Token budget for an utterance of the given duration."""
+        budget = int(duration * self.config.tokens_per_second) + self.config.min_tokens
+        return min(budget, self.config.max_tokens, WHISPER_MAX_TOKENS)
+
+    def timeout(self, duration: float) -> float:
+        """Wall-clock budget in seconds for decoding an utterance."""
+        return max(self.config.min_timeout, duration * self.config.timeout_factor)
+
+    def options(self, duration: float) -> Dict[str, Any]:
+        """Decode options added to a backend call.
+
+        Args:
+            duration: Utterance duration in seconds
+
+        Returns:
+            ``max_tokens`` and ``decode_timeout`` options
+        """
+        if not self.config.enabled:
+            return {}
+        return {
+            "max_tokens": self.max_tokens(duration),
+            "decode_timeout": self.timeout(duration),
+        }
+
+    def check(
+        self,
+        result: Dict[str, Any],
+        backend: str,
+        elapsed: float,
+        max_tokens: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Apply the repetition guard and record aborts.
+
+        Backends report their own aborts by setting ``decode_aborted``
+        (``timeout``: the decode was stopped; ``abandoned``: the client
+        stopped waiting but the server is still decoding). A decode that used its whole token budget is
+        counted as cut short, and repetitive text that got through is
+        truncated here.
+
+        Pass ``max_tokens`` only for backends that enforce the budget;
+        otherwise a long transcription would be reported as cut short.
+
+        Args:
+            result: Backend transcription result (modified in place)
+            backend: Backend name (for metrics)
+            elapsed: Decode wall-clock time in seconds
+            max_tokens: Token budget that was applied (None if the backend
+                does not enforce one)
+
+        Returns:
+            The result
+        """
+        if not self.config.enabled:
+            return result
+
+        tokens = result.get("tokens") or 0
+        if max_tokens and not result.get("decode_aborted") and tokens >= max_tokens:
+            result["decode_aborted"] = "token_budget"
+            result["time_saved"] = estimate_time_saved(elapsed, tokens, max_tokens)
+
+        text = result.get("text", "")
+        if result.get("decode_aborted") in (None, "token_budget") and text:
+            keep = find_repetition_loop(text)
+            ratio = compression_ratio(text)
+            if keep is not None:
+                words = text.split()
+                truncated = " ".join(words[:keep])
+                logger.warning(
+                    f"Repetition loop truncated ({len(words)} -> {keep} words, "
+                    f"compression ratio {ratio:.2f})"
+                )
+                result["text"] = truncated
+                result["compression_ratio"] = compression_ratio(truncated)
+                result["decode_aborted"] = result.get("decode_aborted") or "repetition"
+            elif ratio > self.config.compression_ratio_threshold:
+                # Whisper treats this as a failed decode; there is no clean prefix
+                logger.warning(f"Discarding repetitive decode (compression ratio {ratio:.2f})")
+                result["text"] = ""
+                result["confidence"] = 0.0
+                result["decode_aborted"] = result.get("decode_aborted") or "compression_ratio"
+
+        reason = result.get("decode_aborted")
+        if reason:
+            self._record(backend, reason, result.get("time_saved", 0.0))
+        return result
+
+    @staticmethod
+    def _record(backend: str, reason: str, time_saved: float) -> None:
+        decode_aborts.labels(backend=backend, reason=reason).inc()
+        if time_saved > 0:
+            decode_time_saved.labels(backend=backend).inc(time_saved)
+
+
+def estimate_time_saved(elapsed: float, tokens: int, max_tokens: int) -> float:
+    """Estimate decode time saved when a token budget cut a decode short.
+
+    Assumes the decode would otherwise have run to Whisper's own limit at
+    the same per-token rate.
+
+    Args:
+        elapsed: Time the budgeted decode took
+        tokens: Tokens generated
+        max_tokens: Token budget that was applied
+
+    Returns:
+        Estimated seconds saved (0.0 if the budget was not reached)
+    """
+    if tokens <= 0 or tokens < max_tokens:
+        return 0.0
+    return elapsed / tokens * (WHISPER_MAX_TOKENS - tokens)
@@ -0,0 +1,254 @@
+"""Per-topic grammar-constrained decoding.
+
+Most topics only issue a small set of home-automation commands. A topic can
+carry a GBNF grammar or a plain phrase list (compiled to GBNF here); the
+compiled grammar is cached once per topic and handed to the backends:
+
+- whisper.cpp CLI: ``--grammar`` / ``--grammar-rule`` / ``--grammar-penalty``
+- whisper-server and PyTorch: no per-request grammar support, so the phrase
+  list is sent as the decoder prompt, which biases decoding towards it
+
+A constrained decode that scores poorly (the audio was probably not one of
+the commands) is retried without the grammar. On backends without grammar
+support, a grammar given only as GBNF has no effect and is not applied.
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..config.settings import GrammarConfig
+from ..utils.logging import get_logger
+from ..utils.metrics import grammar_requests
+from .topic import TopicConfig, TopicGrammar
+
+logger = get_logger(__name__)
+
+# Whisper's prompt is limited to half its 448-token text context
+MAX_PROMPT_CHARS = 800
+
+_RULE_RE = re.compile(r"^\s*([A-Za-z][\w-]*)\s*::=", re.MULTILINE)
+
+
+class GrammarError(ValueError):
+    """Raised when a topic grammar cannot be compiled."""
+
+
+def _literal(text: str) -> str:
+    """Quote text as a GBNF string literal."""
+    escaped = text.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def _phrase_rule(phrase: str) -> str:
+    """GBNF sequence for a phrase, accepting either case for its first letter."""
+    first, rest = phrase[0], phrase[1:]
+    parts = []
+    if first.lower() != first.upper():
+        parts.append(f"[{first.upper()}{first.lower()}]")
+    else:
+        parts.append(_literal(first))
+    if rest:
+        parts.append(_literal(rest))
+    return " ".join(parts)
+
+
+def phrases_to_gbnf(phrases: List[str]) -> str:
+    """Compile a phrase list into a GBNF grammar.
+
+    Whisper emits a leading space and sentence punctuation, so both are
+    allowed around each phrase.
+
+    Args:
+        phrases: Accepted commands (e.g. "turn on the kitchen lights")
+
+    Returns:
+        GBNF grammar with a ``root`` rule
+
+    Raises:
+        GrammarError: If the list has no non-empty phrase
+    """
+    cleaned = [" ".join(p.split()) for p in phrases]
+    cleaned = [p for p in dict.fromkeys(cleaned) if p]
+    if not cleaned:
+        raise GrammarError("Phrase list is empty")
+
+    alternatives = "\n    | ".join(_phrase_rule(p) for p in cleaned)
+    return (
+        'root ::= " "? command [.!?]?\n'
+        f"command ::= {alternatives}\n"
+    )
+
+
+def validate_gbnf(gbnf: str, root_rule: str = "root") -> None:
+    """Check that a grammar defines its root rule.
+
+    Full parsing is left to whisper.cpp; this catches the common mistakes
+    before a request fails.
+
+    Raises:
+        GrammarError: If the grammar is empty or lacks the root rule
+    """
+    rules = set(_RULE_RE.findall(gbnf or ""))
+    if not rules:
+        raise GrammarError("Grammar defines no rules")
+    if root_rule not in rules:
+        raise GrammarError(f"Grammar has no '{root_rule}' rule")
+
+
+@dataclass
+class CompiledGrammar:
+    """Grammar ready to pass to the backends."""
+
+    topic: str
+    digest: str
+    gbnf: str
+    path: Path
+    root_rule: str
+    penalty: float
+    prompt: Optional[str]
+    min_avg_logprob: float
+
+    def options(self, grammar_support: bool = True) -> Dict[str, Any]:
+        """Decode options for a backend.
+
+        Args:
+            grammar_support: Whether the backend applies GBNF grammars
+
+        Returns:
+            Grammar and prompt options; empty when nothing applies to the
+            backend (a GBNF-only grammar without grammar support)
+        """
+        options: Dict[str, Any] = {}
+        if grammar_support:
+            options.update(
+                grammar_path=str(self.path),
+                grammar_rule=self.root_rule,
+                grammar_penalty=self.penalty,
+            )
+        if self.prompt:
+            options["prompt"] = self.prompt
+        return options
+
+    def should_fallback(self, result: Dict[str, Any]) -> bool:
+        """Whether a constrained result scores too poorly to keep.
+
+        Aborted decodes are never retried: the retry would most likely hit
+        the same limit.
+        """
+        if result.get("decode_aborted"):
+            return False
+        if not result.get("text", "").strip():
+            return True
+        avg_logprob = result.get("avg_logprob")
+        return avg_logprob is not None and avg_logprob < self.min_avg_logprob
+
+
+class GrammarCompiler:
+    """Compiles topic grammars once and caches them per topic."""
+
+    def __init__(self, config: Optional[GrammarConfig] = None):
+        """Initialize grammar compiler.
+
+        Args:
+            config: Grammar configuration
+        """
+        self.config = config or GrammarConfig()
+        self._cache: Dict[str, CompiledGrammar] = {}
+
+    @staticmethod
+    def _digest(grammar: TopicGrammar) -> str:
+        return hashlib.sha256(grammar.model_dump_json().encode()).hexdigest()[:16]
+
+    def compile(self, topic: str, grammar: TopicGrammar) -> CompiledGrammar:
+        """Compile a topic grammar (cached until it changes).
+
+        Args:
+            topic: Topic name
+            grammar: Topic grammar settings
+
+        Returns:
+            Compiled grammar
+
+        Raises:
+            GrammarError: If the grammar is invalid
+        """
+        digest = self._digest(grammar)
+        cached = self._cache.get(topic)
+        if cached is not None and cached.digest == digest:
+            return cached
+
+        if grammar.gbnf:
+            gbnf = grammar.gbnf
+            root_rule = grammar.root_rule
+        elif grammar.phrases:
+            gbnf = phrases_to_gbnf(grammar.phrases)
+            root_rule = "root"
+        else:
+            raise GrammarError("Grammar needs either gbnf or phrases")
+        validate_gbnf(gbnf, root_rule)
+
+        prompt = None
+        if grammar.phrases:
+            prompt = ". ".join(" ".join(p.split()) for p in grammar.phrases if p.strip())
+            prompt = prompt[:MAX_PROMPT_CHARS] + "."
+
+        self.config.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.config.cache_dir / f"{digest}.gbnf"
+        if not path.exists():
+            path.write_text(gbnf)
+
+        compiled = CompiledGrammar(
+            topic=topic,
+            digest=digest,
+            gbnf=gbnf,
+            path=path,
+            root_rule=root_rule,
+            penalty=grammar.penalty if grammar.penalty is not None else self.config.penalty,
+            prompt=prompt,
+            min_avg_logprob=(
+                grammar.min_avg_logprob
+                if grammar.min_avg_logprob is not None
+                else self.config.min_avg_logprob
+            ),
+        )
+        self._cache[topic] = compiled
+        logger.info(f"Compiled grammar for topic '{topic}' ({digest})")
+        return compiled
+
+    def for_topic(self, topic: str, topic_config: Optional[TopicConfig]) -> Optional[CompiledGrammar]:
+        """Compiled grammar for a request's topic, if it has one.
+
+        Invalid grammars are logged and ignored so requests still succeed.
+        """
+        if not self.config.enabled or topic_config is None or topic_config.grammar is None:
+            return None
+        try:
+            return self.compile(topic, topic_config.grammar)
+        except GrammarError as e:
+            logger.warning(f"Ignoring invalid grammar for topic '{topic}': {e}")
+            return None
+
+    def invalidate(self, topic: str) -> None:
+        """Drop a topic's compiled grammar."""
+        self._cache.pop(topic, None)
+
+
+def record_grammar_outcome(topic: str, outcome: str) -> None:
+    """Count a grammar-constrained request by outcome (constrained or fallback)."""
+    grammar_requests.labels(topic=topic, outcome=outcome).inc()
+
+
+# Global compiler instance
+_grammar_compiler: Optional[GrammarCompiler] = None
+
+
+def get_grammar_compiler() -> GrammarCompiler:
+    """Get or create the global GrammarCompiler instance."""
+    global _grammar_compiler
+    if _grammar_compiler is None:
+        from ..config.loader import load_config
+        _grammar_compiler = GrammarCompiler(load_config().grammar)
+    return _grammar_compiler
@@ -0,0 +1,150 @@
+"""Request hedging across whisper-server workers.
+
+An occasional slow inference dominates p99. When more than one
+whisper-server worker is available, a request that has not been answered
+after the recent p95 latency for its duration bucket is duplicated to a
+second worker; whichever answers first wins and the other is abandoned.
+A budget caps the extra load (by default at most 5% of requests are
+hedged).
+
+Latencies of every attempt, including abandoned ones, feed the p95
+estimate, and the primary worker's latency is kept for each request so
+the p99 with and without hedging can be compared.
+"""
+
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from ..config.settings import HedgingConfig
+from ..utils.logging import get_logger
+from ..utils.metrics import hedge_requests
+
+logger = get_logger(__name__)
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile (None for no values)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+class HedgePolicy:
+    """Decides when to hedge and keeps the statistics to do so."""
+
+    def __init__(self, config: Optional[HedgingConfig] = None):
+        """Initialize hedge policy.
+
+        Args:
+            config: Hedging configuration
+        """
+        self.config = config or HedgingConfig()
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, Deque[float]] = {}
+        # Whether each recent request was hedged (budget window)
+        self._decisions: Deque[bool] = deque(maxlen=self.config.budget_window)
+        # End-to-end and primary-only latency of recent requests
+        self._observed: Deque[float] = deque(maxlen=self.config.window)
+        self._primary: Deque[float] = deque(maxlen=self.config.window)
+        self._stats = {"requests": 0, "hedged": 0, "budget_exhausted": 0, "primary_wins": 0, "hedge_wins": 0}
+
+    def bucket(self, duration: float) -> str:
+        """Duration bucket label, e.g. "<=2s" or ">10s"."""
+        for edge in self.config.bucket_edges:
+            if duration <= edge:
+                return f"<={edge:g}s"
+        return f">{self.config.bucket_edges[-1]:g}s" if self.config.bucket_edges else "all"
+
+    def delay(self, duration: float) -> Optional[float]:
+        """Seconds to wait for the primary before hedging.
+
+        Returns:
+            The bucket's rolling p95 latency (at least ``min_delay``), or
+            None until the bucket has ``min_samples`` latencies
+        """
+        with self._lock:
+            samples = list(self._latencies.get(self.bucket(duration), ()))
+        if len(samples) < self.config.min_samples:
+            return None
+        return max(self.config.min_delay, percentile(samples, self.config.percentile))
+
+    def record_attempt(self, duration: float, latency: float) -> None:
+        """Record the latency of one worker request."""
+        bucket = self.bucket(duration)
+        with self._lock:
+            self._latencies.setdefault(bucket, deque(maxlen=self.config.window)).append(latency)
+
+    def try_hedge(self) -> bool:
+        """Spend hedging budget for the current request if any is left."""
+        with self._lock:
+            window = len(self._decisions) + 1
+            if (sum(self._decisions) + 1) / window > self.config.budget:
+                self._stats["budget_exhausted"] += 1
+                return False
+            self._stats["hedged"] += 1
+            # This request's entry in the budget window
+            self._decisions.append(True)
+        return True
+
+    def record_request(self, observed: float, hedged: bool, winner: str = "primary") -> None:
+        """Record a finished request.
+
+        Args:
+            observed: Latency returned to the caller
+            hedged: Whether a hedge was sent (budget already recorded)
+            winner: "primary" or "hedge"
+        """
+        with self._lock:
+            self._stats["requests"] += 1
+            if not hedged:
+                self._decisions.append(False)
+            self._stats[f"{winner}_wins"] += hedged
+            self._observed.append(observed)
+        hedge_requests.labels(outcome=f"{winner}_won" if hedged else "not_hedged").inc()
+
+    def record_primary(self, latency: float) -> None:
+        """Record how long the primary worker took (even if it lost)."""
+        with self._lock:
+            self._primary.append(latency)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hedge rate, win counts, thresholds and p99 with and without hedging."""
+        with self._lock:
+            stats = dict(self._stats)
+            observed = list(self._observed)
+            primary = list(self._primary)
+            buckets = {name: list(values) for name, values in self._latencies.items()}
+
+        p99_observed = percentile(observed, 99)
+        p99_primary = percentile(primary, 99)
+        return {
+            **stats,
+            "hedge_rate": stats["hedged"] / stats["requests"] if stats["requests"] else None,
+            "p99_observed": p99_observed,
+            "p99_primary_only": p99_primary,
+            "p99_improvement": (
+                p99_primary - p99_observed if p99_observed is not None and p99_primary is not None else None
+            ),
+            "thresholds": {
+                name: (
+                    max(self.config.min_delay, percentile(values, self.config.percentile))
+                    if len(values) >= self.config.min_samples else None
+                )
+                for name, values in buckets.items()
+            },
+        }
+
+
+# Global policy instance (shared by all whisper-server clients)
+_hedge_policy: Optional[HedgePolicy] = None
+
+
+def get_hedge_policy() -> HedgePolicy:
+    """Get or create the global HedgePolicy instance."""
+    global _hedge_policy
+    if _hedge_policy is None:
+        from ..config.loader import load_config
+        _hedge_policy = HedgePolicy(load_config().hedging)
+    return _hedge_policy
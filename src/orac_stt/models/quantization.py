@@ -0,0 +1,163 @@
+"""Dynamic int8 quantization of openai-whisper models for CPU inference.
+
+The Linear layers (attention projections and MLPs, most of the encoder and
+decoder FLOPs) are replaced by dynamically quantized int8 Linear layers:
+weights are stored as int8 and activations are quantized per batch at run
+time. Convolutions and the token embedding stay fp32. The quantized kernels
+run on CPU only.
+
+Quantized models can be cached on disk, so startup loads the int8 model
+directly instead of loading fp32 weights and quantizing them again.
+
+torch is imported lazily; only the PyTorch backend calls into it.
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+INT8 = "int8"
+SUPPORTED = (INT8,)
+
+# Model name suffix selecting int8 (e.g. whisper-tiny-int8)
+INT8_SUFFIX = "-int8"
+
+
+def split_model_name(model_name: str, quantization: Optional[str] = None) -> Tuple[str, Optional[str]]:
+    """Separate a quantization suffix from a model name.
+
+    Args:
+        model_name: Model name, optionally ending in ``-int8``
+        quantization: Configured quantization (used if the name has none)
+
+    Returns:
+        Tuple of (base model name, quantization or None)
+    """
+    if model_name.endswith(INT8_SUFFIX):
+        return model_name[:-len(INT8_SUFFIX)], INT8
+    if quantization and quantization not in SUPPORTED:
+        raise ValueError(f"Unsupported quantization '{quantization}'. Supported: {', '.join(SUPPORTED)}")
+    return model_name, quantization or None
+
+
+def cache_path(cache_dir: Path, model_size: str, quantization: str, torch_version: str, whisper_version: str) -> Path:
+    """Location of a cached quantized model.
+
+    The file is a pickled module, so it is only valid for the torch and
+    openai-whisper versions that wrote it; both are part of the name.
+    """
+    tag = f"torch{torch_version}-whisper{whisper_version}".replace("+", "_")
+    return Path(cache_dir) / "quantized" / f"{model_size}-{quantization}-{tag}.pt"
+
+
+def _plain_linears(model: Any) -> None:
+    """Replace whisper's Linear subclass with nn.Linear sharing its weights.
+
+    ``quantize_dynamic`` matches module types exactly; whisper's subclass
+    only casts weights to the input dtype, which is a no-op in fp32.
+    """
+    import torch
+
+    for parent in model.modules():
+        for name, child in parent.named_children():
+            if isinstance(child, torch.nn.Linear) and type(child) is not torch.nn.Linear:
+                linear = torch.nn.Linear(child.in_features, child.out_features, bias=child.bias is not None)
+                linear.weight = child.weight
+                linear.bias = child.bias
+                setattr(parent, name, linear)
+
+
+def quantize_int8(model: Any) -> Any:
+    """Quantize the Linear layers of a CPU fp32 whisper model to int8.
+
+    Args:
+        model: openai-whisper model on CPU
+
+    Returns:
+        Quantized model (the input model is modified)
+    """
+    import torch
+
+    _plain_linears(model.float().eval())
+    return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def model_size_mb(model: Any) -> float:
+    """Size of a model's parameters and buffers, including packed int8 weights."""
+    import io
+
+    import torch
+
+    buffer = io.BytesIO()
+    torch.save(model.state_dict(), buffer)
+    return buffer.tell() / (1024 * 1024)
+
+
+def load_quantized(
+    model_size: str,
+    download_root: Optional[str],
+    quantization: str = INT8,
+    cache_dir: Optional[Path] = None,
+) -> Tuple[Any, Dict[str, Any]]:
+    """Load a quantized CPU model, from the cache when possible.
+
+    Args:
+        model_size: openai-whisper model size (tiny, base, small, ...)
+        download_root: Directory for downloaded fp32 checkpoints
+        quantization: Quantization mode (only int8)
+        cache_dir: Directory for quantized models (None: no cache)
+
+    Returns:
+        Tuple of (model, info) where info reports the mode, whether the
+        cache was used, load time and model size
+    """
+    import torch
+    import whisper
+
+    if quantization not in SUPPORTED:
+        raise ValueError(f"Unsupported quantization '{quantization}'. Supported: {', '.join(SUPPORTED)}")
+
+    start = time.perf_counter()
+    path = None
+    if cache_dir is not None:
+        path = cache_path(cache_dir, model_size, quantization, torch.__version__, whisper.__version__)
+        if path.exists():
+            try:
+                # Written by this service below; a full module pickle
+                model = torch.load(path, map_location="cpu", weights_only=False)
+                info = {"mode": quantization, "cached": True, "load_time": time.perf_counter() - start}
+                logger.info(f"Loaded {quantization} {model_size} model from {path} in {info['load_time']:.2f}s")
+                return model, {**info, "size_mb": round(model_size_mb(model), 1)}
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable quantized model cache {path}: {e}")
+
+    model = whisper.load_model(model_size, device="cpu", download_root=download_root)
+    fp32_mb = model_size_mb(model)
+    model = quantize_int8(model)
+    info = {
+        "mode": quantization,
+        "cached": False,
+        "load_time": time.perf_counter() - start,
+        "size_mb": round(model_size_mb(model), 1),
+        "fp32_size_mb": round(fp32_mb, 1),
+    }
+    logger.info(
+        f"Quantized {model_size} to {quantization} in {info['load_time']:.2f}s "
+        f"({info['fp32_size_mb']} MB -> {info['size_mb']} MB)"
+    )
+
+    if path is not None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            torch.save(model, tmp)
+            os.replace(tmp, path)
+            logger.info(f"Cached quantized model at {path}")
+        except OSError as e:
+            logger.warning(f"Could not cache quantized model at {path}: {e}")
+    return model, info
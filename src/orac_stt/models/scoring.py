@@ -0,0 +1,121 @@
+"""Decoder score helpers shared by the inference backends.
+
+Every backend reports the same three quality signals Whisper itself uses for
+temperature fallback, so callers can judge a transcription without knowing
+which backend produced it:
+
+- ``avg_logprob``: mean log-probability of the generated text tokens
+- ``no_speech_prob``: probability of the no-speech token (None if unknown)
+- ``compression_ratio``: gzip compression ratio of the text (high = repetitive)
+"""
+
+import math
+import zlib
+from typing import Any, Dict, Iterable, Optional
+
+
+def compression_ratio(text: str) -> float:
+    """Compute the gzip compression ratio of a transcription.
+
+    Args:
+        text: Transcribed text
+
+    Returns:
+        Ratio of raw to compressed byte length (0.0 for empty text)
+    """
+    if not text:
+        return 0.0
+    raw = text.encode("utf-8")
+    return len(raw) / len(zlib.compress(raw))
+
+
+def confidence_from_logprob(avg_logprob: Optional[float]) -> float:
+    """Map an average token log-probability to a 0-1 confidence.
+
+    Args:
+        avg_logprob: Mean token log-probability
+
+    Returns:
+        Geometric mean token probability, or 0.0 if unknown
+    """
+    if avg_logprob is None:
+        return 0.0
+    return max(0.0, min(1.0, math.exp(avg_logprob)))
+
+
+def build_scores(
+    text: str,
+    avg_logprob: Optional[float],
+    no_speech_prob: Optional[float] = None,
+    tokens: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Build the score fields added to a backend result.
+
+    Args:
+        text: Transcribed text
+        avg_logprob: Mean token log-probability (None if unavailable)
+        no_speech_prob: No-speech probability (None if unavailable)
+        tokens: Number of generated tokens (None if unavailable)
+
+    Returns:
+        Dictionary with confidence, avg_logprob, no_speech_prob,
+        compression_ratio and tokens
+    """
+    return {
+        "confidence": confidence_from_logprob(avg_logprob) if text else 0.0,
+        "avg_logprob": avg_logprob,
+        "no_speech_prob": no_speech_prob,
+        "compression_ratio": compression_ratio(text),
+        "tokens": tokens,
+    }
+
+
+def scores_from_token_probs(text: str, probs: Iterable[float]) -> Dict[str, Any]:
+    """Build scores from per-token probabilities (whisper.cpp JSON output).
+
+    Args:
+        text: Transcribed text
+        probs: Probability of each generated text token
+
+    Returns:
+        Score fields (see build_scores)
+    """
+    logprobs = [math.log(max(p, 1e-10)) for p in probs]
+    avg_logprob = sum(logprobs) / len(logprobs) if logprobs else None
+    return build_scores(text, avg_logprob, tokens=len(logprobs) or None)
+
+
+def scores_from_segments(text: str, segments: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build scores from Whisper-style segments.
+
+    Segment ``avg_logprob`` values are weighted by token count when available
+    (by text length otherwise); ``no_speech_prob`` is taken from the first
+    segment, which is where Whisper evaluates it.
+
+    Args:
+        text: Full transcribed text
+        segments: Segments with avg_logprob / no_speech_prob keys
+
+    Returns:
+        Score fields (see build_scores)
+    """
+    total_weight = 0.0
+    weighted = 0.0
+    no_speech_prob = None
+    token_count = 0
+
+    for segment in segments:
+        token_count += len(segment.get("tokens") or [])
+        if no_speech_prob is None and segment.get("no_speech_prob") is not None:
+            no_speech_prob = float(segment["no_speech_prob"])
+
+        logprob = segment.get("avg_logprob")
+        if logprob is None:
+            continue
+        tokens = segment.get("tokens")
+        weight = len(tokens) if tokens else max(len(segment.get("text", "")), 1)
+        weighted += float(logprob) * weight
+        total_weight += weight
+
+    avg_logprob = weighted / total_weight if total_weight else None
+    return build_scores(text, avg_logprob, no_speech_prob, tokens=token_count or None)
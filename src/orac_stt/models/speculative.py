@@ -0,0 +1,184 @@
+"""Draft-and-verify speculative greedy decoding.
+
+A small draft model proposes ``k`` tokens one at a time; the target model
+scores all of them in a single forward pass and keeps the longest prefix
+that matches its own greedy choices, plus the token it predicts after that
+prefix. The output is therefore token-for-token identical to greedy
+decoding with the target model, while the target runs roughly once per
+accepted run of tokens instead of once per token.
+
+The algorithm only needs incremental decoder sessions (see
+``DecoderSession``), so it is independent of the inference framework; the
+PyTorch backend provides sessions over openai-whisper models.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional, Protocol, Sequence, Tuple
+
+
+class DecoderSession(Protocol):
+    """Incremental greedy decoder over one utterance.
+
+    A session holds the decoder state (e.g. a key/value cache) for the
+    tokens consumed so far.
+    """
+
+    @property
+    def length(self) -> int:
+        """Number of tokens consumed."""
+        ...
+
+    def extend(self, tokens: Sequence[int]) -> List[Tuple[int, float]]:
+        """Consume tokens in one forward pass.
+
+        Returns:
+            For each consumed token, the greedy next token and its
+            log-probability
+        """
+        ...
+
+    def truncate(self, length: int) -> None:
+        """Roll the session back to its first ``length`` tokens."""
+        ...
+
+
+@dataclass
+class DecodeOutput:
+    """Tokens generated after the prompt, with statistics."""
+
+    tokens: List[int] = field(default_factory=list)
+    logprobs: List[float] = field(default_factory=list)
+    target_passes: int = 0
+    draft_passes: int = 0
+    proposed: int = 0
+    accepted: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def acceptance_rate(self) -> Optional[float]:
+        """Fraction of draft proposals the target accepted."""
+        return self.accepted / self.proposed if self.proposed else None
+
+
+def _finish(output: DecodeOutput, eot: int, max_tokens: int) -> DecodeOutput:
+    """Cut the output at end-of-text or the token budget."""
+    end = min(len(output.tokens), max_tokens)
+    if eot in output.tokens[:end]:
+        end = output.tokens.index(eot)
+    output.tokens = output.tokens[:end]
+    output.logprobs = output.logprobs[:end]
+    return output
+
+
+def greedy_decode(
+    target: DecoderSession,
+    prompt: Sequence[int],
+    eot: int,
+    max_tokens: int,
+) -> DecodeOutput:
+    """Reference greedy decoding with the target model alone.
+
+    Args:
+        target: Fresh decoder session of the target model
+        prompt: Start-of-transcript token sequence
+        eot: End-of-text token
+        max_tokens: Maximum tokens to generate
+
+    Returns:
+        Generated tokens (without the end-of-text token)
+    """
+    start = time.time()
+    output = DecodeOutput()
+    token, logprob = target.extend(prompt)[-1]
+    output.target_passes += 1
+
+    while True:
+        output.tokens.append(token)
+        output.logprobs.append(logprob)
+        if token == eot or len(output.tokens) >= max_tokens:
+            break
+        token, logprob = target.extend([token])[-1]
+        output.target_passes += 1
+
+    output.elapsed = time.time() - start
+    return _finish(output, eot, max_tokens)
+
+
+def speculative_decode(
+    target: DecoderSession,
+    draft: DecoderSession,
+    prompt: Sequence[int],
+    eot: int,
+    max_tokens: int,
+    k: int = 4,
+) -> DecodeOutput:
+    """Greedy decoding with draft proposals verified by the target.
+
+    Both sessions always hold every committed token except the last one
+    (``pending``), which is fed together with the next proposals.
+
+    Args:
+        target: Fresh decoder session of the target model
+        draft: Fresh decoder session of the draft model (same tokenizer)
+        prompt: Start-of-transcript token sequence
+        eot: End-of-text token
+        max_tokens: Maximum tokens to generate
+        k: Tokens proposed by the draft per round
+
+    Returns:
+        Generated tokens, identical to ``greedy_decode`` with the target
+    """
+    start = time.time()
+    output = DecodeOutput()
+    committed = list(prompt)
+
+    if len(prompt) > 1:
+        target.extend(prompt[:-1])
+        draft.extend(prompt[:-1])
+        output.target_passes += 1
+        output.draft_passes += 1
+
+    while True:
+        pending = committed[-1]
+
+        # Bring the draft up to date with committed[:-1]
+        if draft.length < len(committed) - 1:
+            draft.extend(committed[draft.length:-1])
+            output.draft_passes += 1
+
+        # Draft proposes up to k tokens greedily
+        budget = max_tokens - (len(committed) - len(prompt))
+        proposals: List[int] = []
+        token = pending
+        for _ in range(max(1, min(k, budget))):
+            token = draft.extend([token])[-1][0]
+            output.draft_passes += 1
+            proposals.append(token)
+            if token == eot:
+                break
+
+        # Target scores pending + proposals in one pass
+        verified = target.extend([pending] + proposals)
+        output.target_passes += 1
+        accepted = 0
+        while accepted < len(proposals) and proposals[accepted] == verified[accepted][0]:
+            accepted += 1
+        output.proposed += len(proposals)
+        output.accepted += accepted
+
+        # Accepted proposals, then the target's own next token
+        for token, logprob in verified[:accepted + 1]:
+            output.tokens.append(token)
+            output.logprobs.append(logprob)
+        committed.extend(proposals[:accepted])
+        committed.append(verified[accepted][0])
+
+        if eot in output.tokens or len(output.tokens) >= max_tokens:
+            break
+
+        target.truncate(len(committed) - 1)
+        draft.truncate(min(draft.length, len(committed) - 1))
+
+    output.elapsed = time.time() - start
+    return _finish(output, eot, max_tokens)
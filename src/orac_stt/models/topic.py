@@ -1,9 +1,33 @@
 """Topic models for ORAC STT."""
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Literal
 from pydantic import BaseModel, Field
 
 
+class TopicCascadeConfig(BaseModel):
+    """Per-topic cascade overrides; unset fields use the global [cascade] settings."""
+
+    enabled: Optional[bool] = Field(None, description="Enable the tiny-first cascade for this topic")
+    mode: Optional[Literal["sequential", "concurrent"]] = Field(None, description="sequential or concurrent")
+    log_prob_threshold: Optional[float] = Field(None, description="Escalate when avg_logprob is below this")
+    no_speech_threshold: Optional[float] = Field(None, description="Escalate when no_speech_prob is above this")
+    compression_ratio_threshold: Optional[float] = Field(
+        None, description="Escalate when compression_ratio is above this"
+    )
+
+
+class TopicGrammar(BaseModel):
+    """Grammar or phrase list constraining decoding for a topic."""
+
+    gbnf: Optional[str] = Field(None, description="GBNF grammar (whisper.cpp syntax)")
+    phrases: Optional[List[str]] = Field(None, description="Accepted commands, compiled to a grammar")
+    root_rule: str = Field("root", description="Top-level rule of the GBNF grammar")
+    penalty: Optional[float] = Field(None, description="Grammar penalty, None uses [grammar] penalty")
+    min_avg_logprob: Optional[float] = Field(
+        None, description="Retry unconstrained below this avg_logprob, None uses [grammar] setting"
+    )
+
+
 class TopicConfig(BaseModel):
     """Configuration for a single topic."""
 
@@ -15,6 +39,11 @@ class TopicConfig(BaseModel):
         None,
         description="Comma-separated wake words to strip from transcriptions (e.g., 'computa, hey computa')"
     )
+    cascade: Optional[TopicCascadeConfig] = Field(None, description="Model cascade overrides")
+    preferred_model: Optional[str] = Field(
+        None, description="Model to transcribe this topic with (e.g. whisper-tiny), None uses default"
+    )
+    grammar: Optional[TopicGrammar] = Field(None, description="Grammar-constrained decoding")
     
     @property
     def is_active(self) -> bool:
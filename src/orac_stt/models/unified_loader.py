@@ -1,245 +1,499 @@
 """Unified model loader supporting whisper.cpp, whisper-server, and PyTorch backends."""
 
-import os
+import asyncio
+import threading
 import time
-from pathlib import Path
-from typing import Dict, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Tuple
 import numpy as np
 
-from ..config.settings import ModelConfig
+from ..config.settings import BatchingConfig, DecodeConfig, ModelConfig
+from ..core.circuit_breaker import CircuitOpenError
 from ..utils.logging import get_logger
-
-# Determine which backend to use
-# Priority: whisper-server > whisper.cpp > PyTorch
-USE_WHISPER_SERVER = os.environ.get("USE_WHISPER_SERVER", "false").lower() == "true"
-USE_WHISPER_CPP = os.environ.get("USE_WHISPER_CPP", "true").lower() == "true"
-WHISPER_SERVER_URL = os.environ.get("WHISPER_SERVER_URL", "http://localhost:8080")
-
-if USE_WHISPER_SERVER:
-    from .whisper_server import WhisperServerModel
-elif USE_WHISPER_CPP:
-    from .whisper_cpp import WhisperCppModel
-else:
-    import torch
-    import whisper
+from ..utils.metrics import circuit_breaker_diversions
+from .audio_ctx import AudioCtxPolicy
+from .batching import BatchingModel
+from .decode_budget import DecodeGuard
+from .backends import (
+    PyTorchBackend,
+    WhisperCppBackend,
+    WhisperServerBackend,
+    default_backend_name,
+    get_backend_plugin,
+    transcribe_async,
+)
 
 logger = get_logger(__name__)
 
+# Key for a constructed backend instance: (backend name, model name, device)
+BackendKey = Tuple[str, str, str]
+
 
 class UnifiedWhisperLoader:
-    """Unified loader for Whisper models supporting multiple backends."""
-    
-    # Model size mapping for whisper.cpp
-    WHISPER_CPP_MODELS = {
-        "whisper-tiny": "ggml-tiny.bin",
-        "whisper-base": "ggml-base.bin", 
-        "whisper-small": "ggml-small.bin",
-        "whisper-medium": "ggml-medium.bin",
-        "whisper-large": "ggml-large-v3.bin",
-        "whisper-large-v3": "ggml-large-v3.bin",
-    }
-    
-    # Model size mapping for PyTorch
-    PYTORCH_MODELS = {
-        "whisper-tiny": "tiny",
-        "whisper-base": "base",
-        "whisper-small": "small",
-        "whisper-medium": "medium", 
-        "whisper-large": "large",
-        "whisper-large-v3": "large-v3",
-    }
-    
-    def __init__(self, config: ModelConfig):
+    """Unified loader for Whisper models supporting multiple backends.
+
+    Backends are constructed lazily through the plugin registry and cached per
+    (backend, model, device), so several backends can be resident in one
+    process. The active backend can be switched at runtime with
+    ``set_backend()``; the new backend is fully constructed before it replaces
+    the active one, so in-flight requests are not interrupted. Unloading an
+    instance that is still transcribing defers its ``close()`` until the
+    last of those requests finishes.
+    """
+
+    # Model size mappings (kept for callers that inspect them)
+    WHISPER_CPP_MODELS = WhisperCppBackend.MODELS
+    PYTORCH_MODELS = PyTorchBackend.MODELS
+
+    def __init__(
+        self,
+        config: ModelConfig,
+        decode_config: Optional[DecodeConfig] = None,
+        fallback_backend: Optional[str] = None,
+        fallback_device: str = "cpu",
+        batching_config: Optional[BatchingConfig] = None,
+    ):
         """Initialize unified loader.
 
         Args:
             config: Model configuration
+            decode_config: Decode budget configuration
+            fallback_backend: Backend that requests are diverted to while
+                the whisper-server circuit breaker is open (None: fail fast)
+            fallback_device: Device for the fallback backend
+            batching_config: Micro-batching of in-process backends (None: off)
         """
         self.config = config
-        self.use_whisper_server = USE_WHISPER_SERVER
-        self.use_whisper_cpp = USE_WHISPER_CPP
-        self.whisper_server_url = WHISPER_SERVER_URL
-        self._model: Optional[Any] = None
-        self._load_time: Optional[float] = None
-
-        # Determine backend name for logging
-        if self.use_whisper_server:
-            backend = f"whisper-server ({self.whisper_server_url})"
-        elif self.use_whisper_cpp:
-            backend = "whisper.cpp"
-        else:
-            backend = "PyTorch"
+        self.backend_name = config.backend or default_backend_name()
+        self.device = config.device
+        self._backends: Dict[BackendKey, Any] = {}
+        self._load_times: Dict[BackendKey, float] = {}
+        self._lock = threading.RLock()
+        # Requests running on each instance (by id), and unloaded instances
+        # waiting for theirs to finish before being closed
+        self._in_flight: Dict[int, int] = {}
+        self._retired: Dict[int, Tuple[BackendKey, Any]] = {}
+        # Separate from _lock, which is held while a model is constructed
+        self._in_flight_lock = threading.Lock()
+        self.audio_ctx_policy: Optional[AudioCtxPolicy] = None
+        if config.adaptive_audio_ctx:
+            self.audio_ctx_policy = AudioCtxPolicy.load(config.audio_ctx_calibration)
+        self.decode_guard = DecodeGuard(decode_config)
+        self.fallback_backend = fallback_backend
+        self.fallback_device = fallback_device
+        self.batching_config = batching_config
+
+        # Fail fast on unknown backend names
+        get_backend_plugin(self.backend_name)
+
+        logger.info(f"Initializing UnifiedWhisperLoader with backend: {self.backend_label}")
 
-        logger.info(f"Initializing UnifiedWhisperLoader with backend: {backend}")
-    
     @property
-    def model(self) -> Any:
-        """Get loaded model, loading if necessary."""
-        if self._model is None:
-            self.load_model()
-        return self._model
-    
-    def load_model(self) -> None:
-        """Load model using appropriate backend."""
-        start_time = time.time()
-        model_name = self.config.name
+    def backend_label(self) -> str:
+        """Backend name for logging."""
+        if self.backend_name == WhisperServerBackend.name:
+            return f"whisper-server ({WhisperServerBackend.server_url()})"
+        return self.backend_name
 
-        try:
-            if self.use_whisper_server:
-                self._load_whisper_server()
-            elif self.use_whisper_cpp:
-                self._load_whisper_cpp(model_name)
-            else:
-                self._load_pytorch(model_name)
-
-            self._load_time = time.time() - start_time
-            logger.info(f"Model loaded successfully in {self._load_time:.2f}s")
-
-        except Exception as e:
-            logger.error(f"Failed to load model: {e}")
-            raise
-
-    def _load_whisper_server(self) -> None:
-        """Initialize whisper-server client."""
-        logger.info(f"Connecting to whisper-server at {self.whisper_server_url}")
-
-        self._model = WhisperServerModel(
-            server_url=self.whisper_server_url,
-            timeout=30.0,
-            language="en",
+    @property
+    def use_whisper_server(self) -> bool:
+        """Whether the active backend is whisper-server."""
+        return self.backend_name == WhisperServerBackend.name
+
+    @property
+    def use_whisper_cpp(self) -> bool:
+        """Whether the active backend is the whisper.cpp CLI."""
+        return self.backend_name == WhisperCppBackend.name
+
+    def _key(
+        self,
+        backend: Optional[str] = None,
+        model_name: Optional[str] = None,
+        device: Optional[str] = None,
+    ) -> BackendKey:
+        return (
+            backend or self.backend_name,
+            model_name or self.config.name,
+            device or self.device,
         )
 
-        # Wait for server to be ready (model may still be loading)
-        if not self._model.wait_for_ready(timeout=60.0):
-            raise RuntimeError(
-                f"Whisper-server at {self.whisper_server_url} not ready"
+    @property
+    def model(self) -> Any:
+        """Get active model, loading if necessary."""
+        return self.get_backend()
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the active backend/model has been constructed."""
+        return self._key() in self._backends
+
+    def quantization(self) -> Dict[str, Any]:
+        """Requested and effective quantization of the active model."""
+        from .quantization import split_model_name
+
+        _, requested = split_model_name(self.config.name, self.config.quantization)
+        instance = self._backends.get(self._key())
+        return {
+            "requested": requested,
+            # Only the PyTorch backend quantizes, and only on CPU
+            "active": getattr(instance, "quantization", None),
+        }
+
+    def is_resident(
+        self,
+        backend: Optional[str] = None,
+        model_name: Optional[str] = None,
+        device: Optional[str] = None,
+    ) -> bool:
+        """Whether a backend/model instance is already constructed."""
+        return self._key(backend, model_name, device) in self._backends
+
+    def get_backend(
+        self,
+        backend: Optional[str] = None,
+        model_name: Optional[str] = None,
+        device: Optional[str] = None,
+    ) -> Any:
+        """Get a backend model instance, constructing it if necessary.
+
+        Args:
+            backend: Backend name (default: active backend)
+            model_name: Model name (default: configured model)
+            device: Device (default: active device)
+
+        Returns:
+            Model object implementing the backend interface
+        """
+        key = self._key(backend, model_name, device)
+        instance = self._backends.get(key)
+        if instance is not None:
+            return instance
+
+        with self._lock:
+            # Another thread may have finished loading while we waited
+            instance = self._backends.get(key)
+            if instance is not None:
+                return instance
+
+            backend_name, model_name, device = key
+            plugin = get_backend_plugin(backend_name)
+            start_time = time.time()
+
+            try:
+                instance = plugin.create(self.config, model_name, device)
+            except Exception as e:
+                logger.error(f"Failed to load model: {e}")
+                raise
+
+            load_time = time.time() - start_time
+            if self._batches(plugin, instance):
+                instance = BatchingModel(instance, self.batching_config, f"{backend_name}/{model_name}")
+            self._backends[key] = instance
+            self._load_times[key] = load_time
+            logger.info(
+                f"Model loaded successfully in {load_time:.2f}s "
+                f"(backend={backend_name}, model={model_name}, device={device})"
             )
-    
-    def _load_whisper_cpp(self, model_name: str) -> None:
-        """Load whisper.cpp model."""
-        # Get GGML model filename
-        ggml_name = self.WHISPER_CPP_MODELS.get(model_name, "ggml-base.bin")
-        model_path = Path(self.config.cache_dir) / ggml_name
-        
-        # Whisper binary path - whisper.cpp builds as "whisper-cli"
-        whisper_bin = Path("/app/third_party/whisper_cpp/bin/whisper-cli")
-        
-        # Check if binary exists, if not try alternate location
-        if not whisper_bin.exists():
-            whisper_bin = Path(self.config.cache_dir).parent / "whisper_cpp" / "bin" / "whisper-cli"
-        
-        logger.info(f"Loading whisper.cpp model: {model_path}")
-        logger.info(f"Using whisper binary: {whisper_bin}")
-        
-        self._model = WhisperCppModel(
-            model_path=str(model_path),
-            whisper_bin=str(whisper_bin),
-            device="cuda" if self.config.device != "cpu" else "cpu"
+            return instance
+
+    def _checkout(self, key: BackendKey) -> Any:
+        """Get an instance and count a request on it, so unload waits for it."""
+        while True:
+            instance = self.get_backend(*key)
+            with self._in_flight_lock:
+                # Unless it was unloaded since; then get the new instance
+                if self._backends.get(key) is instance:
+                    self._in_flight[id(instance)] = self._in_flight.get(id(instance), 0) + 1
+                    return instance
+
+    def _checkin(self, instance: Any) -> None:
+        """End a request on an instance; close it if it was unloaded meanwhile."""
+        with self._in_flight_lock:
+            remaining = self._in_flight.get(id(instance), 1) - 1
+            if remaining > 0:
+                self._in_flight[id(instance)] = remaining
+                return
+            self._in_flight.pop(id(instance), None)
+            retired = self._retired.pop(id(instance), None)
+        if retired is not None:
+            self._close(*retired)
+
+    def _batches(self, plugin: Any, instance: Any) -> bool:
+        """Whether to put a micro-batcher in front of a new instance."""
+        return (
+            self.batching_config is not None
+            and self.batching_config.enabled
+            and plugin.in_process
+            and hasattr(instance, "transcribe_batch")
         )
-    
-    def _load_pytorch(self, model_name: str) -> None:
-        """Load PyTorch Whisper model."""
-        model_size = self.PYTORCH_MODELS.get(model_name, "base")
-        
-        # Set cache directory
-        os.environ['WHISPER_CACHE_DIR'] = str(self.config.cache_dir)
-        self.config.cache_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Determine device
-        device = self._get_pytorch_device()
-        
-        logger.info(f"Loading PyTorch Whisper model: {model_size} on {device}")
-        
-        self._model = whisper.load_model(
-            model_size,
-            device=device,
-            download_root=str(self.config.cache_dir)
+
+    def load_model(self) -> None:
+        """Load the active backend/model."""
+        self.get_backend()
+
+    def set_backend(self, backend: str, device: Optional[str] = None) -> None:
+        """Switch the active backend at runtime.
+
+        The new backend is constructed before being made active; if
+        construction fails the previous backend stays active.
+
+        Args:
+            backend: Backend name from the registry
+            device: Optional device override (e.g. "cpu" for CPU fallback)
+        """
+        plugin = get_backend_plugin(backend)
+        if not plugin.is_available():
+            raise RuntimeError(f"Backend '{backend}' is not available on this host")
+
+        device = device or self.device
+        self.get_backend(backend=backend, device=device)
+
+        with self._lock:
+            previous = (self.backend_name, self.device)
+            self.backend_name = backend
+            self.device = device
+
+        logger.info(
+            f"Active backend switched: {previous[0]} ({previous[1]}) -> {backend} ({device})"
         )
-    
-    def _get_pytorch_device(self) -> str:
-        """Get PyTorch device based on configuration and availability."""
-        if self.config.device == "cpu":
-            return "cpu"
-            
-        if torch.cuda.is_available():
-            logger.info("CUDA available, using GPU")
-            return "cuda"
-        else:
-            logger.warning("CUDA not available, falling back to CPU")
-            return "cpu"
-    
+
+    def unload(
+        self,
+        backend: Optional[str] = None,
+        model_name: Optional[str] = None,
+        device: Optional[str] = None,
+    ) -> bool:
+        """Unload a constructed backend instance.
+
+        Requests still transcribing on the instance finish first; it is
+        closed when the last of them returns.
+
+        Returns:
+            True if an instance was unloaded
+        """
+        key = self._key(backend, model_name, device)
+        with self._lock:
+            instance = self._backends.pop(key, None)
+            self._load_times.pop(key, None)
+        if instance is None:
+            return False
+        with self._in_flight_lock:
+            in_flight = self._in_flight.get(id(instance), 0)
+            if in_flight:
+                # New requests already get a fresh instance; close this one
+                # when the requests still decoding on it are done
+                self._retired[id(instance)] = (key, instance)
+                logger.info(f"Unloaded backend instance: {key} (closing after {in_flight} in-flight requests)")
+                return True
+
+        self._close(key, instance)
+        return True
+
+    def _close(self, key: BackendKey, instance: Any) -> None:
+        if hasattr(instance, "close"):
+            try:
+                instance.close()
+            except Exception as e:
+                logger.warning(f"Error closing backend {key}: {e}")
+        logger.info(f"Unloaded backend instance: {key}")
+
+    def get_instances(self, backend: str) -> List[Any]:
+        """Get all constructed instances of a backend."""
+        with self._lock:
+            return [
+                instance for key, instance in self._backends.items()
+                if key[0] == backend
+            ]
+
+    def loaded_backends(self) -> List[Dict[str, Any]]:
+        """Describe constructed backend instances."""
+        active = self._key()
+        with self._lock:
+            return [
+                {
+                    "backend": key[0],
+                    "model": key[1],
+                    "device": key[2],
+                    "load_time": self._load_times.get(key),
+                    "active": key == active,
+                    "quantization": getattr(instance, "quantization", None),
+                    "batching": instance.get_stats() if isinstance(instance, BatchingModel) else None,
+                }
+                for key, instance in self._backends.items()
+            ]
+
+    def _decode_options(
+        self,
+        audio_data: np.ndarray,
+        sample_rate: int,
+        kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Add duration-dependent decode options unless the caller set them."""
+        duration = len(audio_data) / sample_rate
+        if self.audio_ctx_policy is not None and "audio_ctx" not in kwargs:
+            kwargs["audio_ctx"] = self.audio_ctx_policy.select(duration)
+        for option, value in self.decode_guard.options(duration).items():
+            kwargs.setdefault(option, value)
+        return kwargs
+
+    def _speculative_options(self, key: BackendKey) -> Dict[str, Any]:
+        """Draft model options for speculative decoding, if configured.
+
+        Only in-process backends can share decoder state with a draft
+        model; the draft instance is constructed on first use.
+        """
+        backend_name, model_name, device = key
+        draft_name = self.config.speculative_draft_model
+        if not draft_name or draft_name == model_name:
+            return {}
+        if not get_backend_plugin(backend_name).in_process:
+            return {}
+        return {
+            "draft_model": self.get_backend(backend_name, draft_name, device),
+            "speculative_k": self.config.speculative_k,
+        }
+
     def transcribe(
         self,
         audio_data: np.ndarray,
         sample_rate: int = 16000,
         language: Optional[str] = None,
+        backend: Optional[str] = None,
+        model_name: Optional[str] = None,
+        device: Optional[str] = None,
         **kwargs
     ) -> Dict[str, Any]:
-        """Transcribe audio using loaded model.
-        
+        """Transcribe audio using a loaded model.
+
         Args:
             audio_data: Audio samples as numpy array
-            sample_rate: Sample rate 
+            sample_rate: Sample rate
             language: Language code
+            backend: Backend override (default: active backend)
+            model_name: Model override (default: configured model)
+            device: Device override (default: active device)
             **kwargs: Additional arguments
-            
+
         Returns:
             Transcription results
         """
-        if self._model is None:
-            self.load_model()
-            
-        # Extract task from kwargs if present
-        task = kwargs.pop("task", "transcribe") if isinstance(kwargs, dict) else "transcribe"
-        
-        return self._model.transcribe(
-            audio_data,
-            sample_rate=sample_rate,
-            language=language,
-            **kwargs if isinstance(kwargs, dict) else {}
-        )
-    
+        key = self._key(backend, model_name, device)
+        model = self._checkout(key)
+        try:
+            options = self._decode_options(audio_data, sample_rate, kwargs)
+            options.update(self._speculative_options(key))
+            start = time.time()
+            result = model.transcribe(
+                audio_data,
+                sample_rate=sample_rate,
+                language=language,
+                **options
+            )
+        except CircuitOpenError:
+            if not self._can_divert(key):
+                raise
+            self._record_diversion()
+            return self.transcribe(
+                audio_data, sample_rate, language,
+                backend=self.fallback_backend, model_name=key[1], device=self.fallback_device,
+                **kwargs
+            )
+        finally:
+            self._checkin(model)
+        return self._check_decode(result, key, time.time() - start, options)
+
+    async def transcribe_async(
+        self,
+        audio_data: np.ndarray,
+        sample_rate: int = 16000,
+        language: Optional[str] = None,
+        backend: Optional[str] = None,
+        model_name: Optional[str] = None,
+        device: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Transcribe audio without blocking the event loop.
+
+        Same arguments as ``transcribe()``.
+        """
+        key = self._key(backend, model_name, device)
+        if self._backends.get(key) is not None:
+            model = self._checkout(key)
+        else:
+            # Construction may block (model load, readiness wait)
+            loop = asyncio.get_running_loop()
+            model = await loop.run_in_executor(None, self._checkout, key)
+
+        try:
+            options = self._decode_options(audio_data, sample_rate, kwargs)
+            if self.config.speculative_draft_model:
+                # May construct the draft model
+                loop = asyncio.get_running_loop()
+                options.update(await loop.run_in_executor(None, self._speculative_options, key))
+            start = time.time()
+            result = await transcribe_async(
+                model,
+                audio_data,
+                sample_rate=sample_rate,
+                language=language,
+                **options
+            )
+        except CircuitOpenError:
+            if not self._can_divert(key):
+                raise
+            self._record_diversion()
+            return await self.transcribe_async(
+                audio_data, sample_rate, language,
+                backend=self.fallback_backend, model_name=key[1], device=self.fallback_device,
+                **kwargs
+            )
+        finally:
+            self._checkin(model)
+        return self._check_decode(result, key, time.time() - start, options)
+
+    def _check_decode(
+        self, result: Dict[str, Any], key: BackendKey, elapsed: float, options: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Apply the decode guard; the token budget only counts where the backend enforces it."""
+        max_tokens = options.get("max_tokens") if get_backend_plugin(key[0]).token_budget else None
+        return self.decode_guard.check(result, key[0], elapsed, max_tokens)
+
+    def _can_divert(self, key: BackendKey) -> bool:
+        """Whether a request rejected by the circuit breaker can go to the fallback."""
+        return self.fallback_backend is not None and key[0] != self.fallback_backend
+
+    def _record_diversion(self) -> None:
+        logger.warning(f"Circuit open, diverting request to {self.fallback_backend} ({self.fallback_device})")
+        circuit_breaker_diversions.labels(backend=self.fallback_backend).inc()
+
     def detect_language(
         self,
         audio_data: np.ndarray,
         sample_rate: int = 16000
     ) -> tuple[str, float]:
         """Detect language of audio.
-        
+
         Args:
             audio_data: Audio samples
             sample_rate: Sample rate
-            
+
         Returns:
             Tuple of (language_code, confidence)
         """
-        if self._model is None:
-            self.load_model()
-            
-        if hasattr(self._model, 'detect_language'):
-            return self._model.detect_language(audio_data, sample_rate)
-        else:
-            # Fallback for PyTorch backend
-            result = self._model.transcribe(
-                audio_data,
-                task="detect_language"
-            )
-            return result.get("language", "en"), 0.9
-    
+        return self.model.detect_language(audio_data, sample_rate)
+
     @property
     def is_multilingual(self) -> bool:
         """Check if model supports multiple languages."""
-        if self._model is None:
+        if not self.is_loaded:
             # Check based on model name
             return "tiny.en" not in self.config.name and "base.en" not in self.config.name
-        
-        if hasattr(self._model, 'is_multilingual'):
-            return self._model.is_multilingual
-        else:
-            # PyTorch models
-            return self._model.is_multilingual if hasattr(self._model, 'is_multilingual') else True
-    
+
+        return getattr(self.model, "is_multilingual", True)
+
     def cleanup(self) -> None:
         """Clean up resources."""
-        self._model = None
-        logger.info("Model resources cleaned up")
\ No newline at end of file
+        with self._lock:
+            keys = list(self._backends)
+        for key in keys:
+            self.unload(*key)
+        logger.info("Model resources cleaned up")
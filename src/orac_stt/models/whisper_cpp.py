@@ -10,12 +10,16 @@ import wave
 import numpy as np
 
 from ..utils.logging import get_logger
+from .scoring import scores_from_token_probs
 
 logger = get_logger(__name__)
 
 
 class WhisperCppModel:
     """Wrapper for whisper.cpp binary execution."""
+
+    # Seconds allowed for the CLI to load its model before decoding starts
+    LOAD_ALLOWANCE = 10.0
     
     def __init__(
         self,
@@ -58,7 +62,7 @@ class WhisperCppModel:
             **kwargs: Additional arguments for whisper.cpp
             
         Returns:
-            Dictionary with transcription results
+            Dictionary with transcription results and decoder scores
         """
         if sample_rate != 16000:
             raise ValueError(f"Sample rate must be 16000, got {sample_rate}")
@@ -76,6 +80,10 @@ class WhisperCppModel:
                 audio_int16 = np.clip(audio_data * 32767, -32768, 32767).astype(np.int16)
                 wav.writeframes(audio_int16.tobytes())
         
+        # Full JSON output carries per-token probabilities
+        json_base = tmp_path[:-len(".wav")]
+        json_path = f"{json_base}.json"
+
         try:
             # Build whisper.cpp command
             cmd = [
@@ -83,6 +91,7 @@ class WhisperCppModel:
                 "-m", str(self.model_path),
                 "-f", tmp_path,
                 "--no-timestamps",  # Disable timestamps for faster inference
+                "-ojf", "-of", json_base,
                 # Note: VAD requires a separate model file (silero_vad.onnx)
                 # TODO: Download VAD model and enable: --vad --vad-model /path/to/silero_vad.onnx
             ]
@@ -94,15 +103,52 @@ class WhisperCppModel:
             # Add language if specified
             if language:
                 cmd.extend(["-l", language])
+
+            # Reduced encoder window for short utterances (0 = full 30 s)
+            audio_ctx = kwargs.get("audio_ctx")
+            if audio_ctx:
+                cmd.extend(["-ac", str(audio_ctx)])
+
+            # Topic grammar constraining the decoder to known commands
+            if kwargs.get("grammar_path"):
+                cmd.extend(["--grammar", kwargs["grammar_path"]])
+                cmd.extend(["--grammar-rule", kwargs.get("grammar_rule") or "root"])
+                if kwargs.get("grammar_penalty") is not None:
+                    cmd.extend(["--grammar-penalty", str(kwargs["grammar_penalty"])])
+            if kwargs.get("prompt"):
+                cmd.extend(["--prompt", kwargs["prompt"]])
+
+            # Load-adaptive decoding quality (beam search vs greedy, fallback step)
+            if kwargs.get("beam_size"):
+                cmd.extend(["-bs", str(kwargs["beam_size"])])
+            if kwargs.get("best_of"):
+                cmd.extend(["-bo", str(kwargs["best_of"])])
+            if kwargs.get("temperature_inc") is not None:
+                cmd.extend(["-tpi", str(kwargs["temperature_inc"])])
+
+            # Thread count of a pinned inference worker (the CLI inherits its affinity)
+            if kwargs.get("threads"):
+                cmd.extend(["-t", str(kwargs["threads"])])
             
             # Run whisper.cpp
             logger.info(f"Running whisper.cpp: {' '.join(cmd)}")
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            # The CLI loads the model on every call, so the decode budget
+            # starts after a fixed load allowance
+            timeout = kwargs.get("decode_timeout")
+            if timeout:
+                timeout += self.LOAD_ALLOWANCE
+            try:
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                    timeout=timeout
+                )
+            except subprocess.TimeoutExpired:
+                # Runaway decode: the process is killed, freeing the GPU
+                logger.warning(f"whisper.cpp decode aborted after {timeout:.1f}s")
+                return {"text": "", "confidence": 0.0, "decode_aborted": "timeout"}
             
             # Parse text output from stdout
             # Whisper.cpp outputs the transcription directly to stdout
@@ -116,11 +162,9 @@ class WhisperCppModel:
             logger.debug(f"Whisper.cpp stdout (cleaned): {transcribed_text}")
             logger.debug(f"Whisper.cpp stderr: {result.stderr}")
             
-            # Create output dictionary
+            # Create output dictionary with decoder scores from the JSON output
             output = {"text": transcribed_text}
-            
-            # Add confidence score (whisper.cpp doesn't provide this directly)
-            output["confidence"] = 0.95 if output.get("text") else 0.0
+            output.update(self._parse_json_output(json_path, transcribed_text))
             
             logger.info(f"Transcription complete: {output.get('text', '')[:50]}...")
             return output
@@ -130,9 +174,45 @@ class WhisperCppModel:
             raise RuntimeError(f"Transcription failed: {e.stderr}")
             
         finally:
-            # Clean up temporary file
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+            # Clean up temporary files
+            for path in (tmp_path, json_path):
+                if os.path.exists(path):
+                    os.unlink(path)
+
+    @staticmethod
+    def _parse_json_output(json_path: str, fallback_text: str) -> Dict[str, Any]:
+        """Extract text, language and token scores from ``-ojf`` output.
+
+        Args:
+            json_path: Path of the JSON file written by whisper.cpp
+            fallback_text: Text parsed from stdout, used if JSON is unavailable
+
+        Returns:
+            Text, language and score fields
+        """
+        try:
+            with open(json_path) as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"No whisper.cpp JSON output, scores unavailable: {e}")
+            return scores_from_token_probs(fallback_text, [])
+
+        segments = data.get("transcription", [])
+        text = "".join(segment.get("text", "") for segment in segments).strip() or fallback_text
+        probs = [
+            token["p"]
+            for segment in segments
+            for token in segment.get("tokens", [])
+            # Skip special tokens ([_BEG_], [_TT_n], <|endoftext|>, ...)
+            if "p" in token and not token.get("text", "").startswith(("[_", "<|"))
+        ]
+
+        output = {"text": text}
+        output.update(scores_from_token_probs(text, probs))
+        language = data.get("result", {}).get("language")
+        if language:
+            output["language"] = language
+        return output
     
     def detect_language(self, audio_data: np.ndarray, sample_rate: int = 16000) -> Tuple[str, float]:
         """Detect language of audio.
@@ -0,0 +1,522 @@
+"""PyTorch Whisper wrapper exposing the same interface as the whisper.cpp backends.
+
+Importing this module pulls in torch and openai-whisper, so it must only be
+imported lazily by the PyTorch backend plugin.
+"""
+
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import torch
+import whisper
+from whisper.tokenizer import get_tokenizer
+
+from ..utils.logging import get_logger
+from .quantization import load_quantized
+from .scoring import build_scores, scores_from_segments
+from .speculative import greedy_decode, speculative_decode
+
+logger = get_logger(__name__)
+
+# openai-whisper never samples more than half of its text context
+SAMPLE_LEN = 224
+
+
+class WhisperDecoderSession:
+    """Incremental greedy decoder over one utterance (see speculative.DecoderSession).
+
+    Keeps its own key/value cache through openai-whisper's cache hooks, so
+    the model must not run other decodes while the session is open.
+    """
+
+    def __init__(
+        self,
+        model: "whisper.Whisper",
+        audio_features: torch.Tensor,
+        suppress_tokens: Sequence[int],
+        blank_tokens: Sequence[int],
+        sample_begin: int,
+        no_speech: Optional[int] = None,
+    ):
+        """Open a decoder session.
+
+        Args:
+            model: openai-whisper model
+            audio_features: Encoder output for the utterance
+            suppress_tokens: Tokens never generated
+            blank_tokens: Tokens suppressed at the first sampled position
+            sample_begin: Prompt length (first sampled position)
+            no_speech: No-speech token, whose probability is read at the start token
+        """
+        self.model = model
+        self.audio_features = audio_features
+        self.suppress_tokens = list(suppress_tokens)
+        self.blank_tokens = list(blank_tokens)
+        self.sample_begin = sample_begin
+        self.no_speech = no_speech
+        self.no_speech_prob: Optional[float] = None
+        self._tokens: List[int] = []
+        self.cache, self._hooks = model.install_kv_cache_hooks()
+        # Self-attention entries grow with the text; cross-attention ones do not
+        self._self_attn = [
+            module
+            for block in model.decoder.blocks
+            for module in (block.attn.key, block.attn.value)
+        ]
+
+    @property
+    def length(self) -> int:
+        return len(self._tokens)
+
+    def extend(self, tokens: Sequence[int]) -> List[Tuple[int, float]]:
+        tokens = list(tokens)
+        x = torch.tensor([tokens], device=self.audio_features.device)
+        with torch.no_grad():
+            logits = self.model.decoder(x, self.audio_features, kv_cache=self.cache)[0].float()
+
+        if self.length == 0 and self.no_speech is not None:
+            self.no_speech_prob = float(logits[0].softmax(dim=-1)[self.no_speech])
+        logits[:, self.suppress_tokens] = -np.inf
+
+        predictions = []
+        for i, row in enumerate(logits):
+            if self.length + i + 1 == self.sample_begin:
+                row = row.clone()
+                row[self.blank_tokens] = -np.inf
+            token = int(row.argmax())
+            predictions.append((token, float(row.log_softmax(dim=-1)[token])))
+        self._tokens.extend(tokens)
+        return predictions
+
+    def truncate(self, length: int) -> None:
+        for module in self._self_attn:
+            if module in self.cache:
+                self.cache[module] = self.cache[module][:, :length]
+        del self._tokens[length:]
+
+    def close(self) -> None:
+        """Remove the cache hooks from the model."""
+        for hook in self._hooks:
+            hook.remove()
+        self.cache.clear()
+
+
+class PyTorchWhisperModel:
+    """Adapter around an openai-whisper model."""
+
+    def __init__(
+        self,
+        model_size: str = "base",
+        device: str = "cpu",
+        download_root: Optional[str] = None,
+        quantization: Optional[str] = None,
+        quantized_cache_dir: Optional[Path] = None,
+    ):
+        """Load a PyTorch Whisper model.
+
+        Args:
+            model_size: openai-whisper model size (tiny, base, small, ...)
+            device: Requested device (cuda or cpu)
+            download_root: Directory for downloaded checkpoints
+            quantization: "int8" for dynamic int8 Linear layers (CPU only)
+            quantized_cache_dir: Directory caching quantized models (None: no cache)
+        """
+        self.model_size = model_size
+        self.device = self._resolve_device(device)
+        # openai-whisper decodes through module hooks, so one decode at a time
+        self._lock = threading.Lock()
+        self.quantization: Optional[Dict[str, Any]] = None
+
+        if quantization and self.device != "cpu":
+            logger.warning(f"{quantization} quantization runs on CPU only; loading {model_size} unquantized on {self.device}")
+            quantization = None
+
+        logger.info(f"Loading PyTorch Whisper model: {model_size} on {self.device} ({quantization or 'fp32'})")
+        if quantization:
+            self.model, self.quantization = load_quantized(
+                model_size, download_root, quantization, quantized_cache_dir
+            )
+        else:
+            self.model = whisper.load_model(
+                model_size,
+                device=self.device,
+                download_root=download_root,
+            )
+
+    @staticmethod
+    def _resolve_device(device: str) -> str:
+        """Get PyTorch device based on configuration and availability."""
+        if device == "cpu":
+            return "cpu"
+
+        if torch.cuda.is_available():
+            logger.info("CUDA available, using GPU")
+            return "cuda"
+
+        logger.warning("CUDA not available, falling back to CPU")
+        return "cpu"
+
+    def transcribe(
+        self,
+        audio_data: np.ndarray,
+        sample_rate: int = 16000,
+        language: Optional[str] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Transcribe audio using the PyTorch model.
+
+        Args:
+            audio_data: Audio samples as numpy array
+            sample_rate: Sample rate (must be 16000)
+            language: Language code (e.g., 'en', 'es')
+            **kwargs: Additional decoding options passed to whisper
+
+        Returns:
+            Dictionary with transcription results and decoder scores
+        """
+        if sample_rate != 16000:
+            raise ValueError(f"Sample rate must be 16000, got {sample_rate}")
+
+        draft = kwargs.pop("draft_model", None)
+        if draft is not None and self._can_speculate(draft, audio_data, kwargs):
+            return self.decode_greedy(
+                audio_data,
+                language=language,
+                task=kwargs.get("task", "transcribe"),
+                max_tokens=kwargs.get("max_tokens"),
+                draft=draft,
+                k=kwargs.get("speculative_k", 4),
+            )
+        kwargs.pop("speculative_k", None)
+
+        task = kwargs.pop("task", "transcribe")
+        # openai-whisper's encoder has a fixed 30 s positional embedding
+        kwargs.pop("audio_ctx", None)
+        decode_options = {}
+        if kwargs.get("max_tokens"):
+            # Decode budget: maximum tokens sampled per 30 s window
+            decode_options["sample_len"] = kwargs["max_tokens"]
+        if kwargs.get("prompt"):
+            # Topic phrase list biases decoding (no grammar support here)
+            decode_options["initial_prompt"] = kwargs["prompt"]
+        if kwargs.get("beam_size"):
+            # beam_size 1 is greedy; openai-whisper wants None for that
+            decode_options["beam_size"] = kwargs["beam_size"] if kwargs["beam_size"] > 1 else None
+        if kwargs.get("best_of"):
+            decode_options["best_of"] = kwargs["best_of"]
+        if kwargs.get("temperature_inc"):
+            # Temperature fallback schedule 0.0, inc, 2*inc, ... 1.0
+            decode_options["temperature"] = tuple(
+                float(t) for t in np.arange(0.0, 1.0 + 1e-6, kwargs["temperature_inc"]).round(2)
+            )
+        with self._lock:
+            result = self.model.transcribe(
+                audio_data.astype(np.float32),
+                language=language,
+                task=task,
+                fp16=self.device == "cuda",
+                **decode_options,
+            )
+
+        text = result.get("text", "").strip()
+        output = {
+            "text": text,
+            "language": result.get("language", language),
+        }
+        output.update(scores_from_segments(text, result.get("segments", [])))
+        return output
+
+    def _can_speculate(self, draft: "PyTorchWhisperModel", audio_data: np.ndarray, options: Dict[str, Any]) -> bool:
+        """Whether a request can use speculative greedy decoding with a draft."""
+        if (options.get("beam_size") or 1) > 1 or options.get("prompt"):
+            return False
+        if len(audio_data) > whisper.audio.N_SAMPLES:
+            # Long-form audio needs whisper's sliding window
+            return False
+        if draft.model.dims.n_vocab != self.model.dims.n_vocab:
+            logger.warning(
+                f"Draft model {draft.model_size} does not share the tokenizer of "
+                f"{self.model_size}; speculative decoding disabled"
+            )
+            return False
+        return True
+
+    def _embed(self, audio: np.ndarray) -> torch.Tensor:
+        """Run the encoder on 30 s of padded audio."""
+        mel = whisper.log_mel_spectrogram(audio, n_mels=self.model.dims.n_mels)
+        dtype = torch.float16 if self.device == "cuda" else torch.float32
+        with torch.no_grad():
+            return self.model.embed_audio(mel.unsqueeze(0).to(self.model.device, dtype))
+
+    def _suppress_tokens(self, tokenizer) -> List[int]:
+        """whisper's default token suppression, without timestamps."""
+        suppress = set(tokenizer.non_speech_tokens)
+        suppress.update([
+            tokenizer.transcribe, tokenizer.translate, tokenizer.sot,
+            tokenizer.sot_prev, tokenizer.sot_lm, tokenizer.no_speech,
+        ])
+        # No timestamps are requested
+        suppress.update(range(tokenizer.timestamp_begin, self.model.dims.n_vocab))
+        return sorted(suppress)
+
+    def _session(self, features: torch.Tensor, tokenizer, sample_begin: int) -> WhisperDecoderSession:
+        """Open a decoder session with whisper's default token suppression."""
+        return WhisperDecoderSession(
+            self.model,
+            features,
+            suppress_tokens=self._suppress_tokens(tokenizer),
+            blank_tokens=tokenizer.encode(" ") + [tokenizer.eot],
+            sample_begin=sample_begin,
+            no_speech=tokenizer.no_speech,
+        )
+
+    def decode_greedy(
+        self,
+        audio_data: np.ndarray,
+        language: Optional[str] = None,
+        task: str = "transcribe",
+        max_tokens: Optional[int] = None,
+        draft: Optional["PyTorchWhisperModel"] = None,
+        k: int = 4,
+    ) -> Dict[str, Any]:
+        """Greedy decoding of up to 30 s of audio, optionally speculative.
+
+        With a draft model, the draft proposes ``k`` tokens at a time and
+        this model verifies them in one decoder pass; the text is identical
+        to plain greedy decoding. The encoder output of this model is
+        computed once and reused by every verification pass. Temperature
+        fallback is not applied.
+
+        Args:
+            audio_data: Audio samples at 16 kHz
+            language: Language code (detected if None)
+            task: transcribe or translate
+            max_tokens: Token budget (default: whisper's sample length)
+            draft: Smaller model sharing this model's tokenizer
+            k: Tokens proposed per round
+
+        Returns:
+            Transcription result with decoder scores and a ``speculative``
+            entry with pass counts and the acceptance rate
+        """
+        audio = whisper.pad_or_trim(audio_data.astype(np.float32))
+        max_tokens = min(max_tokens or SAMPLE_LEN, SAMPLE_LEN)
+
+        # Lock order is always target, then draft
+        with self._lock:
+            features = self._embed(audio)
+            if language is None and self.model.is_multilingual:
+                _, probs = self.model.detect_language(features)
+                language = max(probs[0], key=probs[0].get)
+            tokenizer = get_tokenizer(
+                self.model.is_multilingual,
+                num_languages=self.model.num_languages,
+                language=language or "en",
+                task=task,
+            )
+            prompt = list(tokenizer.sot_sequence_including_notimestamps)
+            target = self._session(features, tokenizer, len(prompt))
+
+            try:
+                if draft is None:
+                    output = greedy_decode(target, prompt, tokenizer.eot, max_tokens)
+                else:
+                    with draft._lock:
+                        draft_session = draft._session(draft._embed(audio), tokenizer, len(prompt))
+                        try:
+                            output = speculative_decode(
+                                target, draft_session, prompt, tokenizer.eot, max_tokens, k
+                            )
+                        finally:
+                            draft_session.close()
+            finally:
+                target.close()
+
+        text = tokenizer.decode(output.tokens).strip()
+        avg_logprob = sum(output.logprobs) / len(output.logprobs) if output.logprobs else None
+        result = {"text": text, "language": language}
+        result.update(build_scores(text, avg_logprob, target.no_speech_prob, tokens=len(output.tokens)))
+        result["speculative"] = {
+            "draft_model": draft.model_size if draft else None,
+            "target_passes": output.target_passes,
+            "draft_passes": output.draft_passes,
+            "acceptance_rate": output.acceptance_rate,
+            "decode_time": output.elapsed,
+        }
+        return result
+
+    def batch_key(
+        self,
+        audio_data: np.ndarray,
+        sample_rate: int,
+        language: Optional[str],
+        options: Dict[str, Any],
+    ) -> Optional[Tuple[Any, ...]]:
+        """Group key for ``transcribe_batch``, or None if the request needs ``transcribe``.
+
+        Batched decoding is greedy over one 30 s window, so beam search,
+        prompts, speculative decoding and long-form audio are not batched.
+        """
+        if sample_rate != 16000 or len(audio_data) > whisper.audio.N_SAMPLES:
+            return None
+        if (options.get("beam_size") or 1) > 1 or (options.get("best_of") or 1) > 1:
+            return None
+        if options.get("prompt") or options.get("draft_model") is not None:
+            return None
+        return (language, options.get("task", "transcribe"))
+
+    def transcribe_batch(
+        self,
+        audio_batch: Sequence[np.ndarray],
+        language: Optional[str] = None,
+        options: Sequence[Dict[str, Any]] = (),
+    ) -> List[Dict[str, Any]]:
+        """Greedy decoding of several utterances in one encoder and decoder batch.
+
+        Each utterance is padded to 30 s; the decoder runs until every
+        utterance has produced end-of-text or used its own token budget.
+        Temperature fallback is not applied.
+
+        Args:
+            audio_batch: Audio samples at 16 kHz (up to 30 s each)
+            language: Language code shared by the batch (detected per utterance if None)
+            options: Per-utterance decode options sharing one ``batch_key``
+                (``task`` and ``max_tokens`` are used)
+
+        Returns:
+            One transcription result with decoder scores per utterance
+        """
+        options = list(options) or [{} for _ in audio_batch]
+        task = options[0].get("task", "transcribe")
+        budgets = [min(o.get("max_tokens") or SAMPLE_LEN, SAMPLE_LEN) for o in options]
+        dtype = torch.float16 if self.device == "cuda" else torch.float32
+
+        with self._lock:
+            mel = torch.stack([
+                whisper.log_mel_spectrogram(whisper.pad_or_trim(audio.astype(np.float32)), n_mels=self.model.dims.n_mels)
+                for audio in audio_batch
+            ])
+            with torch.no_grad():
+                features = self.model.embed_audio(mel.to(self.model.device, dtype))
+                if language is None and self.model.is_multilingual:
+                    _, probs = self.model.detect_language(features)
+                    languages = [max(p, key=p.get) for p in probs]
+                else:
+                    languages = [language or "en"] * len(audio_batch)
+
+            tokenizers = [
+                get_tokenizer(
+                    self.model.is_multilingual,
+                    num_languages=self.model.num_languages,
+                    language=lang,
+                    task=task,
+                )
+                for lang in languages
+            ]
+            outputs = self._greedy_batch(features, tokenizers, budgets)
+
+        results = []
+        for tokenizer, lang, (tokens, logprobs, no_speech_prob) in zip(tokenizers, languages, outputs):
+            text = tokenizer.decode(tokens).strip()
+            avg_logprob = sum(logprobs) / len(logprobs) if logprobs else None
+            result = {"text": text, "language": lang}
+            result.update(build_scores(text, avg_logprob, no_speech_prob, tokens=len(tokens)))
+            results.append(result)
+        return results
+
+    def _greedy_batch(
+        self,
+        features: torch.Tensor,
+        tokenizers: Sequence[Any],
+        budgets: Sequence[int],
+    ) -> List[Tuple[List[int], List[float], Optional[float]]]:
+        """Batched greedy decoding with a shared key/value cache (lock held).
+
+        Prompts of one model have the same length for every language, so
+        the batch advances one token per decoder pass; finished utterances
+        are fed end-of-text until the batch completes.
+
+        Returns:
+            Per utterance: generated tokens (without end-of-text), their
+            log-probabilities and the no-speech probability
+        """
+        reference = tokenizers[0]
+        eot = reference.eot
+        suppress = self._suppress_tokens(reference)
+        blank = reference.encode(" ") + [eot]
+        prompts = [list(t.sot_sequence_including_notimestamps) for t in tokenizers]
+
+        n = len(prompts)
+        tokens: List[List[int]] = [[] for _ in range(n)]
+        logprobs: List[List[float]] = [[] for _ in range(n)]
+        done = [False] * n
+        no_speech_probs: List[Optional[float]] = [None] * n
+
+        cache, hooks = self.model.install_kv_cache_hooks()
+        try:
+            x = torch.tensor(prompts, device=features.device)
+            first = True
+            with torch.no_grad():
+                while not all(done):
+                    logits = self.model.decoder(x, features, kv_cache=cache).float()
+                    step = logits[:, -1]
+                    if first:
+                        # No-speech probability is read at the start token
+                        no_speech_probs = [float(p) for p in logits[:, 0].softmax(dim=-1)[:, reference.no_speech]]
+                        step[:, blank] = -np.inf
+                        first = False
+                    step[:, suppress] = -np.inf
+                    log_probs = step.log_softmax(dim=-1)
+                    next_tokens = step.argmax(dim=-1)
+
+                    for i in range(n):
+                        if done[i]:
+                            next_tokens[i] = eot
+                            continue
+                        token = int(next_tokens[i])
+                        if token == eot:
+                            done[i] = True
+                            continue
+                        tokens[i].append(token)
+                        logprobs[i].append(float(log_probs[i, token]))
+                        if len(tokens[i]) >= budgets[i]:
+                            done[i] = True
+                    x = next_tokens.unsqueeze(1)
+        finally:
+            for hook in hooks:
+                hook.remove()
+            cache.clear()
+
+        return list(zip(tokens, logprobs, no_speech_probs))
+
+    def detect_language(
+        self, audio_data: np.ndarray, sample_rate: int = 16000
+    ) -> Tuple[str, float]:
+        """Detect language of audio.
+
+        Args:
+            audio_data: Audio samples
+            sample_rate: Sample rate
+
+        Returns:
+            Tuple of (language_code, confidence)
+        """
+        audio = whisper.pad_or_trim(audio_data.astype(np.float32))
+        mel = whisper.log_mel_spectrogram(audio, n_mels=self.model.dims.n_mels)
+        _, probs = self.model.detect_language(mel.to(self.model.device))
+        language = max(probs, key=probs.get)
+        return language, float(probs[language])
+
+    @property
+    def is_multilingual(self) -> bool:
+        """Check if model supports multiple languages."""
+        return self.model.is_multilingual
+
+    def close(self) -> None:
+        """Release model memory (after any decode in progress)."""
+        with self._lock:
+            self.model = None
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
@@ -5,18 +5,33 @@ eliminating subprocess overhead and keeping the model loaded in memory.
 """
 
 import io
+import os
+import threading
 import time
 import wave
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import requests
 
+from ..core.circuit_breaker import CircuitBreaker, CircuitOpenError
 from ..utils.logging import get_logger
+from .hedging import HedgePolicy
+from .scoring import scores_from_segments
 
 logger = get_logger(__name__)
 
+# Vocabulary bias the whisper-server is started with (--prompt $WHISPER_PROMPT)
+DEFAULT_PROMPT = "lounge cabinet lights kitchen bedroom bathroom office"
+
+
+def default_prompt() -> str:
+    """Configured whisper-server prompt (``WHISPER_PROMPT`` or the default)."""
+    return os.environ.get("WHISPER_PROMPT", DEFAULT_PROMPT)
+
 
 class WhisperServerModel:
     """HTTP client for whisper-server inference."""
@@ -26,6 +41,10 @@ class WhisperServerModel:
         server_url: str = "http://localhost:8080",
         timeout: float = 30.0,
         language: str = "en",
+        hedge_urls: Optional[List[str]] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        prompt: Optional[str] = None,
     ):
         """Initialize whisper-server client.
 
@@ -33,15 +52,90 @@ class WhisperServerModel:
             server_url: Base URL of whisper-server (e.g., http://localhost:8080)
             timeout: Request timeout in seconds
             language: Default language for transcription
+            hedge_urls: Other whisper-servers running the same model that
+                slow requests may be hedged to
+            hedge_policy: Hedging policy (hedging is off without one)
+            breaker: Circuit breaker shared with the server manager
+                (None: requests are always sent)
+            prompt: Vocabulary prompt sent with every request, ahead of a
+                topic's phrase list (default from ``WHISPER_PROMPT``)
         """
         self.server_url = server_url.rstrip("/")
         self.inference_url = f"{self.server_url}/inference"
         self.timeout = timeout
         self.default_language = language
         self._session = requests.Session()
+        self.hedge_urls = [url.rstrip("/") for url in hedge_urls or []]
+        self.hedge_policy = hedge_policy
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        self.breaker = breaker
+        self.prompt = default_prompt() if prompt is None else prompt
+
+        # In-flight requests per server URL, used to drain a server before
+        # it is stopped during a blue/green model switch
+        self._inflight: Dict[str, int] = defaultdict(int)
+        self._inflight_cond = threading.Condition()
 
         logger.info(f"WhisperServerModel initialized: {self.inference_url}")
 
+    def repoint(self, server_url: str) -> None:
+        """Atomically point new requests at a different whisper-server.
+
+        Requests already in flight keep using the server they started on.
+
+        Args:
+            server_url: Base URL of the new whisper-server
+        """
+        with self._inflight_cond:
+            old_url = self.server_url
+            self.server_url = server_url.rstrip("/")
+            self.inference_url = f"{self.server_url}/inference"
+        logger.info(f"WhisperServerModel repointed: {old_url} -> {self.server_url}")
+
+    def _begin_request(self, server_url: Optional[str] = None) -> Tuple[str, str]:
+        """Register an in-flight request and return the URLs it must use.
+
+        Args:
+            server_url: Server to use (default: the current one)
+        """
+        with self._inflight_cond:
+            server_url = server_url or self.server_url
+            self._inflight[server_url] += 1
+            return server_url, f"{server_url}/inference"
+
+    def _end_request(self, server_url: str) -> None:
+        """Mark an in-flight request as finished."""
+        with self._inflight_cond:
+            self._inflight[server_url] -= 1
+            if self._inflight[server_url] <= 0:
+                del self._inflight[server_url]
+            self._inflight_cond.notify_all()
+
+    def inflight(self, server_url: Optional[str] = None) -> int:
+        """Number of requests in flight against a server (default: current)."""
+        with self._inflight_cond:
+            return self._inflight.get((server_url or self.server_url).rstrip("/"), 0)
+
+    def wait_for_drain(self, server_url: str, timeout: float = 30.0) -> bool:
+        """Wait until no requests are in flight against a server.
+
+        Args:
+            server_url: Base URL of the server being drained
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if drained, False on timeout
+        """
+        server_url = server_url.rstrip("/")
+        deadline = time.time() + timeout
+        with self._inflight_cond:
+            while self._inflight.get(server_url, 0) > 0:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return False
+                self._inflight_cond.wait(remaining)
+        return True
+
     def _audio_to_wav_bytes(
         self, audio_data: np.ndarray, sample_rate: int
     ) -> bytes:
@@ -83,22 +177,31 @@ class WhisperServerModel:
             audio_data: Audio samples as numpy array
             sample_rate: Sample rate (must be 16000 for Whisper)
             language: Language code (e.g., 'en', 'es')
-            **kwargs: Additional arguments (ignored for compatibility)
+            **kwargs: Decode options (audio_ctx, decode_timeout, beam_size,
+                best_of, temperature_inc, prompt); others ignored
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open (no request sent)
+            RuntimeError: If whisper-server cannot be reached or fails
 
         Returns:
             Dictionary with transcription results:
                 - text: Transcribed text
-                - confidence: Confidence score (estimated)
+                - confidence: Geometric mean token probability
+                - avg_logprob / no_speech_prob / compression_ratio: Decoder scores
         """
         if sample_rate != 16000:
             raise ValueError(f"Sample rate must be 16000, got {sample_rate}")
 
+        if self.breaker is not None and not self.breaker.allow():
+            raise CircuitOpenError(f"whisper-server circuit is {self.breaker.state}, not sending request")
+
         # Convert audio to WAV bytes
         wav_bytes = self._audio_to_wav_bytes(audio_data, sample_rate)
 
         # Prepare form data
-        files = {"file": ("audio.wav", wav_bytes, "audio/wav")}
-        data = {"response_format": "json"}
+        # verbose_json includes per-segment avg_logprob and no_speech_prob
+        data = {"response_format": "verbose_json"}
 
         # Add language if specified
         if language:
@@ -106,14 +209,75 @@ class WhisperServerModel:
         elif self.default_language:
             data["language"] = self.default_language
 
+        # whisper-server keeps request parameters between requests, so the
+        # encoder window is always sent (0 = full 30 s)
+        data["audio_ctx"] = str(kwargs.get("audio_ctx") or 0)
+        # No max_tokens option: max_context limits the prompt, not the
+        # generated text, so decodes are bounded by decode_timeout and the
+        # repetition guard. Always sent so the server's default is kept
+        data["max_context"] = "-1"
+        # whisper-server has no per-request grammar; a topic's phrase list
+        # is appended to the configured prompt instead. Always sent: the
+        # server would otherwise keep the previous topic's phrases
+        data["prompt"] = ". ".join(p for p in (self.prompt, kwargs.get("prompt")) if p)
+        # Load-adaptive decoding quality; only sent when the degradation
+        # controller is enabled, which then sends it on every request
+        for option in ("beam_size", "best_of", "temperature_inc"):
+            if kwargs.get(option) is not None:
+                data[option] = str(kwargs[option])
+        decode_timeout = kwargs.get("decode_timeout")
+
+        try:
+            if self.hedge_policy is not None and self._hedge_target() is not None:
+                result = self._transcribe_hedged(wav_bytes, data, decode_timeout, len(audio_data) / sample_rate)
+            else:
+                result = self._post(wav_bytes, data, decode_timeout)
+        except RuntimeError as e:
+            if self.breaker is not None:
+                self.breaker.record_failure(str(e))
+            raise
+        if self.breaker is not None:
+            if result.get("decode_aborted") == "abandoned":
+                # A server that stops answering within the decode budget is
+                # as sick as one that refuses connections
+                self.breaker.record_failure("decode timed out")
+            else:
+                self.breaker.record_success()
+        return result
+
+    def _post(
+        self,
+        wav_bytes: bytes,
+        data: Dict[str, str],
+        decode_timeout: Optional[float],
+        server_url: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Send one inference request and parse the response.
+
+        Args:
+            wav_bytes: Audio as WAV
+            data: Form fields
+            decode_timeout: Decode budget in seconds (None: client timeout only)
+            server_url: Server to send to (default: the current one)
+
+        Returns:
+            Transcription result
+        """
+        files = {"file": ("audio.wav", wav_bytes, "audio/wav")}
+        server_url, inference_url = self._begin_request(server_url)
         start_time = time.time()
 
         try:
+            timeout = self.timeout
+            if decode_timeout:
+                # The server decodes one request at a time, so allow a decode
+                # budget for every request queued on it (including this one)
+                timeout = min(self.timeout, decode_timeout * max(self.inflight(server_url), 1))
             response = self._session.post(
-                self.inference_url,
+                inference_url,
                 files=files,
                 data=data,
-                timeout=self.timeout,
+                timeout=timeout,
             )
             response.raise_for_status()
 
@@ -127,26 +291,126 @@ class WhisperServerModel:
                 f"Transcription complete in {elapsed:.3f}s: {text[:50]}..."
             )
 
-            return {
-                "text": text,
-                "confidence": 0.95 if text else 0.0,
-                "inference_time": elapsed,
-            }
+            output = {"text": text, "inference_time": elapsed}
+            output.update(scores_from_segments(text, result.get("segments", [])))
+            return output
 
         except requests.exceptions.Timeout:
+            if decode_timeout and timeout < self.timeout:
+                # Only the wait is cut short: whisper-server cannot cancel a
+                # request and keeps decoding it. The caller gets an empty
+                # result marked as abandoned instead of an error
+                logger.warning(
+                    f"Abandoned whisper-server request after {timeout:.1f}s "
+                    "(the server is still decoding it)"
+                )
+                return {"text": "", "confidence": 0.0, "decode_aborted": "abandoned"}
             logger.error(f"Whisper-server request timed out after {self.timeout}s")
             raise RuntimeError("Transcription timed out")
 
         except requests.exceptions.ConnectionError as e:
             logger.error(f"Failed to connect to whisper-server: {e}")
             raise RuntimeError(
-                f"Cannot connect to whisper-server at {self.server_url}"
+                f"Cannot connect to whisper-server at {server_url}"
             )
 
         except requests.exceptions.HTTPError as e:
             logger.error(f"Whisper-server HTTP error: {e}")
             raise RuntimeError(f"Transcription failed: {e}")
 
+        finally:
+            self._end_request(server_url)
+
+    def _hedge_target(self) -> Optional[str]:
+        """Least busy other worker a request could be hedged to."""
+        with self._inflight_cond:
+            candidates = [url for url in self.hedge_urls if url != self.server_url]
+            if not candidates:
+                return None
+            return min(candidates, key=lambda url: self._inflight.get(url, 0))
+
+    def _submit(
+        self,
+        wav_bytes: bytes,
+        data: Dict[str, str],
+        decode_timeout: Optional[float],
+        server_url: Optional[str],
+        duration: float,
+        primary: bool,
+    ) -> Future:
+        """Start a request on the hedging pool, recording its latency when done."""
+        if self._hedge_executor is None:
+            self._hedge_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="whisper-hedge")
+        policy = self.hedge_policy
+        started = time.time()
+        future = self._hedge_executor.submit(self._post, wav_bytes, data, decode_timeout, server_url)
+
+        def record(done: Future) -> None:
+            latency = time.time() - started
+            if done.cancelled() or done.exception() is not None:
+                return
+            policy.record_attempt(duration, latency)
+            if primary:
+                policy.record_primary(latency)
+
+        future.add_done_callback(record)
+        return future
+
+    def _transcribe_hedged(
+        self,
+        wav_bytes: bytes,
+        data: Dict[str, str],
+        decode_timeout: Optional[float],
+        duration: float,
+    ) -> Dict[str, Any]:
+        """Send a request, duplicating it to another worker if it is slow.
+
+        The primary gets the duration bucket's p95 latency to answer; after
+        that a hedge goes to the least busy other worker if the budget
+        allows. The first successful answer wins. whisper-server does not
+        notice a client going away, so the losing request is abandoned
+        rather than aborted: its result is discarded when it arrives.
+
+        Args:
+            wav_bytes: Audio as WAV
+            data: Form fields
+            decode_timeout: Decode budget in seconds
+            duration: Audio duration in seconds
+
+        Returns:
+            Transcription result (``hedged`` names the winner if a hedge was sent)
+        """
+        policy = self.hedge_policy
+        start = time.time()
+        primary = self._submit(wav_bytes, data, decode_timeout, None, duration, primary=True)
+        attempts = {primary: "primary"}
+
+        delay = policy.delay(duration)
+        if delay is not None:
+            done, _ = wait([primary], timeout=delay)
+            hedge_url = self._hedge_target()
+            if not done and hedge_url is not None and policy.try_hedge():
+                logger.info(f"Hedging request to {hedge_url} after {delay:.2f}s")
+                attempts[self._submit(wav_bytes, data, decode_timeout, hedge_url, duration, primary=False)] = "hedge"
+        hedged = len(attempts) > 1
+
+        error: Optional[BaseException] = None
+        while attempts:
+            done, _ = wait(attempts, return_when=FIRST_COMPLETED)
+            for future in done:
+                label = attempts.pop(future)
+                if future.exception() is not None:
+                    error = future.exception()
+                    continue
+                for loser in attempts:
+                    loser.cancel()
+                policy.record_request(time.time() - start, hedged, label)
+                result = future.result()
+                if hedged:
+                    result["hedged"] = label
+                return result
+        raise error
+
     def detect_language(
         self, audio_data: np.ndarray, sample_rate: int = 16000
     ) -> Tuple[str, float]:
@@ -0,0 +1,283 @@
+"""CPU-affinity-aware inference worker pool.
+
+On CPU nodes, whisper.cpp, PyTorch and NumPy preprocessing otherwise
+compete for the same cores (torch threads x concurrent requests). In this
+mode inference runs in separate worker processes, each pinned to its own
+core set with ``os.sched_setaffinity`` and limited to that many threads
+(torch intra-op threads, OpenMP/BLAS threads and whisper.cpp ``-t``).
+Requests go to the worker with the fewest requests in flight.
+
+The pool is a backend (``worker-pool``) wrapping another backend, so it is
+selected like any other backend and the rest of the service is unchanged.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from ..config.settings import ModelConfig, WorkerPoolConfig
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Whisper's CPU decoding stops scaling well beyond this many threads
+MAX_AUTO_THREADS = 4
+
+# Thread-count environment variables read by BLAS/OpenMP when they load (the
+# worker imports numpy before its initializer runs, so they are set at spawn)
+THREAD_ENV_VARS = ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS", "NUMEXPR_NUM_THREADS")
+
+
+def available_cores() -> List[int]:
+    """Cores this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def plan_workers(
+    cores: List[int],
+    workers: int = 0,
+    threads_per_worker: int = 0,
+    reserved_cores: int = 1,
+) -> List[List[int]]:
+    """Split cores into one core set per worker.
+
+    Args:
+        cores: Cores available to the service
+        workers: Worker count (0: as many as fit)
+        threads_per_worker: Cores per worker (0: up to MAX_AUTO_THREADS)
+        reserved_cores: Cores left to the API process (preprocessing,
+            event loop), only when more than two cores are available
+
+    Returns:
+        Core set per worker (contiguous, non-overlapping where possible)
+    """
+    if len(cores) > 2:
+        cores = cores[:len(cores) - min(reserved_cores, len(cores) - 1)]
+    if threads_per_worker <= 0:
+        per = max(1, len(cores) // workers) if workers > 0 else min(MAX_AUTO_THREADS, len(cores))
+    else:
+        per = threads_per_worker
+    per = max(1, min(per, len(cores)))
+    if workers <= 0:
+        workers = max(1, len(cores) // per)
+
+    plan = []
+    for i in range(workers):
+        start = (i * per) % len(cores)
+        core_set = [cores[(start + j) % len(cores)] for j in range(per)]
+        plan.append(sorted(set(core_set)))
+    return plan
+
+
+@contextmanager
+def _thread_env(threads: int) -> Iterator[None]:
+    """Set THREAD_ENV_VARS for processes started in the block, then restore them."""
+    saved = {var: os.environ.get(var) for var in THREAD_ENV_VARS}
+    os.environ.update({var: str(threads) for var in THREAD_ENV_VARS})
+    try:
+        yield
+    finally:
+        for var, value in saved.items():
+            if value is None:
+                os.environ.pop(var, None)
+            else:
+                os.environ[var] = value
+
+
+# Model instance of the current worker process
+_worker_model: Any = None
+_worker_threads: int = 1
+
+
+def _init_worker(
+    core_set: List[int],
+    backend: str,
+    config: ModelConfig,
+    model_name: str,
+    device: str,
+) -> None:
+    """Pin the worker, limit its threads and load its model."""
+    global _worker_model, _worker_threads
+
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, core_set)
+    threads = len(core_set)
+    _worker_threads = threads
+
+    from .backends import get_backend_plugin
+
+    plugin = get_backend_plugin(backend)
+    if plugin.in_process:
+        import torch
+
+        torch.set_num_threads(threads)
+        torch.set_num_interop_threads(1)
+    _worker_model = plugin.create(config, model_name, device)
+
+
+def _worker_transcribe(audio_data: np.ndarray, sample_rate: int, language: Optional[str], kwargs: Dict[str, Any]):
+    # ``threads`` is read by whisper.cpp (-t); in-process backends ignore it
+    return _worker_model.transcribe(
+        audio_data, sample_rate=sample_rate, language=language, threads=_worker_threads, **kwargs
+    )
+
+
+def _worker_detect_language(audio_data: np.ndarray, sample_rate: int) -> Tuple[str, float]:
+    return _worker_model.detect_language(audio_data, sample_rate)
+
+
+def _worker_ready() -> bool:
+    return _worker_model is not None
+
+
+@dataclass
+class _Worker:
+    index: int
+    cores: List[int]
+    executor: ProcessPoolExecutor
+    inflight: int = 0
+    completed: int = 0
+
+
+class WorkerPoolModel:
+    """Dispatches requests to pinned single-process workers."""
+
+    def __init__(
+        self,
+        pool_config: WorkerPoolConfig,
+        model_config: ModelConfig,
+        model_name: str,
+        device: str = "cpu",
+    ):
+        """Start the worker processes and load a model in each.
+
+        Args:
+            pool_config: Worker pool configuration
+            model_config: Model configuration
+            model_name: Model to load in every worker
+            device: Device (the pool is meant for cpu)
+        """
+        self.backend = pool_config.backend
+        self.model_name = model_name
+        self._lock = threading.Lock()
+        plan = plan_workers(
+            available_cores(),
+            pool_config.workers,
+            pool_config.threads_per_worker,
+            pool_config.reserved_cores,
+        )
+        # Spawned rather than forked: the API process runs threads
+        context = multiprocessing.get_context("spawn")
+        # One single-process executor per worker, so each gets its own core set
+        self._workers = [
+            _Worker(
+                index=i,
+                cores=cores,
+                executor=ProcessPoolExecutor(
+                    max_workers=1,
+                    mp_context=context,
+                    initializer=_init_worker,
+                    initargs=(cores, self.backend, model_config, model_name, device),
+                ),
+            )
+            for i, cores in enumerate(plan)
+        ]
+        # The first submit starts the worker process, which inherits the
+        # thread limits; load the model in every worker before accepting requests
+        ready = []
+        for worker in self._workers:
+            with _thread_env(len(worker.cores)):
+                ready.append(worker.executor.submit(_worker_ready))
+        try:
+            for future in ready:
+                future.result()
+        except BrokenProcessPool as e:
+            # The worker's own traceback (initializer failure) is on stderr
+            self.close()
+            raise RuntimeError(f"Worker pool failed to load {self.backend}/{model_name}") from e
+        logger.info(
+            f"Worker pool started: {len(self._workers)} x {self.backend}/{model_name}, "
+            f"core sets {[w.cores for w in self._workers]}"
+        )
+
+    def _acquire(self) -> _Worker:
+        """Pick the worker with the fewest requests in flight."""
+        with self._lock:
+            worker = min(self._workers, key=lambda w: (w.inflight, w.completed))
+            worker.inflight += 1
+            return worker
+
+    def _release(self, worker: _Worker) -> None:
+        with self._lock:
+            worker.inflight -= 1
+            worker.completed += 1
+
+    def transcribe(
+        self,
+        audio_data: np.ndarray,
+        sample_rate: int = 16000,
+        language: Optional[str] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Transcribe on the least busy worker (blocking)."""
+        worker = self._acquire()
+        try:
+            result = worker.executor.submit(_worker_transcribe, audio_data, sample_rate, language, kwargs).result()
+        finally:
+            self._release(worker)
+        result["worker"] = worker.index
+        return result
+
+    async def transcribe_async(
+        self,
+        audio_data: np.ndarray,
+        sample_rate: int = 16000,
+        language: Optional[str] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Transcribe on the least busy worker without blocking the event loop."""
+        worker = self._acquire()
+        try:
+            future = worker.executor.submit(_worker_transcribe, audio_data, sample_rate, language, kwargs)
+            result = await asyncio.wrap_future(future)
+        finally:
+            self._release(worker)
+        result["worker"] = worker.index
+        return result
+
+    def detect_language(self, audio_data: np.ndarray, sample_rate: int = 16000) -> Tuple[str, float]:
+        """Detect language on the least busy worker."""
+        worker = self._acquire()
+        try:
+            return worker.executor.submit(_worker_detect_language, audio_data, sample_rate).result()
+        finally:
+            self._release(worker)
+
+    @property
+    def is_multilingual(self) -> bool:
+        """Check if model supports multiple languages."""
+        return ".en" not in self.model_name
+
+    def get_status(self) -> List[Dict[str, Any]]:
+        """Per-worker core set and load."""
+        with self._lock:
+            return [
+                {"worker": w.index, "cores": w.cores, "inflight": w.inflight, "completed": w.completed}
+                for w in self._workers
+            ]
+
+    def close(self) -> None:
+        """Stop the worker processes."""
+        for worker in self._workers:
+            worker.executor.shutdown(wait=False, cancel_futures=True)
+        logger.info("Worker pool stopped")
@@ -0,0 +1,6 @@
+"""
+Operational command-line tools for ORAC STT.
+
+Run inside the container from /app, e.g.
+``python3 -m src.orac_stt.tools.calibrate_audio_ctx --corpus /app/data/corpus``.
+"""
@@ -0,0 +1,99 @@
+"""Calibrate adaptive audio_ctx buckets against a local corpus.
+
+The corpus is a directory of ``*.wav`` files, each with a ``<name>.txt``
+reference transcript. Every utterance is transcribed with the full encoder
+window and with each candidate window that covers its duration bucket,
+through the configured backend (whisper.cpp CLI or a running whisper-server).
+
+The report lists per-bucket RTF and WER deltas and the chosen buckets; the
+service loads it from ``model.audio_ctx_calibration`` when
+``model.adaptive_audio_ctx`` is enabled.
+
+Usage:
+    python3 -m src.orac_stt.tools.calibrate_audio_ctx --corpus /app/data/corpus
+    python3 -m src.orac_stt.tools.calibrate_audio_ctx --corpus ./corpus \\
+        --backend whisper.cpp --max-wer-delta 0.02 --output report.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from ..config.loader import load_config
+from ..models.audio_ctx import (
+    DEFAULT_BUCKET_EDGES,
+    DEFAULT_CANDIDATES,
+    calibrate,
+    load_corpus,
+)
+from ..models.unified_loader import UnifiedWhisperLoader
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", type=Path, required=True, help="Directory of WAV + TXT pairs")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="Report path (default: model.audio_ctx_calibration)")
+    parser.add_argument("--backend", default=None, help="Backend to calibrate (default: configured)")
+    parser.add_argument("--model", default=None, help="Model to calibrate (default: configured)")
+    parser.add_argument("--buckets", type=float, nargs="+", default=list(DEFAULT_BUCKET_EDGES),
+                        help="Bucket upper bounds in seconds")
+    parser.add_argument("--candidates", type=int, nargs="+", default=list(DEFAULT_CANDIDATES),
+                        help="audio_ctx values to evaluate")
+    parser.add_argument("--max-wer-delta", type=float, default=0.01,
+                        help="Largest acceptable absolute WER increase per bucket")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """Run calibration and write the report."""
+    args = parse_args(argv)
+    settings = load_config()
+    model_config = settings.model.model_copy(update={"adaptive_audio_ctx": False})
+    if args.backend:
+        model_config.backend = args.backend
+    if args.model:
+        model_config.name = args.model
+
+    corpus = load_corpus(args.corpus)
+    if not corpus:
+        print(f"No WAV files with reference transcripts in {args.corpus}", file=sys.stderr)
+        return 1
+    print(f"Calibrating on {len(corpus)} utterances from {args.corpus}")
+
+    loader = UnifiedWhisperLoader(model_config, settings.decode)
+    report = calibrate(
+        lambda audio, audio_ctx: loader.transcribe(audio, audio_ctx=audio_ctx),
+        corpus,
+        bucket_edges=args.buckets,
+        candidates=args.candidates,
+        max_wer_delta=args.max_wer_delta,
+    )
+    report["backend"] = loader.backend_name
+    report["model"] = model_config.name
+    report["corpus"] = str(args.corpus)
+
+    output = args.output or model_config.audio_ctx_calibration
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+
+    for bucket in report["details"]:
+        print(
+            f"<= {bucket['max_duration']:>5.1f}s  n={bucket['utterances']:<4} "
+            f"full rtf={bucket['full_window']['rtf']:.3f} wer={bucket['full_window']['wer']:.3f}  "
+            f"-> audio_ctx={bucket['chosen_audio_ctx'] or 'full'}"
+        )
+        for row in bucket["candidates"]:
+            print(
+                f"      ctx={row['audio_ctx']:<5} rtf={row['rtf']:.3f} ({row['rtf_delta']:+.3f})  "
+                f"wer={row['wer']:.3f} ({row['wer_delta']:+.3f})"
+            )
+    print(f"Report written to {output}")
+    loader.cleanup()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,305 @@
+"""Prometheus metric definitions.
+
+Defined here rather than in the API package so core, model and integration
+modules can record metrics without importing the API layer. The
+``/metrics`` endpoint in ``api/metrics.py`` serves the registry.
+"""
+
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
+
+# Create a custom registry to avoid conflicts
+registry = CollectorRegistry()
+
+# Define metrics
+request_count = Counter(
+    'orac_stt_requests_total',
+    'Total number of STT requests',
+    ['method', 'endpoint', 'status'],
+    registry=registry
+)
+
+request_duration = Histogram(
+    'orac_stt_request_duration_seconds',
+    'Request duration in seconds',
+    ['method', 'endpoint'],
+    registry=registry
+)
+
+active_requests = Gauge(
+    'orac_stt_active_requests',
+    'Number of active requests',
+    registry=registry
+)
+
+stt_processing_duration = Histogram(
+    'orac_stt_processing_duration_seconds',
+    'STT processing duration in seconds',
+    ['model', 'degradation_level'],
+    registry=registry
+)
+
+model_load_time = Gauge(
+    'orac_stt_model_load_time_seconds',
+    'Time taken to load the model',
+    ['model'],
+    registry=registry
+)
+
+warmup_latency = Gauge(
+    'orac_stt_warmup_latency_seconds',
+    'Latency of the last warm-up transcription per synthetic utterance length',
+    ['model', 'backend', 'utterance'],
+    registry=registry
+)
+
+cascade_requests = Counter(
+    'orac_stt_cascade_requests_total',
+    'Cascade transcriptions by outcome (accepted draft or escalated)',
+    ['topic', 'outcome'],
+    registry=registry
+)
+
+cascade_latency_saved = Counter(
+    'orac_stt_cascade_latency_saved_seconds_total',
+    'Estimated latency saved by accepting draft transcriptions',
+    ['topic'],
+    registry=registry
+)
+
+cascade_latency_overhead = Counter(
+    'orac_stt_cascade_latency_overhead_seconds_total',
+    'Draft latency spent on sequential escalations',
+    ['topic'],
+    registry=registry
+)
+
+decode_aborts = Counter(
+    'orac_stt_decode_aborts_total',
+    'Decodes cut short by the decode budget or repetition guard',
+    ['backend', 'reason'],
+    registry=registry
+)
+
+decode_time_saved = Counter(
+    'orac_stt_decode_time_saved_seconds_total',
+    'Estimated decode time saved by token budgets',
+    ['backend'],
+    registry=registry
+)
+
+degradation_level = Gauge(
+    'orac_stt_degradation_level',
+    'Load-adaptive decoding degradation level (0 = full quality)',
+    registry=registry
+)
+
+degradation_transitions = Counter(
+    'orac_stt_degradation_transitions_total',
+    'Degradation level changes',
+    ['direction'],
+    registry=registry
+)
+
+model_residency_events = Counter(
+    'orac_stt_model_residency_events_total',
+    'Model residency loads, prefetches and evictions',
+    ['model', 'event'],
+    registry=registry
+)
+
+model_residency_requests = Counter(
+    'orac_stt_model_residency_requests_total',
+    'Requests for a preferred model by whether it was already resident',
+    ['model', 'result'],
+    registry=registry
+)
+
+model_residency_memory = Gauge(
+    'orac_stt_model_residency_memory_mb',
+    'Estimated memory held by resident models in MB',
+    registry=registry
+)
+
+grammar_requests = Counter(
+    'orac_stt_grammar_requests_total',
+    'Grammar-constrained requests by outcome (constrained or fallback)',
+    ['topic', 'outcome'],
+    registry=registry
+)
+
+template_requests = Counter(
+    'orac_stt_template_requests_total',
+    'Acoustic template fast-path lookups by result (hit or miss)',
+    ['result'],
+    registry=registry
+)
+
+template_verifications = Counter(
+    'orac_stt_template_verifications_total',
+    'Template hits re-checked by Whisper, by outcome (confirmed or false_accept)',
+    ['outcome'],
+    registry=registry
+)
+
+template_latency_saved = Counter(
+    'orac_stt_template_latency_saved_seconds_total',
+    'Estimated Whisper latency avoided by template hits',
+    registry=registry
+)
+
+result_cache_requests = Counter(
+    'orac_stt_result_cache_requests_total',
+    'Transcription result cache lookups by result (hit, miss or coalesced)',
+    ['result'],
+    registry=registry
+)
+
+result_cache_entries = Gauge(
+    'orac_stt_result_cache_entries',
+    'Transcription results held in the cache',
+    registry=registry
+)
+
+hedge_requests = Counter(
+    'orac_stt_hedge_requests_total',
+    'whisper-server requests by hedging outcome (not_hedged, primary_won or hedge_won)',
+    ['outcome'],
+    registry=registry
+)
+
+circuit_breaker_state = Gauge(
+    'orac_stt_circuit_breaker_state',
+    'Circuit breaker state (0 = closed, 1 = half-open, 2 = open)',
+    ['breaker'],
+    registry=registry
+)
+
+circuit_breaker_transitions = Counter(
+    'orac_stt_circuit_breaker_transitions_total',
+    'Circuit breaker state transitions by new state',
+    ['breaker', 'state'],
+    registry=registry
+)
+
+circuit_breaker_rejections = Counter(
+    'orac_stt_circuit_breaker_rejections_total',
+    'Requests failed fast or diverted while the circuit breaker was not closed',
+    ['breaker'],
+    registry=registry
+)
+
+circuit_breaker_diversions = Counter(
+    'orac_stt_circuit_breaker_diversions_total',
+    'Requests diverted to the fallback backend while the circuit breaker was open',
+    ['backend'],
+    registry=registry
+)
+
+batch_size = Histogram(
+    'orac_stt_batch_size',
+    'Utterances decoded together by the micro-batcher',
+    buckets=[1, 2, 3, 4, 6, 8, 12, 16],
+    registry=registry
+)
+
+batch_wait = Histogram(
+    'orac_stt_batch_wait_seconds',
+    'Time requests waited in the micro-batcher before decoding started',
+    buckets=[0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.5],
+    registry=registry
+)
+
+whisper_server_stage = Histogram(
+    'orac_stt_whisper_server_stage_seconds',
+    'Per-request stage times reported by whisper-server (whisper.cpp timings)',
+    ['stage'],
+    buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
+    registry=registry
+)
+
+whisper_server_start = Histogram(
+    'orac_stt_whisper_server_start_seconds',
+    'whisper-server start time by phase (prepare, load, total) and page-cache state of the model file',
+    ['phase', 'page_cache'],
+    buckets=[0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 15.0, 20.0, 30.0, 60.0, 120.0],
+    registry=registry
+)
+
+whisper_server_recovery = Histogram(
+    'orac_stt_whisper_server_recovery_seconds',
+    'Time from a detected whisper-server failure until it served again',
+    ['fallback'],
+    buckets=[0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0, 300.0, 600.0],
+    registry=registry
+)
+
+standby_memory = Gauge(
+    'orac_stt_standby_memory_bytes',
+    'Resident memory of the hot-standby whisper-server (0 when none is running)',
+    registry=registry
+)
+
+standby_failovers = Counter(
+    'orac_stt_standby_failovers_total',
+    'Failovers from a failed whisper-server to the hot standby',
+    registry=registry
+)
+
+core_forward_queue_depth = Gauge(
+    'orac_stt_core_forward_queue_depth',
+    'Transcriptions waiting to be forwarded to ORAC Core (queued or awaiting retry)',
+    registry=registry
+)
+
+core_forward_retries = Counter(
+    'orac_stt_core_forward_retries_total',
+    'Retries of failed forwards to ORAC Core',
+    registry=registry
+)
+
+core_forwards = Counter(
+    'orac_stt_core_forwards_total',
+    'Forwards to ORAC Core by outcome (delivered, failed, expired, rejected)',
+    ['result'],
+    registry=registry
+)
+
+core_forward_latency = Histogram(
+    'orac_stt_core_forward_latency_seconds',
+    'Time from queuing a transcription to ORAC Core accepting it, retries included',
+    buckets=[0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0],
+    registry=registry
+)
+
+core_relay_first_token = Histogram(
+    'orac_stt_core_relay_first_token_seconds',
+    'Time from sending a relayed transcription to ORAC Core until its first response chunk',
+    buckets=[0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0],
+    registry=registry
+)
+
+audio_duration = Histogram(
+    'orac_stt_audio_duration_seconds',
+    'Duration of processed audio in seconds',
+    registry=registry
+)
+
+error_count = Counter(
+    'orac_stt_errors_total',
+    'Total number of errors',
+    ['error_type'],
+    registry=registry
+)
+
+# GPU metrics placeholders
+gpu_utilization = Gauge(
+    'orac_stt_gpu_utilization_percent',
+    'GPU utilization percentage',
+    registry=registry
+)
+
+gpu_memory_used = Gauge(
+    'orac_stt_gpu_memory_used_bytes',
+    'GPU memory used in bytes',
+    registry=registry
+)
@@ -0,0 +1,39 @@
+"""Word error rate for accuracy calibration and benchmarks."""
+
+import re
+from typing import List
+
+
+def normalize_words(text: str) -> List[str]:
+    """Lowercase, strip punctuation and split into words."""
+    return re.sub(r"[^\w\s']", " ", text.lower()).split()
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    """Compute word error rate (substitutions + deletions + insertions) / reference words.
+
+    Args:
+        reference: Reference transcript
+        hypothesis: Transcript to score
+
+    Returns:
+        WER (0.0 is perfect; can exceed 1.0 with many insertions)
+    """
+    ref = normalize_words(reference)
+    hyp = normalize_words(hypothesis)
+    if not ref:
+        return 0.0 if not hyp else 1.0
+
+    # Single-row Levenshtein distance over words
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, 1):
+        current = [i]
+        for j, hyp_word in enumerate(hyp, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_word != hyp_word),
+            ))
+        previous = current
+
+    return previous[-1] / len(ref)
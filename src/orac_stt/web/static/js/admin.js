@@ -212,25 +212,41 @@ class OracSTTAdmin {
 
             const result = await response.json();
 
-            if (response.ok && result.status === 'success') {
-                // Update running model
-                this.runningModel = modelName;
-                this.currentModel.textContent = modelName;
-                console.log('Model restarted successfully:', result.message);
-            } else {
-                throw new Error(result.detail || 'Restart failed');
+            if (response.ok && result.status === 'started') {
+                // Switch runs in the background; progress arrives as
+                // model_switch WebSocket messages
+                this.switchJobId = result.job_id;
+                console.log('Model switch started:', result.message);
+                return;
             }
+            throw new Error(result.detail || 'Restart failed');
 
         } catch (error) {
             console.error('Failed to restart with model:', error);
             alert('Failed to restart: ' + error.message);
-        } finally {
-            // Remove loading state
-            this.restartBtn.classList.remove('loading');
-            this.modelDropdown.disabled = false;
-            this.updateModelChangeState();
+            this.finishModelSwitch();
+        }
+    }
+
+    handleModelSwitch(job) {
+        console.log(`Model switch ${job.id}: ${job.state} - ${job.message}`);
+        if (job.state === 'completed') {
+            this.runningModel = job.model_name;
+            this.currentModel.textContent = job.model_name;
+            this.finishModelSwitch();
+        } else if (job.state === 'failed') {
+            alert('Failed to restart: ' + (job.error || job.message));
+            this.finishModelSwitch();
         }
     }
+
+    finishModelSwitch() {
+        // Remove loading state
+        this.switchJobId = null;
+        this.restartBtn.classList.remove('loading');
+        this.modelDropdown.disabled = false;
+        this.updateModelChangeState();
+    }
     
     connectWebSocket() {
         const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
@@ -328,6 +344,14 @@ class OracSTTAdmin {
                 this.selectedModel = data.model;
                 this.updateModelChangeState();
                 break;
+
+            case 'model_switch':
+                this.handleModelSwitch(data.job);
+                break;
+
+            case 'backend_changed':
+                console.log(`Inference backend changed: ${data.backend} (${data.device})`);
+                break;
                 
             default:
                 console.warn('Unknown message type:', data.type);
@@ -42,3 +42,133 @@ def mock_settings():
             port=7272
         )
     )
+
+
+FAKE_WHISPER_SERVER = '''
+import argparse
+import json
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--host", default="127.0.0.1")
+parser.add_argument("--port", type=int, default=8080)
+parser.add_argument("--model")
+args, _ = parser.parse_known_args()
+
+with open(args.model, "rb") as model:
+    if model.read(7) == b"corrupt":
+        print("whisper_model_load: invalid model data (bad magic)", flush=True)
+        sys.exit(1)
+
+
+class Handler(BaseHTTPRequestHandler):
+    def _reply(self, body):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(json.dumps(body).encode())
+
+    def do_GET(self):
+        self._reply({"status": "ok"})
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._reply({"text": "", "segments": []})
+
+    def log_message(self, *args):
+        pass
+
+
+print("whisper_print_timings:     load time =    12.00 ms", flush=True)
+ThreadingHTTPServer((args.host, args.port), Handler).serve_forever()
+'''
+
+
+@pytest.fixture
+def fake_whisper_server(tmp_path, monkeypatch):
+    """Point WhisperServerManager at a stand-in whisper-server binary.
+
+    The stand-in answers health checks and /inference with an empty
+    transcript on the --host/--port it is given, or exits at once if its
+    --model file starts with "corrupt". Restart history goes to tmp_path.
+    """
+    import sys
+    from src.orac_stt.config.settings import ModelStoreConfig, RestartPolicyConfig
+    from src.orac_stt.core import model_store, restart_policy
+    from src.orac_stt.core.whisper_manager import WhisperServerManager
+
+    server = tmp_path / "whisper-server"
+    server.write_text(f"#!{sys.executable}\n{FAKE_WHISPER_SERVER}")
+    server.chmod(0o755)
+    (tmp_path / "ggml-base.bin").write_bytes(b"")
+    (tmp_path / "ggml-tiny.bin").write_bytes(b"")
+    monkeypatch.setattr(WhisperServerManager, "WHISPER_SERVER_BIN", str(server))
+    monkeypatch.setattr(WhisperServerManager, "WHISPER_MODELS_DIR", str(tmp_path))
+    monkeypatch.setattr(
+        model_store, "_model_store",
+        model_store.ModelStore(ModelStoreConfig(checksum_cache=tmp_path / "checksums.json")),
+    )
+    monkeypatch.setattr(
+        restart_policy, "_restart_policy",
+        restart_policy.RestartPolicy(RestartPolicyConfig(history_file=tmp_path / "restarts.json")),
+    )
+    return server
+
+
+@pytest.fixture
+def make_breaker():
+    """Return a factory for circuit breakers that open after two failures."""
+    from src.orac_stt.config.settings import CircuitBreakerConfig
+    from src.orac_stt.core.circuit_breaker import CircuitBreaker
+
+    def make(**overrides) -> CircuitBreaker:
+        settings = {"failure_threshold": 2, "open_duration": 0.0, **overrides}
+        return CircuitBreaker("test", CircuitBreakerConfig(**settings))
+
+    return make
+
+
+@pytest.fixture
+def make_controller():
+    """Return a factory for degradation controllers that change level at once."""
+    from src.orac_stt.config.settings import DegradationConfig
+    from src.orac_stt.core.degradation import DegradationController
+
+    def make(**overrides) -> DegradationController:
+        settings = {
+            "enabled": True,
+            "queue_depth_high": 2,
+            "queue_depth_low": 0,
+            "step_up_interval": 0.0,
+            "step_down_interval": 0.0,
+            **overrides,
+        }
+        return DegradationController(DegradationConfig(**settings))
+
+    return make
+
+
+@pytest.fixture
+def make_hedge_policy():
+    """Return a factory for hedge policies that hedge after a few samples."""
+    from src.orac_stt.config.settings import HedgingConfig
+    from src.orac_stt.models.hedging import HedgePolicy
+
+    def make(**overrides) -> HedgePolicy:
+        settings = {"enabled": True, "min_samples": 5, "min_delay": 0.01, "budget": 1.0, **overrides}
+        return HedgePolicy(HedgingConfig(**settings))
+
+    return make
+
+
+@pytest.fixture
+def make_matcher():
+    """Return a factory for template matchers that verify every match."""
+    from src.orac_stt.config.settings import TemplateConfig
+    from src.orac_stt.core.templates import TemplateMatcher
+
+    def make(**overrides) -> TemplateMatcher:
+        return TemplateMatcher(TemplateConfig(**{"enabled": True, "verify_rate": 1.0, **overrides}))
+
+    return make
@@ -0,0 +1,104 @@
+"""Unit tests for adaptive audio_ctx selection and calibration."""
+
+import json
+
+import numpy as np
+import pytest
+
+from src.orac_stt.config.settings import ModelConfig
+from src.orac_stt.models.audio_ctx import (
+    AudioCtxBucket,
+    AudioCtxPolicy,
+    CorpusItem,
+    calibrate,
+)
+from src.orac_stt.models.backends import BackendPlugin, register_backend
+from src.orac_stt.models.unified_loader import UnifiedWhisperLoader
+from src.orac_stt.utils.wer import word_error_rate
+
+
+class RecordingModel:
+    """Backend model that records decode options."""
+
+    def __init__(self):
+        self.calls = []
+
+    def transcribe(self, audio_data, sample_rate=16000, language=None, **kwargs):
+        self.calls.append(kwargs)
+        return {"text": ""}
+
+
+class RecordingPlugin(BackendPlugin):
+    name = "fake-audio-ctx"
+
+    def __init__(self):
+        self.model = RecordingModel()
+
+    def create(self, config, model_name, device):
+        return self.model
+
+
+def test_policy_selects_smallest_covering_bucket():
+    """Test that the smallest bucket covering the duration sets audio_ctx."""
+    policy = AudioCtxPolicy([AudioCtxBucket(4.0, 320), AudioCtxBucket(2.0, 256)])
+
+    assert policy.select(1.5) == 256
+    assert policy.select(3.0) == 320
+    assert policy.select(20.0) == 0
+
+
+def test_policy_loads_calibration_report(tmp_path):
+    """Test loading a calibration report, with defaults when it is missing."""
+    path = tmp_path / "calibration.json"
+    path.write_text(json.dumps({"buckets": [{"max_duration": 3.0, "audio_ctx": 192}]}))
+
+    assert AudioCtxPolicy.load(path).select(2.0) == 192
+    assert AudioCtxPolicy.load(tmp_path / "missing.json").select(1.0) == 256
+
+
+def test_word_error_rate():
+    """Test word error rate ignores case and punctuation."""
+    assert word_error_rate("turn the lights off", "Turn the lights off.") == 0.0
+    assert word_error_rate("turn the lights off", "turn lights of") == pytest.approx(0.5)
+
+
+def test_calibration_rejects_windows_that_hurt_accuracy():
+    """Test that calibration only keeps windows that transcribe correctly."""
+    corpus = [
+        CorpusItem("a", np.zeros(16000, dtype=np.float32), 1.0, "lights off"),
+        CorpusItem("b", np.zeros(48000, dtype=np.float32), 3.0, "open the garage door"),
+    ]
+    references = {16000: "lights off", 48000: "open the garage door"}
+
+    def transcribe(audio, audio_ctx):
+        # Windows under 200 positions garble the transcript
+        if audio_ctx and audio_ctx < 200:
+            return {"text": "garbled"}
+        return {"text": references[len(audio)]}
+
+    report = calibrate(transcribe, corpus, bucket_edges=(2.0, 4.0), candidates=(128, 256, 320))
+
+    assert report["buckets"] == [
+        {"max_duration": 2.0, "audio_ctx": 256},
+        {"max_duration": 4.0, "audio_ctx": 256},
+    ]
+    first = report["details"][0]["candidates"]
+    assert [row["audio_ctx"] for row in first] == [128, 256, 320]
+    assert first[0]["wer_delta"] == 1.0
+
+
+def test_loader_passes_audio_ctx_for_duration(tmp_path):
+    """Test that the loader picks audio_ctx by duration unless one is given."""
+    plugin = RecordingPlugin()
+    register_backend(plugin)
+    config = ModelConfig(
+        cache_dir=tmp_path, backend="fake-audio-ctx", adaptive_audio_ctx=True,
+        audio_ctx_calibration=tmp_path / "missing.json",
+    )
+    loader = UnifiedWhisperLoader(config)
+
+    loader.transcribe(np.zeros(16000, dtype=np.float32))
+    loader.transcribe(np.zeros(16000, dtype=np.float32), audio_ctx=1500)
+
+    assert plugin.model.calls[0]["audio_ctx"] == 256
+    assert plugin.model.calls[1]["audio_ctx"] == 1500
@@ -0,0 +1,179 @@
+"""Unit tests for the backend plugin registry and UnifiedWhisperLoader switching."""
+
+import asyncio
+import subprocess
+import sys
+import threading
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from src.orac_stt.config.settings import ModelConfig
+from src.orac_stt.models.backends import BackendPlugin, register_backend
+from src.orac_stt.models.unified_loader import UnifiedWhisperLoader
+
+
+class FakeModel:
+    """Minimal backend model for tests."""
+
+    def __init__(self, label: str):
+        self.label = label
+        self.closed = False
+
+    def transcribe(self, audio_data, sample_rate=16000, language=None, **kwargs):
+        return {"text": self.label, "confidence": 0.9}
+
+    def close(self):
+        self.closed = True
+
+
+class FakePlugin(BackendPlugin):
+    """Backend plugin that records constructions."""
+
+    def __init__(self, name: str, fail: bool = False):
+        self.name = name
+        self.fail = fail
+        self.created = []
+
+    def create(self, config, model_name, device):
+        if self.fail:
+            raise RuntimeError("load failed")
+        self.created.append((model_name, device))
+        return FakeModel(f"{self.name}:{model_name}:{device}")
+
+
+@pytest.fixture
+def plugins():
+    """Register two fake backends."""
+    primary = FakePlugin("fake-primary")
+    secondary = FakePlugin("fake-secondary")
+    register_backend(primary)
+    register_backend(secondary)
+    return primary, secondary
+
+
+@pytest.fixture
+def loader(plugins, tmp_path):
+    config = ModelConfig(name="whisper-tiny", device="cuda", cache_dir=tmp_path, backend="fake-primary")
+    return UnifiedWhisperLoader(config)
+
+
+def test_importing_loader_does_not_import_torch():
+    """Importing the loader and choosing a backend must not import torch."""
+    code = (
+        "import sys\n"
+        "from src.orac_stt.models.unified_loader import UnifiedWhisperLoader\n"
+        "from src.orac_stt.models.backends import default_backend_name\n"
+        "default_backend_name()\n"
+        "print('torch' in sys.modules)\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert output.strip().endswith("False")
+
+
+def test_unknown_backend_raises(tmp_path):
+    """Test that an unregistered backend name is rejected."""
+    config = ModelConfig(cache_dir=tmp_path, backend="does-not-exist")
+    with pytest.raises(ValueError):
+        UnifiedWhisperLoader(config)
+
+
+def test_backend_constructed_lazily(loader, plugins):
+    """Test that the backend is only created on first use."""
+    primary, _ = plugins
+    assert not loader.is_loaded
+    assert primary.created == []
+
+    result = loader.transcribe(np.zeros(16000, dtype=np.float32))
+
+    assert result["text"] == "fake-primary:whisper-tiny:cuda"
+    assert loader.is_loaded
+    assert primary.created == [("whisper-tiny", "cuda")]
+
+
+def test_multiple_backends_resident(loader, plugins):
+    """Test that several backends can stay loaded at once."""
+    loader.load_model()
+    loader.get_backend(backend="fake-secondary", device="cpu")
+
+    loaded = {(b["backend"], b["device"]) for b in loader.loaded_backends()}
+    assert loaded == {("fake-primary", "cuda"), ("fake-secondary", "cpu")}
+
+
+def test_set_backend_switches_active(loader):
+    """Test switching the active backend and device."""
+    loader.load_model()
+    loader.set_backend("fake-secondary", device="cpu")
+
+    assert loader.backend_name == "fake-secondary"
+    assert loader.device == "cpu"
+    result = loader.transcribe(np.zeros(160, dtype=np.float32))
+    assert result["text"] == "fake-secondary:whisper-tiny:cpu"
+
+
+def test_set_backend_failure_keeps_previous(loader):
+    """Test that a backend that fails to load leaves the previous one active."""
+    register_backend(FakePlugin("fake-broken", fail=True))
+    loader.load_model()
+
+    with pytest.raises(RuntimeError):
+        loader.set_backend("fake-broken")
+
+    assert loader.backend_name == "fake-primary"
+
+
+@pytest.mark.asyncio
+async def test_transcribe_async_uses_executor(loader):
+    """Test async transcription through the loader."""
+    result = await loader.transcribe_async(np.zeros(160, dtype=np.float32))
+    assert result["text"] == "fake-primary:whisper-tiny:cuda"
+
+
+def test_unload_closes_instance(loader):
+    """Test that unloading closes the backend instance."""
+    model = loader.get_backend()
+    assert loader.unload() is True
+    assert model.closed
+    assert not loader.is_loaded
+
+
+class BlockingModel(FakeModel):
+    """Fake model whose transcriptions wait until released, then use the model."""
+
+    def __init__(self, label: str):
+        super().__init__(label)
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def transcribe(self, audio_data, sample_rate=16000, language=None, **kwargs):
+        self.started.set()
+        self.release.wait(5)
+        if self.closed:
+            raise RuntimeError("model closed during decode")
+        return super().transcribe(audio_data, sample_rate, language, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_model_switch_waits_for_in_flight_transcription(loader, plugins, monkeypatch):
+    """Test that a model switch closes the old model only after its requests finish."""
+    from src.orac_stt.api import admin
+
+    primary, _ = plugins
+    monkeypatch.setattr(primary, "create", lambda config, model_name, device: BlockingModel(model_name))
+    monkeypatch.setattr(admin, "get_model_loader", lambda: loader)
+    monkeypatch.setattr(admin, "notify_model_change", AsyncMock())
+    old = loader.get_backend()
+
+    request = asyncio.create_task(loader.transcribe_async(np.zeros(160, dtype=np.float32)))
+    assert await asyncio.to_thread(old.started.wait, 5)
+    loader.get_backend(model_name="whisper-base").release.set()
+
+    assert (await admin.select_model(admin.ModelSelectRequest(model_name="whisper-base")))["status"] == "success"
+    assert not old.closed and not loader.is_resident(model_name="whisper-tiny")
+
+    old.release.set()
+    assert (await request)["text"] == "whisper-tiny"
+    assert old.closed
@@ -0,0 +1,124 @@
+"""Unit tests for micro-batching of in-process backends."""
+
+import asyncio
+import time
+
+import numpy as np
+import pytest
+
+from src.orac_stt.config.settings import BatchingConfig, ModelConfig
+from src.orac_stt.models.backends import BackendPlugin, register_backend
+from src.orac_stt.models.batching import BatchingModel
+from src.orac_stt.models.unified_loader import UnifiedWhisperLoader
+
+AUDIO = np.zeros(16000, dtype=np.float32)
+
+
+class FakeBatchModel:
+    def __init__(self, delay: float = 0.02):
+        self.delay = delay
+        self.batches = []
+        self.unbatched = 0
+        self.fail = False
+
+    def batch_key(self, audio_data, sample_rate, language, options):
+        if (options.get("beam_size") or 1) > 1:
+            return None
+        return (language, options.get("task", "transcribe"))
+
+    def transcribe_batch(self, audio_batch, language=None, options=()):
+        if self.fail:
+            raise RuntimeError("decoder exploded")
+        time.sleep(self.delay)
+        self.batches.append(len(audio_batch))
+        return [{"text": f"item {o['item']}", "language": language} for o in options]
+
+    def transcribe(self, audio_data, sample_rate=16000, language=None, **kwargs):
+        self.unbatched += 1
+        return {"text": "beam search"}
+
+
+def batcher(model, **overrides) -> BatchingModel:
+    return BatchingModel(model, BatchingConfig(**{"enabled": True, "max_batch": 4, "max_wait_ms": 5.0, **overrides}))
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_batched_and_scattered():
+    """Test that concurrent requests share batches and each gets its own result."""
+    model = FakeBatchModel()
+    batching = batcher(model)
+
+    results = await asyncio.gather(*(batching.transcribe_async(AUDIO, language="en", item=i) for i in range(8)))
+
+    assert [r["text"] for r in results] == [f"item {i}" for i in range(8)]
+    assert model.batches == [4, 4]
+    assert all(r["batch_size"] == 4 for r in results)
+    batching.close()
+
+
+def test_lone_request_only_waits_the_window():
+    """Test that a single request waits no longer than the batching window."""
+    model = FakeBatchModel(delay=0.0)
+    batching = batcher(model, max_wait_ms=2.0)
+
+    start = time.perf_counter()
+    result = batching.transcribe(AUDIO, item=0)
+
+    assert time.perf_counter() - start < 0.05
+    assert result["batch_size"] == 1
+    batching.close()
+
+
+@pytest.mark.asyncio
+async def test_incompatible_requests_are_not_mixed():
+    """Test that requests with different decode options go in separate batches."""
+    model = FakeBatchModel()
+    batching = batcher(model)
+
+    results = await asyncio.gather(
+        batching.transcribe_async(AUDIO, language="en", item=0),
+        batching.transcribe_async(AUDIO, language="de", item=1),
+        batching.transcribe_async(AUDIO, language="en", item=2),
+        batching.transcribe_async(AUDIO, language="en", beam_size=5),
+    )
+
+    assert sorted(model.batches) == [1, 2]
+    assert [r["language"] for r in results[:3]] == ["en", "de", "en"]
+    assert results[3]["text"] == "beam search" and model.unbatched == 1
+    assert batching.get_stats()["unbatched_requests"] == 1
+    batching.close()
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_reaches_every_request():
+    """Test that a failed batch raises in every request in it."""
+    model = FakeBatchModel()
+    model.fail = True
+    batching = batcher(model)
+
+    results = await asyncio.gather(
+        *(batching.transcribe_async(AUDIO, item=i) for i in range(2)), return_exceptions=True
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    batching.close()
+
+
+class BatchPlugin(BackendPlugin):
+    name = "fake-batching"
+    in_process = True
+
+    def create(self, config, model_name, device):
+        return FakeBatchModel(delay=0.0)
+
+
+def test_loader_batches_in_process_backends(tmp_path):
+    """Test that the loader wraps in-process backends in a batcher."""
+    register_backend(BatchPlugin())
+    config = ModelConfig(name="whisper-tiny", device="cpu", cache_dir=tmp_path, backend="fake-batching")
+    loader = UnifiedWhisperLoader(config, batching_config=BatchingConfig(enabled=True))
+
+    assert loader.transcribe(AUDIO, item=7)["text"] == "item 7"
+    assert isinstance(loader.model, BatchingModel)
+    assert loader.loaded_backends()[0]["batching"]["batches"] == 1
+    loader.unload()
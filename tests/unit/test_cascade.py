@@ -0,0 +1,139 @@
+"""Unit tests for decoder scores and the confidence-driven model cascade."""
+
+import json
+import math
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from src.orac_stt.config.settings import CascadeConfig
+from src.orac_stt.core.cascade import CascadePolicy, ModelCascade
+from src.orac_stt.models.scoring import compression_ratio, scores_from_segments
+from src.orac_stt.models.topic import TopicCascadeConfig, TopicConfig
+from src.orac_stt.models.whisper_cpp import WhisperCppModel
+
+
+class FakeLoader:
+    """Model loader returning canned results per model."""
+
+    def __init__(self, results, backend_name="whisper.cpp", model="whisper-small"):
+        self.results = results
+        self.backend_name = backend_name
+        self.config = type("Config", (), {"name": model})()
+        self.calls = []
+
+    async def transcribe_async(self, audio_data, sample_rate=16000, language=None,
+                               backend=None, model_name=None, **kwargs):
+        model = model_name or self.config.name
+        self.calls.append(model)
+        return dict(self.results[model])
+
+
+CONFIDENT = {"text": "lights off", "avg_logprob": -0.1, "no_speech_prob": 0.01, "compression_ratio": 1.0}
+DOUBTFUL = {"text": "lie tsof", "avg_logprob": -1.2, "no_speech_prob": 0.01, "compression_ratio": 1.0}
+FULL = {"text": "lights off", "avg_logprob": -0.2, "no_speech_prob": 0.01, "compression_ratio": 1.0}
+
+AUDIO = np.zeros(16000, dtype=np.float32)
+
+
+def test_segment_scores_weighted_by_tokens():
+    """Test that segment scores are combined weighted by token count."""
+    segments = [
+        {"text": "a", "tokens": [1, 2, 3], "avg_logprob": -0.3, "no_speech_prob": 0.2},
+        {"text": "b", "tokens": [4], "avg_logprob": -1.1, "no_speech_prob": 0.9},
+    ]
+    scores = scores_from_segments("a b", segments)
+
+    assert scores["avg_logprob"] == pytest.approx(-0.5)
+    assert scores["no_speech_prob"] == 0.2
+    assert scores["confidence"] == pytest.approx(math.exp(-0.5))
+
+
+def test_repetition_raises_compression_ratio():
+    """Test that repetitive text has a high compression ratio."""
+    assert compression_ratio("turn " * 40) > 2.4
+    assert compression_ratio("turn off the kitchen lights") < 2.4
+
+
+def test_whisper_cpp_json_scores(tmp_path):
+    """Test scores parsed from whisper.cpp JSON output, skipping special tokens."""
+    path = tmp_path / "out.json"
+    path.write_text(json.dumps({
+        "result": {"language": "en"},
+        "transcription": [{
+            "text": " lights off",
+            "tokens": [
+                {"text": "[_BEG_]", "p": 0.01},
+                {"text": " lights", "p": 0.9},
+                {"text": " off", "p": 0.8},
+            ],
+        }],
+    }))
+    output = WhisperCppModel._parse_json_output(str(path), "")
+
+    assert output["text"] == "lights off"
+    assert output["language"] == "en"
+    assert output["avg_logprob"] == pytest.approx((math.log(0.9) + math.log(0.8)) / 2)
+
+
+def test_topic_overrides_thresholds():
+    """Test that a topic's cascade settings override the global thresholds."""
+    topic = TopicConfig(name="kitchen", cascade=TopicCascadeConfig(enabled=True, log_prob_threshold=-2.0))
+    policy = CascadePolicy.resolve(CascadeConfig(), topic)
+
+    assert policy.enabled
+    assert policy.log_prob_threshold == -2.0
+    assert policy.escalation_reasons(DOUBTFUL) == []
+    assert policy.escalation_reasons({"text": "x"}) == ["no_scores"]
+
+
+def test_unknown_mode_rejected():
+    """Test that only sequential and concurrent are accepted as cascade modes."""
+    assert TopicCascadeConfig(mode="concurrent").mode == "concurrent"
+    with pytest.raises(ValidationError):
+        CascadeConfig(mode="parallel")
+    with pytest.raises(ValidationError):
+        TopicCascadeConfig(mode="parallel")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["sequential", "concurrent"])
+async def test_confident_draft_is_accepted(mode):
+    """Test that a confident draft is returned without escalating."""
+    loader = FakeLoader({"whisper-tiny": CONFIDENT, "whisper-small": FULL})
+    cascade = ModelCascade(CascadeConfig(enabled=True, mode=mode))
+
+    result = await cascade.transcribe(loader, AUDIO, topic="kitchen")
+
+    assert result["cascade"]["escalated"] is False
+    assert result["cascade"]["model"] == "whisper-tiny"
+    assert cascade.get_stats()["kitchen"]["escalation_rate"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_doubtful_draft_escalates():
+    """Test that a low-scoring draft escalates to the full model."""
+    loader = FakeLoader({"whisper-tiny": DOUBTFUL, "whisper-small": FULL})
+    cascade = ModelCascade(CascadeConfig(enabled=True))
+
+    result = await cascade.transcribe(loader, AUDIO, topic="kitchen")
+
+    assert loader.calls == ["whisper-tiny", "whisper-small"]
+    assert result["text"] == "lights off"
+    assert result["cascade"]["reasons"] == ["avg_logprob"]
+    stats = cascade.get_stats()["kitchen"]
+    assert stats["escalations"] == 1
+    assert stats["reasons"] == {"avg_logprob": 1}
+
+
+@pytest.mark.asyncio
+async def test_disabled_or_single_model_backend_skips_cascade():
+    """Test that single-model backends transcribe with the configured model only."""
+    loader = FakeLoader({"whisper-small": FULL}, backend_name="whisper-server")
+    cascade = ModelCascade(CascadeConfig(enabled=True))
+
+    result = await cascade.transcribe(loader, AUDIO, topic="kitchen")
+
+    assert loader.calls == ["whisper-small"]
+    assert "cascade" not in result
@@ -0,0 +1,149 @@
+"""Unit tests for the whisper-server circuit breaker."""
+
+import time
+
+import numpy as np
+import pytest
+import requests
+
+from src.orac_stt.config.settings import ModelConfig
+from src.orac_stt.core.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+from src.orac_stt.models.backends import BackendPlugin, register_backend
+from src.orac_stt.models.unified_loader import UnifiedWhisperLoader
+from src.orac_stt.models.whisper_server import WhisperServerModel
+
+AUDIO = np.zeros(16000, dtype=np.float32)
+
+
+def failing_client(breaker: CircuitBreaker) -> WhisperServerModel:
+    client = WhisperServerModel(server_url="http://down:8080", breaker=breaker)
+    client.calls = 0
+
+    def fake_post(wav_bytes, data, decode_timeout, server_url=None):
+        client.calls += 1
+        raise RuntimeError("Cannot connect to whisper-server")
+
+    client._post = fake_post
+    return client
+
+
+def test_consecutive_failures_open_the_breaker(make_breaker):
+    """Test that consecutive failures open the breaker and it then fails fast."""
+    breaker = make_breaker()
+    client = failing_client(breaker)
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            client.transcribe(AUDIO)
+    assert breaker.state == OPEN
+
+    start = time.perf_counter()
+    with pytest.raises(CircuitOpenError):
+        client.transcribe(AUDIO)
+    assert time.perf_counter() - start < 0.05
+    assert client.calls == 2  # Nothing sent while open
+    assert breaker.get_status()["rejected"] == 1
+
+
+def test_decode_timeouts_open_the_breaker(monkeypatch, make_breaker):
+    """Test that whisper-server decode timeouts count as failures."""
+    breaker = make_breaker()
+    client = WhisperServerModel(server_url="http://hung:8080", breaker=breaker)
+
+    def hang(*args, **kwargs):
+        raise requests.exceptions.Timeout()
+
+    monkeypatch.setattr(client._session, "post", hang)
+
+    for _ in range(2):
+        assert client.transcribe(AUDIO, decode_timeout=0.5)["decode_aborted"] == "abandoned"
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError):
+        client.transcribe(AUDIO, decode_timeout=0.5)
+
+
+def test_success_resets_failure_count(make_breaker):
+    """Test that a success resets the consecutive failure count."""
+    breaker = make_breaker()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == CLOSED
+
+
+def test_half_open_probe_closes_or_reopens(make_breaker):
+    """Test that a half-open probe closes the breaker on success and reopens it on failure."""
+    breaker = make_breaker()
+    breaker.trip("restarting")
+    assert not breaker.allow()
+
+    def down(audio):
+        raise RuntimeError("still down")
+
+    assert not breaker.probe(down)
+    assert breaker.state == OPEN
+
+    probed = []
+    assert breaker.probe(lambda audio: probed.append(len(audio)))
+    assert probed == [16000]  # One second of synthetic audio
+    assert breaker.state == CLOSED
+    assert [t["to"] for t in breaker.get_status()["transitions"]] == [OPEN, HALF_OPEN, OPEN, HALF_OPEN, CLOSED]
+
+
+def test_probe_waits_for_open_duration(make_breaker):
+    """Test that no probe is due before the open duration has passed."""
+    breaker = make_breaker(open_duration=60.0)
+    breaker.trip("health check failed")
+
+    assert not breaker.probe_due()
+    assert breaker.state == OPEN
+
+
+def test_disabled_breaker_never_rejects(make_breaker):
+    """Test that a disabled breaker lets requests through even when tripped."""
+    breaker = make_breaker(enabled=False)
+    breaker.trip("health check failed")
+
+    assert breaker.allow()
+
+
+class FallbackModel:
+    def transcribe(self, audio_data, sample_rate=16000, language=None, **kwargs):
+        return {"text": "from cpu", "confidence": 0.9}
+
+
+class RejectingModel:
+    def transcribe(self, audio_data, sample_rate=16000, language=None, **kwargs):
+        raise CircuitOpenError("whisper-server circuit is open")
+
+
+class RejectingPlugin(BackendPlugin):
+    name = "fake-breaker-primary"
+
+    def create(self, config, model_name, device):
+        return RejectingModel()
+
+
+class CPUPlugin(BackendPlugin):
+    name = "fake-breaker-cpu"
+
+    def create(self, config, model_name, device):
+        assert device == "cpu"
+        return FallbackModel()
+
+
+@pytest.mark.asyncio
+async def test_loader_diverts_to_fallback_backend(tmp_path):
+    """Test that the loader diverts to the fallback backend while the circuit is open."""
+    register_backend(RejectingPlugin())
+    register_backend(CPUPlugin())
+    config = ModelConfig(name="whisper-tiny", device="cuda", cache_dir=tmp_path, backend="fake-breaker-primary")
+
+    diverting = UnifiedWhisperLoader(config, fallback_backend="fake-breaker-cpu")
+    assert (await diverting.transcribe_async(AUDIO))["text"] == "from cpu"
+    assert diverting.transcribe(AUDIO)["text"] == "from cpu"
+
+    failing_fast = UnifiedWhisperLoader(config)
+    with pytest.raises(CircuitOpenError):
+        await failing_fast.transcribe_async(AUDIO)
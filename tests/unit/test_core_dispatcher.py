@@ -0,0 +1,167 @@
+"""Unit tests for the retrying ORAC Core forward dispatcher."""
+
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+
+from src.orac_stt.utils.metrics import registry
+from src.orac_stt.config.settings import CommandAPIConfig
+from src.orac_stt.integrations.core_dispatcher import CoreForwardDispatcher
+
+
+class MockCore:
+    """ORAC Core stand-in that fails the first ``failures`` requests with 503."""
+
+    def __init__(self, failures: int = 0, delay: float = 0.0):
+        self.failures = failures
+        self.delay = delay
+        self.received = []
+        self.forward_ids = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate(self, request: web.Request) -> web.Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            payload = await request.json()
+            self.forward_ids.append(payload["metadata"].get("forward_id"))
+            await asyncio.sleep(self.delay)
+            if self.failures > 0:
+                self.failures -= 1
+                return web.Response(status=503, text="restarting")
+            self.received.append((request.match_info["topic"], payload))
+            return web.json_response({"response": "ok"})
+        finally:
+            self.in_flight -= 1
+
+    async def serve(self, port: int = 0):
+        app = web.Application()
+        app.router.add_post("/v1/generate/{topic}", self.generate)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        return runner, f"http://127.0.0.1:{port}"
+
+
+def config(**overrides) -> CommandAPIConfig:
+    return CommandAPIConfig(**{"retry_delay": 0.05, "timeout": 5, **overrides})
+
+
+async def wait_for(condition, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        await asyncio.sleep(0.02)
+
+
+def forwards(result: str) -> float:
+    return registry.get_sample_value("orac_stt_core_forwards_total", {"result": result}) or 0
+
+
+@pytest.mark.asyncio
+async def test_retries_until_core_is_back():
+    """Test that forwards are retried with the same forward_id until Core accepts them."""
+    core = MockCore(failures=2)
+    runner, url = await core.serve()
+    dispatcher = CoreForwardDispatcher(config(max_retries=3))
+    retries_before = registry.get_sample_value("orac_stt_core_forward_retries_total") or 0
+
+    assert dispatcher.submit(url, "turn on the lights", "home", {"confidence": 0.9})
+    await wait_for(lambda: core.received)
+
+    topic, payload = core.received[0]
+    assert topic == "home" and payload["prompt"] == "turn on the lights"
+    assert payload["metadata"]["confidence"] == 0.9
+    # Idempotency key, the same on every attempt
+    assert len(core.forward_ids) == 3 and len(set(core.forward_ids)) == 1
+    assert registry.get_sample_value("orac_stt_core_forward_retries_total") == retries_before + 2
+    await wait_for(lambda: dispatcher.get_stats()["pending"] == 0)
+    assert dispatcher.get_stats()["delivered"] == 1
+    await dispatcher.stop()
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_retries_and_rejects_when_full():
+    """Test giving up after max_retries and rejecting forwards when the queue is full."""
+    core = MockCore(failures=100)
+    runner, url = await core.serve()
+    dispatcher = CoreForwardDispatcher(config(max_retries=1, queue_size=1))
+    failed_before, rejected_before = forwards("failed"), forwards("rejected")
+
+    assert dispatcher.submit(url, "first", "general")
+    assert not dispatcher.submit(url, "second", "general")
+    await wait_for(lambda: forwards("failed") == failed_before + 1)
+
+    assert forwards("rejected") == rejected_before + 1
+    assert core.failures == 98
+    await dispatcher.stop()
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_pending_forwards_survive_a_restart(tmp_path):
+    """Test that pending forwards are replayed from the spill log after a restart."""
+    spill = tmp_path / "forwards.jsonl"
+    core = MockCore()
+    runner, url = await core.serve()
+    await runner.cleanup()
+
+    # Core is down: the forward keeps waiting for a retry when we shut down
+    first = CoreForwardDispatcher(config(spill_path=spill, retry_delay=30.0))
+    first.submit(url, "what time is it", "general", {"timestamp": "2026-01-01T00:00:00"})
+    await wait_for(lambda: first.get_stats()["waiting_retry"] == 1)
+    await first.stop()
+
+    runner, _ = await core.serve(port=int(url.rsplit(":", 1)[1]))
+    second = CoreForwardDispatcher(config(spill_path=spill))
+    second.start()
+    await wait_for(lambda: core.received)
+
+    assert core.received[0][1]["metadata"]["timestamp"] == "2026-01-01T00:00:00"
+    await wait_for(lambda: second.get_stats()["pending"] == 0)
+    await second.stop()
+    # Delivered forwards are not replayed again
+    assert CoreForwardDispatcher(config(spill_path=spill))._replay_spill() == []
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_per_core_concurrency_limit():
+    """Test that forwards to one Core respect the concurrency limit."""
+    core = MockCore(delay=0.1)
+    runner, url = await core.serve()
+    dispatcher = CoreForwardDispatcher(config(per_core_concurrency=1))
+
+    for i in range(4):
+        dispatcher.submit(url, f"command {i}", "general")
+    await wait_for(lambda: len(core.received) == 4)
+
+    assert core.max_in_flight == 1
+    await dispatcher.stop()
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_slow_core_does_not_hold_up_other_cores():
+    """Test that a slow Core does not delay forwards to other Cores."""
+    slow, fast = MockCore(delay=2.0), MockCore()
+    slow_runner, slow_url = await slow.serve()
+    fast_runner, fast_url = await fast.serve()
+    dispatcher = CoreForwardDispatcher(config(per_core_concurrency=1))
+
+    for i in range(4):
+        dispatcher.submit(slow_url, f"slow {i}", "general")
+    dispatcher.submit(fast_url, "fast", "general")
+    await wait_for(lambda: fast.received, timeout=1.0)
+
+    assert slow.received == []
+    assert dispatcher.get_stats()["queued"][slow_url] == 3
+    await dispatcher.stop()
+    await slow_runner.cleanup()
+    await fast_runner.cleanup()
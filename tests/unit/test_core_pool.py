@@ -0,0 +1,99 @@
+"""Unit tests for the pooled per-Core-URL ORAC Core clients."""
+
+from datetime import datetime
+
+import pytest
+from aiohttp import web
+
+from src.orac_stt.config.settings import CorePoolConfig
+from src.orac_stt.core.heartbeat_manager import HeartbeatManager
+from src.orac_stt.integrations import core_pool
+from src.orac_stt.integrations.core_pool import CoreClientPool
+from src.orac_stt.models.heartbeat import HeartbeatRequest, ModelHeartbeat
+
+
+class MockCore:
+    """ORAC Core stand-in that records which client connection each request used."""
+
+    def __init__(self):
+        self.requests = []
+        self.connections = set()
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests.append(request.path)
+        self.connections.add(request.transport.get_extra_info("peername"))
+        return web.json_response({"status": "ok"})
+
+    async def serve(self):
+        app = web.Application()
+        app.router.add_post("/v1/generate/{topic}", self.handle)
+        app.router.add_post("/v1/topics/heartbeat", self.handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        return runner, f"http://127.0.0.1:{port}"
+
+
+@pytest.mark.asyncio
+async def test_clients_are_shared_per_url_and_reuse_connections():
+    """Test that one client is shared per Core URL and keeps its connection alive."""
+    core = MockCore()
+    runner, url = await core.serve()
+    pool = CoreClientPool(CorePoolConfig())
+
+    client = pool.get(url)
+    assert pool.get(url + "/") is client
+    for i in range(5):
+        await pool.get(url).send_transcription(f"command {i}", "general")
+
+    assert len(core.requests) == 5
+    # Keep-alive: every request went over the same connection
+    assert len(core.connections) == 1
+    await pool.close()
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_idle_clients_are_evicted_and_closed():
+    """Test that idle clients are evicted and their sessions closed."""
+    core = MockCore()
+    runner, url = await core.serve()
+    pool = CoreClientPool(CorePoolConfig(idle_timeout=60.0))
+
+    client = pool.get(url)
+    await client.send_transcription("hello", "general")
+    assert await pool.evict_idle() == 0
+    assert await pool.evict_idle(now=pool._last_used[url] + 61) == 1
+
+    assert client._session.closed
+    assert pool.get_stats()["clients"] == {} and pool.get_stats()["evicted"] == 1
+    assert pool.get(url) is not client
+    await pool.close()
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_overrides_use_pooled_clients(tmp_path, monkeypatch):
+    """Test that heartbeat forwarding to per-topic Core URLs uses pooled clients."""
+    core = MockCore()
+    runner, url = await core.serve()
+    pool = CoreClientPool(CorePoolConfig())
+    monkeypatch.setattr(core_pool, "_core_pool", pool)
+
+    manager = HeartbeatManager(data_dir=str(tmp_path))
+    manager.get_topic_registry().set_core_url("kitchen", url)
+    manager._core_url = url
+    request = HeartbeatRequest(
+        source="hey_orac", instance_id="sat-1", timestamp=datetime.utcnow(),
+        models=[ModelHeartbeat(topic="kitchen", wake_word="hey kitchen", status="active")],
+    )
+    await manager.process_heartbeat(request)
+    await manager._forward_to_core()
+
+    assert core.requests == ["/v1/topics/heartbeat"] * 2
+    assert list(pool.get_stats()["clients"]) == [url] and pool.get_stats()["created"] == 1
+    assert len(core.connections) == 1
+    await pool.close()
+    await runner.cleanup()
@@ -0,0 +1,216 @@
+"""Unit tests for relaying ORAC Core responses back to the satellite."""
+
+import asyncio
+import io
+import json
+import threading
+import time
+from unittest.mock import AsyncMock, Mock
+
+import numpy as np
+import pytest
+import soundfile as sf
+from aiohttp import web
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.orac_stt import dependencies
+from src.orac_stt.api import stt
+from src.orac_stt.api.stt import CoreRelay, TranscriptionResult
+from src.orac_stt.core.heartbeat_manager import HeartbeatManager
+from src.orac_stt.integrations import core_pool
+from src.orac_stt.integrations.core_pool import CoreClientPool
+from src.orac_stt.integrations.orac_core_client import ORACCoreClient
+
+TOKENS = ["The ", "lights ", "are ", "on."]
+
+
+class MockCore:
+    """ORAC Core stand-in that streams its answer as server-sent events."""
+
+    def __init__(self):
+        self.payloads = []
+        self.delay = 0.0
+
+    async def generate(self, request: web.Request) -> web.StreamResponse:
+        payload = await request.json()
+        self.payloads.append(payload)
+        await asyncio.sleep(self.delay)
+        if not payload["stream"]:
+            return web.json_response({"response": "".join(TOKENS)})
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        for token in TOKENS:
+            await response.write(f"data: {json.dumps({'response': token, 'done': False})}\n\n".encode())
+            await asyncio.sleep(0.01)
+        await response.write(b"data: [DONE]\n\n")
+        await response.write_eof()
+        return response
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/v1/generate/{topic}", self.generate)
+        return app
+
+
+@pytest.fixture
+def mock_core():
+    """Mock Core served from its own event loop thread (TestClient runs another loop)."""
+    core = MockCore()
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+    state = {}
+
+    async def serve():
+        runner = web.AppRunner(core.app())
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        state["runner"] = runner
+        state["url"] = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+        started.set()
+
+    thread = threading.Thread(target=lambda: (loop.run_until_complete(serve()), loop.run_forever()), daemon=True)
+    thread.start()
+    assert started.wait(5)
+    core.url = state["url"]
+    yield core
+    asyncio.run_coroutine_threadsafe(state["runner"].cleanup(), loop).result(5)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(5)
+
+
+@pytest.fixture
+def relay_app(mock_core, monkeypatch, tmp_path):
+    """STT router with transcription stubbed out and the mock Core as default Core."""
+    result = TranscriptionResult(text="Hey Jarvis turn on the lights", confidence=0.9, language="en")
+    monkeypatch.setattr(stt, "transcribe_with_error_handling", AsyncMock(return_value=result))
+    monkeypatch.setattr(stt, "save_debug_recording_if_enabled", AsyncMock(return_value=None))
+    heartbeat = HeartbeatManager(data_dir=str(tmp_path))
+    monkeypatch.setattr(stt, "get_heartbeat_manager", lambda: heartbeat)
+    monkeypatch.setattr(dependencies, "_model_loader", Mock())
+    core_client = ORACCoreClient(base_url=mock_core.url)
+    monkeypatch.setattr(dependencies, "_core_client", core_client)
+    monkeypatch.setattr(core_pool, "_core_pool", CoreClientPool())
+    app = FastAPI()
+    app.include_router(stt.router, prefix="/stt/v1")
+    # Entered so every request runs on one loop, where the Core sessions are closed afterwards
+    with TestClient(app) as client:
+        yield client
+        for session_owner in {core_client, dependencies._core_client, core_pool.get_core_pool()}:
+            client.portal.call(session_owner.close)
+
+
+def wav_bytes(seconds: float = 1.0) -> bytes:
+    buffer = io.BytesIO()
+    audio = (np.random.default_rng(0).standard_normal(int(16000 * seconds)) * 0.1).astype(np.float32)
+    sf.write(buffer, audio, 16000, format="WAV")
+    return buffer.getvalue()
+
+
+@pytest.mark.asyncio
+async def test_client_streams_tokens(mock_core):
+    """Test that the Core client yields tokens and then the full response."""
+    client = ORACCoreClient(base_url=mock_core.url)
+    events = [event async for event in client.stream_transcription("turn on the lights", "home", {"confidence": 0.9})]
+    await client.close()
+
+    assert [e["text"] for e in events[:-1]] == TOKENS
+    assert events[-1]["type"] == "core_response" and events[-1]["text"] == "".join(TOKENS)
+    assert mock_core.payloads[0]["stream"] is True
+
+
+def test_websocket_relays_core_response(relay_app, mock_core):
+    """Test relaying Core's streamed response over the WebSocket."""
+    with relay_app.websocket_connect("/stt/v1/ws/stream/home?relay=true") as ws:
+        ws.send_bytes(np.zeros(8000, dtype=np.int16).tobytes())
+        ws.send_text(json.dumps({"type": "end"}))
+        messages = [json.loads(ws.receive_text()) for _ in range(len(TOKENS) + 2)]
+
+    assert messages[0]["type"] == "transcription"
+    assert [m["text"] for m in messages[1:-1]] == TOKENS
+    assert messages[-1] == {"type": "core_response", "text": "".join(TOKENS), "response": {"response": "on.", "done": False}}
+    assert mock_core.payloads[0]["prompt"] == "Hey Jarvis turn on the lights"
+
+
+def test_http_relay_streams_server_sent_events(relay_app, mock_core):
+    """Test relaying Core's streamed response as server-sent events."""
+    response = relay_app.post(
+        "/stt/v1/stream/home?relay=true",
+        files={"file": ("command.wav", wav_bytes(), "audio/wav")},
+    )
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [json.loads(line[len("data: "):]) for line in response.text.splitlines() if line.startswith("data: ")]
+    assert [e["type"] for e in events] == ["transcription"] + ["core_token"] * len(TOKENS) + ["core_response", "done"]
+    assert events[0]["text"] == "Hey Jarvis turn on the lights"
+
+
+def test_relay_queues_forward_when_core_is_down(relay_app, monkeypatch):
+    """Test that a failed relay is queued for delivery and reported to the client."""
+    monkeypatch.setattr(dependencies, "_core_client", ORACCoreClient(base_url="http://127.0.0.1:9"))
+    dispatcher = Mock()
+    dispatcher.submit.return_value = True
+    monkeypatch.setattr(stt, "get_core_dispatcher", lambda: dispatcher)
+
+    with relay_app.websocket_connect("/stt/v1/ws/stream/home") as ws:
+        ws.send_text(json.dumps({"type": "config", "relay": True}))
+        ws.send_bytes(np.zeros(8000, dtype=np.int16).tobytes())
+        ws.send_text(json.dumps({"type": "end"}))
+        transcription = json.loads(ws.receive_text())
+        error = json.loads(ws.receive_text())
+
+    assert transcription["text"] == "Hey Jarvis turn on the lights"
+    assert error["type"] == "core_error" and error["queued"] is True
+    dispatcher.submit.assert_called_once()
+
+
+def wait_until(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.02)
+
+
+def test_command_not_lost_when_satellite_disconnects(relay_app, mock_core, monkeypatch):
+    """Test that the command is queued when the satellite hangs up mid-relay."""
+    mock_core.delay = 1.0
+    dispatcher = Mock()
+    monkeypatch.setattr(stt, "get_core_dispatcher", lambda: dispatcher)
+
+    with relay_app.websocket_connect("/stt/v1/ws/stream/home?relay=true") as ws:
+        ws.send_bytes(np.zeros(8000, dtype=np.int16).tobytes())
+        ws.send_text(json.dumps({"type": "end"}))
+        assert json.loads(ws.receive_text())["type"] == "transcription"
+        # Core got the command before the satellite saw the transcription
+        wait_until(lambda: mock_core.payloads)
+    # Hung up before Core answered: the forward is queued for retried delivery
+    wait_until(lambda: dispatcher.submit.called)
+
+    url, text, topic, metadata = dispatcher.submit.call_args.args
+    assert (url, text, topic) == (mock_core.url, "Hey Jarvis turn on the lights", "home")
+    assert metadata["forward_id"] == mock_core.payloads[0]["metadata"]["forward_id"]
+
+
+@pytest.mark.asyncio
+async def test_abandoned_relay_is_queued_before_core_answers(mock_core, monkeypatch, tmp_path):
+    """Test that abandoning a relay queues the forward with the same forward_id."""
+    mock_core.delay = 1.0
+    dispatcher = Mock()
+    monkeypatch.setattr(stt, "get_core_dispatcher", lambda: dispatcher)
+    monkeypatch.setattr(stt, "get_heartbeat_manager", lambda: HeartbeatManager(data_dir=str(tmp_path)))
+    monkeypatch.setattr(core_pool, "_core_pool", CoreClientPool())
+
+    core_client = ORACCoreClient(base_url=mock_core.url)
+    relay = CoreRelay(core_client, "turn on the lights", "home", {"confidence": 0.9})
+    await asyncio.sleep(0.2)
+    relay.abandon()
+    await asyncio.sleep(0)
+
+    assert relay._task.cancelled()
+    url, text, topic, metadata = dispatcher.submit.call_args.args
+    assert (url, text, topic) == (mock_core.url, "turn on the lights", "home")
+    # Same idempotency key as the abandoned request, which Core may have received
+    assert metadata["forward_id"] == mock_core.payloads[0]["metadata"]["forward_id"]
+    await core_client.close()
+    await core_pool.get_core_pool().close()
@@ -0,0 +1,91 @@
+"""Unit tests for the duration-aware decode budget and repetition guard."""
+
+import numpy as np
+import pytest
+
+from src.orac_stt.config.settings import DecodeConfig, ModelConfig
+from src.orac_stt.models.backends import BackendPlugin, register_backend
+from src.orac_stt.models.decode_budget import (
+    WHISPER_MAX_TOKENS,
+    DecodeGuard,
+    find_repetition_loop,
+)
+from src.orac_stt.models.unified_loader import UnifiedWhisperLoader
+
+
+def test_budget_scales_with_duration():
+    """Test that the token budget and timeout scale with duration, within limits."""
+    guard = DecodeGuard(DecodeConfig(tokens_per_second=6.0, min_tokens=16, min_timeout=5.0))
+
+    assert guard.max_tokens(1.0) == 22
+    assert guard.max_tokens(10.0) == 76
+    assert guard.max_tokens(120.0) == WHISPER_MAX_TOKENS
+    assert guard.options(1.0)["decode_timeout"] == 5.0
+    assert DecodeGuard(DecodeConfig(enabled=False)).options(1.0) == {}
+
+
+@pytest.mark.parametrize("text,keep", [
+    ("turn off the lights", None),
+    ("no no no", None),
+    ("turn off the lights thank you thank you thank you thank you", 6),
+    ("the the the the the the the", 1),
+])
+def test_find_repetition_loop(text, keep):
+    """Test detecting repeated phrases while keeping genuine repetition."""
+    assert find_repetition_loop(text) == keep
+
+
+def test_loop_truncated_and_counted():
+    """Test that a repetition loop is truncated after its first occurrence."""
+    guard = DecodeGuard()
+    result = guard.check(
+        {"text": "lights off. Thank you. Thank you. Thank you. Thank you."}, "test", 1.0
+    )
+
+    assert result["text"] == "lights off. Thank you."
+    assert result["decode_aborted"] == "repetition"
+
+
+def test_token_budget_hit_reports_time_saved():
+    """Test that a decode using its whole token budget is reported with the time saved."""
+    guard = DecodeGuard()
+    result = guard.check({"text": "a b c", "tokens": 22}, "test", elapsed=1.1, max_tokens=22)
+
+    assert result["decode_aborted"] == "token_budget"
+    assert result["time_saved"] == pytest.approx(1.1 / 22 * (WHISPER_MAX_TOKENS - 22))
+
+
+def test_clean_result_untouched():
+    """Test that a clean result within budget is left as it is."""
+    result = DecodeGuard().check({"text": "open the garage", "tokens": 5}, "test", 0.2, max_tokens=22)
+
+    assert result == {"text": "open the garage", "tokens": 5}
+
+
+class LongDecodeModel:
+    """Backend model whose decodes always use more tokens than any budget."""
+
+    def transcribe(self, audio_data, sample_rate=16000, language=None, **kwargs):
+        return {"text": "set a timer for ten minutes", "tokens": WHISPER_MAX_TOKENS}
+
+
+class LongDecodePlugin(BackendPlugin):
+    def __init__(self, name, token_budget):
+        self.name = name
+        self.token_budget = token_budget
+
+    def create(self, config, model_name, device):
+        return LongDecodeModel()
+
+
+@pytest.mark.parametrize("token_budget, aborted", [(True, "token_budget"), (False, None)])
+def test_token_budget_only_reported_where_enforced(tmp_path, token_budget, aborted):
+    """Test that only backends enforcing the token budget report it as hit."""
+    # whisper.cpp backends have no token cap, so their decodes are never "cut short"
+    name = f"fake-budget-{token_budget}"
+    register_backend(LongDecodePlugin(name, token_budget))
+    loader = UnifiedWhisperLoader(ModelConfig(cache_dir=tmp_path, backend=name))
+
+    result = loader.transcribe(np.zeros(16000, dtype=np.float32))
+
+    assert result.get("decode_aborted") == aborted
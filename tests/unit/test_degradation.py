@@ -0,0 +1,71 @@
+"""Unit tests for load-adaptive quality degradation."""
+
+from unittest.mock import patch
+
+from src.orac_stt.config.settings import DegradationConfig
+from src.orac_stt.core.degradation import (
+    LEVEL_GREEDY,
+    LEVEL_NORMAL,
+    LEVEL_SHORT_FALLBACK,
+    LEVEL_SMALL_MODEL,
+    DegradationController,
+)
+
+
+def test_decode_options_per_level(make_controller):
+    """Test the decode options at each degradation level."""
+    controller = make_controller()
+
+    assert controller.decode_options(LEVEL_NORMAL) == {
+        "beam_size": 5, "best_of": 5, "temperature_inc": 0.2
+    }
+    assert controller.decode_options(LEVEL_GREEDY)["beam_size"] == 1
+    assert controller.decode_options(LEVEL_SHORT_FALLBACK)["temperature_inc"] == 0.5
+    assert controller.decode_options(LEVEL_SMALL_MODEL)["model_name"] == "whisper-tiny"
+
+
+def test_steps_up_under_queue_pressure(make_controller):
+    """Test that concurrent requests step the level up."""
+    controller = make_controller()
+
+    with controller.track(1.0):
+        with controller.track(1.0) as level:
+            # Second concurrent request crosses queue_depth_high
+            assert level == LEVEL_GREEDY
+            with controller.track(1.0) as level:
+                # Without a resident small model the last level is short fallback
+                assert level == LEVEL_SHORT_FALLBACK
+                with controller.track(1.0) as level:
+                    assert level == LEVEL_SHORT_FALLBACK
+
+
+def test_steps_down_only_after_dwell_time(make_controller):
+    """Test that the level steps down only after the dwell time."""
+    controller = make_controller(step_down_interval=30.0)
+    clock = [1000.0]
+
+    with patch("src.orac_stt.core.degradation.time.time", side_effect=lambda: clock[0]):
+        with controller.track(1.0):
+            with controller.track(1.0):
+                pass
+        assert controller.level == LEVEL_GREEDY
+
+        # Load is gone but the minimum dwell time has not passed
+        clock[0] += 10.0
+        with controller.track(0.0):
+            pass
+        assert controller.level == LEVEL_GREEDY
+
+        clock[0] += 30.0
+        with controller.track(0.0):
+            pass
+        assert controller.level == LEVEL_NORMAL
+
+
+def test_disabled_controller_never_degrades():
+    """Test that a disabled controller stays at the normal level."""
+    controller = DegradationController(DegradationConfig(enabled=False, queue_depth_high=1))
+
+    with controller.track(1.0):
+        with controller.track(1.0) as level:
+            assert level == LEVEL_NORMAL
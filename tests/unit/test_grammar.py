@@ -0,0 +1,156 @@
+"""Unit tests for per-topic grammar-constrained decoding."""
+
+import subprocess
+
+import numpy as np
+import pytest
+
+from src.orac_stt.api import stt
+from src.orac_stt.config.settings import GrammarConfig, ModelConfig
+from src.orac_stt.models.backends import BackendPlugin, register_backend
+from src.orac_stt.models.grammar import (
+    GrammarCompiler,
+    GrammarError,
+    phrases_to_gbnf,
+    validate_gbnf,
+)
+from src.orac_stt.models.topic import TopicConfig, TopicGrammar
+from src.orac_stt.models.unified_loader import UnifiedWhisperLoader
+from src.orac_stt.models.whisper_cpp import WhisperCppModel
+from src.orac_stt.models.whisper_server import WhisperServerModel
+
+
+@pytest.fixture
+def compiler(tmp_path):
+    return GrammarCompiler(GrammarConfig(cache_dir=tmp_path, min_avg_logprob=-0.8))
+
+
+def test_phrases_compile_to_gbnf():
+    """Test compiling a phrase list to GBNF, escaping and de-duplicating phrases."""
+    gbnf = phrases_to_gbnf(["turn on the lights", 'say "hi"', "turn on the lights", " "])
+
+    assert gbnf.startswith('root ::= " "? command [.!?]?')
+    assert '[Tt] "urn on the lights"' in gbnf
+    assert '[Ss] "ay \\"hi\\""' in gbnf
+    assert gbnf.count("urn on the lights") == 1
+    validate_gbnf(gbnf)
+
+
+def test_invalid_grammar_rejected(compiler):
+    """Test that grammars without a root rule or content are rejected."""
+    with pytest.raises(GrammarError):
+        validate_gbnf('command ::= "on"')
+    with pytest.raises(GrammarError):
+        compiler.compile("kitchen", TopicGrammar())
+
+
+def test_compiled_once_per_topic(compiler):
+    """Test that a topic grammar is compiled once and recompiled when it changes."""
+    grammar = TopicGrammar(phrases=["lights on", "lights off"])
+    first = compiler.compile("kitchen", grammar)
+
+    assert compiler.compile("kitchen", grammar) is first
+    assert first.path.read_text() == first.gbnf
+    assert first.prompt == "lights on. lights off."
+    assert first.options()["grammar_penalty"] == 100.0
+
+    changed = compiler.compile("kitchen", TopicGrammar(phrases=["lights on"]))
+    assert changed is not first
+
+
+def test_fallback_on_poor_score(compiler):
+    """Test which constrained results are retried without the grammar."""
+    compiled = compiler.for_topic("kitchen", TopicConfig(name="kitchen", grammar=TopicGrammar(phrases=["lights on"])))
+
+    assert not compiled.should_fallback({"text": "Lights on.", "avg_logprob": -0.2})
+    assert compiled.should_fallback({"text": "Lights on.", "avg_logprob": -1.5})
+    assert compiled.should_fallback({"text": "", "avg_logprob": -0.1})
+    # An aborted decode would most likely be aborted again
+    assert not compiled.should_fallback({"text": "", "decode_aborted": "abandoned"})
+    assert compiler.for_topic("general", TopicConfig(name="general")) is None
+
+
+def test_whisper_cpp_grammar_flags(compiler, monkeypatch, tmp_path):
+    """Test that whisper.cpp gets the grammar and prompt flags."""
+    compiled = compiler.compile("kitchen", TopicGrammar(phrases=["lights on"]))
+    whisper_bin = tmp_path / "whisper-cli"
+    whisper_bin.touch()
+    captured = {}
+
+    def fake_run(cmd, **kwargs):
+        captured["cmd"] = cmd
+        return subprocess.CompletedProcess(cmd, 0, stdout="Lights on.", stderr="")
+
+    monkeypatch.setattr("src.orac_stt.models.whisper_cpp.subprocess.run", fake_run)
+    model = WhisperCppModel(model_path=str(tmp_path / "m.bin"), whisper_bin=str(whisper_bin), device="cpu")
+    result = model.transcribe(np.zeros(16000, dtype=np.float32), **compiled.options())
+
+    cmd = captured["cmd"]
+    assert result["text"] == "Lights on."
+    assert cmd[cmd.index("--grammar") + 1] == str(compiled.path)
+    assert cmd[cmd.index("--grammar-rule") + 1] == "root"
+    assert cmd[cmd.index("--prompt") + 1] == "lights on."
+
+
+def test_whisper_server_keeps_configured_prompt(compiler, monkeypatch):
+    """Test that whisper-server appends the phrase prompt to the configured prompt."""
+    monkeypatch.setenv("WHISPER_PROMPT", "lounge kitchen")
+    compiled = compiler.compile("kitchen", TopicGrammar(phrases=["lights on"]))
+    model = WhisperServerModel(server_url="http://127.0.0.1:9")
+    sent = []
+    monkeypatch.setattr(model, "_post", lambda wav, data, timeout: sent.append(data) or {"text": ""})
+
+    audio = np.zeros(16000, dtype=np.float32)
+    model.transcribe(audio)
+    model.transcribe(audio, **compiled.options())
+
+    # A request without a topic grammar must not clear the server's vocabulary bias
+    assert sent[0]["prompt"] == "lounge kitchen"
+    assert sent[1]["prompt"] == "lounge kitchen. lights on."
+
+
+def test_grammar_options_without_grammar_support(compiler):
+    """Test that backends without grammar support only get the phrase list as prompt."""
+    phrases = compiler.compile("kitchen", TopicGrammar(phrases=["lights on"]))
+    gbnf_only = compiler.compile("garage", TopicGrammar(gbnf='root ::= "open" | "close"'))
+
+    assert phrases.options(grammar_support=False) == {"prompt": "lights on."}
+    assert gbnf_only.options(grammar_support=False) == {}
+    assert gbnf_only.options()["grammar_rule"] == "root"
+
+
+class CountingModel:
+    def __init__(self):
+        self.calls = []
+
+    def transcribe(self, audio_data, sample_rate=16000, language=None, **kwargs):
+        self.calls.append(kwargs)
+        return {"text": "", "avg_logprob": -2.0}
+
+
+class NoGrammarPlugin(BackendPlugin):
+    name = "fake-no-grammar"
+
+    def __init__(self):
+        self.model = CountingModel()
+
+    def create(self, config, model_name, device):
+        return self.model
+
+
+@pytest.mark.asyncio
+async def test_unsupported_grammar_is_not_applied_or_retried(compiler, monkeypatch, tmp_path):
+    """Test that a GBNF-only grammar is skipped on a backend that cannot apply it."""
+    plugin = NoGrammarPlugin()
+    register_backend(plugin)
+    loader = UnifiedWhisperLoader(ModelConfig(cache_dir=tmp_path, backend=plugin.name))
+    topic = TopicConfig(name="garage", grammar=TopicGrammar(gbnf='root ::= "open" | "close"'))
+    monkeypatch.setattr(stt, "get_topic_config", lambda name: topic)
+    monkeypatch.setattr(stt, "get_grammar_compiler", lambda: compiler)
+
+    result = await stt._transcribe_full(np.zeros(16000, dtype=np.float32), 16000, loader, topic="garage")
+
+    # One decode, without grammar options, although the result scored poorly
+    assert len(plugin.model.calls) == 1
+    assert "grammar_path" not in plugin.model.calls[0]
+    assert "grammar" not in result
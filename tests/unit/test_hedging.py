@@ -0,0 +1,86 @@
+"""Unit tests for request hedging across whisper-server workers."""
+
+import time
+
+import numpy as np
+
+from src.orac_stt.models.hedging import HedgePolicy
+from src.orac_stt.models.whisper_server import WhisperServerModel
+
+PRIMARY = "http://primary:8080"
+SECONDARY = "http://secondary:8081"
+AUDIO = np.zeros(16000, dtype=np.float32)
+
+
+def make_client(policy: HedgePolicy, latencies: dict) -> WhisperServerModel:
+    """Client whose requests take a fixed time per worker."""
+    client = WhisperServerModel(server_url=PRIMARY, hedge_urls=[SECONDARY], hedge_policy=policy)
+
+    def fake_post(wav_bytes, data, decode_timeout, server_url=None):
+        url = server_url or client.server_url
+        time.sleep(latencies[url])
+        return {"text": url}
+
+    client._post = fake_post
+    return client
+
+
+def warm(policy: HedgePolicy, latency: float = 0.02, count: int = 5) -> None:
+    for _ in range(count):
+        policy.record_attempt(1.0, latency)
+
+
+def test_no_hedging_until_bucket_has_samples(make_hedge_policy):
+    """Test that hedging starts only once a duration bucket has enough samples."""
+    policy = make_hedge_policy()
+    assert policy.delay(1.0) is None
+
+    warm(policy)
+    assert policy.delay(1.0) == 0.02
+    assert policy.delay(8.0) is None  # Other duration bucket
+
+
+def test_slow_primary_is_hedged_and_hedge_wins(make_hedge_policy):
+    """Test that a slow primary is hedged and the faster hedge answers."""
+    policy = make_hedge_policy()
+    warm(policy)
+    client = make_client(policy, {PRIMARY: 0.5, SECONDARY: 0.01})
+
+    start = time.time()
+    result = client.transcribe(AUDIO)
+
+    assert result == {"text": SECONDARY, "hedged": "hedge"}
+    assert time.time() - start < 0.3
+    stats = policy.get_stats()
+    assert stats["hedged"] == 1
+    assert stats["hedge_wins"] == 1
+
+
+def test_fast_primary_is_not_hedged(make_hedge_policy):
+    """Test that a primary answering before the hedge delay is not hedged."""
+    policy = make_hedge_policy()
+    warm(policy, latency=0.2)
+    client = make_client(policy, {PRIMARY: 0.01, SECONDARY: 0.01})
+
+    assert client.transcribe(AUDIO) == {"text": PRIMARY}
+    assert policy.get_stats()["hedged"] == 0
+
+
+def test_budget_caps_hedged_fraction(make_hedge_policy):
+    """Test that the hedge budget caps the fraction of hedged requests."""
+    policy = make_hedge_policy(budget=0.5, budget_window=4)
+    warm(policy, count=50)
+    client = make_client(policy, {PRIMARY: 0.1, SECONDARY: 0.01})
+
+    results = [client.transcribe(AUDIO) for _ in range(4)]
+
+    assert sum("hedged" in r for r in results) == 2
+    assert policy.get_stats()["budget_exhausted"] == 2
+
+
+def test_no_hedge_target_without_other_workers(make_hedge_policy):
+    """Test that there is no hedge target without another worker."""
+    policy = make_hedge_policy()
+    client = WhisperServerModel(server_url=PRIMARY, hedge_urls=[PRIMARY], hedge_policy=policy)
+
+    assert client._hedge_target() is None
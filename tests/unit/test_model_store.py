@@ -0,0 +1,85 @@
+"""Unit tests for model file prewarming and checksum verification."""
+
+import hashlib
+import os
+import socket
+
+import pytest
+
+from src.orac_stt.utils.metrics import registry
+from src.orac_stt.config.settings import ModelStoreConfig
+from src.orac_stt.core.model_store import ModelIntegrityError, ModelStore, resident_fraction
+from src.orac_stt.core.whisper_manager import WhisperServerManager
+
+CONTENT = os.urandom(3 * 1024 * 1024)
+
+
+@pytest.fixture
+def model_file(tmp_path):
+    path = tmp_path / "ggml-tiny.bin"
+    path.write_bytes(CONTENT)
+    return path
+
+
+def store(tmp_path, **overrides) -> ModelStore:
+    return ModelStore(ModelStoreConfig(checksum_cache=tmp_path / "checksums.json", chunk_mb=1, **overrides))
+
+
+def test_checksum_is_recorded_then_reused(tmp_path, model_file):
+    """Test that a computed checksum is cached until the file changes."""
+    first = store(tmp_path).prepare("whisper-tiny", model_file)
+    assert first["checksum"]["source"] == "computed"
+    assert first["checksum"]["sha256"] == hashlib.sha256(CONTENT).hexdigest()
+
+    # A new store (process restart) trusts the cached checksum of the unchanged file
+    second = store(tmp_path).prepare("whisper-tiny", model_file)
+    assert second["checksum"] == {**first["checksum"], "source": "cache"}
+    assert second["size_mb"] == 3.0 and second["read_seconds"] > 0
+
+    model_file.write_bytes(CONTENT[::-1])
+    assert store(tmp_path).prepare("whisper-tiny", model_file)["checksum"]["source"] == "computed"
+
+
+def test_sha256_file_is_enforced(tmp_path, model_file):
+    """Test that a model not matching its .sha256 file is rejected."""
+    sidecar = tmp_path / "ggml-tiny.bin.sha256"
+    sidecar.write_text(f"{hashlib.sha256(CONTENT).hexdigest()}  ggml-tiny.bin\n")
+    assert store(tmp_path).prepare("whisper-tiny", model_file)["checksum"]["reference"] == "sha256 file"
+
+    sidecar.write_text("0" * 64)
+    model_file.write_bytes(CONTENT[:-1])
+    with pytest.raises(ModelIntegrityError):
+        store(tmp_path).prepare("whisper-tiny", model_file)
+
+
+def test_cold_file_is_reported_cold_then_warm(tmp_path, model_file):
+    """Test reporting whether the model file was in the page cache."""
+    with open(model_file, "rb") as f:
+        os.fsync(f.fileno())
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+    fraction = resident_fraction(model_file)
+    if fraction is None or fraction >= 0.9:
+        pytest.skip("cannot evict the file from the page cache on this filesystem")
+
+    model_store = store(tmp_path, verify_checksums=False)
+    assert model_store.prepare("whisper-tiny", model_file)["page_cache"] == "cold"
+    assert model_store.prepare("whisper-tiny", model_file)["page_cache"] == "warm"
+
+
+@pytest.mark.asyncio
+async def test_launch_reports_start_breakdown(fake_whisper_server):
+    """Test that launching whisper-server records its start-up breakdown."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    manager = WhisperServerManager(host="127.0.0.1", port=port)
+    labels = {"phase": "total", "page_cache": "warm"}
+    before = registry.get_sample_value("orac_stt_whisper_server_start_seconds_count", labels) or 0
+
+    process, ready = await manager.launch("whisper-base", port, timeout=10.0)
+
+    assert ready
+    assert manager.last_start["page_cache"] == "warm"
+    assert manager.last_start["total_seconds"] >= manager.last_start["load_seconds"]
+    assert registry.get_sample_value("orac_stt_whisper_server_start_seconds_count", labels) == before + 1
+    await manager.stop_instance(process)
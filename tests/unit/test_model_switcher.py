@@ -0,0 +1,183 @@
+"""Unit tests for blue/green whisper-server model switching."""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.orac_stt.core.model_switcher import (
+    STATE_COMPLETED,
+    STATE_DRAINING,
+    STATE_FAILED,
+    ModelSwitcher,
+    follow_switch,
+)
+from src.orac_stt.models.whisper_server import WhisperServerModel
+
+
+class FakeProcess:
+    """Stand-in for subprocess.Popen."""
+
+    def __init__(self, port):
+        self.port = port
+        self.pid = 1000 + port
+
+
+class FakeManager:
+    """Records calls made by the switcher."""
+
+    def __init__(self, ready=True):
+        self.ready = ready
+        self.model_name = "whisper-tiny"
+        self.port = 8080
+        self.server_url = "http://127.0.0.1:8080"
+        self._process = FakeProcess(8080)
+        self.switch_in_progress = False
+        self.events = []
+
+    @property
+    def alternate_port(self):
+        return 8081
+
+    def url_for_port(self, port):
+        return f"http://127.0.0.1:{port}"
+
+    async def _kill_existing(self, port=None):
+        return False
+
+    async def launch(self, model_name, port, timeout=60.0):
+        self.events.append(("spawn", model_name, port))
+        return FakeProcess(port), self.ready
+
+    def adopt(self, process, model_name, port):
+        self.events.append(("adopt", model_name, port))
+        self._process = process
+        self.model_name = model_name
+        self.port = port
+
+    async def stop_instance(self, process=None, port=None, timeout=5.0):
+        self.events.append(("stop", process.port if process else port))
+        return True
+
+
+class FakeClient:
+    """whisper-server client that records repoints."""
+
+    def __init__(self, events):
+        self.events = events
+        self.server_url = "http://localhost:8080"
+
+    def repoint(self, url):
+        self.events.append(("repoint", url))
+        self.server_url = url
+
+    def wait_for_drain(self, server_url, timeout=30.0):
+        self.events.append(("drain", server_url))
+        return True
+
+    def inflight(self, server_url=None):
+        return 0
+
+
+async def _wait_done(switcher, job):
+    for _ in range(100):
+        if job.done:
+            return
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_switch_repoints_before_stopping_old_server(monkeypatch):
+    """Test that clients move to the new server before the old one stops."""
+    manager = FakeManager()
+    client = FakeClient(manager.events)
+    switcher = ModelSwitcher(manager=manager)
+    monkeypatch.setattr(switcher, "_warm_up", lambda url, model: manager.events.append(("warm", url)))
+
+    progress = []
+
+    async def on_progress(job):
+        progress.append(job.state)
+
+    job = switcher.start_switch("whisper-small", lambda: [client], on_progress)
+    await _wait_done(switcher, job)
+
+    assert job.state == STATE_COMPLETED
+    assert [e[0] for e in manager.events] == ["spawn", "warm", "repoint", "adopt", "drain", "stop"]
+    assert ("drain", "http://localhost:8080") in manager.events
+    assert ("stop", 8080) in manager.events
+    assert manager.model_name == "whisper-small"
+    assert progress[-1] == STATE_COMPLETED
+    assert manager.switch_in_progress is False
+
+
+@pytest.mark.asyncio
+async def test_failed_start_keeps_old_server(monkeypatch):
+    """Test that a new server that fails to start leaves the old one serving."""
+    manager = FakeManager(ready=False)
+    client = FakeClient(manager.events)
+    switcher = ModelSwitcher(manager=manager)
+
+    job = switcher.start_switch("whisper-small", lambda: [client])
+    await _wait_done(switcher, job)
+
+    assert job.state == STATE_FAILED
+    assert ("stop", 8081) in manager.events
+    assert not any(e[0] == "repoint" for e in manager.events)
+    assert manager.model_name == "whisper-tiny"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_switch_rejected(monkeypatch):
+    """Test that a second switch is rejected while one is running."""
+    manager = FakeManager()
+    switcher = ModelSwitcher(manager=manager)
+    monkeypatch.setattr(switcher, "_warm_up", lambda url, model: time.sleep(0.05))
+
+    job = switcher.start_switch("whisper-small", lambda: [])
+    with pytest.raises(RuntimeError):
+        switcher.start_switch("whisper-base", lambda: [])
+    await _wait_done(switcher, job)
+
+
+def test_client_drain_waits_for_inflight_requests():
+    """Test that draining waits for requests still sent to the old server."""
+    client = WhisperServerModel(server_url="http://old:8080")
+    old_url, _ = client._begin_request()
+    client.repoint("http://new:8081")
+
+    assert client.inflight("http://old:8080") == 1
+    assert client.inflight() == 0
+    assert client.wait_for_drain(old_url, timeout=0.01) is False
+
+    threading.Timer(0.05, client._end_request, args=(old_url,)).start()
+    assert client.wait_for_drain(old_url, timeout=2.0) is True
+
+
+@pytest.mark.asyncio
+async def test_loader_follows_switch_when_traffic_moves(monkeypatch):
+    """Test that results are labeled with the new model from the moment it serves."""
+    manager = FakeManager()
+    client = FakeClient(manager.events)
+    switcher = ModelSwitcher(manager=manager)
+    monkeypatch.setattr(switcher, "_warm_up", lambda url, model: None)
+    unloaded = []
+    loader = SimpleNamespace(
+        config=SimpleNamespace(name="whisper-tiny"),
+        unload=lambda backend=None, model_name=None: unloaded.append((backend, model_name, len(manager.events))),
+    )
+    names = {}
+
+    async def on_progress(job):
+        follow_switch(loader, job)
+        names[job.state] = loader.config.name
+
+    job = switcher.start_switch("whisper-small", lambda: [client], on_progress)
+    await _wait_done(switcher, job)
+
+    assert names[STATE_DRAINING] == "whisper-small"
+    # The old client is unloaded after it was drained, before the old server stops
+    drained = [e[0] for e in manager.events].index("drain") + 1
+    assert unloaded == [("whisper-server", "whisper-tiny", drained)]
@@ -0,0 +1,65 @@
+"""Unit tests for int8 quantization selection in the PyTorch backend."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.orac_stt.config.settings import ModelConfig
+from src.orac_stt.models.backends import BackendPlugin, PyTorchBackend, register_backend
+from src.orac_stt.models.quantization import cache_path, split_model_name
+from src.orac_stt.models.unified_loader import UnifiedWhisperLoader
+
+
+def test_model_name_suffix_selects_int8():
+    """Test that an -int8 model name suffix selects int8 quantization."""
+    assert split_model_name("whisper-base-int8") == ("whisper-base", "int8")
+    assert split_model_name("whisper-base") == ("whisper-base", None)
+    assert split_model_name("whisper-base", "int8") == ("whisper-base", "int8")
+
+
+def test_unknown_quantization_is_rejected():
+    """Test that unsupported quantization modes are rejected."""
+    with pytest.raises(ValueError, match="int4"):
+        split_model_name("whisper-base", "int4")
+
+
+def test_cache_path_is_versioned():
+    """Test that the quantized model cache path includes the library versions."""
+    path = cache_path(Path("/models"), "small", "int8", "2.3.0+cpu", "20240930")
+
+    assert path == Path("/models/quantized/small-int8-torch2.3.0_cpu-whisper20240930.pt")
+
+
+def test_int8_models_are_budgeted_smaller():
+    """Test that int8 models are budgeted less memory."""
+    plugin = PyTorchBackend()
+
+    assert plugin.memory_mb("whisper-small-int8") < plugin.memory_mb("whisper-small")
+
+
+class QuantizedModel:
+    quantization = {"mode": "int8", "cached": True, "load_time": 0.4, "size_mb": 45.2}
+
+    def transcribe(self, audio_data, sample_rate=16000, language=None, **kwargs):
+        return {"text": "ok"}
+
+
+class QuantizedPlugin(BackendPlugin):
+    name = "fake-quantized"
+
+    def create(self, config, model_name, device):
+        return QuantizedModel()
+
+
+def test_loader_reports_quantization(tmp_path):
+    """Test the requested and active quantization reported by the loader."""
+    register_backend(QuantizedPlugin())
+    config = ModelConfig(name="whisper-base-int8", device="cpu", cache_dir=tmp_path, backend="fake-quantized")
+    loader = UnifiedWhisperLoader(config)
+
+    assert loader.quantization() == {"requested": "int8", "active": None}
+    loader.transcribe(np.zeros(16000, dtype=np.float32))
+
+    assert loader.quantization()["active"]["cached"] is True
+    assert loader.loaded_backends()[0]["quantization"]["mode"] == "int8"
@@ -0,0 +1,129 @@
+"""Unit tests for memory-budgeted multi-model residency."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.orac_stt.api import topics
+from src.orac_stt.config.settings import ModelConfig, ResidencyConfig
+from src.orac_stt.core.heartbeat_manager import HeartbeatManager
+from src.orac_stt.core.residency import ModelResidencyManager
+from src.orac_stt.models.backends import BackendPlugin, register_backend
+from src.orac_stt.models.topic import TopicConfig
+from src.orac_stt.models.unified_loader import UnifiedWhisperLoader
+
+
+class FakeModel:
+    def transcribe(self, audio_data, sample_rate=16000, language=None, **kwargs):
+        return {"text": "", "confidence": 0.0}
+
+
+class SizedPlugin(BackendPlugin):
+    """In-process backend with fixed model sizes."""
+
+    name = "fake-resident"
+    in_process = True
+    MODEL_MEMORY_MB = {"whisper-tiny": 100, "whisper-base": 200, "whisper-small": 500}
+
+    def create(self, config, model_name, device):
+        return FakeModel()
+
+
+@pytest.fixture
+def loader(tmp_path):
+    register_backend(SizedPlugin())
+    config = ModelConfig(name="whisper-tiny", device="cpu", cache_dir=tmp_path, backend="fake-resident")
+    loader = UnifiedWhisperLoader(config)
+    loader.load_model()
+    return loader
+
+
+def topic(name, model):
+    return TopicConfig(name=name, preferred_model=model)
+
+
+@pytest.mark.asyncio
+async def test_preferred_model_loaded_then_hit(loader):
+    """Test that a topic's preferred model is loaded once and then reused."""
+    manager = ModelResidencyManager(ResidencyConfig(enabled=True, memory_budget_mb=1000))
+
+    assert await manager.acquire(loader, topic("dictation", "whisper-small")) == "whisper-small"
+    assert await manager.acquire(loader, topic("dictation", "whisper-small")) == "whisper-small"
+    assert await manager.acquire(loader, topic("timer", None)) is None
+
+    stats = manager.get_stats(loader)["models"]["whisper-small"]
+    assert (stats["hits"], stats["misses"], stats["loads"]) == (1, 1, 1)
+    assert loader.is_resident(model_name="whisper-small")
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_model_evicted(loader):
+    """Test that the least recently used model is evicted to make room."""
+    # Budget fits the configured tiny model plus one of base/small
+    manager = ModelResidencyManager(ResidencyConfig(enabled=True, memory_budget_mb=700))
+
+    await manager.acquire(loader, topic("a", "whisper-base"))
+    manager.release("whisper-base")
+    await manager.acquire(loader, topic("b", "whisper-small"))
+
+    assert not loader.is_resident(model_name="whisper-base")
+    assert loader.is_resident(model_name="whisper-small")
+    # The configured model is never evicted
+    assert loader.is_resident(model_name="whisper-tiny")
+    assert manager.get_stats(loader)["models"]["whisper-base"]["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_model_in_use_is_not_evicted(loader):
+    """Test that a model still decoding is not evicted."""
+    manager = ModelResidencyManager(ResidencyConfig(enabled=True, memory_budget_mb=700))
+
+    # whisper-base is still decoding when another topic needs whisper-small
+    assert await manager.acquire(loader, topic("a", "whisper-base")) == "whisper-base"
+    assert await manager.acquire(loader, topic("b", "whisper-small")) is None
+    assert loader.is_resident(model_name="whisper-base")
+    assert manager.get_stats(loader)["models"].get("whisper-base", {}).get("evictions") == 0
+
+    with manager.releasing("whisper-base"):
+        pass
+    assert await manager.acquire(loader, topic("b", "whisper-small")) == "whisper-small"
+    assert not loader.is_resident(model_name="whisper-base")
+
+
+@pytest.mark.asyncio
+async def test_model_over_budget_falls_back_to_configured(loader):
+    """Test that a model too large for the budget falls back to the configured model."""
+    manager = ModelResidencyManager(ResidencyConfig(enabled=True, memory_budget_mb=300))
+
+    assert await manager.acquire(loader, topic("dictation", "whisper-small")) is None
+    assert not loader.is_resident(model_name="whisper-small")
+
+
+@pytest.mark.asyncio
+async def test_prefetch_does_not_evict_wanted_models(loader):
+    """Test that prefetching stops rather than evict another wanted model."""
+    manager = ModelResidencyManager(ResidencyConfig(enabled=True, memory_budget_mb=700))
+
+    loaded = await manager.prefetch(loader, [topic("a", "whisper-base"), topic("b", "whisper-small")])
+
+    # Both are wanted but only the most recent topic's model fits
+    assert loaded == ["whisper-base"]
+    assert loader.is_resident(model_name="whisper-base")
+
+
+def test_unknown_preferred_model_is_rejected(tmp_path, monkeypatch):
+    """Test that a topic's preferred model must be a known model."""
+    manager = HeartbeatManager(data_dir=str(tmp_path))
+    monkeypatch.setattr(topics, "get_heartbeat_manager", lambda: manager)
+    app = FastAPI()
+    app.include_router(topics.router)
+    client = TestClient(app)
+
+    response = client.post("/admin/topics/dictation/model", json={"preferred_model": "whisper-huge"})
+    assert response.status_code == 400
+    assert manager.get_topic_registry().get_topic("dictation") is None
+
+    for model in ("whisper-small", "whisper-small-int8", None):
+        response = client.post("/admin/topics/dictation/model", json={"preferred_model": model})
+        assert response.status_code == 200
+        assert manager.get_topic_registry().get_topic("dictation").preferred_model == model
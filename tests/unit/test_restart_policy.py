@@ -0,0 +1,159 @@
+"""Unit tests for whisper-server restart backoff and crash-loop fallback."""
+
+import asyncio
+import os
+import signal
+import socket
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.orac_stt import dependencies
+from src.orac_stt.utils.metrics import registry
+from src.orac_stt.config.settings import RestartPolicyConfig
+from src.orac_stt.core import model_switcher, restart_policy
+from src.orac_stt.core.model_switcher import ModelSwitcher
+from src.orac_stt.core.restart_policy import RestartPolicy
+from src.orac_stt.core.whisper_manager import WhisperServerManager
+from src.orac_stt.models.backends import WhisperServerBackend
+
+
+def policy(tmp_path, **overrides) -> RestartPolicy:
+    return RestartPolicy(RestartPolicyConfig(history_file=tmp_path / "restarts.json", **overrides))
+
+
+def test_backoff_grows_with_recent_restarts(tmp_path):
+    """Test that restart backoff grows exponentially within the window."""
+    restarts = policy(tmp_path, initial_backoff=1.0, max_backoff=5.0, jitter=0.2)
+    assert restarts.next_delay() == 0.0
+
+    delays = []
+    for _ in range(5):
+        restarts.record("exited (code 1)", "whisper-base", False, 0.1)
+        delays.append(restarts.next_delay())
+
+    for delay, base in zip(delays, [1.0, 2.0, 4.0, 5.0, 5.0]):
+        assert base * 0.8 <= delay <= base * 1.2
+    # Restarts outside the window no longer count
+    assert restarts.next_delay(now=time.time() + 3600) == 0.0
+
+
+def test_history_survives_restarts_and_detects_crash_loop(tmp_path):
+    """Test that restart history is persisted and detects a crash loop."""
+    first = policy(tmp_path, crash_loop_restarts=3)
+    for _ in range(2):
+        first.record("exited (code 1)", "whisper-base", True, 1.0)
+    assert not first.in_crash_loop()
+
+    # A new process (container restart) sees the earlier restarts
+    second = policy(tmp_path, crash_loop_restarts=3)
+    second.record("unresponsive", "whisper-base", False, 1.0)
+    assert second.in_crash_loop()
+    assert [event["reason"] for event in second.history()] == ["exited (code 1)"] * 2 + ["unresponsive"]
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def wait_for(condition, timeout: float = 20.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        await asyncio.sleep(0.02)
+
+
+def recoveries(fallback: str) -> float:
+    return registry.get_sample_value("orac_stt_whisper_server_recovery_seconds_count", {"fallback": fallback}) or 0
+
+
+async def started_manager(**kwargs) -> WhisperServerManager:
+    manager = WhisperServerManager(host="127.0.0.1", port=free_port(), health_refresh_interval=60.0, **kwargs)
+    assert await manager.start()
+    await manager.start_watchdog()
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_time_to_recovery_after_crash(fake_whisper_server):
+    """Test that a crashed whisper-server is restarted and recovery is timed."""
+    manager = await started_manager()
+    before = recoveries("false")
+
+    start = time.monotonic()
+    os.kill(manager.active_pid, signal.SIGKILL)
+    await wait_for(lambda: recoveries("false") == before + 1)
+
+    assert time.monotonic() - start < 10.0
+    assert manager.is_healthy() and manager.model_name == "whisper-base"
+    assert restart_policy.get_restart_policy().history()[-1]["success"] is True
+    await manager.stop()
+
+
+@pytest.mark.asyncio
+async def test_crash_loop_falls_back_to_fallback_model(fake_whisper_server, monkeypatch, tmp_path):
+    """Test that a crash loop switches to the fallback model."""
+    monkeypatch.setattr(restart_policy, "_restart_policy", policy(
+        tmp_path, initial_backoff=0.05, jitter=0.0, crash_loop_restarts=2, fallback_model="whisper-tiny",
+    ))
+    loader = Mock()
+    loader.config.name = "whisper-base"
+    monkeypatch.setattr(dependencies, "_model_loader", loader)
+    manager = await started_manager()
+    before = recoveries("true")
+
+    # The model file goes bad: every restart with it crashes while loading
+    (fake_whisper_server.parent / "ggml-base.bin").write_bytes(b"corrupt")
+    os.kill(manager.active_pid, signal.SIGKILL)
+    await wait_for(lambda: recoveries("true") == before + 1)
+
+    assert manager.model_name == "whisper-tiny" and manager.original_model == "whisper-base"
+    assert loader.config.name == "whisper-tiny"  # Results are labeled with the model serving them
+    history = restart_policy.get_restart_policy().history()
+    assert [event["success"] for event in history] == [False, False, True]
+    assert history[1]["delay_s"] == 0.05 and history[-1]["fallback"] is True
+    assert manager.get_status()["restart_policy"]["crash_loop"] is True
+    await manager.stop()
+
+
+@pytest.mark.asyncio
+async def test_configured_model_restored_once_crash_loop_is_over(fake_whisper_server, monkeypatch, tmp_path):
+    """Test that the configured model is restored once the crash loop is over."""
+    restarts = policy(tmp_path, window=1.0)
+    monkeypatch.setattr(restart_policy, "_restart_policy", restarts)
+    loader = Mock(get_instances=lambda backend: [])
+    loader.config.name = "whisper-tiny"
+    monkeypatch.setattr(dependencies, "_model_loader", loader)
+    monkeypatch.setattr(WhisperServerBackend, "_url_override", None)
+    # Running the fallback model after a crash loop
+    restarts.record("exited (code 1)", "whisper-base", True, 0.1, fallback=True)
+    manager = await started_manager(model_name="whisper-tiny", health_check_interval=0.1)
+    manager.original_model = "whisper-base"
+    monkeypatch.setattr(model_switcher, "_model_switcher", ModelSwitcher(manager, warmup_durations=(0.5,)))
+
+    # Not while the restart is still within the crash-loop window
+    await asyncio.sleep(0.5)
+    assert manager.model_name == "whisper-tiny"
+
+    await wait_for(lambda: manager.model_name == "whisper-base" and not manager.switch_in_progress)
+    assert manager.original_model is None
+    assert manager.get_status()["fallback_from"] is None
+    assert loader.config.name == "whisper-base"
+    loader.unload.assert_called_once_with(backend="whisper-server", model_name="whisper-tiny")
+    await manager.stop()
+
+
+def test_switching_models_ends_fallback_but_standby_takeover_does_not():
+    """Test that only a switch to another model ends the fallback."""
+    manager = WhisperServerManager(host="127.0.0.1", port=free_port(), model_name="whisper-tiny")
+    manager.original_model = "whisper-base"
+
+    # A hot standby runs the active (fallback) model
+    manager.adopt(Mock(pid=1), "whisper-tiny", manager.alternate_port)
+    assert manager.original_model == "whisper-base"
+
+    manager.adopt(Mock(pid=2), "whisper-small", manager.alternate_port)
+    assert manager.original_model is None
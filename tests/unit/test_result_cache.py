@@ -0,0 +1,138 @@
+"""Unit tests for the transcription result cache."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from src.orac_stt.config.settings import ResultCacheConfig
+from src.orac_stt.core.result_cache import TranscriptionCache, cache_key
+
+AUDIO = np.linspace(-0.5, 0.5, 16000, dtype=np.float32)
+
+
+def test_key_covers_audio_and_params():
+    """Test that the cache key changes with the audio and decode parameters."""
+    params = {"model": "whisper-tiny", "language": "en"}
+
+    assert cache_key(AUDIO, 16000, params) == cache_key(AUDIO.copy(), 16000, dict(params))
+    assert cache_key(AUDIO, 16000, params) != cache_key(AUDIO[::-1], 16000, params)
+    assert cache_key(AUDIO, 16000, params) != cache_key(AUDIO, 16000, {**params, "language": "de"})
+
+
+@pytest.mark.asyncio
+async def test_repeated_request_is_a_hit():
+    """Test that a repeated request is served from the cache."""
+    cache = TranscriptionCache()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return {"text": "lights on"}
+
+    first, outcome = await cache.get_or_compute("k", compute)
+    assert outcome == "miss"
+    await asyncio.sleep(0)  # Let the done callback store the result
+    second, outcome = await cache.get_or_compute("k", compute)
+
+    assert outcome == "hit"
+    assert second == first == {"text": "lights on"}
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_inference():
+    """Test that concurrent identical requests share one inference."""
+    cache = TranscriptionCache()
+    release = asyncio.Event()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await release.wait()
+        return {"text": "lights off"}
+
+    waiters = [asyncio.create_task(cache.get_or_compute("k", compute)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*waiters)
+
+    assert len(calls) == 1
+    assert sorted(outcome for _, outcome in results) == ["coalesced", "coalesced", "miss"]
+    assert all(result == {"text": "lights off"} for result, _ in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_inference():
+    """Test that cancelling the first caller does not cancel the shared inference."""
+    cache = TranscriptionCache()
+    release = asyncio.Event()
+
+    async def compute():
+        await release.wait()
+        return {"text": "stop"}
+
+    leader = asyncio.create_task(cache.get_or_compute("k", compute))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(cache.get_or_compute("k", compute))
+    await asyncio.sleep(0)
+    leader.cancel()
+    release.set()
+
+    result, outcome = await follower
+    assert (result, outcome) == ({"text": "stop"}, "coalesced")
+
+
+@pytest.mark.asyncio
+async def test_failures_and_aborted_decodes_are_not_cached():
+    """Test that failed and aborted decodes are not cached."""
+    cache = TranscriptionCache()
+
+    async def fail():
+        raise RuntimeError("backend down")
+
+    async def aborted():
+        return {"text": "", "decode_aborted": "timeout"}
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_compute("a", fail)
+    await cache.get_or_compute("b", aborted)
+    await asyncio.sleep(0)
+
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+
+
+def test_degraded_results_are_not_cached():
+    """Test that results decoded at a degraded level are not cached."""
+    cache = TranscriptionCache()
+
+    cache.put("degraded", {"text": "lights on", "degradation_level": 2})
+    cache.put("full", {"text": "lights on", "degradation_level": 0})
+
+    assert cache.get("degraded") is None
+    assert cache.get("full")["text"] == "lights on"
+
+
+def test_lru_and_memory_bounds():
+    """Test that the cache is bounded by entry count and memory."""
+    cache = TranscriptionCache(ResultCacheConfig(max_entries=2))
+    for key in ("a", "b", "c"):
+        cache.put(key, {"text": key})
+    assert cache.get("a") is None
+    assert cache.get("c") == {"text": "c"}
+
+    tiny = TranscriptionCache(ResultCacheConfig(max_memory_mb=0.001))  # ~1 KB
+    tiny.put("a", {"text": "a"})
+    tiny.put("b", {"text": "b"})
+    assert tiny.get_stats()["entries"] == 1
+    assert tiny.get("b") == {"text": "b"}
+
+
+def test_expired_entries_are_dropped():
+    """Test that entries older than the TTL are dropped."""
+    cache = TranscriptionCache(ResultCacheConfig(ttl=0.0))
+    cache.put("a", {"text": "a"})
+
+    assert cache.get("a") is None
+    assert cache.get_stats()["expired"] == 1
@@ -0,0 +1,65 @@
+"""Unit tests for draining whisper-server output."""
+
+import asyncio
+import sys
+
+import pytest
+
+from src.orac_stt.utils.metrics import registry
+from src.orac_stt.core.server_output import ServerOutputLog, parse_timing
+from src.orac_stt.core.whisper_manager import WhisperServerManager
+
+TIMINGS = """\
+whisper_print_timings:     load time =   101.23 ms
+whisper_print_timings:     fallbacks =   0 p /   0 h
+whisper_print_timings:      mel time =    10.45 ms
+whisper_print_timings:   encode time =   350.12 ms /     1 runs (  350.12 ms per run)
+whisper_print_timings:   decode time =    20.33 ms /     5 runs (    4.07 ms per run)
+whisper_print_timings:    total time =   498.87 ms
+"""
+
+
+def stage_count(stage: str) -> float:
+    return registry.get_sample_value("orac_stt_whisper_server_stage_seconds_count", {"stage": stage}) or 0
+
+
+def test_parse_timing_lines():
+    """Test parsing whisper.cpp timing lines into stage durations."""
+    assert parse_timing("whisper_print_timings:   encode time =   350.12 ms /     1 runs") == ("encode", 0.35012)
+    assert parse_timing("whisper_print_timings:     fallbacks =   0 p /   0 h") is None
+    assert parse_timing("main: processing 'audio.wav'") is None
+
+
+@pytest.mark.asyncio
+async def test_drain_keeps_ring_and_observes_timings():
+    """Test that draining keeps the last lines and records stage timings."""
+    stream = asyncio.StreamReader()
+    stream.feed_data(("noise\n" * 10 + TIMINGS).encode())
+    stream.feed_eof()
+    encodes = stage_count("encode")
+    log = ServerOutputLog(max_lines=4)
+
+    await log.drain(stream, port=8080)
+
+    assert [entry["line"] for entry in log.tail(2)][-1].endswith("498.87 ms")
+    assert log.get_stats()["buffered_lines"] == 4 and log.get_stats()["total_lines"] == 16
+    assert log.last_timings == {"load": 101.23, "mel": 10.45, "encode": 350.12, "decode": 20.33, "total": 498.87}
+    assert stage_count("encode") == encodes + 1
+
+
+@pytest.mark.asyncio
+async def test_chatty_server_does_not_block_on_full_pipe(monkeypatch, tmp_path):
+    """Test that server output is drained so the process never blocks on it."""
+    # Far more output than a pipe buffer holds; unread, the process would block
+    server = tmp_path / "whisper-server"
+    server.write_text(f"#!{sys.executable}\nfor i in range(20000):\n    print('decoding segment', i)\n")
+    server.chmod(0o755)
+    manager = WhisperServerManager(output_lines=10)
+    monkeypatch.setattr(manager, "WHISPER_SERVER_BIN", str(server))
+
+    process = await manager.spawn("whisper-base", 18080)
+
+    assert await asyncio.wait_for(process.wait(), timeout=10.0) == 0
+    await asyncio.gather(*manager._drain_tasks)
+    assert manager.output.tail(1)[0]["line"] == "decoding segment 19999"
+    assert manager.output.tail(1)[0]["port"] == 18080
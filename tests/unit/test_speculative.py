@@ -0,0 +1,105 @@
+"""Unit tests for draft-and-verify speculative greedy decoding."""
+
+import random
+
+import pytest
+
+from src.orac_stt.config.settings import ModelConfig
+from src.orac_stt.models.backends import BackendPlugin, register_backend
+from src.orac_stt.models.speculative import greedy_decode, speculative_decode
+from src.orac_stt.models.unified_loader import UnifiedWhisperLoader
+
+EOT = 0
+PROMPT = [900, 901, 902]
+
+
+class FakeSession:
+    """Deterministic decoder whose greedy token depends on the whole prefix."""
+
+    def __init__(self, length: int, error_rate: float = 0.0, seed: int = 0):
+        self.target_length = length
+        self.error_rate = error_rate
+        self.seed = seed
+        self.tokens = []
+        self.passes = 0
+
+    @property
+    def length(self):
+        return len(self.tokens)
+
+    def _predict(self, prefix):
+        generated = len(prefix) - len(PROMPT)
+        if generated >= self.target_length:
+            return EOT
+        token = 1 + hash(tuple(prefix)) % 50
+        if self.error_rate and random.Random(hash((self.seed, tuple(prefix)))).random() < self.error_rate:
+            token = 51 + token  # a token the target never produces
+        return token
+
+    def extend(self, tokens):
+        self.passes += 1
+        out = []
+        for token in tokens:
+            self.tokens.append(token)
+            out.append((self._predict(self.tokens), -0.1))
+        return out
+
+    def truncate(self, length):
+        del self.tokens[length:]
+
+
+@pytest.mark.parametrize("k", [1, 2, 4, 8])
+@pytest.mark.parametrize("error_rate", [0.0, 0.3, 1.0])
+def test_output_identical_to_greedy(k, error_rate):
+    """Test that speculative decoding produces exactly the greedy output."""
+    reference = greedy_decode(FakeSession(30), PROMPT, EOT, max_tokens=224)
+    output = speculative_decode(
+        FakeSession(30), FakeSession(30, error_rate=error_rate, seed=k), PROMPT, EOT, 224, k=k
+    )
+
+    assert len(reference.tokens) == 30
+    assert output.tokens == reference.tokens
+
+
+def test_token_budget_respected():
+    """Test that speculative decoding stops at the token budget."""
+    reference = greedy_decode(FakeSession(100), PROMPT, EOT, max_tokens=17)
+    output = speculative_decode(FakeSession(100), FakeSession(100), PROMPT, EOT, 17, k=4)
+
+    assert output.tokens == reference.tokens
+    assert len(output.tokens) == 17
+
+
+def test_accurate_draft_reduces_target_passes():
+    """Test that an accurate draft saves target model passes."""
+    target = FakeSession(40)
+    output = speculative_decode(target, FakeSession(40), PROMPT, EOT, 224, k=4)
+
+    assert output.acceptance_rate == 1.0
+    # One pass for the prompt, then one per 4 accepted tokens + 1 bonus token
+    assert target.passes <= 1 + 40 // 5 + 1
+
+
+class InProcessPlugin(BackendPlugin):
+    name = "fake-in-process"
+    in_process = True
+
+    def create(self, config, model_name, device):
+        return object()
+
+
+def test_draft_only_for_in_process_backends(tmp_path):
+    """Test that draft options are only used by in-process backends."""
+    register_backend(InProcessPlugin())
+    config = ModelConfig(
+        name="whisper-small", device="cpu", cache_dir=tmp_path,
+        backend="fake-in-process", speculative_draft_model="whisper-tiny",
+    )
+    loader = UnifiedWhisperLoader(config)
+
+    options = loader._speculative_options(loader._key())
+    assert options["speculative_k"] == 4
+    assert loader.is_resident(model_name="whisper-tiny")
+    # The draft never drafts for itself
+    assert loader._speculative_options(loader._key(model_name="whisper-tiny")) == {}
+    assert loader._speculative_options(("whisper-server", "whisper-small", "cpu")) == {}
@@ -0,0 +1,78 @@
+"""Unit tests for the hot-standby whisper-server."""
+
+import asyncio
+import os
+import signal
+import socket
+import time
+
+import pytest
+
+from src.orac_stt.config.settings import StandbyConfig
+from src.orac_stt.core import standby as standby_module
+from src.orac_stt.core.standby import WhisperStandby
+from src.orac_stt.core.whisper_manager import WhisperServerManager
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def wait_for(condition, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        await asyncio.sleep(0.02)
+
+
+class FakeClient:
+    def __init__(self):
+        self.urls = []
+
+    def repoint(self, url):
+        self.urls.append(url)
+
+
+@pytest.mark.asyncio
+async def test_crash_fails_over_to_standby_and_rebuilds(fake_whisper_server, monkeypatch):
+    """Test that a crash fails over to the standby and a new standby is started."""
+    monkeypatch.setattr(standby_module, "available_mb", lambda: None)
+    active_port, standby_port = free_port(), free_port()
+    manager = WhisperServerManager(host="127.0.0.1", port=active_port, health_refresh_interval=60.0)
+    client = FakeClient()
+    manager.standby = WhisperStandby(
+        manager, StandbyConfig(enabled=True, port=standby_port, check_interval=60.0), clients=lambda: [client]
+    )
+    assert await manager.start()
+    await manager.start_watchdog()
+    await wait_for(lambda: manager.standby.ready)
+    old_pid = manager.active_pid
+
+    start = time.monotonic()
+    os.kill(old_pid, signal.SIGKILL)
+    await wait_for(lambda: manager.port == standby_port)
+
+    assert time.monotonic() - start < 2.0
+    assert client.urls == [f"http://127.0.0.1:{standby_port}"]
+    assert manager.is_healthy() and manager.standby.failovers == 1
+    # The failed server comes back as the new standby on the old port
+    await wait_for(lambda: manager.standby.ready)
+    assert manager.standby.port == active_port and manager.standby.pid != old_pid
+    assert manager.get_status()["standby"]["memory_overhead_mb"] > 0
+    await manager.stop()
+
+
+@pytest.mark.asyncio
+async def test_standby_is_not_started_when_memory_is_tight(fake_whisper_server, monkeypatch):
+    """Test that no standby is started without enough free memory."""
+    monkeypatch.setattr(standby_module, "available_mb", lambda: 600.0)
+    manager = WhisperServerManager(host="127.0.0.1", port=free_port())
+    standby = WhisperStandby(manager, StandbyConfig(enabled=True, port=free_port(), min_available_mb=700))
+
+    await standby.maintain()
+
+    assert standby.pid is None and not standby.ready
+    assert "must stay free" in standby.get_status()["disabled_reason"]
+    assert not await standby.take_over()
@@ -257,14 +257,16 @@ class TestForwardToCoreAsync:
     """Test forward_to_core_async function."""
 
     @pytest.mark.asyncio
-    async def test_forward_creates_task(self):
-        """Test that forwarding creates an async task."""
+    async def test_forward_queues_on_dispatcher(self):
+        """Test that forwarding queues the transcription for the client's Core."""
         mock_client = Mock()
-        mock_client.forward_transcription = AsyncMock()
+        mock_client.base_url = "http://core:8000"
 
         metadata = {"confidence": 0.95, "language": "en"}
 
-        with patch('src.orac_stt.api.stt.asyncio.create_task') as mock_create_task:
+        with patch('src.orac_stt.api.stt.get_core_dispatcher') as mock_dispatcher, \
+                patch('src.orac_stt.api.stt.get_heartbeat_manager') as mock_heartbeat:
+            mock_heartbeat.return_value.get_topic_registry.return_value.get_core_url.return_value = None
             await forward_to_core_async(
                 core_client=mock_client,
                 text="test",
@@ -272,24 +274,46 @@ class TestForwardToCoreAsync:
                 metadata=metadata
             )
 
-            # Verify create_task was called
-            mock_create_task.assert_called_once()
+            mock_dispatcher.return_value.submit.assert_called_once_with(
+                "http://core:8000", "test", "general", metadata
+            )
+
+    @pytest.mark.asyncio
+    async def test_forward_uses_topic_core_url(self):
+        """Test that a topic's Core URL override applies to transcriptions."""
+        mock_client = Mock()
+        mock_client.base_url = "http://core:8000"
+
+        with patch('src.orac_stt.api.stt.get_core_dispatcher') as mock_dispatcher, \
+                patch('src.orac_stt.api.stt.get_heartbeat_manager') as mock_heartbeat:
+            mock_heartbeat.return_value.get_topic_registry.return_value.get_core_url.return_value = "http://kitchen:8000"
+            await forward_to_core_async(
+                core_client=mock_client,
+                text="test",
+                topic="kitchen",
+                metadata={}
+            )
+
+            mock_dispatcher.return_value.submit.assert_called_once_with(
+                "http://kitchen:8000", "test", "kitchen", {}
+            )
 
     @pytest.mark.asyncio
     async def test_forward_handles_errors(self):
         """Test that forwarding errors are caught and logged."""
         mock_client = Mock()
-        mock_client.forward_transcription = AsyncMock(side_effect=Exception("Network error"))
 
         metadata = {"confidence": 0.95, "language": "en"}
 
         # Should not raise - errors are caught and logged
-        await forward_to_core_async(
-            core_client=mock_client,
-            text="test",
-            topic="general",
-            metadata=metadata
-        )
+        with patch('src.orac_stt.api.stt.get_core_dispatcher') as mock_dispatcher:
+            mock_dispatcher.return_value.submit.side_effect = Exception("Queue error")
+            await forward_to_core_async(
+                core_client=mock_client,
+                text="test",
+                topic="general",
+                metadata=metadata
+            )
 
 
 class TestBuildTranscriptionResponse:
@@ -0,0 +1,112 @@
+"""Unit tests for the acoustic template fast path."""
+
+import numpy as np
+
+from src.orac_stt.audio.features import dtw_distance, mfcc
+from src.orac_stt.config.settings import TemplateConfig
+from src.orac_stt.core.templates import TemplateMatcher
+
+SR = 16000
+
+
+def command(f0: float, f1: float, duration: float = 1.0, seed: int = 0) -> np.ndarray:
+    """Harmonic chirp standing in for a spoken command, padded with silence."""
+    t = np.arange(int(duration * SR)) / SR
+    phase = 2 * np.pi * (f0 * t + (f1 - f0) * t ** 2 / (2 * duration))
+    envelope = 0.5 * (1 + np.sin(2 * np.pi * 3 * t - np.pi / 2))
+    voiced = 0.3 * sum(np.sin(k * phase) / k for k in range(1, 5)) * envelope
+    noise = 0.005 * np.random.default_rng(seed).standard_normal(len(t) + SR // 2)
+    audio = noise.copy()
+    audio[SR // 4:SR // 4 + len(t)] += voiced
+    return audio.astype(np.float32)
+
+
+def learn(matcher: TemplateMatcher, audio: np.ndarray, text: str, confidence: float = 0.95) -> bool:
+    utterance = matcher.extract(audio, SR)
+    return matcher.learn("general", utterance, {"text": text, "confidence": confidence, "language": "en"})
+
+
+def test_dtw_tolerates_tempo_changes():
+    """Test that DTW distance tolerates a slower utterance of the same command."""
+    a = mfcc(command(150, 300))
+    slower = mfcc(command(150, 300, duration=1.15, seed=1))
+    other = mfcc(command(300, 120, duration=0.8, seed=2))
+
+    assert dtw_distance(a, a) == 0.0
+    assert dtw_distance(a, slower) < dtw_distance(a, other)
+
+
+def test_matches_learned_command(make_matcher):
+    """Test matching audio against learned command templates."""
+    matcher = make_matcher()
+    assert learn(matcher, command(150, 300), "Lights on.")
+    assert learn(matcher, command(300, 120, duration=0.9), "Lights off.")
+
+    match = matcher.match("general", matcher.extract(command(150, 300, duration=1.1, seed=3), SR))
+
+    assert match is not None
+    assert match.result()["text"] == "Lights on."
+    assert match.runner_up < match.similarity
+    assert matcher.get_stats()["hits"] == 1
+
+
+def test_unknown_audio_misses(make_matcher):
+    """Test that unknown audio and other topics do not match."""
+    matcher = make_matcher()
+    learn(matcher, command(150, 300), "Lights on.")
+
+    noise = np.random.default_rng(4).standard_normal(SR).astype(np.float32) * 0.2
+
+    assert matcher.match("general", matcher.extract(noise, SR)) is None
+    assert matcher.match("kitchen", matcher.extract(command(150, 300), SR)) is None
+    assert matcher.get_stats()["misses"] == 2
+
+
+def test_only_confident_short_results_are_learned(make_matcher):
+    """Test that only confident short transcriptions become templates."""
+    matcher = make_matcher(max_words=3)
+    audio = command(150, 300)
+
+    assert not learn(matcher, audio, "Lights on.", confidence=0.5)
+    assert not learn(matcher, audio, "please turn all of the lights on")
+    assert not learn(matcher, audio, "")
+    assert matcher.get_stats()["topics"] == {}
+
+
+def test_templates_per_text_and_topic_are_bounded(make_matcher):
+    """Test the template limits per text and per topic."""
+    matcher = make_matcher(templates_per_text=2, max_templates=3)
+    for seed in range(3):
+        learn(matcher, command(150, 300, seed=seed), "Lights on.")
+    learn(matcher, command(300, 120), "Lights off.")
+    learn(matcher, command(200, 400), "Stop.")
+
+    topic = matcher.get_stats()["topics"]["general"]
+    assert topic["templates"] == 3
+    assert all(entry["templates"] <= 2 for entry in topic["texts"].values())
+
+
+def test_false_accept_is_audited_and_template_dropped(make_matcher):
+    """Test that a false accept is audited and its template dropped."""
+    matcher = make_matcher()
+    learn(matcher, command(150, 300), "Lights on.")
+    match = matcher.match("general", matcher.extract(command(150, 300, seed=5), SR))
+    assert match is not None
+
+    assert matcher.verify(match, {"text": "lights on"})
+    assert not matcher.verify(match, {"text": "Lights off."})
+
+    stats = matcher.get_stats()
+    assert stats["verifications"] == 2
+    assert stats["false_accepts"] == 1
+    assert stats["audits"][0]["whisper_text"] == "Lights off."
+    assert stats["topics"]["general"]["templates"] == 0
+
+
+def test_disabled_matcher_accepts_nothing(make_matcher):
+    """Test which audio the matcher does not accept."""
+    matcher = TemplateMatcher(TemplateConfig(enabled=False))
+
+    assert not matcher.accepts(command(150, 300), SR)
+    assert not make_matcher(max_duration=1.0).accepts(command(150, 300, duration=2.0), SR)
+    assert not make_matcher().accepts(command(150, 300), SR, task="translate")
@@ -0,0 +1,71 @@
+"""Unit tests for model warm-up and readiness gating."""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.orac_stt.api import health
+from src.orac_stt.core import warmup
+from src.orac_stt.core.warmup import ReadinessGate, run_warmup, warm_up_loader
+
+
+class FakeLoader:
+    """Model loader that fails a configurable number of loads."""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.config = type("Config", (), {"name": "whisper-tiny"})()
+        self.backend_name = "fake"
+        self.lengths = []
+
+    def load_model(self):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("backend not up yet")
+
+    def transcribe(self, audio):
+        self.lengths.append(len(audio))
+        return {"text": ""}
+
+
+def test_run_warmup_reports_latency_per_length():
+    """Test that warm-up transcribes each utterance length and reports its latency."""
+    lengths = []
+    report = run_warmup(lambda audio: lengths.append(len(audio)), (1.0, 3.0), model="m", backend="b")
+
+    assert lengths == [16000, 48000]
+    assert set(report["latencies"]) == {"1s", "3s"}
+    assert report["model"] == "m"
+
+
+@pytest.mark.asyncio
+async def test_warm_up_loader_retries_until_ready():
+    """Test that warm-up retries after a failure and then opens the gate."""
+    gate = ReadinessGate()
+    loader = FakeLoader(failures=1)
+
+    await asyncio.wait_for(warm_up_loader(loader, gate, (0.5,), retry_interval=0.01), timeout=5)
+
+    assert gate.is_ready
+    assert loader.lengths == [8000]
+    assert gate.get_status()["last_warmup"]["backend"] == "fake"
+
+
+def test_readiness_endpoint_gated(monkeypatch):
+    """Test that the readiness endpoint returns 503 until warm-up is done."""
+    gate = ReadinessGate()
+    monkeypatch.setattr(warmup, "_readiness_gate", gate)
+    app = FastAPI()
+    app.include_router(health.router)
+    client = TestClient(app)
+
+    response = client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json()["status"] == "not_ready"
+
+    gate.set_ready()
+    response = client.get("/health/ready")
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
@@ -0,0 +1,86 @@
+"""Unit tests for the asyncio whisper-server manager."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.orac_stt.core.whisper_manager import WhisperServerManager
+
+
+async def _hanging_server(reader, writer):
+    # Never answers; returns once the client gives up and disconnects
+    await reader.read()
+    writer.close()
+
+
+@pytest.mark.asyncio
+async def test_status_is_served_from_cache_while_server_hangs():
+    """Test that status is served from the cached snapshot while a probe hangs."""
+    server = await asyncio.start_server(_hanging_server, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    manager = WhisperServerManager(host="127.0.0.1", port=port, health_check_timeout=0.3)
+    manager.get_status()  # Create the singletons it reports on
+
+    probe = asyncio.create_task(manager.check_health())
+    await asyncio.sleep(0.05)
+    start = time.perf_counter()
+    status = manager.get_status()
+    assert time.perf_counter() - start < 0.01
+    assert status["is_healthy"] is False and status["health"]["checked_at"] is None
+
+    assert await probe is False
+    assert "timed out" in manager.get_status()["health"]["error"]
+    server.close()
+
+
+@pytest.mark.asyncio
+async def test_process_exit_triggers_restart_immediately(fake_whisper_server, monkeypatch):
+    """Test that a process exit triggers a restart without waiting for the watchdog."""
+    manager = WhisperServerManager(health_check_interval=60.0, health_refresh_interval=60.0)
+    monkeypatch.setattr(manager, "WHISPER_SERVER_BIN", "/bin/sleep")
+
+    async def no_existing(port=None):
+        return False
+
+    async def ready(timeout=60.0, url=None, process=None):
+        return True
+
+    restarted = asyncio.Event()
+
+    async def restart():
+        restarted.set()
+        return True
+
+    monkeypatch.setattr(manager, "_kill_existing", no_existing)
+    monkeypatch.setattr(manager, "_wait_for_ready", ready)
+    monkeypatch.setattr(manager, "restart", restart)
+    # /bin/sleep rejects whisper-server's flags and exits at once
+    assert await manager.start()
+    await manager.start_watchdog()
+
+    await asyncio.wait_for(restarted.wait(), timeout=5.0)
+    assert manager.is_healthy() is False
+    assert "exited" in manager.get_status()["health"]["error"]
+    await manager.stop()
+
+
+@pytest.mark.asyncio
+async def test_stopping_the_server_is_not_treated_as_a_crash(monkeypatch):
+    """Test that stopping a server on purpose does not trigger a restart."""
+    manager = WhisperServerManager()
+    manager._running = True
+    restarts = []
+
+    async def restart():
+        restarts.append(True)
+        return True
+
+    monkeypatch.setattr(manager, "restart", restart)
+    process = await asyncio.create_subprocess_exec("sleep", "30")
+    manager.adopt(process, "whisper-base", manager.port)
+
+    await manager.stop_instance(process)
+    await asyncio.sleep(0.05)
+    assert restarts == []
+    manager._running = False
@@ -0,0 +1,111 @@
+"""Unit tests for the CPU-affinity-aware inference worker pool."""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from src.orac_stt.models import worker_pool
+from src.orac_stt.models.worker_pool import WorkerPoolModel, _thread_env, _Worker, plan_workers
+
+AUDIO = np.zeros(16000, dtype=np.float32)
+
+
+def test_auto_plan_reserves_a_core_and_caps_threads():
+    """Test that the automatic plan reserves a core and caps threads per worker."""
+    plan = plan_workers(list(range(16)))
+
+    # 15 usable cores, 4 threads per worker
+    assert plan == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9, 10, 11]]
+
+
+def test_plan_with_fixed_worker_count_splits_cores():
+    """Test splitting cores between a fixed number of workers."""
+    assert plan_workers(list(range(9)), workers=2) == [[0, 1, 2, 3], [4, 5, 6, 7]]
+    assert plan_workers(list(range(8)), workers=4, threads_per_worker=1, reserved_cores=0) == [[0], [1], [2], [3]]
+
+
+def test_small_hosts_get_one_worker_on_all_cores():
+    """Test that small hosts get a single worker using every core."""
+    assert plan_workers([0]) == [[0]]
+    assert plan_workers([0, 1]) == [[0, 1]]
+
+
+def test_oversubscribed_plan_wraps_around_cores():
+    """Test that a plan needing more cores than available reuses them."""
+    plan = plan_workers([0, 1, 2], workers=3, threads_per_worker=2, reserved_cores=0)
+
+    assert plan == [[0, 1], [0, 2], [1, 2]]
+
+
+class SlowModel:
+    def __init__(self):
+        self.threads = []
+
+    def transcribe(self, audio_data, sample_rate=16000, language=None, **kwargs):
+        self.threads.append(kwargs["threads"])
+        time.sleep(0.05)
+        return {"text": "ok", "worker_thread": threading.current_thread().name}
+
+
+def thread_pool(n: int) -> WorkerPoolModel:
+    """Pool whose workers are threads of this process instead of pinned processes."""
+    pool = object.__new__(WorkerPoolModel)
+    pool.backend = "fake"
+    pool.model_name = "whisper-tiny"
+    pool._lock = threading.Lock()
+    pool._workers = [
+        _Worker(index=i, cores=[i], executor=ThreadPoolExecutor(max_workers=1)) for i in range(n)
+    ]
+    return pool
+
+
+@pytest.mark.asyncio
+async def test_requests_go_to_least_busy_worker(monkeypatch):
+    """Test that concurrent requests are spread over idle workers."""
+    model = SlowModel()
+    monkeypatch.setattr(worker_pool, "_worker_model", model)
+    monkeypatch.setattr(worker_pool, "_worker_threads", 2)
+    pool = thread_pool(3)
+
+    results = await asyncio.gather(*(pool.transcribe_async(AUDIO) for _ in range(3)))
+
+    assert sorted(r["worker"] for r in results) == [0, 1, 2]
+    assert model.threads == [2, 2, 2]
+    assert all(w["inflight"] == 0 and w["completed"] == 1 for w in pool.get_status())
+    pool.close()
+
+
+def test_blocking_transcribe_balances_completed_requests(monkeypatch):
+    """Test that blocking requests alternate between workers."""
+    monkeypatch.setattr(worker_pool, "_worker_model", SlowModel())
+    pool = thread_pool(2)
+
+    workers = [pool.transcribe(AUDIO)["worker"] for _ in range(4)]
+
+    assert workers == [0, 1, 0, 1]
+    pool.close()
+
+
+def test_worker_starts_with_thread_limits(monkeypatch):
+    """Test that worker processes start with the thread limits in their environment."""
+    monkeypatch.setenv("OMP_NUM_THREADS", "16")
+    monkeypatch.delenv("MKL_NUM_THREADS", raising=False)
+    executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+
+    with _thread_env(2):
+        future = executor.submit(os.getenv, "MKL_NUM_THREADS")
+    try:
+        assert future.result(timeout=60) == "2"
+        assert executor.submit(os.getenv, "OMP_NUM_THREADS").result(timeout=60) == "2"
+    finally:
+        executor.shutdown()
+
+    # The API process keeps its own settings
+    assert os.environ["OMP_NUM_THREADS"] == "16"
+    assert "MKL_NUM_THREADS" not in os.environ